@@ -1,6 +1,8 @@
 """Core conversion pipeline for Swagger to MCP server transformation."""
 
 import asyncio
+import hashlib
+import json
 import os
 import shutil
 import tempfile
@@ -12,8 +14,26 @@ from urllib.parse import urlparse
 
 import structlog
 
+from ..parser.base import ParserConfig, ParseResult, ValidationTier
+from ..parser.error_handler import ErrorHandler
+from ..parser.stream_parser import SwaggerStreamParser
+from ..parser.validation import (
+    DeferredValidation,
+    OpenAPIValidator,
+    SpecValidationCache,
+)
+from ..parser.yaml_stream_parser import SwaggerYamlStreamParser
 from .package_generator import DeploymentPackageGenerator
 from .progress_tracker import ConversionProgressTracker
+from .spec_diff import (
+    ENDPOINTS_SECTION,
+    NODE_HASHES_KEY,
+    SCHEMAS_SECTION,
+    TAGS_SECTION,
+    SpecDiff,
+    SpecDiffer,
+    endpoint_key,
+)
 from .validator import ConversionValidator
 
 # Import components from previous epics (using mock implementations for demonstration)
@@ -36,6 +56,9 @@ except ImportError:
 
 logger = structlog.get_logger(__name__)
 
+# Operations stored in the generated server's database
+STORED_HTTP_METHODS = ("get", "post", "put", "delete", "patch")
+
 
 class ConversionError(Exception):
     """Exception raised during conversion process."""
@@ -61,6 +84,9 @@ class ConversionPipeline:
         self.conversion_stats = {}
         self.start_time = None
 
+        # Set while full specification validation runs in a worker process
+        self.deferred_validation: Optional[DeferredValidation] = None
+
         # Initialize progress tracker
         self.progress_tracker = ConversionProgressTracker(
             verbose=self.options.get("verbose", False)
@@ -86,10 +112,18 @@ class ConversionPipeline:
 
             # Phase 1: Validation and preparation
             await self._validate_input_file()
+
+            # Incremental mode updates a previous conversion in place
+            if self.options.get("incremental", False):
+                incremental_result = await self._execute_incremental_conversion()
+                if incremental_result is not None:
+                    return incremental_result
+
             await self._prepare_output_directory()
 
             # Phase 2: Core processing pipeline
             parsed_data = await self._execute_parsing_phase()
+            await self._execute_spec_validation_phase(parsed_data)
             categorized_data = await self._execute_categorization_phase(parsed_data)
             normalized_data = await self._execute_normalization_phase(categorized_data)
             database_path = await self._execute_storage_phase(normalized_data)
@@ -139,12 +173,9 @@ class ConversionPipeline:
             if not os.path.exists(self.swagger_file):
                 raise ConversionError(f"Swagger file not found: {self.swagger_file}")
 
-            # Check file size
+            # No size limit: the specification is streamed, so memory use
+            # does not grow with the file size
             file_size = os.path.getsize(self.swagger_file)
-            if file_size > 100 * 1024 * 1024:  # 100MB limit
-                raise ConversionError(
-                    f"Swagger file too large: {file_size / 1024 / 1024:.1f}MB"
-                )
 
             # Check if it's a URL (basic check)
             if self.swagger_file.startswith(("http://", "https://")):
@@ -183,36 +214,55 @@ class ConversionPipeline:
             (output_path / "docs").mkdir(exist_ok=True)
 
     async def _execute_parsing_phase(self) -> Dict[str, Any]:
-        """Execute parsing phase with Epic 1 integration."""
+        """Execute parsing phase with Epic 1 integration.
+
+        The specification is streamed: only its skeleton and the fields of
+        each operation needed for categorization are kept. Schemas are
+        counted by the skeleton pass, which skips over their definitions.
+        """
         with self.progress_tracker.track_phase("Parsing Swagger specification"):
             try:
-                # Initialize parser from Epic 1
-                parser = SwaggerParser()
+                parse_result = await self._stream_specification()
+                document = parse_result.document_stream
+                swagger = document.skeleton
 
-                # Parse the swagger file
-                parsed_data = await parser.parse_file(self.swagger_file)
+                endpoints = [
+                    {
+                        "path": path,
+                        "method": method.upper(),
+                        "operation_id": operation.get("operationId"),
+                        "tags": operation.get("tags", []),
+                    }
+                    for path, method, operation in document.iter_operations()
+                ]
+                schema_count = parse_result.metrics.schemas_found
+
+                parsed_data = {
+                    "info": swagger.get("info", {}),
+                    "endpoints": endpoints,
+                    "schema_count": schema_count,
+                    "swagger_version": swagger.get("swagger")
+                    or swagger.get("openapi"),
+                    # Root-level tag descriptions and groups for categorization
+                    "tags": swagger.get("tags", []),
+                    "x-tagGroups": swagger.get("x-tagGroups", []),
+                    "document": document,
+                }
 
                 # Update conversion statistics
-                endpoints = parsed_data.get("endpoints", [])
-                schemas = parsed_data.get("schemas", {})
-
                 self.conversion_stats.update(
                     {
                         "endpoints_found": len(endpoints),
-                        "schemas_found": len(schemas),
-                        "api_title": parsed_data.get("info", {}).get(
-                            "title", "Unknown API"
-                        ),
-                        "api_version": parsed_data.get("info", {}).get(
-                            "version", "1.0"
-                        ),
+                        "schemas_found": schema_count,
+                        "api_title": parsed_data["info"].get("title", "Unknown API"),
+                        "api_version": parsed_data["info"].get("version", "1.0"),
                     }
                 )
 
                 logger.info(
                     "Parsing completed",
                     endpoints=len(endpoints),
-                    schemas=len(schemas),
+                    schemas=schema_count,
                 )
 
                 return parsed_data
@@ -220,6 +270,53 @@ class ConversionPipeline:
             except Exception as e:
                 raise ConversionError(f"Failed to parse Swagger file: {str(e)}")
 
+    async def _execute_spec_validation_phase(self, parsed_data: Dict[str, Any]):
+        """Validate the specification at the configured validation tier.
+
+        The spec validator result is cached by the hash of the file contents,
+        in ``validation_cache_dir`` when set, so unchanged specifications are
+        not revalidated by later runs. The deferred tier leaves the full
+        validation running in a worker process (see ``deferred_validation``)
+        while the conversion continues. Validation errors are reported, not
+        fatal.
+        """
+        with self.progress_tracker.track_phase("Validating specification"):
+            try:
+                tier = ValidationTier(self.options.get("validation_tier", "full"))
+            except ValueError:
+                raise ConversionError(
+                    f"Unknown validation tier: {self.options['validation_tier']}",
+                    {"valid_tiers": [t.value for t in ValidationTier]},
+                )
+
+            cache_dir = self.options.get("validation_cache_dir")
+            validator = OpenAPIValidator(
+                ErrorHandler(),
+                tier=tier,
+                cache=SpecValidationCache(cache_dir) if cache_dir else None,
+            )
+            result = await validator.validate_specification_file(
+                self.swagger_file,
+                parsed_data["document"].skeleton,
+                self._calculate_file_hash(),
+            )
+            self.deferred_validation = validator.deferred_validation
+
+            if result.errors:
+                logger.warning(
+                    "Specification validation found errors",
+                    errors=[error.message for error in result.errors],
+                )
+
+            self.conversion_stats["spec_validation"] = {
+                "tier": tier.value,
+                "is_valid": result.is_valid,
+                "errors": len(result.errors),
+                "warnings": len(result.warnings),
+                "deferred": self.deferred_validation is not None,
+                "duration_ms": result.validation_duration_ms,
+            }
+
     async def _execute_categorization_phase(
         self, parsed_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -306,15 +403,9 @@ class ConversionPipeline:
                 # Normalize the parsed data
                 normalized_data = await normalizer.normalize_schema_data(parsed_data)
 
-                # Update statistics
-                self.conversion_stats.update(
-                    {
-                        "normalization_completed": True,
-                        "normalized_schemas": len(
-                            normalized_data.get("normalized_schemas", {})
-                        ),
-                    }
-                )
+                # Update statistics; schema definitions are not loaded by
+                # the parsing phase, they are streamed into the database
+                self.conversion_stats["normalization_completed"] = True
 
                 return normalized_data
 
@@ -446,17 +537,10 @@ class ConversionPipeline:
     async def _populate_database(self, parsed_data: Dict[str, Any]):
         """Populate database with actual API data from parsed swagger."""
         try:
-            import json
-            from pathlib import Path
-
             # Import storage components
+            from ..storage.bulk_loader import BulkLoader
             from ..storage.database import DatabaseManager, DatabaseConfig
-            from ..storage.repositories import (
-                EndpointRepository,
-                SchemaRepository,
-                MetadataRepository,
-            )
-            from ..storage.models import APIMetadata, Endpoint, Schema, EndpointCategory
+            from ..storage.models import APIMetadata, Endpoint, Schema
 
             # Database path
             db_path = Path(self.output_dir) / "data" / "mcp_server.db"
@@ -470,14 +554,21 @@ class ConversionPipeline:
             db_manager = DatabaseManager(db_config)
             await db_manager.initialize()
 
-            # Load swagger data
-            with open(self.swagger_file, "r", encoding="utf-8") as f:
-                swagger = json.load(f)
-
-            async with db_manager.get_session() as session:
-                # Create API metadata
-                metadata_repo = MetadataRepository(session)
-
+            # Streamed by the parsing phase (or opened here when called
+            # without one): only the document skeleton is loaded, operations
+            # and schemas are read one at a time below
+            document = parsed_data.get("document")
+            if document is None:
+                document = (await self._stream_specification()).document_stream
+            swagger = document.skeleton
+            # Node hashes let later incremental conversions diff against
+            # this revision
+            differ = SpecDiffer()
+            differ.classify_tag_metadata(swagger)
+
+            # All rows are written in batches inside one transaction
+            loader = BulkLoader(db_manager)
+            async with loader:
                 # Extract servers info
                 servers = swagger.get('servers', [])
                 if not servers and swagger.get('host'):
@@ -487,16 +578,17 @@ class ConversionPipeline:
                     base_path = swagger.get('basePath', '')
                     servers = [{"url": f"{scheme}://{host}{base_path}"}]
 
-                api = APIMetadata(
-                    title=swagger["info"]["title"],
-                    version=swagger["info"]["version"],
-                    openapi_version=swagger.get("swagger", swagger.get("openapi", "3.0")),
-                    description=swagger["info"].get("description", ""),
-                    base_url=swagger.get("host", ""),
-                    contact_info=json.dumps(swagger.get("info", {}).get("contact", {})),
-                    servers=json.dumps(servers) if servers else None
-                )
-                api = await metadata_repo.create(api)
+                # Create API metadata
+                api_id = await loader.insert_one(APIMetadata, {
+                    "title": swagger["info"]["title"],
+                    "version": swagger["info"]["version"],
+                    "openapi_version": swagger.get("swagger", swagger.get("openapi", "3.0")),
+                    "description": swagger["info"].get("description", ""),
+                    "base_url": swagger.get("host", ""),
+                    "contact_info": json.dumps(swagger.get("info", {}).get("contact", {})),
+                    "servers": json.dumps(servers) if servers else None,
+                    "specification_hash": self._calculate_file_hash(),
+                })
 
                 # Extract category catalog from parsed data (Story 8.2)
                 categories = parsed_data.get("category_catalog", [])
@@ -505,94 +597,42 @@ class ConversionPipeline:
                     count=len(categories)
                 )
 
-                # Add api_id to each category (Story 8.2)
-                enriched_categories = []
-                if categories:
-                    for cat in categories:
-                        cat_with_id = cat.copy()
-                        cat_with_id["api_id"] = api.id
-                        enriched_categories.append(cat_with_id)
-
                 # Create endpoints
-                endpoint_repo = EndpointRepository(session)
                 endpoint_count = 0
-                for path, path_item in swagger.get("paths", {}).items():
-                    for method, operation in path_item.items():
-                        if method in ["get", "post", "put", "delete", "patch"]:
-                            endpoint = Endpoint(
-                                api_id=api.id,
-                                path=path,
-                                method=method.upper(),
-                                operation_id=operation.get("operationId", ""),
-                                summary=operation.get("summary", ""),
-                                description=operation.get("description", ""),
-                                tags=json.dumps(operation.get("tags", [])),
-                                parameters=json.dumps(operation.get("parameters", [])),
-                                request_body=json.dumps(operation.get("requestBody", {})),
-                                responses=json.dumps(operation.get("responses", {}))
-                            )
-                            await endpoint_repo.create(endpoint)
-                            endpoint_count += 1
-
-                # Create schemas
-                schema_repo = SchemaRepository(session)
-                schemas = swagger.get('components', {}).get('schemas', {})
-                # Swagger 2.0 fallback
-                if not schemas:
-                    schemas = swagger.get('definitions', {})
+                for path, method, operation in document.iter_operations():
+                    if method in STORED_HTTP_METHODS:
+                        differ.classify(
+                            ENDPOINTS_SECTION, endpoint_key(path, method), operation
+                        )
+                        await loader.add(Endpoint, {
+                            "api_id": api_id,
+                            **self._endpoint_fields(path, method, operation)
+                        })
+                        endpoint_count += 1
 
                 schema_count = 0
-                for schema_name, schema_def in schemas.items():
-                    schema_obj = Schema(
-                        api_id=api.id,
-                        name=schema_name,
-                        type=schema_def.get("type", "object"),
-                        title=schema_def.get("title", ""),
-                        description=schema_def.get("description", ""),
-                        properties=json.dumps(schema_def.get("properties", {})),
-                        required=json.dumps(schema_def.get("required", [])),
-                        example=json.dumps(schema_def.get("example", {})),
-                        format=schema_def.get("format", "")
-                    )
-                    await schema_repo.create(schema_obj)
+                # components.schemas, or definitions for Swagger 2.0
+                for schema_name, schema_def in document.iter_schemas():
+                    differ.classify(SCHEMAS_SECTION, schema_name, schema_def)
+                    await loader.add(Schema, {
+                        "api_id": api_id,
+                        **self._schema_fields(schema_name, schema_def)
+                    })
                     schema_count += 1
 
-                await session.commit()
-
-            # Create categories (Story 8.2) - after commit to ensure api_id exists
-            category_count = 0
-            if enriched_categories:
-                logger.info(
-                    "Persisting categories to database",
-                    count=len(enriched_categories)
+                await loader.update(
+                    APIMetadata,
+                    api_id,
+                    {"parse_metadata": {NODE_HASHES_KEY: differ.node_hashes}},
                 )
 
-                for category_data in enriched_categories:
-                    try:
-                        # Use DatabaseManager's create_endpoint_category (Story 8.1)
-                        await db_manager.create_endpoint_category(
-                            api_id=category_data["api_id"],
-                            category_name=category_data["category_name"],
-                            display_name=category_data.get("display_name"),
-                            description=category_data.get("description"),
-                            category_group=category_data.get("category_group"),
-                            endpoint_count=category_data.get("endpoint_count", 0),
-                            http_methods=category_data.get("http_methods", [])
-                        )
-                        category_count += 1
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to persist category",
-                            category=category_data.get("category_name"),
-                            error=str(e)
-                        )
-
-                logger.info(
-                    "Categories persisted successfully",
-                    count=category_count
+                # Create categories (Story 8.2)
+                category_count = await self._persist_categories(
+                    loader, [{**cat, "api_id": api_id} for cat in categories]
+                )
+                link_count = await self._persist_category_links(
+                    loader, api_id, self._endpoint_category_names(parsed_data)
                 )
-            else:
-                logger.warning("No categories found, skipping category population")
 
             await db_manager.close()
 
@@ -600,7 +640,8 @@ class ConversionPipeline:
                 "Database populated successfully",
                 endpoints=endpoint_count,
                 schemas=schema_count,
-                categories=category_count
+                categories=category_count,
+                rows_per_second=round(loader.stats.rows_per_second, 1)
             )
 
             # Update conversion stats
@@ -608,7 +649,9 @@ class ConversionPipeline:
                 "database_populated": True,
                 "endpoints_inserted": endpoint_count,
                 "schemas_inserted": schema_count,
-                "categories_inserted": category_count
+                "categories_inserted": category_count,
+                "category_links_inserted": link_count,
+                "bulk_load": loader.stats.to_dict(),
             })
 
         except Exception as e:
@@ -616,6 +659,609 @@ class ConversionPipeline:
             # Don't fail conversion, just log warning
             logger.warning("Database population failed, server generated with empty database")
 
+    async def _stream_specification(self) -> ParseResult:
+        """Parse the skeleton of the input specification.
+
+        Operations and schemas are left on disk and streamed one at a time
+        from the result's ``document_stream``.
+        """
+        input_size_mb = os.path.getsize(self.swagger_file) // (1024 * 1024) + 1
+        parser_config = ParserConfig(
+            streaming_mode=True,
+            max_file_size_mb=max(ParserConfig.max_file_size_mb, input_size_mb),
+        )
+        # Same selection as SwaggerParser._select_stream_parser
+        stream_parser = SwaggerYamlStreamParser(parser_config)
+        if not stream_parser.can_parse(self.swagger_file):
+            stream_parser = SwaggerStreamParser(parser_config)
+        parse_result = await stream_parser.parse(self.swagger_file)
+
+        if not parse_result.is_success:
+            errors = [error.message for error in parse_result.metrics.errors]
+            raise ConversionError(
+                f"Failed to stream Swagger file: {'; '.join(errors)}"
+            )
+
+        return parse_result
+
+    def _endpoint_fields(
+        self, path: str, method: str, operation: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Get the endpoint row columns of an operation."""
+        return {
+            "path": path,
+            "method": method.upper(),
+            "operation_id": operation.get("operationId", ""),
+            "summary": operation.get("summary", ""),
+            "description": operation.get("description", ""),
+            "tags": json.dumps(operation.get("tags", [])),
+            "parameters": json.dumps(operation.get("parameters", [])),
+            "request_body": json.dumps(operation.get("requestBody", {})),
+            "responses": json.dumps(operation.get("responses", {})),
+        }
+
+    def _schema_fields(
+        self, schema_name: str, schema_def: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Get the schema row columns of a schema definition."""
+        return {
+            "name": schema_name,
+            "type": schema_def.get("type", "object"),
+            "title": schema_def.get("title", ""),
+            "description": schema_def.get("description", ""),
+            "properties": json.dumps(schema_def.get("properties", {})),
+            "required": json.dumps(schema_def.get("required", [])),
+            "example": json.dumps(schema_def.get("example", {})),
+            "format": schema_def.get("format", ""),
+        }
+
+    def _calculate_file_hash(self) -> str:
+        """Calculate SHA-256 hash of the input file."""
+        hasher = hashlib.sha256()
+        with open(self.swagger_file, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    async def _persist_categories(
+        self, loader: Any, categories: List[Dict[str, Any]]
+    ) -> int:
+        """Persist category catalog entries (each carrying its api_id).
+
+        Rows are written through the bulk loader; a category repeated for
+        the same API is skipped.
+        """
+        from ..storage.models import EndpointCategory
+
+        if not categories:
+            logger.warning("No categories found, skipping category population")
+            return 0
+
+        logger.info("Persisting categories to database", count=len(categories))
+
+        rows_before = loader.stats.rows_by_table.get(EndpointCategory.__tablename__, 0)
+        for category_data in categories:
+            await loader.add(
+                EndpointCategory,
+                {
+                    "api_id": category_data["api_id"],
+                    "category_name": category_data["category_name"],
+                    "display_name": category_data.get("display_name"),
+                    "description": category_data.get("description"),
+                    "category_group": category_data.get("category_group"),
+                    "endpoint_count": category_data.get("endpoint_count", 0),
+                    "http_methods": category_data.get("http_methods", []),
+                },
+                ignore_conflicts=True,
+            )
+        await loader.flush()
+
+        category_count = (
+            loader.stats.rows_by_table.get(EndpointCategory.__tablename__, 0)
+            - rows_before
+        )
+        if category_count < len(categories):
+            logger.warning(
+                "Skipped duplicate categories",
+                skipped=len(categories) - category_count,
+            )
+
+        logger.info("Categories persisted successfully", count=category_count)
+        return category_count
+
+    @staticmethod
+    def _endpoint_category_names(parsed_data: Dict[str, Any]) -> Dict[str, str]:
+        """Map endpoint keys to the category assigned by categorization."""
+        return {
+            endpoint_key(endpoint["path"], endpoint["method"]): endpoint["category"]
+            for endpoint in parsed_data.get("endpoints", [])
+            if endpoint.get("category") and endpoint.get("path")
+            and endpoint.get("method")
+        }
+
+    async def _persist_category_links(
+        self, loader: Any, api_id: int, category_names: Dict[str, str]
+    ) -> int:
+        """Link the stored endpoints of an API to their categories.
+
+        Args:
+            loader: Active bulk loader; endpoints and categories must have
+                been added to it already
+            api_id: API whose endpoints are linked
+            category_names: Category name by endpoint key
+
+        Returns:
+            Number of links created
+        """
+        from sqlalchemy import select
+
+        from ..storage.models import Endpoint, EndpointCategory, EndpointCategoryLink
+
+        if not category_names:
+            return 0
+
+        result = await loader.execute(
+            select(EndpointCategory.id, EndpointCategory.category_name).where(
+                EndpointCategory.api_id == api_id
+            )
+        )
+        category_ids = {name: category_id for category_id, name in result.all()}
+
+        result = await loader.execute(
+            select(Endpoint.id, Endpoint.path, Endpoint.method).where(
+                Endpoint.api_id == api_id
+            )
+        )
+        link_count = 0
+        for endpoint_id, path, method in result.all():
+            category_id = category_ids.get(
+                category_names.get(endpoint_key(path, method))
+            )
+            if category_id is not None:
+                await loader.add(
+                    EndpointCategoryLink,
+                    {"category_id": category_id, "endpoint_id": endpoint_id},
+                )
+                link_count += 1
+        await loader.flush()
+
+        logger.info("Endpoint category links persisted", count=link_count)
+        return link_count
+
+    async def _execute_incremental_conversion(self) -> Optional[Dict[str, Any]]:
+        """Update a previous conversion in place from a structural spec diff.
+
+        Only operations and schemas whose content hash changed are inserted,
+        updated or deleted; FTS rows follow through the database triggers and
+        an existing Whoosh index is updated document by document.
+
+        Returns:
+            Conversion result, or None if there is no previous conversion
+            with node hashes to update
+        """
+        from ..storage.database import DatabaseConfig, DatabaseManager
+
+        db_path = Path(self.output_dir) / "data" / "mcp_server.db"
+        if not db_path.exists():
+            logger.info("No previous conversion found, running full conversion")
+            return None
+
+        db_manager = DatabaseManager(DatabaseConfig(database_path=str(db_path)))
+        await db_manager.initialize()
+        try:
+            with self.progress_tracker.track_phase("Applying incremental update"):
+                diff = await self._apply_spec_diff(db_manager)
+        finally:
+            await db_manager.close()
+
+        if diff is None:
+            logger.info(
+                "Previous conversion has no node hashes, running full conversion"
+            )
+            return None
+
+        conversion_report = await self._generate_conversion_report()
+        conversion_report["incremental_update"] = diff.summary()
+
+        total_time = time.time() - self.start_time
+        logger.info(
+            "Incremental conversion completed",
+            duration=f"{total_time:.1f}s",
+            changes=diff.summary(),
+        )
+
+        return {
+            "status": "success",
+            "output_directory": self.output_dir,
+            "server_config": None,
+            "conversion_stats": self.conversion_stats,
+            "deployment_ready": True,
+            "incremental": True,
+            "changes": diff.summary(),
+            "report": conversion_report,
+            "duration": total_time,
+        }
+
+    async def _apply_spec_diff(self, db_manager: Any) -> Optional[SpecDiff]:
+        """Diff the input file against the stored revision and apply changes.
+
+        Args:
+            db_manager: Initialized manager of the previous conversion database
+
+        Returns:
+            Applied diff, or None if the stored revision has no node hashes
+        """
+        from sqlalchemy import select
+
+        from ..storage.models import APIMetadata, Endpoint, Schema
+        from ..storage.repositories import EndpointRepository, SchemaRepository
+
+        spec_hash = self._calculate_file_hash()
+
+        async with db_manager.get_session() as session:
+            result = await session.execute(
+                select(APIMetadata).order_by(APIMetadata.id).limit(1)
+            )
+            api = result.scalar_one_or_none()
+            stored_hashes = (
+                (api.parse_metadata or {}).get(NODE_HASHES_KEY) if api else None
+            )
+            if not stored_hashes:
+                return None
+
+            if api.specification_hash == spec_hash:
+                # Byte-identical input, nothing to diff
+                diff = SpecDiff()
+                diff.endpoints.unchanged = len(
+                    stored_hashes.get(ENDPOINTS_SECTION, {})
+                )
+                diff.schemas.unchanged = len(stored_hashes.get(SCHEMAS_SECTION, {}))
+                diff.tags.unchanged = len(stored_hashes.get(TAGS_SECTION, {}))
+                self._update_incremental_stats(api, diff)
+                return diff
+
+            document = (await self._stream_specification()).document_stream
+            swagger = document.skeleton
+            differ = SpecDiffer(stored_hashes)
+            # Tag definitions and groups decide the categories of all
+            # endpoints, not only of the changed ones
+            differ.classify_tag_metadata(swagger)
+
+            endpoint_repo = EndpointRepository(session)
+            result = await session.execute(
+                select(Endpoint.id, Endpoint.path, Endpoint.method).where(
+                    Endpoint.api_id == api.id
+                )
+            )
+            endpoint_ids = {
+                endpoint_key(path, method): endpoint_id
+                for endpoint_id, path, method in result.all()
+            }
+
+            updated_endpoints = []
+            for path, method, operation in document.iter_operations():
+                if method not in STORED_HTTP_METHODS:
+                    continue
+                key = endpoint_key(path, method)
+                if differ.classify(ENDPOINTS_SECTION, key, operation) is None:
+                    continue
+
+                fields = self._endpoint_fields(path, method, operation)
+                if key in endpoint_ids:
+                    await endpoint_repo.update_by_id(endpoint_ids[key], fields)
+                else:
+                    endpoint = await endpoint_repo.create(
+                        Endpoint(api_id=api.id, **fields)
+                    )
+                    endpoint_ids[key] = endpoint.id
+                updated_endpoints.append(
+                    {
+                        "id": endpoint_ids[key],
+                        "path": path,
+                        "method": method.upper(),
+                        "operation_id": operation.get("operationId", ""),
+                        "summary": operation.get("summary", ""),
+                        "description": operation.get("description", ""),
+                        "tags": operation.get("tags", []),
+                        "parameters": operation.get("parameters", []),
+                        "request_body": operation.get("requestBody", {}),
+                        "responses": operation.get("responses", {}),
+                        "security": operation.get("security", []),
+                    }
+                )
+
+            schema_repo = SchemaRepository(session)
+            result = await session.execute(
+                select(Schema.id, Schema.name).where(Schema.api_id == api.id)
+            )
+            schema_ids = {name: schema_id for schema_id, name in result.all()}
+
+            for schema_name, schema_def in document.iter_schemas():
+                if differ.classify(SCHEMAS_SECTION, schema_name, schema_def) is None:
+                    continue
+
+                fields = self._schema_fields(schema_name, schema_def)
+                if schema_name in schema_ids:
+                    await schema_repo.update_by_id(schema_ids[schema_name], fields)
+                else:
+                    schema = await schema_repo.create(Schema(api_id=api.id, **fields))
+                    schema_ids[schema_name] = schema.id
+
+            diff = differ.finish()
+
+            removed_endpoint_ids = []
+            for key in diff.endpoints.removed:
+                if key in endpoint_ids:
+                    await endpoint_repo.delete_by_id(endpoint_ids[key])
+                    removed_endpoint_ids.append(endpoint_ids[key])
+            for schema_name in diff.schemas.removed:
+                if schema_name in schema_ids:
+                    await schema_repo.delete_by_id(schema_ids[schema_name])
+
+            info = swagger.get("info", {})
+            api.title = info.get("title", api.title)
+            api.version = info.get("version", api.version)
+            api.description = info.get("description", "")
+            api.specification_hash = spec_hash
+            # Reassign so the JSON column change is detected
+            api.parse_metadata = {
+                **(api.parse_metadata or {}),
+                NODE_HASHES_KEY: differ.node_hashes,
+            }
+            self._update_incremental_stats(api, diff)
+
+            await session.commit()
+            api_id = api.id
+
+        if diff.endpoints.has_changes or diff.tags.has_changes:
+            await self._refresh_categories(
+                db_manager,
+                api_id,
+                swagger,
+                updated_endpoints,
+                removed_endpoint_ids,
+                recategorize_all=diff.tags.has_changes,
+            )
+        if diff.endpoints.has_changes:
+            await self._sync_search_index(updated_endpoints, removed_endpoint_ids)
+
+        logger.info("Incremental update applied", changes=diff.summary())
+        return diff
+
+    def _update_incremental_stats(self, api: Any, diff: SpecDiff) -> None:
+        """Record conversion statistics of an incremental update."""
+        endpoints = diff.endpoints
+        schemas = diff.schemas
+        self.conversion_stats.update(
+            {
+                "api_title": api.title,
+                "api_version": api.version,
+                "endpoints_found": len(endpoints.added)
+                + len(endpoints.changed)
+                + endpoints.unchanged,
+                "schemas_found": len(schemas.added)
+                + len(schemas.changed)
+                + schemas.unchanged,
+                "database_populated": True,
+                "incremental_changes": diff.summary(),
+            }
+        )
+
+    async def _refresh_categories(
+        self,
+        db_manager: Any,
+        api_id: int,
+        spec_data: Dict[str, Any],
+        updated_endpoints: List[Dict[str, Any]],
+        removed_endpoint_ids: List[int],
+        recategorize_all: bool = False,
+    ) -> None:
+        """Categorize changed endpoints and update the category catalog.
+
+        Only the added and changed endpoints are categorized, unless the tag
+        definitions or groups changed: then every endpoint of the API is
+        recategorized from its stored row. The links of the categorized and
+        removed endpoints are replaced, the display name, description and
+        group of existing categories are updated, and the counts and methods
+        of the categories involved are recounted from the links.
+
+        Args:
+            db_manager: Initialized manager of the conversion database
+            api_id: API whose endpoints changed
+            spec_data: Specification root holding tag definitions and groups
+            updated_endpoints: Added and changed endpoints, with their ids
+            removed_endpoint_ids: Ids of deleted endpoints
+            recategorize_all: Categorize all endpoints of the API
+        """
+        from sqlalchemy import delete, select
+
+        from ..parser.endpoint_processor import enrich_endpoints_with_categories
+        from ..storage.bulk_loader import BulkLoader
+        from ..storage.models import Endpoint, EndpointCategory, EndpointCategoryLink
+
+        if recategorize_all:
+            updated_endpoints = await self._stored_endpoints(db_manager, api_id)
+
+        enriched_endpoints, category_catalog = enrich_endpoints_with_categories(
+            [
+                {
+                    "id": endpoint["id"],
+                    "path": endpoint["path"],
+                    "method": endpoint["method"],
+                    "operation": {
+                        "tags": endpoint["tags"],
+                        "operationId": endpoint["operation_id"],
+                        "summary": endpoint["summary"],
+                        "description": endpoint["description"],
+                    },
+                }
+                for endpoint in updated_endpoints
+            ],
+            spec_data,
+        )
+        if recategorize_all:
+            # Every category of the API is recounted, and dropped if empty
+            api_categories = select(EndpointCategory.id).where(
+                EndpointCategory.api_id == api_id
+            )
+            affected_query = api_categories
+            relinked = EndpointCategoryLink.category_id.in_(api_categories)
+        else:
+            relinked_ids = [endpoint["id"] for endpoint in updated_endpoints]
+            relinked_ids.extend(removed_endpoint_ids)
+            relinked = EndpointCategoryLink.endpoint_id.in_(relinked_ids)
+            affected_query = (
+                select(EndpointCategoryLink.category_id).where(relinked).distinct()
+            )
+
+        # Few rows change; keep the FTS and tag triggers instead of
+        # reindexing every endpoint at the end of the load
+        async with BulkLoader(db_manager, defer_fts=False, defer_tags=False) as loader:
+            result = await loader.execute(affected_query)
+            affected_ids = set(result.scalars())
+            await loader.execute(delete(EndpointCategoryLink).where(relinked))
+
+            # New categories; existing ones are skipped and recounted below
+            category_count = await self._persist_categories(
+                loader,
+                [{**category, "api_id": api_id} for category in category_catalog],
+            )
+            result = await loader.execute(
+                select(EndpointCategory.id, EndpointCategory.category_name).where(
+                    EndpointCategory.api_id == api_id,
+                    EndpointCategory.category_name.in_(
+                        [category["category_name"] for category in category_catalog]
+                    ),
+                )
+            )
+            category_ids = {name: category_id for category_id, name in result.all()}
+            # Existing rows were skipped above; their metadata follows the
+            # tag definitions and groups of the new revision
+            for category in category_catalog:
+                await loader.update(
+                    EndpointCategory,
+                    category_ids[category["category_name"]],
+                    {
+                        "display_name": category.get("display_name"),
+                        "description": category.get("description"),
+                        "category_group": category.get("category_group"),
+                    },
+                )
+
+            for endpoint in enriched_endpoints:
+                category_id = category_ids[endpoint["category"]]
+                await loader.add(
+                    EndpointCategoryLink,
+                    {"category_id": category_id, "endpoint_id": endpoint["id"]},
+                )
+                affected_ids.add(category_id)
+
+            result = await loader.execute(
+                select(EndpointCategoryLink.category_id, Endpoint.method)
+                .join(Endpoint, Endpoint.id == EndpointCategoryLink.endpoint_id)
+                .where(EndpointCategoryLink.category_id.in_(affected_ids))
+            )
+            category_methods: Dict[int, List[str]] = {}
+            for category_id, method in result.all():
+                category_methods.setdefault(category_id, []).append(method)
+
+            for category_id in affected_ids:
+                methods = category_methods.get(category_id)
+                if methods:
+                    await loader.update(
+                        EndpointCategory,
+                        category_id,
+                        {
+                            "endpoint_count": len(methods),
+                            "http_methods": sorted(set(methods)),
+                        },
+                    )
+                else:
+                    # Full conversions store no empty categories
+                    await loader.execute(
+                        delete(EndpointCategory).where(
+                            EndpointCategory.id == category_id
+                        )
+                    )
+
+        self.conversion_stats["categories_inserted"] = category_count
+        self.conversion_stats["category_links_inserted"] = len(enriched_endpoints)
+
+    async def _stored_endpoints(
+        self, db_manager: Any, api_id: int
+    ) -> List[Dict[str, Any]]:
+        """Read the categorization fields of all stored endpoints of an API."""
+        from sqlalchemy import select
+
+        from ..storage.models import Endpoint
+
+        async with db_manager.get_session() as session:
+            result = await session.execute(
+                select(
+                    Endpoint.id,
+                    Endpoint.path,
+                    Endpoint.method,
+                    Endpoint.operation_id,
+                    Endpoint.summary,
+                    Endpoint.description,
+                    Endpoint.tags,
+                ).where(Endpoint.api_id == api_id)
+            )
+            rows = result.all()
+
+        endpoints = []
+        for endpoint_id, path, method, operation_id, summary, description, tags in rows:
+            # Rows written by conversions hold the tags as a JSON string
+            if isinstance(tags, str):
+                tags = json.loads(tags)
+            endpoints.append(
+                {
+                    "id": endpoint_id,
+                    "path": path,
+                    "method": method,
+                    "operation_id": operation_id,
+                    "summary": summary,
+                    "description": description,
+                    "tags": tags or [],
+                }
+            )
+        return endpoints
+
+    async def _sync_search_index(
+        self,
+        updated_endpoints: List[Dict[str, Any]],
+        removed_endpoint_ids: List[int],
+    ) -> None:
+        """Apply endpoint changes to an existing Whoosh index."""
+        from whoosh import index as whoosh_index
+
+        index_path = os.path.join(self.output_dir, "data", "search_index")
+        if not whoosh_index.exists_in(index_path):
+            # No persistent index yet; it will be built from the database
+            return
+
+        from ..config.settings import SearchConfig
+        from ..search.index_manager import SearchIndexManager as WhooshIndexManager
+
+        index_manager = WhooshIndexManager(
+            index_path,
+            endpoint_repo=None,
+            schema_repo=None,
+            metadata_repo=None,
+            config=SearchConfig(),
+        )
+        try:
+            updated, removed = await index_manager.apply_endpoint_changes(
+                updated_endpoints,
+                [str(endpoint_id) for endpoint_id in removed_endpoint_ids],
+            )
+        finally:
+            index_manager.close()
+
+        self.conversion_stats.update(
+            {"index_documents_updated": updated, "index_documents_removed": removed}
+        )
+
     async def _validate_generated_server(self, deployment_package: str):
         """Validate generated MCP server functionality."""
         with self.progress_tracker.track_phase("Validating generated server"):
@@ -642,6 +1288,7 @@ class ConversionPipeline:
     async def _generate_conversion_report(self) -> Dict[str, Any]:
         """Generate comprehensive conversion report."""
         duration = time.time() - self.start_time if self.start_time else 0
+        bulk_load = self.conversion_stats.get("bulk_load", {})
 
         report = {
             "conversion_summary": {
@@ -656,6 +1303,11 @@ class ConversionPipeline:
                 "endpoints": self.conversion_stats.get("endpoints_found", 0),
                 "schemas": self.conversion_stats.get("schemas_found", 0),
             },
+            "database_load": {
+                "rows_inserted": bulk_load.get("rows_inserted", 0),
+                "duration": f"{bulk_load.get('duration_seconds', 0):.2f}s",
+                "rows_per_second": bulk_load.get("rows_per_second", 0.0),
+            },
             "processing_phases": {
                 "parsing": "completed",
                 "normalization": "completed",
@@ -0,0 +1,180 @@
+"""Structural diff of specifications for incremental re-conversion.
+
+Every operation and schema of a converted specification is fingerprinted
+with a content hash, and so are the root tag definitions and tag groups
+that endpoint categorization depends on. The hashes are stored with the
+converted API, so a later conversion of a new revision only has to touch
+the nodes whose hash changed.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# Key of the node hashes inside APIMetadata.parse_metadata
+NODE_HASHES_KEY = "node_hashes"
+
+ENDPOINTS_SECTION = "endpoints"
+SCHEMAS_SECTION = "schemas"
+TAGS_SECTION = "tags"
+
+# Root keys hashed in TAGS_SECTION
+TAG_METADATA_KEYS = ("tags", "x-tagGroups")
+
+NODE_ADDED = "added"
+NODE_CHANGED = "changed"
+
+
+def hash_node(node: Any) -> str:
+    """Compute the content hash of a specification node.
+
+    Keys are sorted, so key order and formatting of the source file do not
+    affect the hash.
+
+    Args:
+        node: Operation, schema or tag metadata object
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON encoding
+    """
+    encoded = json.dumps(
+        node, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def endpoint_key(path: str, method: str) -> str:
+    """Get the node key of an operation (e.g. ``GET /pets``)."""
+    return f"{method.upper()} {path}"
+
+
+@dataclass
+class SectionDiff:
+    """Changed node keys of one specification section."""
+
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        """Check if any node was added, changed or removed."""
+        return bool(self.added or self.changed or self.removed)
+
+    def summary(self) -> Dict[str, int]:
+        """Get node counts by change type."""
+        return {
+            "added": len(self.added),
+            "changed": len(self.changed),
+            "removed": len(self.removed),
+            "unchanged": self.unchanged,
+        }
+
+
+@dataclass
+class SpecDiff:
+    """Node level diff between two specification revisions."""
+
+    endpoints: SectionDiff = field(default_factory=SectionDiff)
+    schemas: SectionDiff = field(default_factory=SectionDiff)
+    tags: SectionDiff = field(default_factory=SectionDiff)
+
+    @property
+    def has_changes(self) -> bool:
+        """Check if any operation, schema or tag metadata changed."""
+        return (
+            self.endpoints.has_changes
+            or self.schemas.has_changes
+            or self.tags.has_changes
+        )
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Get node counts by section and change type."""
+        return {
+            ENDPOINTS_SECTION: self.endpoints.summary(),
+            SCHEMAS_SECTION: self.schemas.summary(),
+            TAGS_SECTION: self.tags.summary(),
+        }
+
+
+class SpecDiffer:
+    """Classifies the nodes of a new revision against stored node hashes.
+
+    Nodes are fed one at a time while the new revision is streamed, so the
+    full document never has to be held in memory. ``node_hashes`` collects
+    the hashes of the new revision for storage.
+    """
+
+    def __init__(self, stored_hashes: Optional[Dict[str, Dict[str, str]]] = None):
+        """Initialize specification differ.
+
+        Args:
+            stored_hashes: Node hashes of the previous revision by section,
+                empty for a first conversion
+        """
+        self.stored_hashes = stored_hashes or {}
+        self.node_hashes: Dict[str, Dict[str, str]] = {
+            ENDPOINTS_SECTION: {},
+            SCHEMAS_SECTION: {},
+            TAGS_SECTION: {},
+        }
+        self._diff = SpecDiff()
+
+    def classify(self, section: str, key: str, node: Any) -> Optional[str]:
+        """Record a node of the new revision and classify it.
+
+        Args:
+            section: ENDPOINTS_SECTION, SCHEMAS_SECTION or TAGS_SECTION
+            key: Node key within the section
+            node: Node content
+
+        Returns:
+            NODE_ADDED, NODE_CHANGED, or None if the node is unchanged
+        """
+        node_hash = hash_node(node)
+        self.node_hashes[section][key] = node_hash
+
+        section_diff = getattr(self._diff, section)
+        stored_hash = self.stored_hashes.get(section, {}).get(key)
+        if stored_hash is None:
+            section_diff.added.append(key)
+            return NODE_ADDED
+        if stored_hash != node_hash:
+            section_diff.changed.append(key)
+            return NODE_CHANGED
+
+        section_diff.unchanged += 1
+        return None
+
+    def classify_tag_metadata(self, root: Dict[str, Any]) -> bool:
+        """Record the root tag definitions and groups of the new revision.
+
+        Revisions stored before tag metadata was hashed have no hashes for
+        it, so their tag metadata counts as added.
+
+        Args:
+            root: Specification root (or its streamed skeleton)
+
+        Returns:
+            True if the tag definitions or groups were added or changed
+        """
+        changed = False
+        for key in TAG_METADATA_KEYS:
+            if self.classify(TAGS_SECTION, key, root.get(key, [])) is not None:
+                changed = True
+        return changed
+
+    def finish(self) -> SpecDiff:
+        """Complete the diff once all nodes of the new revision were seen.
+
+        Returns:
+            Diff including the nodes removed since the previous revision
+        """
+        for section in (ENDPOINTS_SECTION, SCHEMAS_SECTION, TAGS_SECTION):
+            seen = self.node_hashes[section]
+            getattr(self._diff, section).removed = [
+                key for key in self.stored_hashes.get(section, {}) if key not in seen
+            ]
+        return self._diff
@@ -260,6 +260,26 @@ def cli(ctx: click.Context, verbose: bool, quiet: bool, config: Optional[str]):
     is_flag=True,
     help="Skip generated server validation (faster but less safe)",
 )
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Update a previous conversion in the output directory with only the "
+    "changed endpoints and schemas",
+)
+@click.option(
+    "--validation-tier",
+    type=click.Choice(["structural", "full", "deferred"]),
+    default="full",
+    show_default=True,
+    help="Specification validation depth: structural skips "
+    "openapi-spec-validator, deferred runs it alongside the conversion",
+)
+@click.option(
+    "--validation-cache-dir",
+    type=click.Path(file_okay=False),
+    help="Directory caching validation results of unchanged specifications "
+    "(default: ~/.swagger-mcp-server/validation-cache)",
+)
 @click.pass_context
 def convert(
     ctx: click.Context,
@@ -271,6 +291,9 @@ def convert(
     dry_run: bool,
     validate_only: bool,
     skip_validation: bool,
+    incremental: bool,
+    validation_tier: str,
+    validation_cache_dir: Optional[str],
 ):
     """Convert Swagger file to MCP server.
 
@@ -306,6 +329,12 @@ def convert(
 
       # Custom server name
       swagger-mcp-server convert api.json --name "MyAPI-Server"
+
+      # Re-convert a new revision, updating only what changed
+      swagger-mcp-server convert api.json --incremental
+
+      # Validate the specification in the background while converting
+      swagger-mcp-server convert api.json --validation-tier deferred
     """
     # Import conversion pipeline at module level to avoid scope issues
     from .conversion import ConversionError, ConversionPipeline
@@ -321,6 +350,10 @@ def convert(
             "dry_run": dry_run,
             "validate_only": validate_only,
             "skip_validation": skip_validation,
+            "incremental": incremental,
+            "validation_tier": validation_tier,
+            "validation_cache_dir": validation_cache_dir
+            or str(Path.home() / ".swagger-mcp-server" / "validation-cache"),
             "verbose": cli_context.verbose,
             "quiet": cli_context.quiet,
         }
@@ -378,7 +411,12 @@ def _run_full_conversion(pipeline, cli_context):
     import asyncio
 
     async def convert():
-        return await pipeline.execute_conversion()
+        result = await pipeline.execute_conversion()
+        if pipeline.deferred_validation is not None:
+            if not cli_context.quiet:
+                click.echo("🔎 Waiting for full specification validation...")
+            result["deferred_validation"] = await pipeline.deferred_validation.result()
+        return result
 
     try:
         if not cli_context.quiet:
@@ -387,12 +425,30 @@ def _run_full_conversion(pipeline, cli_context):
 
         result = asyncio.run(convert())
         _display_conversion_success(result, cli_context.quiet)
+        if "deferred_validation" in result:
+            _display_deferred_validation(
+                result["deferred_validation"], cli_context.quiet
+            )
 
     except Exception as e:
         click.echo(f"❌ Conversion failed: {str(e)}", err=True)
         sys.exit(1)
 
 
+def _display_deferred_validation(validation, quiet: bool = False):
+    """Display the result of validation deferred to a worker process."""
+    if validation.is_valid:
+        if not quiet:
+            click.echo("✅ Specification passed full validation")
+        return
+
+    click.echo(
+        f"⚠️  Full validation found {len(validation.errors)} error(s):", err=True
+    )
+    for error in validation.errors:
+        click.echo(f"   • {error.message}", err=True)
+
+
 def _display_conversion_preview(preview_data: dict):
     """Display conversion preview information."""
     click.echo("🔍 Conversion Preview")
@@ -451,6 +507,24 @@ def _display_conversion_success(result: dict, quiet: bool = False):
         click.echo(f"🔗 Endpoints: {api_summary.get('endpoints', 0)}")
         click.echo(f"📋 Schemas: {api_summary.get('schemas', 0)}")
 
+        database_load = result.get("report", {}).get("database_load", {})
+        if database_load.get("rows_inserted"):
+            click.echo(
+                f"💾 Database: {database_load['rows_inserted']} rows in "
+                f"{database_load['duration']} "
+                f"({database_load['rows_per_second']:.0f} rows/sec)"
+            )
+
+        # Incremental update summary
+        changes = result.get("changes")
+        if changes:
+            for section, counts in changes.items():
+                click.echo(
+                    f"🔁 {section.capitalize()}: +{counts['added']} "
+                    f"~{counts['changed']} -{counts['removed']} "
+                    f"({counts['unchanged']} unchanged)"
+                )
+
         click.echo()
 
         # Next Steps
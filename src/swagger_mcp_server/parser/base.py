@@ -1,5 +1,6 @@
 """Base parser interface and data structures."""
 
+import dataclasses
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -7,6 +8,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union
 
+import psutil
+
 from swagger_mcp_server.config.logging import get_logger
 
 logger = get_logger(__name__)
@@ -31,6 +34,30 @@ class ParseStatus(Enum):
     CANCELLED = "cancelled"
 
 
+class MemoryTelemetryMode(Enum):
+    """Memory measurement modes for parsing operations."""
+
+    OFF = "off"
+    SAMPLED = "sampled"  # Process RSS sampled at progress intervals
+    TRACEMALLOC = "tracemalloc"  # Full allocation tracing, for profiling only
+
+
+class ParseStrategy(Enum):
+    """How JSON documents are decoded."""
+
+    AUTO = "auto"  # Chosen by file size and available memory
+    IN_MEMORY = "in_memory"  # Memory-mapped and decoded in a single call
+    STREAMING = "streaming"  # Rebuilt from ijson events
+
+
+class ValidationTier(Enum):
+    """OpenAPI compliance validation depth."""
+
+    STRUCTURAL = "structural"  # Built-in structure checks only
+    FULL = "full"  # Structure checks and openapi-spec-validator
+    DEFERRED = "deferred"  # openapi-spec-validator runs in a worker process
+
+
 @dataclass
 class ParseError:
     """Represents a parsing error with context."""
@@ -53,6 +80,8 @@ class ParseMetrics:
     file_size_bytes: int = 0
     bytes_processed: int = 0
     memory_peak_mb: float = 0.0
+    memory_telemetry_mode: str = MemoryTelemetryMode.SAMPLED.value
+    phase_memory_peak_mb: Dict[str, float] = field(default_factory=dict)
     parse_duration_ms: float = 0.0
     validation_duration_ms: float = 0.0
 
@@ -61,6 +90,10 @@ class ParseMetrics:
     schemas_found: int = 0
     security_schemes_found: int = 0
     extensions_found: int = 0
+    bundled_files: int = 0  # Files merged in bundle mode, root included
+    # Decoder that produced the document (e.g., "orjson+mmap",
+    # "ijson:yajl2_c", "pyyaml:CSafeLoader")
+    parser_backend: str = ""
 
     # Error metrics
     errors: List[ParseError] = field(default_factory=list)
@@ -95,6 +128,14 @@ class ParseResult:
     openapi_version: Optional[str] = None
     api_title: Optional[str] = None
     api_version: Optional[str] = None
+    # Set in streaming mode: lazy access to paths and schemas that are not
+    # materialized in ``data``
+    document_stream: Optional[Any] = None
+    # Set with the deferred validation tier: full validation still running
+    # in a worker process
+    deferred_validation: Optional[Any] = None
+    # Set in bundle mode: files merged into ``data``, root document excluded
+    referenced_files: List[Path] = field(default_factory=list)
 
     @property
     def is_success(self) -> bool:
@@ -120,12 +161,48 @@ class ParserConfig:
     max_file_size_mb: int = 10
     max_memory_mb: int = 2048  # 2GB RAM limit
     chunk_size_bytes: int = 8192
+    # Keep paths and schemas out of the parsed document and stream them
+    # one item at a time (bounded memory for very large specs)
+    streaming_mode: bool = False
+    # JSON decoding strategy outside streaming mode. AUTO decodes files of up
+    # to in_memory_max_mb in one call if in_memory_factor times the file size
+    # fits in available memory and max_memory_mb, and streams larger files
+    parse_strategy: ParseStrategy = ParseStrategy.AUTO
+    in_memory_max_mb: int = 256
+    in_memory_factor: float = 8.0  # Decoded document size / file size
+    # Memory measurement; max_memory_mb is enforced in SAMPLED and
+    # TRACEMALLOC modes only
+    memory_telemetry: MemoryTelemetryMode = MemoryTelemetryMode.SAMPLED
 
     # Processing options
     validate_openapi: bool = True
+    validation_tier: ValidationTier = ValidationTier.FULL
+    # openapi-spec-validator results are cached in memory by specification
+    # hash; a directory also persists them across runs
+    validation_cache_dir: Optional[str] = None
+    # Worker processes for endpoint/schema normalization (1 = serial,
+    # 0 = one per CPU)
+    normalization_workers: int = 1
+    # On-disk cache of normalization results keyed by specification hash
+    # (None disables it); least recently used entries are evicted past the
+    # size limit
+    normalization_cache_dir: Optional[str] = None
+    normalization_cache_max_mb: int = 512
+    # Write normalized endpoints and schemas to a temporary on-disk store
+    # (in normalization_spill_dir, or the system temp directory) as they are
+    # produced, for specifications whose normalized form exceeds memory
+    normalization_spill: bool = False
+    normalization_spill_dir: Optional[str] = None
     preserve_order: bool = True
     strict_mode: bool = False
 
+    # Multi-file specifications: load the files referenced through relative
+    # $refs concurrently and merge them into the root document, optionally
+    # writing the merged single-file specification to bundle_output_path
+    bundle_references: bool = False
+    bundle_workers: int = 4
+    bundle_output_path: Optional[str] = None
+
     # Progress reporting
     progress_callback: Optional[Callable[[int, int], None]] = None
     progress_interval_bytes: int = 1024 * 1024  # 1MB
@@ -140,6 +217,38 @@ class ParserConfig:
 ProgressCallback = Callable[[int, int], None]  # (bytes_processed, total_bytes)
 
 
+def select_parse_strategy(
+    file_size_bytes: int,
+    config: ParserConfig,
+    available_memory_bytes: Optional[int] = None,
+) -> ParseStrategy:
+    """Choose how a JSON document is decoded.
+
+    Args:
+        file_size_bytes: Size of the file
+        config: Parser configuration; a strategy other than AUTO is returned
+            as is
+        available_memory_bytes: Memory available to the process, read from
+            the system if not given
+
+    Returns:
+        IN_MEMORY or STREAMING, or the configured strategy
+    """
+    if config.parse_strategy != ParseStrategy.AUTO:
+        return config.parse_strategy
+    if file_size_bytes > config.in_memory_max_mb * 1024 * 1024:
+        return ParseStrategy.STREAMING
+
+    if available_memory_bytes is None:
+        available_memory_bytes = psutil.virtual_memory().available
+    required_bytes = file_size_bytes * config.in_memory_factor
+    memory_limit_bytes = min(available_memory_bytes, config.max_memory_mb * 1024 * 1024)
+
+    if required_bytes > memory_limit_bytes:
+        return ParseStrategy.STREAMING
+    return ParseStrategy.IN_MEMORY
+
+
 class BaseParser(ABC):
     """Abstract base parser for different file formats."""
 
@@ -255,6 +364,9 @@ class ParserFactory:
     ) -> BaseParser:
         """Create appropriate parser for the given file.
 
+        The parser configuration gets the decoding strategy for the file's
+        size (see ``select_parse_strategy``).
+
         Args:
             file_path: Path to file to parse
             config: Parser configuration
@@ -276,6 +388,16 @@ class ParserFactory:
                 "UnsupportedFileType",
             )
 
+        config = config or ParserConfig()
+        if path.is_file():
+            strategy = select_parse_strategy(path.stat().st_size, config)
+            config = dataclasses.replace(config, parse_strategy=strategy)
+            self.logger.debug(
+                "Parse strategy selected",
+                file_path=str(path),
+                parse_strategy=strategy.value,
+            )
+
         parser_class = self._parsers[parser_type]
         return parser_class(config)
 
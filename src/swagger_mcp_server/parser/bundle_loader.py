@@ -0,0 +1,610 @@
+"""Concurrent loading of OpenAPI specifications split across multiple files.
+
+A bundle is a root document plus every file reachable from it through
+relative ``$ref``s. Files are discovered level by level; the files of a
+level are read and decoded concurrently in a thread pool. The loaded files
+are then merged into one document in which every external reference points
+into the document itself, so the normalizer never touches the filesystem.
+The merged document can also be written out as a single-file specification.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import unquote
+
+import yaml
+
+from swagger_mcp_server.config.logging import get_logger
+from swagger_mcp_server.parser.base import SwaggerParseError
+from swagger_mcp_server.parser.reference_resolver import (
+    REMOTE_REF_PREFIXES,
+    JsonPointerIndex,
+    unescape_pointer_token,
+)
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+logger = get_logger(__name__)
+
+# Component kinds that external targets are moved into, by section of the
+# root document
+OPENAPI_3_COMPONENT_KINDS = (
+    "schemas",
+    "responses",
+    "parameters",
+    "examples",
+    "requestBodies",
+    "headers",
+    "links",
+    "callbacks",
+)
+SWAGGER_2_SECTIONS = {
+    "schemas": ("definitions",),
+    "parameters": ("parameters",),
+    "responses": ("responses",),
+}
+
+# Keys whose children are components of a kind (e.g., every value of
+# "responses" is a response)
+CONTAINER_KINDS = {
+    "parameters": "parameters",
+    "responses": "responses",
+    "headers": "headers",
+    "examples": "examples",
+    "links": "links",
+    "callbacks": "callbacks",
+}
+
+INVALID_NAME_CHARACTERS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def decode_document(path: Path, content: bytes) -> Any:
+    """Decode a JSON or YAML document.
+
+    Args:
+        path: File location; ``.json`` files are decoded as JSON
+        content: Raw file content
+
+    Returns:
+        Decoded document
+    """
+    if path.suffix.lower() == ".json":
+        return json.loads(content)
+    return yaml.load(content, Loader=YamlLoader)
+
+
+def referenced_files(document: Any, source: Path) -> Set[Path]:
+    """Find the files referenced by the relative ``$ref``s of a document.
+
+    Args:
+        document: Decoded document
+        source: Location of the document
+
+    Returns:
+        Resolved paths of the referenced files
+    """
+    files: Set[Path] = set()
+    stack = [document]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                file_part = ref.partition("#")[0]
+                if file_part and not file_part.startswith(REMOTE_REF_PREFIXES):
+                    files.add((source.parent / unquote(file_part)).resolve())
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return files
+
+
+@dataclass
+class CachedFile:
+    """Decoded bundle file with the state it was read in."""
+
+    mtime_ns: int
+    size: int
+    content_hash: str
+    document: Any
+    references: Set[Path]
+
+
+class BundleFileCache:
+    """In-memory cache of decoded bundle files.
+
+    Files with an unchanged modification time and size are not read again.
+    Files that were touched but whose SHA-256 is unchanged are read but not
+    decoded again. Cached documents are shared and must not be modified.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Path, CachedFile] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.decodes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self, path: Path) -> CachedFile:
+        """Load a file, reusing the cached document if it is unchanged.
+
+        Called from worker threads.
+
+        Args:
+            path: Resolved file location
+
+        Returns:
+            Cached file entry
+
+        Raises:
+            OSError, ValueError, yaml.YAMLError: If the file cannot be read
+                or decoded
+        """
+        stat = path.stat()
+        with self._lock:
+            entry = self._entries.get(path)
+        if (
+            entry is not None
+            and entry.mtime_ns == stat.st_mtime_ns
+            and entry.size == stat.st_size
+        ):
+            with self._lock:
+                self.hits += 1
+            return entry
+
+        content = path.read_bytes()
+        content_hash = hashlib.sha256(content).hexdigest()
+        if entry is not None and entry.content_hash == content_hash:
+            document, references = entry.document, entry.references
+            with self._lock:
+                self.hits += 1
+        else:
+            document = decode_document(path, content)
+            references = referenced_files(document, path)
+            with self._lock:
+                self.decodes += 1
+
+        entry = CachedFile(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            content_hash=content_hash,
+            document=document,
+            references=references,
+        )
+        with self._lock:
+            self._entries[path] = entry
+        return entry
+
+
+@dataclass
+class SpecBundle:
+    """Specification merged from a root document and its referenced files."""
+
+    root_path: Path
+    document: Dict[str, Any]
+    files: List[Path] = field(default_factory=list)  # Root document first
+    errors: List[str] = field(default_factory=list)
+    load_duration_ms: float = 0.0
+
+    def write(self, output_path: Union[str, Path]) -> Path:
+        """Write the merged document as a single-file specification.
+
+        Args:
+            output_path: Output file; ``.yaml``/``.yml`` files are written
+                as YAML, anything else as JSON
+
+        Returns:
+            Path of the written file
+        """
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            if path.suffix.lower() in (".yaml", ".yml"):
+                yaml.safe_dump(self.document, f, sort_keys=False, allow_unicode=True)
+            else:
+                json.dump(self.document, f, indent=2, ensure_ascii=False)
+        return path
+
+
+class SpecBundleLoader:
+    """Loads multi-file specifications concurrently and merges them."""
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        cache: Optional[BundleFileCache] = None,
+        executor_factory: Optional[Callable[[int], Executor]] = None,
+    ):
+        """Initialize bundle loader.
+
+        Args:
+            max_workers: Threads reading and decoding files
+            cache: File cache shared between loads, defaults to a new cache
+            executor_factory: Creates the executor for a worker count,
+                defaults to ``ThreadPoolExecutor``
+        """
+        self.max_workers = max(1, max_workers)
+        self.cache = cache if cache is not None else BundleFileCache()
+        self.executor_factory = executor_factory or (
+            lambda workers: ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="bundle-loader"
+            )
+        )
+
+    async def load(
+        self,
+        root_path: Union[str, Path],
+        root_document: Optional[Dict[str, Any]] = None,
+    ) -> SpecBundle:
+        """Load a root document and all files it references.
+
+        Args:
+            root_path: Location of the root document
+            root_document: Already parsed root document, read from
+                ``root_path`` if not given
+
+        Returns:
+            Merged specification; files that cannot be loaded and
+            references that cannot be resolved are listed in ``errors``
+
+        Raises:
+            SwaggerParseError: If the root document cannot be loaded
+        """
+        start_time = time.time()
+        root = Path(root_path).resolve()
+        documents: Dict[Path, Any] = {}
+        errors: List[str] = []
+        failed: Set[Path] = set()
+
+        if root_document is not None:
+            documents[root] = root_document
+            pending = referenced_files(root_document, root)
+        else:
+            pending = {root}
+
+        loop = asyncio.get_running_loop()
+        with self.executor_factory(self.max_workers) as executor:
+            while pending:
+                paths = sorted(pending)
+                results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(executor, self.cache.load, path)
+                        for path in paths
+                    ),
+                    return_exceptions=True,
+                )
+
+                pending = set()
+                for path, result in zip(paths, results):
+                    if isinstance(result, Exception):
+                        failed.add(path)
+                        errors.append(f"Failed to load {path}: {result}")
+                        continue
+                    documents[path] = result.document
+                    pending |= result.references
+                pending -= documents.keys() | failed
+
+        if root not in documents:
+            raise SwaggerParseError(
+                errors[0] if errors else f"Failed to load {root}",
+                "BundleLoadError",
+                suggestion="Check that the root specification file is readable",
+            )
+
+        document = BundleBuilder(root, documents, errors).build()
+        bundle = SpecBundle(
+            root_path=root,
+            document=document,
+            files=[root] + sorted(path for path in documents if path != root),
+            errors=errors,
+            load_duration_ms=(time.time() - start_time) * 1000,
+        )
+
+        logger.info(
+            "Specification bundle loaded",
+            root_path=str(root),
+            files=len(bundle.files),
+            errors=len(errors),
+            cache_hits=self.cache.hits,
+            load_duration_ms=bundle.load_duration_ms,
+        )
+        return bundle
+
+
+class BundleBuilder:
+    """Merges the files of a bundle into the root document.
+
+    Targets of external references are copied into the component section
+    of their kind (e.g., ``components/schemas`` or ``definitions``) under a
+    unique name, and references to them are rewritten to point there.
+    Targets without a component section (e.g., path items) are inlined.
+    """
+
+    def __init__(self, root: Path, documents: Dict[Path, Any], errors: List[str]):
+        """Initialize bundle builder.
+
+        Args:
+            root: Location of the root document
+            documents: Decoded documents by location; not modified
+            errors: List collecting unresolved references
+        """
+        self.root = root
+        self.documents = documents
+        self.errors = errors
+
+        root_document = documents[root]
+        self.swagger_2 = "swagger" in root_document
+        self.root_document = root_document
+
+        self._indexes: Dict[Path, JsonPointerIndex] = {}
+        self._local_refs: Dict[Tuple[Path, str], str] = {}
+        self._additions: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self._inlining: Set[Tuple[Path, str]] = set()
+
+    def build(self) -> Dict[str, Any]:
+        """Build the merged document.
+
+        Returns:
+            Copy of the root document without external references
+        """
+        self._claim_root_entries()
+        document = self._rewrite(self.documents[self.root], self.root, ())
+
+        for section, entries in self._additions.items():
+            container = document
+            for key in section:
+                container = container.setdefault(key, {})
+            container.update(entries)
+
+        return document
+
+    def _claim_root_entries(self) -> None:
+        """Name targets after root component entries that only reference them.
+
+        An entry such as ``Error: {$ref: common.yaml#/Error}`` is replaced
+        by the referenced schema instead of getting a renamed copy.
+        """
+        for kind in SWAGGER_2_SECTIONS if self.swagger_2 else OPENAPI_3_COMPONENT_KINDS:
+            section = self._section_of_kind(kind)
+            entries = self._root_section(section)
+            for name, entry in entries.items():
+                if not (isinstance(entry, dict) and len(entry) == 1):
+                    continue
+                ref = entry.get("$ref")
+                target = self._external_target(ref, self.root)
+                if target is None or target in self._local_refs:
+                    continue
+                self._local_refs[target] = self._section_ref(section, name)
+                self._additions.setdefault(section, {})[name] = None
+
+        for target, local_ref in list(self._local_refs.items()):
+            section, name = self._split_local_ref(local_ref)
+            found, value = self._lookup(*target)
+            if found:
+                self._additions[section][name] = self._rewrite(
+                    value, target[0], section + (name,)
+                )
+            else:
+                # Keep the entry and its reference as they are
+                del self._local_refs[target]
+                del self._additions[section][name]
+
+    def _rewrite(self, node: Any, source: Path, context: Tuple[Any, ...]) -> Any:
+        """Copy a node, rewriting the references it contains.
+
+        Args:
+            node: Node of the document at ``source``
+            source: Location of the document containing the node
+            context: Keys leading to the node in the merged document
+        """
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                rewritten = self._rewrite_ref(ref, source, context)
+                if rewritten is not None:
+                    kind, value = rewritten
+                    if kind == "inline":
+                        return value
+                    node = {**node, "$ref": value}
+            return {
+                key: (
+                    value
+                    if key == "$ref"
+                    else self._rewrite(value, source, context + (key,))
+                )
+                for key, value in node.items()
+            }
+        if isinstance(node, list):
+            return [
+                self._rewrite(item, source, context + (index,))
+                for index, item in enumerate(node)
+            ]
+        return node
+
+    def _rewrite_ref(
+        self, ref: str, source: Path, context: Tuple[Any, ...]
+    ) -> Optional[Tuple[str, Any]]:
+        """Rewrite a reference.
+
+        Returns:
+            ("ref", local reference) or ("inline", target copy), or None to
+            keep the reference as is
+        """
+        file_part, _, fragment = ref.partition("#")
+        if file_part.startswith(REMOTE_REF_PREFIXES):
+            return None
+        if source == self.root and not file_part:
+            return None
+
+        target = self._external_target(ref, source)
+        if target is None:
+            # Reference into the root document from another file
+            return ("ref", f"#{fragment}")
+
+        local_ref = self._local_refs.get(target)
+        if local_ref is not None:
+            return ("ref", local_ref)
+
+        document_path, pointer = target
+        if document_path not in self.documents:
+            return None  # Load failure, already reported
+        found, value = self._lookup(document_path, pointer)
+        if not found:
+            self.errors.append(f"Reference not found: {ref} (in {source})")
+            return None
+
+        section = self._target_section(pointer, context)
+        if section is None:
+            if target in self._inlining:
+                self.errors.append(f"Circular reference cannot be inlined: {ref}")
+                return None
+            self._inlining.add(target)
+            try:
+                return ("inline", self._rewrite(value, document_path, context))
+            finally:
+                self._inlining.discard(target)
+
+        name = self._unique_name(section, self._name_hint(document_path, pointer))
+        local_ref = self._section_ref(section, name)
+        self._local_refs[target] = local_ref
+        additions = self._additions.setdefault(section, {})
+        additions[name] = None  # Reserve the name for cyclic references
+        additions[name] = self._rewrite(value, document_path, section + (name,))
+        return ("ref", local_ref)
+
+    def _external_target(self, ref: Any, source: Path) -> Optional[Tuple[Path, str]]:
+        """Get the (file, pointer) target of a reference outside the root.
+
+        Returns:
+            Target, or None for references into the root document, remote
+            references and invalid values
+        """
+        if not isinstance(ref, str):
+            return None
+        file_part, hash_sign, fragment = ref.partition("#")
+        if file_part.startswith(REMOTE_REF_PREFIXES):
+            return None
+
+        document_path = source
+        if file_part:
+            document_path = (source.parent / unquote(file_part)).resolve()
+        if document_path == self.root:
+            return None
+
+        pointer = unquote(fragment) if hash_sign else ""
+        return document_path, pointer
+
+    def _lookup(self, document_path: Path, pointer: str) -> Tuple[bool, Any]:
+        """Look up a JSON pointer in a loaded document."""
+        if document_path not in self.documents:
+            return False, None
+        if pointer and not pointer.startswith("/"):
+            return False, None
+        index = self._indexes.get(document_path)
+        if index is None:
+            index = JsonPointerIndex(self.documents[document_path])
+            self._indexes[document_path] = index
+        return index.get(pointer)
+
+    def _target_section(
+        self, pointer: str, context: Tuple[Any, ...]
+    ) -> Optional[Tuple[str, ...]]:
+        """Choose the section of the merged document a target is moved to.
+
+        The kind comes from the target's own location if it is a component
+        (e.g., "/components/parameters/Limit"), otherwise from where it is
+        referenced.
+        """
+        tokens = [unescape_pointer_token(token) for token in pointer.split("/")[1:]]
+        kind = None
+        if len(tokens) == 3 and tokens[0] == "components":
+            kind = tokens[1] if tokens[1] in OPENAPI_3_COMPONENT_KINDS else None
+        elif len(tokens) == 2 and tokens[0] == "definitions":
+            kind = "schemas"
+        elif len(tokens) == 2 and tokens[0] in ("parameters", "responses"):
+            kind = tokens[0]
+
+        if kind is None:
+            kind = self._context_kind(context)
+        if kind is None:
+            return None
+        return self._section_of_kind(kind)
+
+    @staticmethod
+    def _context_kind(context: Tuple[Any, ...]) -> Optional[str]:
+        """Infer the component kind of a reference from its location.
+
+        Returns:
+            Component kind, or None for path items
+        """
+        if not context:
+            return "schemas"
+        if context[-1] == "requestBody":
+            return "requestBodies"
+        if len(context) >= 2:
+            parent = context[-2]
+            in_properties = len(context) >= 3 and context[-3] == "properties"
+            if parent == "paths":
+                return None
+            if parent in CONTAINER_KINDS and not in_properties:
+                return CONTAINER_KINDS[parent]
+        return "schemas"
+
+    def _section_of_kind(self, kind: str) -> Optional[Tuple[str, ...]]:
+        """Get the section of the merged document holding a component kind."""
+        if self.swagger_2:
+            return SWAGGER_2_SECTIONS.get(kind)
+        return ("components", kind)
+
+    def _root_section(self, section: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+        """Get a section of the root document, or an empty dict."""
+        node: Any = self.root_document
+        for key in section or ():
+            node = node.get(key) if isinstance(node, dict) else None
+        return node if isinstance(node, dict) else {}
+
+    def _unique_name(self, section: Tuple[str, ...], hint: str) -> str:
+        """Get a name not yet used in a section."""
+        taken = (
+            self._root_section(section).keys() | self._additions.get(section, {}).keys()
+        )
+        name = hint
+        suffix = 2
+        while name in taken:
+            name = f"{hint}_{suffix}"
+            suffix += 1
+        return name
+
+    @staticmethod
+    def _name_hint(document_path: Path, pointer: str) -> str:
+        """Derive a component name from a target location."""
+        token = pointer.rpartition("/")[2] if pointer else document_path.stem
+        name = INVALID_NAME_CHARACTERS.sub("_", unescape_pointer_token(token))
+        return name or document_path.stem
+
+    @staticmethod
+    def _section_ref(section: Tuple[str, ...], name: str) -> str:
+        """Get the local reference to a section entry."""
+        tokens = [
+            token.replace("~", "~0").replace("/", "~1") for token in section + (name,)
+        ]
+        return "#/" + "/".join(tokens)
+
+    @staticmethod
+    def _split_local_ref(local_ref: str) -> Tuple[Tuple[str, ...], str]:
+        """Split a local reference made by ``_section_ref``."""
+        tokens = [unescape_pointer_token(token) for token in local_ref[2:].split("/")]
+        return tuple(tokens[:-1]), tokens[-1]
@@ -12,7 +12,7 @@ import asyncio
 import re
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from swagger_mcp_server.config.logging import get_logger
 
@@ -55,6 +55,7 @@ class CategorizationEngine:
         self.logger = logger
         self._tag_definitions: Dict[str, Dict] = {}
         self._tag_groups: List[Dict] = []
+        self._tag_group_index: Dict[str, str] = {}
 
     def set_tag_definitions(self, tags: List[Dict]) -> None:
         """Set tag definitions from OpenAPI spec root.
@@ -74,6 +75,19 @@ class CategorizationEngine:
             tag_groups: List of tag group objects with name and tags array
         """
         self._tag_groups = tag_groups or []
+
+        # Tag -> group name; the first group listing a tag wins
+        self._tag_group_index = {}
+        for group in self._tag_groups:
+            if not isinstance(group, dict):
+                continue
+            group_tags = group.get("tags", [])
+            if not isinstance(group_tags, (list, tuple, set)):
+                continue
+            for tag in group_tags:
+                if isinstance(tag, str):
+                    self._tag_group_index.setdefault(tag, group.get("name"))
+
         self.logger.debug("Tag groups loaded", count=len(self._tag_groups))
 
     def categorize_endpoint(
@@ -104,12 +118,108 @@ class CategorizationEngine:
             )
             return self._get_default_category()
 
+        return self._categorize(
+            operation,
+            path,
+            self.extract_category_from_tags,
+            self.extract_category_from_path,
+        )
+
+    def categorize_endpoints(
+        self,
+        endpoints: Iterable[Tuple[str, str, Dict]],
+        catalog: Optional["CategoryCatalog"] = None,
+    ) -> List[CategoryInfo]:
+        """Categorize many endpoints at once.
+
+        Gives the same results as calling ``categorize_endpoint`` for each
+        endpoint, but resolves each distinct primary tag and each distinct
+        path prefix only once.
+
+        Args:
+            endpoints: (path, method, operation) tuples
+            catalog: Catalog to add the categorized endpoints to
+
+        Returns:
+            CategoryInfo of every endpoint, in input order
+        """
+        tag_categories: Dict[str, CategoryInfo] = {}
+        path_categories: Dict[str, Optional[str]] = {}
+
+        def from_tags(tags: List[str]) -> Optional[CategoryInfo]:
+            primary_tag = tags[0]
+            shared = tag_categories.get(primary_tag)
+            if shared is None:
+                shared = self.extract_category_from_tags([primary_tag])
+                tag_categories[primary_tag] = shared
+            return CategoryInfo(
+                category=shared.category,
+                display_name=shared.display_name,
+                description=shared.description,
+                category_group=shared.category_group,
+                metadata={"original_tag": primary_tag, "all_tags": tags},
+            )
+
+        def from_path(path: str) -> Optional[str]:
+            prefix = self._path_prefix(path)
+            if prefix not in path_categories:
+                path_categories[prefix] = self.extract_category_from_path(prefix)
+            return path_categories[prefix]
+
+        results = []
+        for path, method, operation in endpoints:
+            if isinstance(operation, dict) and path and isinstance(path, str):
+                category_info = self._categorize(operation, path, from_tags, from_path)
+            else:
+                # Logs the invalid input and falls back to the default
+                category_info = self.categorize_endpoint(operation, path)
+
+            if catalog is not None:
+                catalog.add_endpoint_sync(category_info, method)
+            results.append(category_info)
+
+        self.logger.debug(
+            "Endpoints categorized",
+            endpoints=len(results),
+            distinct_tags=len(tag_categories),
+            distinct_path_prefixes=len(path_categories),
+        )
+        return results
+
+    @staticmethod
+    def _path_prefix(path: str) -> str:
+        """Get the part of a path that path-based categorization looks at.
+
+        ``PATH_PATTERNS`` match at most the first three segments, so paths
+        sharing them (e.g. /api/v1/campaign/list and /api/v1/campaign/get)
+        get the same path category.
+        """
+        return "/".join(path.split("/", 4)[:4])
+
+    def _categorize(
+        self,
+        operation: Dict,
+        path: str,
+        from_tags: Callable[[List[str]], Optional[CategoryInfo]],
+        from_path: Callable[[str], Optional[str]],
+    ) -> CategoryInfo:
+        """Categorize a validated endpoint.
+
+        Args:
+            operation: OpenAPI operation object
+            path: Endpoint path
+            from_tags: Extracts the category from operation tags
+            from_path: Extracts the category name from the path
+
+        Returns:
+            CategoryInfo with extracted category data
+        """
         try:
             tags = operation.get("tags", [])
 
             # Priority 1: Extract from tags
             if tags and isinstance(tags, list):
-                category_info = self.extract_category_from_tags(tags)
+                category_info = from_tags(tags)
                 if category_info:
                     self.logger.debug(
                         "Category extracted from tags",
@@ -119,7 +229,7 @@ class CategorizationEngine:
                     return category_info
 
             # Priority 2: Extract from path
-            category = self.extract_category_from_path(path)
+            category = from_path(path)
             if category:
                 self.logger.debug(
                     "Category extracted from path", path=path, category=category
@@ -196,11 +306,7 @@ class CategorizationEngine:
         Returns:
             Group name if found, None otherwise
         """
-        for group in self._tag_groups:
-            group_tags = group.get("tags", [])
-            if tag in group_tags:
-                return group.get("name")
-        return None
+        return self._tag_group_index.get(tag)
 
     @lru_cache(maxsize=256)
     def extract_category_from_path(self, path: str) -> Optional[str]:
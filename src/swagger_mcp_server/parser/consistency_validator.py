@@ -1,8 +1,29 @@
-"""Semantic consistency validation for normalized OpenAPI data."""
+"""Semantic consistency validation for normalized OpenAPI data.
+
+Consistency checks are implemented as rules that run together in a single
+traversal of the normalized API: each rule declares the node types it
+inspects, the visitor calls it for those nodes only and records the time
+spent in every rule.
+"""
 
 import re
+import time
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Set, Tuple
+from enum import Enum
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from swagger_mcp_server.config.logging import get_logger
 from swagger_mcp_server.parser.models import (
@@ -16,427 +37,407 @@ from swagger_mcp_server.parser.models import (
 
 logger = get_logger(__name__)
 
+PATH_PARAMETER_PATTERN = re.compile(r"\{([^}]+)\}")
 
-class ConsistencyValidator:
-    """Validates semantic consistency across normalized OpenAPI components."""
+PRIMITIVE_TYPE_NAMES = frozenset(
+    {"string", "number", "integer", "boolean", "array", "object"}
+)
 
-    def __init__(self):
-        self.logger = get_logger(__name__)
 
-    def _get_method_str(self, endpoint):
-        """Get method string from endpoint, handling both enum and string cases."""
-        return (
-            endpoint.method.value.upper()
-            if hasattr(endpoint.method, "value")
-            else str(endpoint.method).upper()
-        )
+class NodeType(Enum):
+    """Node types of the normalized API visited by consistency rules."""
 
-    def validate_full_consistency(
+    ENDPOINT = "endpoint"
+    PARAMETER = "parameter"
+    SCHEMA = "schema"
+
+
+def get_method_str(endpoint: NormalizedEndpoint) -> str:
+    """Get method string from endpoint, handling both enum and string cases."""
+    return (
+        endpoint.method.value.upper()
+        if hasattr(endpoint.method, "value")
+        else str(endpoint.method).upper()
+    )
+
+
+def analyze_naming_patterns(names: List[str]) -> Dict[str, int]:
+    """Analyze naming patterns in a list of names."""
+    patterns = defaultdict(int)
+
+    for name in names:
+        if "_" in name and name.islower():
+            patterns["snake_case"] += 1
+        elif re.match(r"^[a-z]+([A-Z][a-z]*)*$", name):
+            patterns["camelCase"] += 1
+        elif re.match(r"^[A-Z][a-z]*([A-Z][a-z]*)*$", name):
+            patterns["PascalCase"] += 1
+        elif "-" in name and name.islower():
+            patterns["kebab-case"] += 1
+        elif name.isupper():
+            patterns["UPPER_CASE"] += 1
+        else:
+            patterns["mixed"] += 1
+
+    return dict(patterns)
+
+
+class ConsistencyRule:
+    """Base class for consistency rules.
+
+    Subclasses set ``name`` and the ``node_types`` they inspect and
+    override the matching ``visit_*`` methods. ``finish`` runs after all
+    nodes have been visited, for checks that need the whole API. Issues are
+    collected in ``errors`` and ``warnings``.
+    """
+
+    name: str = ""
+    node_types: FrozenSet[NodeType] = frozenset()
+
+    def __init__(
         self,
-        endpoints: List[NormalizedEndpoint],
         schemas: Dict[str, NormalizedSchema],
         security_schemes: Dict[str, NormalizedSecurityScheme],
-    ) -> Tuple[List[str], List[str]]:
-        """Perform comprehensive consistency validation.
+    ):
+        """Initialize rule.
 
         Args:
-            endpoints: List of normalized endpoints
             schemas: Dictionary of normalized schemas
             security_schemes: Dictionary of security schemes
-
-        Returns:
-            Tuple of (errors, warnings)
         """
-        errors = []
-        warnings = []
-
-        self.logger.info(
-            "Starting comprehensive consistency validation",
-            endpoints=len(endpoints),
-            schemas=len(schemas),
-            security_schemes=len(security_schemes),
-        )
-
-        # Reference consistency validation
-        ref_errors, ref_warnings = self.validate_reference_consistency(
-            endpoints, schemas, security_schemes
-        )
-        errors.extend(ref_errors)
-        warnings.extend(ref_warnings)
+        self.schemas = schemas
+        self.security_schemes = security_schemes
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
 
-        # Path parameter consistency
-        path_errors, path_warnings = self.validate_path_parameter_consistency(endpoints)
-        errors.extend(path_errors)
-        warnings.extend(path_warnings)
+    def visit_endpoint(self, endpoint: NormalizedEndpoint) -> None:
+        """Inspect an endpoint."""
 
-        # Schema consistency
-        schema_errors, schema_warnings = self.validate_schema_consistency(
-            endpoints, schemas
-        )
-        errors.extend(schema_errors)
-        warnings.extend(schema_warnings)
+    def visit_parameter(
+        self, endpoint: NormalizedEndpoint, param: NormalizedParameter
+    ) -> None:
+        """Inspect a parameter of an endpoint."""
 
-        # Security consistency
-        sec_errors, sec_warnings = self.validate_security_consistency(
-            endpoints, security_schemes
-        )
-        errors.extend(sec_errors)
-        warnings.extend(sec_warnings)
+    def visit_schema(self, schema_name: str, schema: NormalizedSchema) -> None:
+        """Inspect a schema."""
 
-        # Naming consistency
-        naming_warnings = self.validate_naming_consistency(endpoints, schemas)
-        warnings.extend(naming_warnings)
+    def finish(self) -> None:
+        """Run checks that need all visited nodes."""
 
-        # HTTP method consistency
-        method_warnings = self.validate_http_method_consistency(endpoints)
-        warnings.extend(method_warnings)
 
-        # Response consistency
-        response_warnings = self.validate_response_consistency(endpoints)
-        warnings.extend(response_warnings)
-
-        self.logger.info(
-            "Consistency validation completed",
-            errors=len(errors),
-            warnings=len(warnings),
-        )
+class ReferenceRule(ConsistencyRule):
+    """All references point to existing definitions."""
 
-        return errors, warnings
+    name = "references"
+    node_types = frozenset({NodeType.ENDPOINT, NodeType.PARAMETER, NodeType.SCHEMA})
 
-    def validate_reference_consistency(
-        self,
-        endpoints: List[NormalizedEndpoint],
-        schemas: Dict[str, NormalizedSchema],
-        security_schemes: Dict[str, NormalizedSecurityScheme],
-    ) -> Tuple[List[str], List[str]]:
-        """Validate that all references point to existing definitions."""
-        errors = []
-        warnings = []
+    def visit_endpoint(self, endpoint: NormalizedEndpoint) -> None:
+        # Check schema dependencies
+        for schema_name in endpoint.schema_dependencies:
+            if schema_name not in self.schemas:
+                self.errors.append(
+                    f"Endpoint {get_method_str(endpoint)} {endpoint.path} "
+                    f"references undefined schema: {schema_name}"
+                )
 
-        schema_names = set(schemas.keys())
-        security_scheme_names = set(security_schemes.keys())
+        # Check security dependencies
+        for scheme_name in endpoint.security_dependencies:
+            if scheme_name not in self.security_schemes:
+                self.errors.append(
+                    f"Endpoint {get_method_str(endpoint)} {endpoint.path} "
+                    f"references undefined security scheme: {scheme_name}"
+                )
 
-        for endpoint in endpoints:
-            # Check schema dependencies
-            for schema_name in endpoint.schema_dependencies:
-                if schema_name not in schema_names:
-                    errors.append(
-                        f"Endpoint {self._get_method_str(endpoint)} {endpoint.path} "
-                        f"references undefined schema: {schema_name}"
-                    )
+    def visit_parameter(
+        self, endpoint: NormalizedEndpoint, param: NormalizedParameter
+    ) -> None:
+        # Check parameter schema references
+        if param.schema_ref:
+            ref_name = (
+                param.schema_ref.split("/")[-1]
+                if "/" in param.schema_ref
+                else param.schema_ref
+            )
+            if ref_name not in self.schemas and not param.schema_ref.startswith("#/"):
+                self.warnings.append(
+                    f"Parameter {param.name} in {endpoint.path} "
+                    f"references unresolved schema: {param.schema_ref}"
+                )
 
-            # Check security dependencies
-            for scheme_name in endpoint.security_dependencies:
-                if scheme_name not in security_scheme_names:
-                    errors.append(
-                        f"Endpoint {self._get_method_str(endpoint)} {endpoint.path} "
-                        f"references undefined security scheme: {scheme_name}"
-                    )
+    def visit_schema(self, schema_name: str, schema: NormalizedSchema) -> None:
+        # Check schema cross-references
+        for ref_name in schema.dependencies:
+            if ref_name not in self.schemas:
+                self.errors.append(
+                    f"Schema {schema_name} references undefined schema: {ref_name}"
+                )
 
-            # Check parameter schema references
-            for param in endpoint.parameters:
-                if param.schema_ref:
-                    ref_name = (
-                        param.schema_ref.split("/")[-1]
-                        if "/" in param.schema_ref
-                        else param.schema_ref
-                    )
-                    if (
-                        ref_name not in schema_names
-                        and not param.schema_ref.startswith("#/")
-                    ):
-                        warnings.append(
-                            f"Parameter {param.name} in {endpoint.path} "
-                            f"references unresolved schema: {param.schema_ref}"
-                        )
 
-        # Check schema cross-references
-        for schema_name, schema in schemas.items():
-            for ref_name in schema.dependencies:
-                if ref_name not in schema_names:
-                    errors.append(
-                        f"Schema {schema_name} references undefined schema: {ref_name}"
-                    )
+class PathParameterRule(ConsistencyRule):
+    """Path parameters match path templates and agree across methods."""
 
-        return errors, warnings
+    name = "path_parameters"
+    node_types = frozenset({NodeType.ENDPOINT})
 
-    def validate_path_parameter_consistency(
-        self, endpoints: List[NormalizedEndpoint]
-    ) -> Tuple[List[str], List[str]]:
-        """Validate path parameter consistency."""
-        errors = []
-        warnings = []
+    def __init__(
+        self,
+        schemas: Dict[str, NormalizedSchema],
+        security_schemes: Dict[str, NormalizedSecurityScheme],
+    ):
+        super().__init__(schemas, security_schemes)
+        # Issues and path parameter definitions grouped by path template,
+        # reported path by path
+        self._path_errors: Dict[str, List[str]] = defaultdict(list)
+        self._path_warnings: Dict[str, List[str]] = defaultdict(list)
+        self._path_endpoint_counts: Dict[str, int] = defaultdict(int)
+        self._param_definitions: Dict[str, Dict[str, List[NormalizedParameter]]] = (
+            defaultdict(lambda: defaultdict(list))
+        )
+        self._template_params: Dict[str, Set[str]] = {}
+
+    def visit_endpoint(self, endpoint: NormalizedEndpoint) -> None:
+        path = endpoint.path
+        errors = self._path_errors[path]
+        warnings = self._path_warnings[path]
+        self._path_endpoint_counts[path] += 1
+
+        # Extract path parameter names from template
+        path_param_names = self._template_params.get(path)
+        if path_param_names is None:
+            path_param_names = set(PATH_PARAMETER_PATTERN.findall(path))
+            self._template_params[path] = path_param_names
+
+        # Get actual path parameters
+        path_params = [
+            param
+            for param in endpoint.parameters
+            if param.location == ParameterLocation.PATH
+        ]
+        actual_path_params = {param.name for param in path_params}
+
+        # Check for missing path parameters
+        missing_params = path_param_names - actual_path_params
+        if missing_params:
+            errors.append(
+                f"Endpoint {get_method_str(endpoint)} {path} "
+                f"missing path parameters: {missing_params}"
+            )
 
-        # Group endpoints by path template
-        path_groups = defaultdict(list)
-        for endpoint in endpoints:
-            path_groups[endpoint.path].append(endpoint)
-
-        for path, path_endpoints in path_groups.items():
-            # Extract path parameter names from template
-            path_param_names = set(re.findall(r"\{([^}]+)\}", path))
-
-            for endpoint in path_endpoints:
-                # Get actual path parameters
-                actual_path_params = {
-                    param.name
-                    for param in endpoint.parameters
-                    if param.location == ParameterLocation.PATH
-                }
-
-                # Check for missing path parameters
-                missing_params = path_param_names - actual_path_params
-                if missing_params:
-                    errors.append(
-                        f"Endpoint {self._get_method_str(endpoint)} {path} "
-                        f"missing path parameters: {missing_params}"
-                    )
+        # Check for extra path parameters
+        extra_params = actual_path_params - path_param_names
+        if extra_params:
+            warnings.append(
+                f"Endpoint {get_method_str(endpoint)} {path} "
+                f"has extra path parameters not in template: {extra_params}"
+            )
 
-                # Check for extra path parameters
-                extra_params = actual_path_params - path_param_names
-                if extra_params:
-                    warnings.append(
-                        f"Endpoint {self._get_method_str(endpoint)} {path} "
-                        f"has extra path parameters not in template: {extra_params}"
-                    )
+        # Validate that path parameters are required
+        for param in path_params:
+            if not param.required:
+                errors.append(
+                    f"Path parameter {param.name} in {get_method_str(endpoint)} {path} "
+                    "must be required"
+                )
+            self._param_definitions[path][param.name].append(param)
 
-                # Validate that path parameters are required
-                for param in endpoint.parameters:
-                    if param.location == ParameterLocation.PATH and not param.required:
-                        errors.append(
-                            f"Path parameter {param.name} in {self._get_method_str(endpoint)} {path} "
-                            "must be required"
-                        )
+    def finish(self) -> None:
+        for path, errors in self._path_errors.items():
+            self.errors.extend(errors)
+            self.warnings.extend(self._path_warnings[path])
 
             # Check consistency across methods for the same path
-            if len(path_endpoints) > 1:
-                self._validate_path_parameter_consistency_across_methods(
-                    path, path_endpoints, errors, warnings
+            if self._path_endpoint_counts[path] > 1:
+                self._check_across_methods(path)
+
+    def _check_across_methods(self, path: str) -> None:
+        """Check path parameter definitions across methods of a path."""
+        for param_name, params in self._param_definitions[path].items():
+            if len(params) <= 1:
+                continue
+
+            types = {param.schema_type for param in params if param.schema_type}
+            formats = {param.format for param in params if param.format}
+            descriptions = {
+                param.description.strip() for param in params if param.description
+            }
+
+            if len(types) > 1:
+                self.warnings.append(
+                    f"Path parameter {param_name} in {path} has inconsistent types: {types}"
                 )
 
-        return errors, warnings
+            if len(formats) > 1:
+                self.warnings.append(
+                    f"Path parameter {param_name} in {path} has inconsistent formats: {formats}"
+                )
 
-    def _validate_path_parameter_consistency_across_methods(
-        self,
-        path: str,
-        endpoints: List[NormalizedEndpoint],
-        errors: List[str],
-        warnings: List[str],
-    ):
-        """Validate path parameter consistency across methods for the same path."""
-        # Get path parameters from all methods
-        param_definitions = {}
+            if len(descriptions) > 1:
+                self.warnings.append(
+                    f"Path parameter {param_name} in {path} has inconsistent descriptions"
+                )
 
-        for endpoint in endpoints:
-            for param in endpoint.parameters:
-                if param.location == ParameterLocation.PATH:
-                    if param.name not in param_definitions:
-                        param_definitions[param.name] = []
-                    param_definitions[param.name].append((endpoint.method, param))
-
-        # Check for inconsistent parameter definitions
-        for param_name, param_list in param_definitions.items():
-            if len(param_list) > 1:
-                # Check type consistency
-                types = set()
-                formats = set()
-                descriptions = set()
-
-                for method, param in param_list:
-                    if param.schema_type:
-                        types.add(param.schema_type)
-                    if param.format:
-                        formats.add(param.format)
-                    if param.description:
-                        descriptions.add(param.description.strip())
-
-                if len(types) > 1:
-                    warnings.append(
-                        f"Path parameter {param_name} in {path} has inconsistent types: {types}"
-                    )
 
-                if len(formats) > 1:
-                    warnings.append(
-                        f"Path parameter {param_name} in {path} has inconsistent formats: {formats}"
-                    )
+class SchemaUsageRule(ConsistencyRule):
+    """Schemas are used, well named and not overly complex."""
 
-                if len(descriptions) > 1:
-                    warnings.append(
-                        f"Path parameter {param_name} in {path} has inconsistent descriptions"
-                    )
+    name = "schemas"
+    node_types = frozenset({NodeType.ENDPOINT, NodeType.SCHEMA})
 
-    def validate_schema_consistency(
+    def __init__(
         self,
-        endpoints: List[NormalizedEndpoint],
         schemas: Dict[str, NormalizedSchema],
-    ) -> Tuple[List[str], List[str]]:
-        """Validate schema usage consistency."""
-        errors = []
-        warnings = []
+        security_schemes: Dict[str, NormalizedSecurityScheme],
+    ):
+        super().__init__(schemas, security_schemes)
+        self._used_schemas: Set[str] = set()
+        self._name_warnings: List[str] = []
+        self._complexity_warnings: List[str] = []
 
-        # Check for unused schemas
-        used_schemas = set()
-        for endpoint in endpoints:
-            used_schemas.update(endpoint.schema_dependencies)
-
-        # Also check schemas used by other schemas
-        for schema in schemas.values():
-            used_schemas.update(schema.dependencies)
-
-        unused_schemas = set(schemas.keys()) - used_schemas
-        if unused_schemas:
-            warnings.extend(
-                [
-                    f"Schema defined but never used: {schema_name}"
-                    for schema_name in unused_schemas
-                ]
-            )
+    def visit_endpoint(self, endpoint: NormalizedEndpoint) -> None:
+        self._used_schemas.update(endpoint.schema_dependencies)
+
+    def visit_schema(self, schema_name: str, schema: NormalizedSchema) -> None:
+        # Schemas used by other schemas
+        self._used_schemas.update(schema.dependencies)
 
         # Check for schema naming conflicts with primitives
-        primitive_types = {
-            "string",
-            "number",
-            "integer",
-            "boolean",
-            "array",
-            "object",
-        }
-        for schema_name in schemas.keys():
-            if schema_name.lower() in primitive_types:
-                warnings.append(
-                    f"Schema name conflicts with primitive type: {schema_name}"
-                )
+        if schema_name.lower() in PRIMITIVE_TYPE_NAMES:
+            self._name_warnings.append(
+                f"Schema name conflicts with primitive type: {schema_name}"
+            )
 
-        # Check for circular dependencies (already handled in schema processor)
-        # Check for overly complex inheritance hierarchies
-        for schema_name, schema in schemas.items():
-            if len(schema.dependencies) > 5:
-                warnings.append(
-                    f"Schema {schema_name} has many dependencies ({len(schema.dependencies)}), "
-                    "consider simplifying"
-                )
+        # Check for overly complex inheritance hierarchies (circular
+        # dependencies are handled in the schema processor)
+        if len(schema.dependencies) > 5:
+            self._complexity_warnings.append(
+                f"Schema {schema_name} has many dependencies ({len(schema.dependencies)}), "
+                "consider simplifying"
+            )
 
-        return errors, warnings
+    def finish(self) -> None:
+        unused_schemas = set(self.schemas.keys()) - self._used_schemas
+        self.warnings.extend(
+            f"Schema defined but never used: {schema_name}"
+            for schema_name in unused_schemas
+        )
+        self.warnings.extend(self._name_warnings)
+        self.warnings.extend(self._complexity_warnings)
 
-    def validate_security_consistency(
+
+class SecurityRule(ConsistencyRule):
+    """Security schemes are used and endpoints are secured."""
+
+    name = "security"
+    node_types = frozenset({NodeType.ENDPOINT})
+
+    def __init__(
         self,
-        endpoints: List[NormalizedEndpoint],
+        schemas: Dict[str, NormalizedSchema],
         security_schemes: Dict[str, NormalizedSecurityScheme],
-    ) -> Tuple[List[str], List[str]]:
-        """Validate security configuration consistency."""
-        errors = []
-        warnings = []
-
-        # Check for unused security schemes
-        used_schemes = set()
-        for endpoint in endpoints:
-            used_schemes.update(endpoint.security_dependencies)
-
-        unused_schemes = set(security_schemes.keys()) - used_schemes
-        if unused_schemes:
-            warnings.extend(
-                [
-                    f"Security scheme defined but never used: {scheme_name}"
-                    for scheme_name in unused_schemes
-                ]
+    ):
+        super().__init__(schemas, security_schemes)
+        self._used_schemes: Set[str] = set()
+        self._unsecured_endpoints: List[str] = []
+
+    def visit_endpoint(self, endpoint: NormalizedEndpoint) -> None:
+        self._used_schemes.update(endpoint.security_dependencies)
+        if not endpoint.security:
+            self._unsecured_endpoints.append(
+                f"{get_method_str(endpoint)} {endpoint.path}"
             )
 
-        # Check for endpoints without security
-        unsecured_endpoints = []
-        for endpoint in endpoints:
-            if not endpoint.security:
-                unsecured_endpoints.append(
-                    f"{self._get_method_str(endpoint)} {endpoint.path}"
-                )
+    def finish(self) -> None:
+        unused_schemes = set(self.security_schemes.keys()) - self._used_schemes
+        self.warnings.extend(
+            f"Security scheme defined but never used: {scheme_name}"
+            for scheme_name in unused_schemes
+        )
 
-        if unsecured_endpoints:
-            warnings.append(
-                f"Endpoints without security requirements: {', '.join(unsecured_endpoints[:5])}"
-                + (
-                    f" and {len(unsecured_endpoints) - 5} more"
-                    if len(unsecured_endpoints) > 5
-                    else ""
-                )
+        unsecured = self._unsecured_endpoints
+        if unsecured:
+            self.warnings.append(
+                f"Endpoints without security requirements: {', '.join(unsecured[:5])}"
+                + (f" and {len(unsecured) - 5} more" if len(unsecured) > 5 else "")
             )
 
-        return errors, warnings
 
-    def validate_naming_consistency(
+class NamingRule(ConsistencyRule):
+    """Operation IDs, schemas and parameters follow one naming convention."""
+
+    name = "naming"
+    node_types = frozenset({NodeType.ENDPOINT, NodeType.PARAMETER, NodeType.SCHEMA})
+
+    def __init__(
         self,
-        endpoints: List[NormalizedEndpoint],
         schemas: Dict[str, NormalizedSchema],
-    ) -> List[str]:
-        """Validate naming convention consistency."""
-        warnings = []
+        security_schemes: Dict[str, NormalizedSecurityScheme],
+    ):
+        super().__init__(schemas, security_schemes)
+        self._operation_ids: List[str] = []
+        self._schema_names: List[str] = []
+        self._param_names: List[str] = []
+
+    def visit_endpoint(self, endpoint: NormalizedEndpoint) -> None:
+        if endpoint.operation_id:
+            self._operation_ids.append(endpoint.operation_id)
+
+    def visit_parameter(
+        self, endpoint: NormalizedEndpoint, param: NormalizedParameter
+    ) -> None:
+        self._param_names.append(param.name)
+
+    def visit_schema(self, schema_name: str, schema: NormalizedSchema) -> None:
+        self._schema_names.append(schema_name)
 
+    def finish(self) -> None:
         # Check operation ID naming patterns
-        operation_ids = [ep.operation_id for ep in endpoints if ep.operation_id]
-        if operation_ids:
-            patterns = self._analyze_naming_patterns(operation_ids)
+        if self._operation_ids:
+            patterns = analyze_naming_patterns(self._operation_ids)
             if len(patterns) > 2:
-                warnings.append(
+                self.warnings.append(
                     f"Inconsistent operation ID naming patterns detected: {list(patterns.keys())[:3]}"
                 )
 
         # Check schema naming patterns
-        schema_names = list(schemas.keys())
-        if schema_names:
-            patterns = self._analyze_naming_patterns(schema_names)
+        if self._schema_names:
+            patterns = analyze_naming_patterns(self._schema_names)
             if len(patterns) > 2:
-                warnings.append(
+                self.warnings.append(
                     f"Inconsistent schema naming patterns detected: {list(patterns.keys())[:3]}"
                 )
 
         # Check parameter naming consistency
-        all_params = []
-        for endpoint in endpoints:
-            all_params.extend([param.name for param in endpoint.parameters])
-
-        if all_params:
-            patterns = self._analyze_naming_patterns(all_params)
+        if self._param_names:
+            patterns = analyze_naming_patterns(self._param_names)
             if len(patterns) > 3:  # Allow more variation for parameters
-                warnings.append("Inconsistent parameter naming patterns detected")
-
-        return warnings
-
-    def _analyze_naming_patterns(self, names: List[str]) -> Dict[str, int]:
-        """Analyze naming patterns in a list of names."""
-        patterns = defaultdict(int)
-
-        for name in names:
-            if "_" in name and name.islower():
-                patterns["snake_case"] += 1
-            elif re.match(r"^[a-z]+([A-Z][a-z]*)*$", name):
-                patterns["camelCase"] += 1
-            elif re.match(r"^[A-Z][a-z]*([A-Z][a-z]*)*$", name):
-                patterns["PascalCase"] += 1
-            elif "-" in name and name.islower():
-                patterns["kebab-case"] += 1
-            elif name.isupper():
-                patterns["UPPER_CASE"] += 1
-            else:
-                patterns["mixed"] += 1
+                self.warnings.append("Inconsistent parameter naming patterns detected")
 
-        return dict(patterns)
 
-    def validate_http_method_consistency(
-        self, endpoints: List[NormalizedEndpoint]
-    ) -> List[str]:
-        """Validate HTTP method usage patterns."""
-        warnings = []
+class HttpMethodRule(ConsistencyRule):
+    """Paths support the usual combinations of HTTP methods."""
 
-        # Group endpoints by path
-        path_methods = defaultdict(set)
-        for endpoint in endpoints:
-            path_methods[endpoint.path].add(endpoint.method)
+    name = "http_methods"
+    node_types = frozenset({NodeType.ENDPOINT})
+
+    def __init__(
+        self,
+        schemas: Dict[str, NormalizedSchema],
+        security_schemes: Dict[str, NormalizedSecurityScheme],
+    ):
+        super().__init__(schemas, security_schemes)
+        self._path_methods: Dict[str, Set[Any]] = defaultdict(set)
 
+    def visit_endpoint(self, endpoint: NormalizedEndpoint) -> None:
+        self._path_methods[endpoint.path].add(endpoint.method)
+
+    def finish(self) -> None:
         # Check for unusual method combinations
-        for path, methods in path_methods.items():
+        for path, methods in self._path_methods.items():
             # Check for paths with only GET (might need POST for creation)
             if methods == {HttpMethod.GET}:
                 # Skip if it looks like a detail endpoint
                 if not re.search(r"\{[^}]+\}", path):
-                    warnings.append(
+                    self.warnings.append(
                         f"Path {path} only supports GET, consider adding POST"
                     )
 
@@ -444,54 +445,297 @@ class ConsistencyValidator:
             if HttpMethod.POST in methods and HttpMethod.GET not in methods:
                 # Check if it looks like a collection endpoint
                 if not re.search(r"\{[^}]+\}$", path):
-                    warnings.append(f"Collection path {path} has POST but no GET")
+                    self.warnings.append(f"Collection path {path} has POST but no GET")
 
             # Check for DELETE without GET
             if HttpMethod.DELETE in methods and HttpMethod.GET not in methods:
-                warnings.append(f"Path {path} supports DELETE but not GET")
+                self.warnings.append(f"Path {path} supports DELETE but not GET")
 
-        return warnings
 
-    def validate_response_consistency(
-        self, endpoints: List[NormalizedEndpoint]
-    ) -> List[str]:
-        """Validate response code consistency patterns."""
-        warnings = []
+class ResponseRule(ConsistencyRule):
+    """Endpoints declare the usual success and error responses."""
 
-        for endpoint in endpoints:
-            status_codes = set(endpoint.responses.keys())
-
-            # Check for missing common success responses
-            if endpoint.method == HttpMethod.GET:
-                if "200" not in status_codes:
-                    warnings.append(f"GET {endpoint.path} missing 200 response")
-            elif endpoint.method == HttpMethod.POST:
-                if "201" not in status_codes and "200" not in status_codes:
-                    warnings.append(f"POST {endpoint.path} missing 201 or 200 response")
-            elif endpoint.method == HttpMethod.PUT:
-                if "200" not in status_codes and "204" not in status_codes:
-                    warnings.append(f"PUT {endpoint.path} missing 200 or 204 response")
-            elif endpoint.method == HttpMethod.DELETE:
-                if "204" not in status_codes and "200" not in status_codes:
-                    warnings.append(
-                        f"DELETE {endpoint.path} missing 204 or 200 response"
-                    )
+    name = "responses"
+    node_types = frozenset({NodeType.ENDPOINT})
 
-            # Check for missing error responses
-            has_client_error = any(code.startswith("4") for code in status_codes)
-            has_server_error = any(code.startswith("5") for code in status_codes)
+    def visit_endpoint(self, endpoint: NormalizedEndpoint) -> None:
+        status_codes = set(endpoint.responses.keys())
 
-            if not has_client_error:
-                warnings.append(
-                    f"{self._get_method_str(endpoint)} {endpoint.path} missing 4xx error responses"
+        # Check for missing common success responses
+        if endpoint.method == HttpMethod.GET:
+            if "200" not in status_codes:
+                self.warnings.append(f"GET {endpoint.path} missing 200 response")
+        elif endpoint.method == HttpMethod.POST:
+            if "201" not in status_codes and "200" not in status_codes:
+                self.warnings.append(
+                    f"POST {endpoint.path} missing 201 or 200 response"
                 )
-
-            if not has_server_error:
-                warnings.append(
-                    f"{self._get_method_str(endpoint)} {endpoint.path} missing 5xx error responses"
+        elif endpoint.method == HttpMethod.PUT:
+            if "200" not in status_codes and "204" not in status_codes:
+                self.warnings.append(f"PUT {endpoint.path} missing 200 or 204 response")
+        elif endpoint.method == HttpMethod.DELETE:
+            if "204" not in status_codes and "200" not in status_codes:
+                self.warnings.append(
+                    f"DELETE {endpoint.path} missing 204 or 200 response"
                 )
 
-        return warnings
+        # Check for missing error responses
+        has_client_error = any(code.startswith("4") for code in status_codes)
+        has_server_error = any(code.startswith("5") for code in status_codes)
+
+        if not has_client_error:
+            self.warnings.append(
+                f"{get_method_str(endpoint)} {endpoint.path} missing 4xx error responses"
+            )
+
+        if not has_server_error:
+            self.warnings.append(
+                f"{get_method_str(endpoint)} {endpoint.path} missing 5xx error responses"
+            )
+
+
+# Rules of a full consistency check, in reporting order
+DEFAULT_RULES: Tuple[Type[ConsistencyRule], ...] = (
+    ReferenceRule,
+    PathParameterRule,
+    SchemaUsageRule,
+    SecurityRule,
+    NamingRule,
+    HttpMethodRule,
+    ResponseRule,
+)
+
+
+class ConsistencyVisitor:
+    """Runs consistency rules in a single traversal of the normalized API.
+
+    Endpoints are visited first, then schemas, in chunks of ``chunk_size``
+    nodes: every rule registered for a node type processes a chunk before
+    the traversal moves on, so each chunk is walked while it is hot and
+    rule time is measured per chunk rather than per node. A rule visits the
+    parameters of an endpoint right after the endpoint itself.
+    """
+
+    def __init__(self, rules: List[ConsistencyRule], chunk_size: int = 256):
+        """Initialize visitor.
+
+        Args:
+            rules: Rules to run, in reporting order
+            chunk_size: Number of nodes visited per rule at a time
+        """
+        self.rules = rules
+        self.chunk_size = chunk_size
+        self.rule_timings_ms: Dict[str, float] = {rule.name: 0.0 for rule in rules}
+
+    def run(
+        self,
+        endpoints: Iterable[NormalizedEndpoint],
+        schemas: Mapping[str, NormalizedSchema],
+    ) -> Tuple[List[str], List[str]]:
+        """Visit all nodes and collect the issues of all rules.
+
+        Args:
+            endpoints: Normalized endpoints, iterated once
+            schemas: Mapping of normalized schemas, iterated once
+
+        Returns:
+            Tuple of (errors, warnings) in rule order
+        """
+        elapsed = [0.0] * len(self.rules)
+        endpoint_rules = [
+            (index, rule, NodeType.PARAMETER in rule.node_types)
+            for index, rule in enumerate(self.rules)
+            if rule.node_types & {NodeType.ENDPOINT, NodeType.PARAMETER}
+        ]
+        schema_rules = [
+            (index, rule)
+            for index, rule in enumerate(self.rules)
+            if NodeType.SCHEMA in rule.node_types
+        ]
+        clock = time.perf_counter
+
+        for chunk in self._chunks(endpoints):
+            for index, rule, visits_parameters in endpoint_rules:
+                start = clock()
+                self._visit_endpoints(rule, chunk, visits_parameters)
+                elapsed[index] += clock() - start
+
+        for chunk in self._chunks(schemas.items()):
+            for index, rule in schema_rules:
+                start = clock()
+                visit_schema = rule.visit_schema
+                for schema_name, schema in chunk:
+                    visit_schema(schema_name, schema)
+                elapsed[index] += clock() - start
+
+        errors: List[str] = []
+        warnings: List[str] = []
+        for index, rule in enumerate(self.rules):
+            start = clock()
+            rule.finish()
+            elapsed[index] += clock() - start
+
+            errors.extend(rule.errors)
+            warnings.extend(rule.warnings)
+            self.rule_timings_ms[rule.name] += elapsed[index] * 1000
+
+        return errors, warnings
+
+    def _chunks(self, nodes: Iterable[Any]) -> Iterator[List[Any]]:
+        """Split nodes into chunks without indexing or copying the input.
+
+        Endpoints and schemas of spilled normalization results are only
+        iterable, and read back from disk one at a time.
+        """
+        iterator = iter(nodes)
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def _visit_endpoints(
+        rule: ConsistencyRule,
+        endpoints: List[NormalizedEndpoint],
+        visits_parameters: bool,
+    ) -> None:
+        """Pass endpoints (and their parameters) to a rule."""
+        visits_endpoints = NodeType.ENDPOINT in rule.node_types
+        visit_endpoint = rule.visit_endpoint
+        visit_parameter = rule.visit_parameter
+
+        for endpoint in endpoints:
+            if visits_endpoints:
+                visit_endpoint(endpoint)
+            if visits_parameters:
+                for param in endpoint.parameters:
+                    visit_parameter(endpoint, param)
+
+
+class ConsistencyValidator:
+    """Validates semantic consistency across normalized OpenAPI components."""
+
+    def __init__(self, rules: Optional[List[Type[ConsistencyRule]]] = None):
+        """Initialize consistency validator.
+
+        Args:
+            rules: Rule classes of a full consistency check, defaults to
+                ``DEFAULT_RULES``
+        """
+        self.rules = list(rules or DEFAULT_RULES)
+        self.logger = get_logger(__name__)
+
+        # Time spent per rule (ms) in the last full consistency check
+        self.rule_timings_ms: Dict[str, float] = {}
+
+    def validate_full_consistency(
+        self,
+        endpoints: List[NormalizedEndpoint],
+        schemas: Dict[str, NormalizedSchema],
+        security_schemes: Dict[str, NormalizedSecurityScheme],
+    ) -> Tuple[List[str], List[str]]:
+        """Perform comprehensive consistency validation.
+
+        All rules run in a single pass over endpoints and schemas; the time
+        spent per rule is kept in ``rule_timings_ms``.
+
+        Args:
+            endpoints: List of normalized endpoints
+            schemas: Dictionary of normalized schemas
+            security_schemes: Dictionary of security schemes
+
+        Returns:
+            Tuple of (errors, warnings)
+        """
+        self.logger.info(
+            "Starting comprehensive consistency validation",
+            endpoints=len(endpoints),
+            schemas=len(schemas),
+            security_schemes=len(security_schemes),
+        )
+
+        visitor = ConsistencyVisitor(
+            [rule(schemas, security_schemes) for rule in self.rules]
+        )
+        errors, warnings = visitor.run(endpoints, schemas)
+        self.rule_timings_ms = visitor.rule_timings_ms
+
+        self.logger.info(
+            "Consistency validation completed",
+            errors=len(errors),
+            warnings=len(warnings),
+            rule_timings_ms={
+                name: round(duration, 3)
+                for name, duration in self.rule_timings_ms.items()
+            },
+        )
+
+        return errors, warnings
+
+    def _run_rule(
+        self,
+        rule_class: Type[ConsistencyRule],
+        endpoints: List[NormalizedEndpoint],
+        schemas: Optional[Dict[str, NormalizedSchema]] = None,
+        security_schemes: Optional[Dict[str, NormalizedSecurityScheme]] = None,
+    ) -> Tuple[List[str], List[str]]:
+        """Run a single rule over the normalized API."""
+        rule = rule_class(schemas or {}, security_schemes or {})
+        return ConsistencyVisitor([rule]).run(endpoints, schemas or {})
+
+    def validate_reference_consistency(
+        self,
+        endpoints: List[NormalizedEndpoint],
+        schemas: Dict[str, NormalizedSchema],
+        security_schemes: Dict[str, NormalizedSecurityScheme],
+    ) -> Tuple[List[str], List[str]]:
+        """Validate that all references point to existing definitions."""
+        return self._run_rule(ReferenceRule, endpoints, schemas, security_schemes)
+
+    def validate_path_parameter_consistency(
+        self, endpoints: List[NormalizedEndpoint]
+    ) -> Tuple[List[str], List[str]]:
+        """Validate path parameter consistency."""
+        return self._run_rule(PathParameterRule, endpoints)
+
+    def validate_schema_consistency(
+        self,
+        endpoints: List[NormalizedEndpoint],
+        schemas: Dict[str, NormalizedSchema],
+    ) -> Tuple[List[str], List[str]]:
+        """Validate schema usage consistency."""
+        return self._run_rule(SchemaUsageRule, endpoints, schemas)
+
+    def validate_security_consistency(
+        self,
+        endpoints: List[NormalizedEndpoint],
+        security_schemes: Dict[str, NormalizedSecurityScheme],
+    ) -> Tuple[List[str], List[str]]:
+        """Validate security configuration consistency."""
+        return self._run_rule(
+            SecurityRule, endpoints, security_schemes=security_schemes
+        )
+
+    def validate_naming_consistency(
+        self,
+        endpoints: List[NormalizedEndpoint],
+        schemas: Dict[str, NormalizedSchema],
+    ) -> List[str]:
+        """Validate naming convention consistency."""
+        return self._run_rule(NamingRule, endpoints, schemas)[1]
+
+    def validate_http_method_consistency(
+        self, endpoints: List[NormalizedEndpoint]
+    ) -> List[str]:
+        """Validate HTTP method usage patterns."""
+        return self._run_rule(HttpMethodRule, endpoints)[1]
+
+    def validate_response_consistency(
+        self, endpoints: List[NormalizedEndpoint]
+    ) -> List[str]:
+        """Validate response code consistency patterns."""
+        return self._run_rule(ResponseRule, endpoints)[1]
 
     def generate_consistency_report(
         self,
@@ -529,6 +773,7 @@ class ConsistencyValidator:
                 "consistency_score": self._calculate_consistency_score(
                     errors, warnings, endpoints, schemas
                 ),
+                "rule_timings_ms": dict(self.rule_timings_ms),
             },
             "recommendations": self._generate_recommendations(errors, warnings),
         }
@@ -2,9 +2,10 @@
 
 import re
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from swagger_mcp_server.config.logging import get_logger
+from swagger_mcp_server.parser.fast_models import EndpointRecord
 from swagger_mcp_server.parser.models import (
     HttpMethod,
     NormalizedEndpoint,
@@ -14,6 +15,7 @@ from swagger_mcp_server.parser.models import (
     NormalizedSecurityRequirement,
     ParameterLocation,
 )
+from swagger_mcp_server.parser.schema_interner import SchemaInterner
 
 logger = get_logger(__name__)
 
@@ -21,8 +23,22 @@ logger = get_logger(__name__)
 class EndpointNormalizer:
     """Normalizes OpenAPI path operations into structured endpoint models."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        strict_validation: bool = False,
+        interner: Optional[SchemaInterner] = None,
+    ):
+        """Initialize endpoint normalizer.
+
+        Args:
+            strict_validation: Whether to run full Pydantic validation when
+                converting endpoint records to models
+            interner: Shares identical schema subtrees of parameters,
+                request bodies and responses (None disables sharing)
+        """
         self.logger = get_logger(__name__)
+        self.strict_validation = strict_validation
+        self.interner = interner
 
         # HTTP methods supported by OpenAPI
         self.http_methods = {method.value for method in HttpMethod}
@@ -60,65 +76,124 @@ class EndpointNormalizer:
         self.logger.info("Starting endpoint normalization", paths_count=len(paths_data))
 
         for path_name, path_item in paths_data.items():
-            if not isinstance(path_name, str):
-                warnings.append(f"Skipping non-string path key: {path_name}")
-                continue
+            normalized_endpoints.extend(
+                self._normalize_path_item(
+                    path_name, path_item, global_security, errors, warnings
+                )
+            )
 
-            if not path_name.startswith("/"):
-                warnings.append(f"Path should start with '/': {path_name}")
+        self.logger.info(
+            "Endpoint normalization completed",
+            endpoints_normalized=len(normalized_endpoints),
+            errors=len(errors),
+            warnings=len(warnings),
+        )
 
-            if not isinstance(path_item, dict):
-                errors.append(f"Path item must be object: {path_name}")
-                continue
+        return normalized_endpoints, errors, warnings
 
-            # Extract path-level parameters and extensions
-            path_parameters = self._extract_path_parameters(path_item)
-            path_extensions = self._extract_extensions(path_item)
+    def iter_normalized_endpoints(
+        self,
+        path_items: Iterable[Tuple[str, Any]],
+        global_security: Optional[List[Dict[str, Any]]] = None,
+        errors: Optional[List[str]] = None,
+        warnings: Optional[List[str]] = None,
+    ) -> Iterator[NormalizedEndpoint]:
+        """Normalize endpoints lazily from a stream of path items.
 
-            # Process each HTTP method in the path
-            for method_name, operation in path_item.items():
-                method_lower = method_name.lower()
+        Used with ``SwaggerStreamParser.iter_path_items`` so that only one
+        path item is held in memory at a time.
 
-                # Skip non-method properties
-                if method_lower not in self.http_methods:
-                    continue
+        Args:
+            path_items: Iterable of (path, path_item) pairs
+            global_security: Global security requirements
+            errors: Optional list collecting error messages
+            warnings: Optional list collecting warning messages
 
-                if not isinstance(operation, dict):
-                    errors.append(
-                        f"Operation must be object: {path_name} {method_name}"
-                    )
-                    continue
-
-                try:
-                    normalized_endpoint = self._normalize_single_endpoint(
-                        path_name=path_name,
-                        method=HttpMethod(method_lower),
-                        operation=operation,
-                        path_parameters=path_parameters,
-                        path_extensions=path_extensions,
-                        global_security=global_security,
-                    )
+        Yields:
+            Normalized endpoints in document order
+        """
+        errors = errors if errors is not None else []
+        warnings = warnings if warnings is not None else []
 
-                    normalized_endpoints.append(normalized_endpoint)
+        for path_name, path_item in path_items:
+            yield from self._normalize_path_item(
+                path_name, path_item, global_security, errors, warnings
+            )
 
-                except Exception as e:
-                    error_msg = f"Failed to normalize endpoint {path_name} {method_name}: {str(e)}"
-                    errors.append(error_msg)
-                    self.logger.error(
-                        "Endpoint normalization failed",
-                        path=path_name,
-                        method=method_name,
-                        error=str(e),
-                    )
+    def _normalize_path_item(
+        self,
+        path_name: Any,
+        path_item: Any,
+        global_security: Optional[List[Dict[str, Any]]],
+        errors: List[str],
+        warnings: List[str],
+    ) -> List[NormalizedEndpoint]:
+        """Normalize every operation of a single path item.
 
-        self.logger.info(
-            "Endpoint normalization completed",
-            endpoints_normalized=len(normalized_endpoints),
-            errors=len(errors),
-            warnings=len(warnings),
-        )
+        Args:
+            path_name: API path
+            path_item: Path item object
+            global_security: Global security requirements
+            errors: List collecting error messages
+            warnings: List collecting warning messages
 
-        return normalized_endpoints, errors, warnings
+        Returns:
+            Normalized endpoints of the path item
+        """
+        endpoints = []
+
+        if not isinstance(path_name, str):
+            warnings.append(f"Skipping non-string path key: {path_name}")
+            return endpoints
+
+        if not path_name.startswith("/"):
+            warnings.append(f"Path should start with '/': {path_name}")
+
+        if not isinstance(path_item, dict):
+            errors.append(f"Path item must be object: {path_name}")
+            return endpoints
+
+        # Extract path-level parameters and extensions
+        path_parameters = self._extract_path_parameters(path_item)
+        path_extensions = self._extract_extensions(path_item)
+
+        # Process each HTTP method in the path
+        for method_name, operation in path_item.items():
+            method_lower = method_name.lower()
+
+            # Skip non-method properties
+            if method_lower not in self.http_methods:
+                continue
+
+            if not isinstance(operation, dict):
+                errors.append(f"Operation must be object: {path_name} {method_name}")
+                continue
+
+            try:
+                normalized_endpoint = self._normalize_single_endpoint(
+                    path_name=path_name,
+                    method=HttpMethod(method_lower),
+                    operation=operation,
+                    path_parameters=path_parameters,
+                    path_extensions=path_extensions,
+                    global_security=global_security,
+                ).to_model(self.strict_validation)
+
+                endpoints.append(normalized_endpoint)
+
+            except Exception as e:
+                error_msg = (
+                    f"Failed to normalize endpoint {path_name} {method_name}: {str(e)}"
+                )
+                errors.append(error_msg)
+                self.logger.error(
+                    "Endpoint normalization failed",
+                    path=path_name,
+                    method=method_name,
+                    error=str(e),
+                )
+
+        return endpoints
 
     def _normalize_single_endpoint(
         self,
@@ -128,7 +203,7 @@ class EndpointNormalizer:
         path_parameters: List[Dict[str, Any]],
         path_extensions: Dict[str, Any],
         global_security: Optional[List[Dict[str, Any]]] = None,
-    ) -> NormalizedEndpoint:
+    ) -> EndpointRecord:
         """Normalize a single endpoint operation.
 
         Args:
@@ -140,7 +215,7 @@ class EndpointNormalizer:
             global_security: Global security requirements
 
         Returns:
-            Normalized endpoint
+            Endpoint record
         """
         # Extract basic operation metadata
         operation_id = operation.get("operationId")
@@ -179,8 +254,8 @@ class EndpointNormalizer:
         schema_dependencies = self._extract_schema_dependencies(operation)
         security_dependencies = self._extract_security_dependencies(security)
 
-        # Create normalized endpoint
-        endpoint = NormalizedEndpoint(
+        # Create endpoint record; converted to a model by the caller
+        endpoint = EndpointRecord(
             path=path_name,
             method=method,
             operation_id=operation_id,
@@ -288,8 +363,8 @@ class EndpointNormalizer:
                 max_length=max_length,
                 pattern=pattern,
                 schema_ref=schema_ref,
-                items_schema=items_schema,
-                additional_properties=additional_properties,
+                items_schema=self._share(items_schema),
+                additional_properties=self._share(additional_properties),
                 extensions=self._extract_extensions(param),
             )
 
@@ -321,7 +396,7 @@ class EndpointNormalizer:
         return NormalizedRequestBody(
             description=request_body.get("description"),
             required=request_body.get("required", False),
-            content=request_body.get("content", {}),
+            content=self._share(request_body.get("content", {})),
             extensions=self._extract_extensions(request_body),
         )
 
@@ -354,14 +429,20 @@ class EndpointNormalizer:
             normalized[status_code] = NormalizedResponse(
                 status_code=status_code,
                 description=response.get("description", ""),
-                headers=response.get("headers", {}),
-                content=response.get("content", {}),
+                headers=self._share(response.get("headers", {})),
+                content=self._share(response.get("content", {})),
                 links=response.get("links", {}),
                 extensions=self._extract_extensions(response),
             )
 
         return normalized
 
+    def _share(self, value: Any) -> Any:
+        """Get the shared instance of a schema subtree."""
+        if self.interner is None:
+            return value
+        return self.interner.intern(value)
+
     def _normalize_security_requirements(
         self, security_list: List[Dict[str, Any]]
     ) -> List[List[NormalizedSecurityRequirement]]:
@@ -64,13 +64,6 @@ class EndpointProcessor:
         # Add to catalog (use synchronous version)
         self.category_catalog.add_endpoint_sync(category_info, method.upper())
 
-        # Enrich operation with category fields
-        enriched_operation = operation.copy()
-        enriched_operation["category"] = category_info.category
-        enriched_operation["category_group"] = category_info.category_group
-        enriched_operation["category_display_name"] = category_info.display_name
-        enriched_operation["category_metadata"] = category_info.to_dict()
-
         self.logger.debug(
             "Endpoint categorized",
             path=path,
@@ -79,6 +72,45 @@ class EndpointProcessor:
             group=category_info.category_group,
         )
 
+        return self._enrich_operation(operation, category_info)
+
+    def process_endpoints(
+        self, endpoints: List[Tuple[str, str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Process many endpoints and add category information.
+
+        Categorizes all endpoints in one batch, which resolves each distinct
+        tag and path prefix once, and adds them to the catalog.
+
+        Args:
+            endpoints: (path, method, operation) tuples
+
+        Returns:
+            Operation dicts enriched with category fields, in input order
+        """
+        category_infos = self.categorization_engine.categorize_endpoints(
+            (
+                (path, method.upper(), operation)
+                for path, method, operation in endpoints
+            ),
+            catalog=self.category_catalog,
+        )
+
+        return [
+            self._enrich_operation(operation, category_info)
+            for (_, _, operation), category_info in zip(endpoints, category_infos)
+        ]
+
+    @staticmethod
+    def _enrich_operation(
+        operation: Any, category_info: CategoryInfo
+    ) -> Dict[str, Any]:
+        """Copy an operation with category fields added."""
+        enriched_operation = operation.copy()
+        enriched_operation["category"] = category_info.category
+        enriched_operation["category_group"] = category_info.category_group
+        enriched_operation["category_display_name"] = category_info.display_name
+        enriched_operation["category_metadata"] = category_info.to_dict()
         return enriched_operation
 
     def process_paths(self, paths: Dict[str, Any]) -> Dict[str, Any]:
@@ -90,18 +122,26 @@ class EndpointProcessor:
         Returns:
             Paths dict with categorized operations
         """
+        http_methods = ["get", "post", "put", "delete", "patch", "head", "options"]
+
+        # Collect all operations so they are categorized in one batch
+        operations = [
+            (path, method, path_item[method])
+            for path, path_item in paths.items()
+            for method in http_methods
+            if method in path_item
+        ]
+        processed_operations = iter(self.process_endpoints(operations))
+
         processed_paths = {}
 
         for path, path_item in paths.items():
             processed_path_item = {}
 
             # Process each HTTP method
-            http_methods = ["get", "post", "put", "delete", "patch", "head", "options"]
             for method in http_methods:
                 if method in path_item:
-                    operation = path_item[method]
-                    processed_operation = self.process_endpoint(path, method, operation)
-                    processed_path_item[method] = processed_operation
+                    processed_path_item[method] = next(processed_operations)
 
             # Preserve non-operation fields (parameters, servers, etc.)
             for key, value in path_item.items():
@@ -153,16 +193,20 @@ def enrich_endpoints_with_categories(
     processor = EndpointProcessor()
     processor.initialize_from_spec(spec_data)
 
-    enriched_endpoints = []
-
-    for endpoint in endpoints:
-        path = endpoint.get("path", "")
-        method = endpoint.get("method", "get")
-        operation = endpoint.get("operation", {})
+    enriched_operations = processor.process_endpoints(
+        [
+            (
+                endpoint.get("path", ""),
+                endpoint.get("method", "get"),
+                endpoint.get("operation", {}),
+            )
+            for endpoint in endpoints
+        ]
+    )
 
-        # Process endpoint
-        enriched_operation = processor.process_endpoint(path, method, operation)
+    enriched_endpoints = []
 
+    for endpoint, enriched_operation in zip(endpoints, enriched_operations):
         # Merge enriched data back to endpoint
         enriched_endpoint = endpoint.copy()
         enriched_endpoint.update(
@@ -188,4 +232,4 @@ def enrich_endpoints_with_categories(
         categories=len(category_catalog),
     )
 
-    return enriched_endpoints, category_catalog
\ No newline at end of file
+    return enriched_endpoints, category_catalog
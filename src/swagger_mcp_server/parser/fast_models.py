@@ -0,0 +1,228 @@
+"""Lightweight internal representations for the normalization hot path.
+
+The Pydantic models in ``models`` validate every field and rebuild derived
+search fields on construction, and each instance carries a ``__dict__``.
+Normalizers build the slotted records below instead and convert them with
+``to_model`` where results leave the normalizer. The conversion validates
+only in strict mode; otherwise models are assembled directly from the
+already normalized values.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from swagger_mcp_server.parser.models import (
+    HttpMethod,
+    NormalizedEndpoint,
+    NormalizedParameter,
+    NormalizedRequestBody,
+    NormalizedResponse,
+    NormalizedSchema,
+    NormalizedSecurityRequirement,
+    build_endpoint_searchable_text,
+    build_schema_searchable_text,
+)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_set_attribute = object.__setattr__
+
+
+@lru_cache(maxsize=None)
+def _field_defaults(
+    model_class: Type[BaseModel],
+) -> Tuple[Tuple[str, Any, Optional[Callable[[], Any]]], ...]:
+    """Get (name, default, default_factory) of every field of a model."""
+    return tuple(
+        (name, info.default, info.default_factory)
+        for name, info in model_class.model_fields.items()
+    )
+
+
+def construct_model(model_class: Type[ModelT], values: Dict[str, Any]) -> ModelT:
+    """Create a model instance from trusted values without validation.
+
+    Equivalent to ``model_class.model_construct(**values)`` for models
+    without private attributes or extra fields, which is a per-field Python
+    loop in Pydantic 2 and slower than validation itself.
+
+    Args:
+        model_class: Pydantic model class
+        values: Field values by field name; missing fields get defaults.
+            A dictionary holding every field is used as the instance
+            dictionary without copying
+
+    Returns:
+        Model instance
+    """
+    fields = values
+    defaults = _field_defaults(model_class)
+    if len(values) != len(defaults):
+        fields = {}
+        for name, default, default_factory in defaults:
+            if name in values:
+                fields[name] = values[name]
+            elif default_factory is not None:
+                fields[name] = default_factory()
+            else:
+                fields[name] = default
+
+    model = model_class.__new__(model_class)
+    _set_attribute(model, "__dict__", fields)
+    _set_attribute(model, "__pydantic_fields_set__", set(values))
+    _set_attribute(model, "__pydantic_extra__", None)
+    _set_attribute(model, "__pydantic_private__", None)
+    return model
+
+
+@dataclass(slots=True)
+class EndpointRecord:
+    """Slotted counterpart of ``NormalizedEndpoint``."""
+
+    path: str
+    method: HttpMethod
+    operation_id: Optional[str] = None
+    summary: Optional[str] = None
+    description: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    external_docs: Optional[Dict[str, Any]] = None
+    parameters: List[NormalizedParameter] = field(default_factory=list)
+    request_body: Optional[NormalizedRequestBody] = None
+    responses: Dict[str, NormalizedResponse] = field(default_factory=dict)
+    security: List[List[NormalizedSecurityRequirement]] = field(default_factory=list)
+    callbacks: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    deprecated: bool = False
+    response_schemas: List[str] = field(default_factory=list)
+    schema_dependencies: Set[str] = field(default_factory=set)
+    security_dependencies: Set[str] = field(default_factory=set)
+    extensions: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def searchable_text(self) -> str:
+        """Combined searchable text, as generated by the Pydantic model."""
+        return build_endpoint_searchable_text(
+            self.path,
+            self.method.value,
+            self.operation_id,
+            self.summary,
+            self.description,
+            self.tags,
+        )
+
+    @property
+    def parameter_names(self) -> List[str]:
+        """All parameter names for search."""
+        return [parameter.name for parameter in self.parameters]
+
+    def to_model(self, strict: bool = False) -> NormalizedEndpoint:
+        """Convert to the Pydantic model.
+
+        Args:
+            strict: Whether to run full Pydantic validation
+
+        Returns:
+            Normalized endpoint model
+        """
+        values = dict(zip(self.__slots__, _endpoint_values(self)))
+        if strict:
+            return NormalizedEndpoint(**values)
+        # Validated models store the enum value (``use_enum_values``)
+        values["method"] = self.method.value
+        values["searchable_text"] = self.searchable_text
+        values["parameter_names"] = self.parameter_names
+        return construct_model(NormalizedEndpoint, values)
+
+
+@dataclass(slots=True)
+class SchemaRecord:
+    """Slotted counterpart of ``NormalizedSchema``."""
+
+    name: str
+    type: Optional[str] = None
+    format: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    default: Optional[Any] = None
+    example: Optional[Any] = None
+    examples: Optional[List[Any]] = None
+    properties: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    required: List[str] = field(default_factory=list)
+    additional_properties: Optional[Union[bool, Dict[str, Any]]] = None
+    items: Optional[Dict[str, Any]] = None
+    min_items: Optional[int] = None
+    max_items: Optional[int] = None
+    unique_items: Optional[bool] = None
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
+    pattern: Optional[str] = None
+    minimum: Optional[Union[int, float]] = None
+    maximum: Optional[Union[int, float]] = None
+    exclusive_minimum: Optional[bool] = None
+    exclusive_maximum: Optional[bool] = None
+    multiple_of: Optional[Union[int, float]] = None
+    enum: Optional[List[Any]] = None
+    const: Optional[Any] = None
+    all_of: Optional[List[Dict[str, Any]]] = None
+    one_of: Optional[List[Dict[str, Any]]] = None
+    any_of: Optional[List[Dict[str, Any]]] = None
+    not_schema: Optional[Dict[str, Any]] = None
+    if_schema: Optional[Dict[str, Any]] = None
+    then_schema: Optional[Dict[str, Any]] = None
+    else_schema: Optional[Dict[str, Any]] = None
+    read_only: Optional[bool] = None
+    write_only: Optional[bool] = None
+    deprecated: bool = False
+    discriminator: Optional[Dict[str, Any]] = None
+    xml: Optional[Dict[str, Any]] = None
+    external_docs: Optional[Dict[str, Any]] = None
+    dependencies: Set[str] = field(default_factory=set)
+    used_by: Set[str] = field(default_factory=set)
+    extensions: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def searchable_text(self) -> str:
+        """Combined searchable text, as generated by the Pydantic model."""
+        return build_schema_searchable_text(
+            self.name, self.title, self.description, self.type, self.format
+        )
+
+    @property
+    def property_names(self) -> List[str]:
+        """Property names for search."""
+        return list(self.properties.keys())
+
+    def to_model(self, strict: bool = False) -> NormalizedSchema:
+        """Convert to the Pydantic model.
+
+        Args:
+            strict: Whether to run full Pydantic validation
+
+        Returns:
+            Normalized schema model
+        """
+        values = dict(zip(self.__slots__, _schema_values(self)))
+        if strict:
+            return NormalizedSchema(**values)
+        values["searchable_text"] = self.searchable_text
+        values["property_names"] = self.property_names
+        return construct_model(NormalizedSchema, values)
+
+
+# Field value getters in slot order, for fast conversion to dictionaries
+_endpoint_values = attrgetter(*EndpointRecord.__slots__)
+_schema_values = attrgetter(*SchemaRecord.__slots__)
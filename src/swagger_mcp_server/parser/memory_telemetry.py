@@ -0,0 +1,183 @@
+"""Pluggable memory telemetry for parsing operations."""
+
+import os
+import tracemalloc
+from typing import Dict, Optional
+
+import psutil
+
+from swagger_mcp_server.config.logging import get_logger
+from swagger_mcp_server.parser.base import (
+    MemoryTelemetryMode,
+    ParseMetrics,
+    SwaggerParseError,
+)
+
+BYTES_PER_MB = 1024 * 1024
+
+
+class MemoryTelemetry:
+    """Tracks memory usage per processing phase.
+
+    Modes:
+        OFF: nothing is measured and ``max_memory_mb`` is not enforced.
+        SAMPLED: process RSS is read through psutil whenever ``sample`` is
+            called (phase boundaries and progress intervals). Cheap enough
+            to leave on for every parse.
+        TRACEMALLOC: Python allocations are traced with ``tracemalloc``.
+            Precise per-phase peaks, but it slows allocation-heavy code
+            several times over, so it is meant for explicit profiling runs.
+
+    Peaks are reported in MB above the usage observed when ``start`` was
+    called.
+    """
+
+    def __init__(
+        self,
+        mode: MemoryTelemetryMode = MemoryTelemetryMode.SAMPLED,
+        max_memory_mb: Optional[float] = None,
+    ):
+        """Initialize memory telemetry.
+
+        Args:
+            mode: Telemetry mode
+            max_memory_mb: Memory limit enforced by ``check_limit``
+        """
+        self.mode = MemoryTelemetryMode(mode)
+        self.max_memory_mb = max_memory_mb
+        self.logger = get_logger(__name__)
+
+        self.peak_mb = 0.0
+        self.phase_peaks_mb: Dict[str, float] = {}
+        self.current_phase: Optional[str] = None
+
+        self._baseline_mb = 0.0
+        self._owns_tracing = False
+        self._process: Optional[psutil.Process] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Check if memory is being measured."""
+        return self.mode != MemoryTelemetryMode.OFF
+
+    def start(self) -> None:
+        """Start measuring and record the baseline usage."""
+        if self.mode == MemoryTelemetryMode.TRACEMALLOC:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracing = True
+        elif self.mode == MemoryTelemetryMode.SAMPLED:
+            self._process = psutil.Process(os.getpid())
+
+        self._baseline_mb = self._read_usage_mb()
+
+    def stop(self) -> None:
+        """Close the current phase and stop tracing if it was started here."""
+        if self.current_phase is not None:
+            self.end_phase()
+
+        if self._owns_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._owns_tracing = False
+
+    def start_phase(self, phase: str) -> None:
+        """Start attributing memory usage to a phase.
+
+        Args:
+            phase: Phase name (e.g. "parsing")
+        """
+        if self.current_phase is not None:
+            self.end_phase()
+
+        self.current_phase = phase
+        self.phase_peaks_mb.setdefault(phase, 0.0)
+
+        if self.mode == MemoryTelemetryMode.TRACEMALLOC and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+        self.sample()
+
+    def end_phase(self) -> None:
+        """Close the current phase, recording its peak."""
+        if self.current_phase is None:
+            return
+
+        self.sample()
+
+        if self.mode == MemoryTelemetryMode.TRACEMALLOC and tracemalloc.is_tracing():
+            _, traced_peak = tracemalloc.get_traced_memory()
+            self._record_peak(traced_peak / BYTES_PER_MB - self._baseline_mb)
+
+        self.current_phase = None
+
+    def sample(self) -> float:
+        """Take a memory sample and update peaks.
+
+        Returns:
+            Current usage in MB (RSS or traced allocations), 0.0 when off
+        """
+        if not self.enabled:
+            return 0.0
+
+        current_mb = self._read_usage_mb()
+        self._record_peak(current_mb - self._baseline_mb)
+        return current_mb
+
+    def check_limit(self) -> float:
+        """Sample memory and enforce the configured limit.
+
+        Returns:
+            Current usage in MB
+
+        Raises:
+            SwaggerParseError: If usage exceeds ``max_memory_mb``
+        """
+        current_mb = self.sample()
+
+        if self.max_memory_mb is not None and current_mb > self.max_memory_mb:
+            raise SwaggerParseError(
+                f"Memory usage {current_mb:.1f}MB exceeds limit {self.max_memory_mb}MB",
+                "MemoryLimitExceeded",
+                suggestion="Increase memory limit or use a smaller file",
+            )
+
+        return current_mb
+
+    def record(self, metrics: ParseMetrics) -> None:
+        """Copy collected peaks into parse metrics.
+
+        Args:
+            metrics: Metrics to update
+        """
+        metrics.memory_telemetry_mode = self.mode.value
+        metrics.memory_peak_mb = max(metrics.memory_peak_mb, self.peak_mb)
+        for phase, peak_mb in self.phase_peaks_mb.items():
+            metrics.phase_memory_peak_mb[phase] = max(
+                metrics.phase_memory_peak_mb.get(phase, 0.0), peak_mb
+            )
+
+    def _record_peak(self, usage_mb: float) -> None:
+        """Update overall and current-phase peaks."""
+        usage_mb = max(usage_mb, 0.0)
+        self.peak_mb = max(self.peak_mb, usage_mb)
+
+        if self.current_phase is not None:
+            self.phase_peaks_mb[self.current_phase] = max(
+                self.phase_peaks_mb[self.current_phase], usage_mb
+            )
+
+    def _read_usage_mb(self) -> float:
+        """Read current usage according to the mode."""
+        if self.mode == MemoryTelemetryMode.TRACEMALLOC:
+            if not tracemalloc.is_tracing():
+                return 0.0
+            current, _ = tracemalloc.get_traced_memory()
+            return current / BYTES_PER_MB
+
+        if self.mode == MemoryTelemetryMode.SAMPLED and self._process is not None:
+            try:
+                return self._process.memory_info().rss / BYTES_PER_MB
+            except psutil.Error as e:
+                self.logger.debug("Failed to read process memory", error=str(e))
+
+        return 0.0
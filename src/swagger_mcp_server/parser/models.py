@@ -12,6 +12,36 @@ from swagger_mcp_server.config.logging import get_logger
 logger = get_logger(__name__)
 
 
+def build_endpoint_searchable_text(
+    path: Optional[str],
+    method: Optional[str],
+    operation_id: Optional[str] = None,
+    summary: Optional[str] = None,
+    description: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+) -> str:
+    """Build the combined searchable text of an endpoint."""
+    parts = [part for part in (path, method) if part is not None]
+    parts.extend(part for part in (operation_id, summary, description) if part)
+    parts.extend(tags or [])
+    return " ".join(parts)
+
+
+def build_schema_searchable_text(
+    name: Optional[str],
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+    schema_type: Optional[str] = None,
+    format_type: Optional[str] = None,
+) -> str:
+    """Build the combined searchable text of a schema."""
+    parts = [name] if name is not None else []
+    parts.extend(
+        part for part in (title, description, schema_type, format_type) if part
+    )
+    return " ".join(parts)
+
+
 class HttpMethod(str, Enum):
     """HTTP methods supported in OpenAPI."""
 
@@ -118,7 +148,7 @@ class NormalizedParameter(BaseModel):
     )
 
     class Config:
-        allow_population_by_field_name = True
+        populate_by_name = True
 
 
 class NormalizedRequestBody(BaseModel):
@@ -188,7 +218,7 @@ class NormalizedSecurity(BaseModel):
     )
 
     class Config:
-        allow_population_by_field_name = True
+        populate_by_name = True
 
 
 class NormalizedSecurityRequirement(BaseModel):
@@ -269,22 +299,14 @@ class NormalizedEndpoint(BaseModel):
     @validator("searchable_text", always=True)
     def generate_searchable_text(cls, v, values):
         """Generate combined searchable text from all relevant fields."""
-        parts = []
-
-        if "path" in values:
-            parts.append(values["path"])
-        if "method" in values:
-            parts.append(values["method"])
-        if "operation_id" in values and values["operation_id"]:
-            parts.append(values["operation_id"])
-        if "summary" in values and values["summary"]:
-            parts.append(values["summary"])
-        if "description" in values and values["description"]:
-            parts.append(values["description"])
-        if "tags" in values:
-            parts.extend(values["tags"])
-
-        return " ".join(parts)
+        return build_endpoint_searchable_text(
+            values.get("path"),
+            values.get("method"),
+            values.get("operation_id"),
+            values.get("summary"),
+            values.get("description"),
+            values.get("tags"),
+        )
 
     @validator("parameter_names", always=True)
     def extract_parameter_names(cls, v, values):
@@ -402,20 +424,13 @@ class NormalizedSchema(BaseModel):
     @validator("searchable_text", always=True)
     def generate_searchable_text(cls, v, values):
         """Generate combined searchable text from schema fields."""
-        parts = []
-
-        if "name" in values:
-            parts.append(values["name"])
-        if "title" in values and values["title"]:
-            parts.append(values["title"])
-        if "description" in values and values["description"]:
-            parts.append(values["description"])
-        if "type" in values and values["type"]:
-            parts.append(values["type"])
-        if "format" in values and values["format"]:
-            parts.append(values["format"])
-
-        return " ".join(parts)
+        return build_schema_searchable_text(
+            values.get("name"),
+            values.get("title"),
+            values.get("description"),
+            values.get("type"),
+            values.get("format"),
+        )
 
     @validator("property_names", always=True)
     def extract_property_names(cls, v, values):
@@ -425,7 +440,7 @@ class NormalizedSchema(BaseModel):
         return []
 
     class Config:
-        allow_population_by_field_name = True
+        populate_by_name = True
 
 
 class NormalizedAPI(BaseModel):
@@ -591,7 +606,7 @@ class NormalizedSecurityFlow(BaseModel):
     scopes: Dict[str, str] = Field(default_factory=dict, description="Available scopes")
 
     class Config:
-        allow_population_by_field_name = True
+        populate_by_name = True
 
 
 class NormalizedSecurityScheme(BaseModel):
@@ -627,7 +642,7 @@ class NormalizedSecurityScheme(BaseModel):
     )
 
     class Config:
-        allow_population_by_field_name = True
+        populate_by_name = True
 
 
 @dataclass
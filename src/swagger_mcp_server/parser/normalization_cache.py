@@ -0,0 +1,316 @@
+"""Persistent content-addressed cache of normalization results."""
+
+import dataclasses
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from swagger_mcp_server import __version__
+from swagger_mcp_server.config.logging import get_logger
+from swagger_mcp_server.parser.schema_normalizer import (
+    NormalizationConfig,
+    NormalizationResult,
+)
+
+logger = get_logger(__name__)
+
+# Bump when NormalizationResult or the normalized models change shape
+CACHE_FORMAT_VERSION = 2
+CACHE_MAGIC = b"SMNC"
+CACHE_FILE_SUFFIX = ".bin"
+
+# NormalizationConfig fields that do not change the result
+NON_RESULT_CONFIG_FIELDS = frozenset({"max_workers", "parallel_min_items", "spill_dir"})
+
+
+class NormalizationCache:
+    """On-disk cache of ``NormalizationResult`` keyed by specification hash.
+
+    Entries are addressed by a SHA-256 over the specification hash, the
+    package version, the cache format version and the result-affecting
+    normalization settings, so a parser upgrade or a config change never
+    returns stale data. Specifications split over several files also record
+    the SHA-256 of every referenced file with the result; an entry whose
+    referenced files changed is a miss. Results are stored as
+    zlib-compressed pickles.
+    The total size is bounded; when it is exceeded the least recently used
+    entries (by file modification time, refreshed on every hit) are evicted.
+
+    Only point the cache at a directory you trust: entries are unpickled.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_size_mb: int = 512,
+        parser_version: str = __version__,
+    ):
+        """Initialize normalization cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created if missing)
+            max_size_mb: Maximum total size of all entries
+            parser_version: Version component of the cache key
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.parser_version = parser_version
+        self.logger = get_logger(__name__)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def cache_key(
+        self, spec_hash: str, config: Optional[NormalizationConfig] = None
+    ) -> str:
+        """Compute the content address of a cache entry.
+
+        Args:
+            spec_hash: SHA-256 of the specification file
+            config: Normalization settings used to produce the result
+
+        Returns:
+            Hex digest identifying the entry
+        """
+        config_items = sorted(
+            (name, value)
+            for name, value in dataclasses.asdict(
+                config or NormalizationConfig()
+            ).items()
+            if name not in NON_RESULT_CONFIG_FIELDS
+        )
+        key_material = (
+            f"{spec_hash}:{self.parser_version}:{CACHE_FORMAT_VERSION}:"
+            f"{config_items!r}"
+        )
+        return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+    def get(
+        self, spec_hash: str, config: Optional[NormalizationConfig] = None
+    ) -> Optional[NormalizationResult]:
+        """Load a cached result.
+
+        Args:
+            spec_hash: SHA-256 of the specification file
+            config: Normalization settings the result must match
+
+        Returns:
+            Cached result, or None on a miss, an unreadable entry or an
+            entry whose referenced files changed
+        """
+        entry_path = self._entry_path(self.cache_key(spec_hash, config))
+
+        try:
+            payload = entry_path.read_bytes()
+        except FileNotFoundError:
+            self.logger.debug("Normalization cache miss", spec_hash=spec_hash)
+            return None
+        except OSError as e:
+            self.logger.warning("Failed to read cache entry", error=str(e))
+            return None
+
+        try:
+            dependency_hashes, result = self._deserialize(payload)
+        except Exception as e:
+            self.logger.warning(
+                "Discarding corrupt cache entry",
+                path=str(entry_path),
+                error=str(e),
+            )
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        changed_files = [
+            path
+            for path, file_hash in dependency_hashes.items()
+            if _file_hash(path) != file_hash
+        ]
+        if changed_files:
+            self.logger.info(
+                "Normalization cache entry is stale",
+                spec_hash=spec_hash,
+                changed_files=changed_files,
+            )
+            return None
+
+        # Refresh recency for LRU eviction
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        self.logger.info(
+            "Normalization cache hit",
+            spec_hash=spec_hash,
+            entry_size_bytes=len(payload),
+        )
+        return result
+
+    def put(
+        self,
+        spec_hash: str,
+        result: NormalizationResult,
+        config: Optional[NormalizationConfig] = None,
+        dependencies: Iterable[Union[str, Path]] = (),
+    ) -> bool:
+        """Store a result and evict old entries if over the size limit.
+
+        Args:
+            spec_hash: SHA-256 of the specification file
+            result: Normalization result to cache
+            config: Normalization settings used to produce the result
+            dependencies: Other files the result was built from (external
+                ``$ref`` targets, bundled files)
+
+        Returns:
+            True if the entry was written
+        """
+        entry_path = self._entry_path(self.cache_key(spec_hash, config))
+
+        dependency_hashes = {
+            str(path): _file_hash(path) for path in sorted(set(map(str, dependencies)))
+        }
+        try:
+            payload = self._serialize(result, dependency_hashes)
+        except Exception as e:
+            self.logger.warning(
+                "Failed to serialize normalization result", error=str(e)
+            )
+            return False
+
+        if len(payload) > self.max_size_bytes:
+            self.logger.info(
+                "Normalization result too large to cache",
+                entry_size_bytes=len(payload),
+                max_size_bytes=self.max_size_bytes,
+            )
+            return False
+
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically so concurrent readers never see partial entries
+            fd, temp_path = tempfile.mkstemp(
+                dir=entry_path.parent, suffix=".tmp", prefix=entry_path.stem
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(temp_path, entry_path)
+            except BaseException:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            self.logger.warning("Failed to write cache entry", error=str(e))
+            return False
+
+        self.logger.info(
+            "Normalization result cached",
+            spec_hash=spec_hash,
+            entry_size_bytes=len(payload),
+        )
+        self.evict(keep=entry_path)
+        return True
+
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """Remove least recently used entries until under the size limit.
+
+        Args:
+            keep: Entry that must not be evicted (the one just written)
+
+        Returns:
+            Number of entries removed
+        """
+        entries = self._list_entries()
+        total_size = sum(size for _, _, size in entries)
+        removed = 0
+
+        for _, path, size in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total_size -= size
+            removed += 1
+
+        if removed:
+            self.logger.info(
+                "Evicted normalization cache entries",
+                removed=removed,
+                total_size_bytes=total_size,
+            )
+        return removed
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        for _, path, _ in self._list_entries():
+            path.unlink(missing_ok=True)
+
+    def get_size_bytes(self) -> int:
+        """Get the total size of all cache entries."""
+        return sum(size for _, _, size in self._list_entries())
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path of an entry (sharded by key prefix)."""
+        return self.cache_dir / key[:2] / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def _list_entries(self) -> List[Tuple[float, Path, int]]:
+        """List entries as (mtime, path, size) tuples."""
+        entries = []
+        for path in self.cache_dir.glob(f"*/*{CACHE_FILE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        return entries
+
+    @staticmethod
+    def _serialize(
+        result: NormalizationResult, dependency_hashes: Dict[str, Optional[str]]
+    ) -> bytes:
+        """Serialize a result and its dependency hashes to the cache format."""
+        body = zlib.compress(
+            pickle.dumps((dependency_hashes, result), protocol=pickle.HIGHEST_PROTOCOL),
+            level=1,
+        )
+        return CACHE_MAGIC + bytes([CACHE_FORMAT_VERSION]) + body
+
+    @staticmethod
+    def _deserialize(
+        payload: bytes,
+    ) -> Tuple[Dict[str, Optional[str]], NormalizationResult]:
+        """Deserialize a result and its dependency hashes from the cache format.
+
+        Raises:
+            ValueError: If the payload is not a cache entry of this format
+        """
+        header_size = len(CACHE_MAGIC) + 1
+        if (
+            payload[: len(CACHE_MAGIC)] != CACHE_MAGIC
+            or payload[len(CACHE_MAGIC)] != CACHE_FORMAT_VERSION
+        ):
+            raise ValueError("Unrecognized cache entry header")
+
+        dependency_hashes, result = pickle.loads(zlib.decompress(payload[header_size:]))
+        if not isinstance(result, NormalizationResult):
+            raise ValueError("Cache entry does not contain a NormalizationResult")
+        return dependency_hashes, result
+
+
+def _file_hash(path: Union[str, Path]) -> Optional[str]:
+    """Get the SHA-256 of a file, or None if it cannot be read."""
+    hasher = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+    except OSError:
+        return None
+    return hasher.hexdigest()
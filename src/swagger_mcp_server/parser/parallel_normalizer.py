@@ -0,0 +1,183 @@
+"""Process-pool sharding of endpoint and schema normalization."""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from swagger_mcp_server.config.logging import get_logger
+from swagger_mcp_server.parser.endpoint_normalizer import EndpointNormalizer
+from swagger_mcp_server.parser.models import (
+    NormalizedEndpoint,
+    NormalizedSchema,
+)
+from swagger_mcp_server.parser.schema_processor import SchemaProcessor
+
+logger = get_logger(__name__)
+
+EndpointShardResult = Tuple[List[NormalizedEndpoint], List[str], List[str]]
+SchemaShardResult = Tuple[Dict[str, NormalizedSchema], Dict[str, Set[str]], List[str]]
+
+
+def resolve_worker_count(workers: int) -> int:
+    """Resolve a configured worker count.
+
+    Args:
+        workers: Configured count; 0 or less means one per CPU
+
+    Returns:
+        Number of worker processes to use
+    """
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def shard_items(items: Dict[str, Any], shard_count: int) -> List[Dict[str, Any]]:
+    """Split a mapping into contiguous shards, preserving document order.
+
+    Args:
+        items: Mapping to split (e.g. ``paths``)
+        shard_count: Maximum number of shards
+
+    Returns:
+        Non-empty shards whose concatenation equals ``items``
+    """
+    entries = list(items.items())
+    shard_count = max(1, min(shard_count, len(entries)))
+    shard_size, remainder = divmod(len(entries), shard_count)
+
+    shards = []
+    start = 0
+    for index in range(shard_count):
+        end = start + shard_size + (1 if index < remainder else 0)
+        shards.append(dict(entries[start:end]))
+        start = end
+    return shards
+
+
+def normalize_endpoint_shard(
+    paths_shard: Dict[str, Any],
+    global_security: Optional[List[Dict[str, Any]]] = None,
+    strict_validation: bool = False,
+) -> EndpointShardResult:
+    """Normalize the endpoints of a ``paths`` shard (runs in a worker).
+
+    Args:
+        paths_shard: Subset of the OpenAPI paths object
+        global_security: Global security requirements
+        strict_validation: Whether to run full Pydantic validation
+
+    Returns:
+        Tuple of (normalized_endpoints, errors, warnings)
+    """
+    return EndpointNormalizer(strict_validation).normalize_endpoints(
+        paths_shard, global_security
+    )
+
+
+def normalize_schema_shard(
+    schemas_shard: Dict[str, Any], strict_validation: bool = False
+) -> SchemaShardResult:
+    """Create the schemas of a ``components.schemas`` shard (runs in a worker).
+
+    Args:
+        schemas_shard: Subset of the schema definitions
+        strict_validation: Whether to run full Pydantic validation
+
+    Returns:
+        Tuple of (schemas, references by schema name, errors)
+    """
+    return SchemaProcessor(strict_validation).normalize_schema_shard(
+        schemas_shard.items()
+    )
+
+
+class ParallelNormalizer:
+    """Shards paths and schema definitions across worker processes.
+
+    Shards are contiguous slices in document order and their results are
+    concatenated in shard order, so output is identical to serial
+    normalization. Only per-item work runs in workers; cross-schema
+    reference resolution and circular reference detection are left to the
+    caller's reduce step (``SchemaProcessor.merge_schema_shards``).
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        executor_factory: Optional[Callable[[int], Executor]] = None,
+        strict_validation: bool = False,
+    ):
+        """Initialize parallel normalizer.
+
+        Args:
+            max_workers: Worker process count; 0 or less means one per CPU
+            executor_factory: Creates the executor for a worker count,
+                defaults to ``ProcessPoolExecutor``
+            strict_validation: Whether workers run full Pydantic validation
+        """
+        self.max_workers = resolve_worker_count(max_workers)
+        self.strict_validation = strict_validation
+        self.executor_factory = executor_factory or (
+            lambda workers: ProcessPoolExecutor(max_workers=workers)
+        )
+        self.logger = get_logger(__name__)
+
+    def normalize(
+        self,
+        paths_data: Dict[str, Any],
+        schemas_data: Dict[str, Any],
+        global_security: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[EndpointShardResult, List[SchemaShardResult]]:
+        """Normalize endpoints and create schemas in parallel (map step).
+
+        Endpoint and schema shards share one pool so both sections keep all
+        workers busy.
+
+        Args:
+            paths_data: OpenAPI paths object
+            schemas_data: Schema definitions
+            global_security: Global security requirements
+
+        Returns:
+            Tuple of (merged endpoint result, schema shard results in order)
+        """
+        path_shards = shard_items(paths_data, self.max_workers) if paths_data else []
+        schema_shards = (
+            shard_items(schemas_data, self.max_workers) if schemas_data else []
+        )
+
+        self.logger.info(
+            "Starting parallel normalization",
+            workers=self.max_workers,
+            path_shards=len(path_shards),
+            schema_shards=len(schema_shards),
+        )
+
+        with self.executor_factory(self.max_workers) as executor:
+            endpoint_futures = [
+                executor.submit(
+                    normalize_endpoint_shard,
+                    shard,
+                    global_security,
+                    self.strict_validation,
+                )
+                for shard in path_shards
+            ]
+            schema_futures = [
+                executor.submit(normalize_schema_shard, shard, self.strict_validation)
+                for shard in schema_shards
+            ]
+
+            endpoints: List[NormalizedEndpoint] = []
+            errors: List[str] = []
+            warnings: List[str] = []
+            for future in endpoint_futures:
+                shard_endpoints, shard_errors, shard_warnings = future.result()
+                endpoints.extend(shard_endpoints)
+                errors.extend(shard_errors)
+                warnings.extend(shard_warnings)
+
+            schema_results = [future.result() for future in schema_futures]
+
+        return (endpoints, errors, warnings), schema_results
@@ -1,10 +1,16 @@
-"""Progress reporting system for parsing operations."""
+"""Progress reporting system for parsing operations.
+
+Events are queued without blocking the caller and delivered to the callback
+by a dispatcher task. Progress updates queued faster than the configured
+event rate are coalesced, so only the latest update of a phase reaches the
+callback; phase boundaries and terminal events are always delivered.
+"""
 
 import asyncio
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from swagger_mcp_server.config.logging import get_logger
 
@@ -80,17 +86,32 @@ class ProgressReporter:
         self,
         callback: Optional[ProgressCallback] = None,
         interval_bytes: int = 1024 * 1024,  # 1MB
+        max_events_per_second: float = 10.0,
     ):
         """Initialize progress reporter.
 
         Args:
             callback: Optional callback for progress events
             interval_bytes: Minimum bytes between progress reports
+            max_events_per_second: Maximum rate of progress updates delivered
+                to the callback (0 disables throttling)
         """
         self.callback = callback
         self.interval_bytes = interval_bytes
+        self.min_event_interval = (
+            1.0 / max_events_per_second if max_events_per_second > 0 else 0.0
+        )
         self.logger = get_logger(__name__)
 
+        # Event delivery; the queue holds (event, is_update) pairs and the
+        # dispatcher task runs only while events are pending
+        self._queue: Optional[asyncio.Queue] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._dispatcher_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.events_delivered = 0
+        self.events_coalesced = 0
+
         # State tracking
         self.current_phase: Optional[ProgressPhase] = None
         self.phase_metrics: Dict[ProgressPhase, PhaseMetrics] = {}
@@ -180,6 +201,24 @@ class ProgressReporter:
     ) -> None:
         """Update progress within current phase.
 
+        Args:
+            bytes_processed: Bytes processed so far
+            total_bytes: Total bytes for current phase
+            message: Optional progress message
+        """
+        self.record_progress(bytes_processed, total_bytes, message)
+
+    def record_progress(
+        self,
+        bytes_processed: int,
+        total_bytes: int,
+        message: Optional[str] = None,
+    ) -> None:
+        """Update progress within current phase without waiting for delivery.
+
+        Safe to call from synchronous code running on the event loop, such
+        as the per-chunk loops of the stream parsers.
+
         Args:
             bytes_processed: Bytes processed so far
             total_bytes: Total bytes for current phase
@@ -196,9 +235,8 @@ class ProgressReporter:
 
         should_report = (
             bytes_since_last >= self.interval_bytes
-            or time_since_last >= 1.0
-            or bytes_processed  # At least every second
-            >= total_bytes  # Always report completion
+            or time_since_last >= 1.0  # At least every second
+            or bytes_processed >= total_bytes  # Always report completion
         )
 
         if not should_report:
@@ -230,22 +268,13 @@ class ProgressReporter:
         )
 
         phase_metrics.events.append(event)
-        await self._emit_event(event)
+        self._enqueue(event, is_update=True)
 
         # Update tracking variables
         self.last_report_bytes = bytes_processed
         self.last_report_time = current_time
         self.total_processed_bytes += bytes_since_last
 
-        self.logger.debug(
-            "Progress updated",
-            phase=self.current_phase.value,
-            progress_percent=progress_percent,
-            bytes_processed=bytes_processed,
-            total_bytes=total_bytes,
-            estimated_remaining_ms=estimated_remaining,
-        )
-
     async def complete_phase(self, message: str = "Phase completed") -> None:
         """Complete the current phase.
 
@@ -301,6 +330,7 @@ class ProgressReporter:
         )
 
         await self._emit_event(event)
+        await self.flush()
 
         self.logger.info(
             "Operation completed",
@@ -325,6 +355,7 @@ class ProgressReporter:
         )
 
         await self._emit_event(event)
+        await self.flush()
 
         self.logger.error(
             "Operation failed",
@@ -348,6 +379,7 @@ class ProgressReporter:
         )
 
         await self._emit_event(event)
+        await self.flush()
 
         self.logger.warning(
             "Operation cancelled",
@@ -381,6 +413,8 @@ class ProgressReporter:
                 for phase, metrics in self.phase_metrics.items()
             },
             "current_phase": self.current_phase.value if self.current_phase else None,
+            "events_delivered": self.events_delivered,
+            "events_coalesced": self.events_coalesced,
         }
 
     def reset(self) -> None:
@@ -392,28 +426,133 @@ class ProgressReporter:
         self.operation_start_time = time.time()
         self.total_operation_bytes = 0
         self.total_processed_bytes = 0
+        self.events_delivered = 0
+        self.events_coalesced = 0
 
         self.logger.debug("Progress reporter reset")
 
+    async def flush(self) -> None:
+        """Wait until all queued events are delivered to the callback."""
+        dispatcher = self._dispatcher
+        if dispatcher is None or dispatcher.done():
+            return
+        if self._dispatcher_loop is not asyncio.get_running_loop():
+            return
+
+        # Deliver pending updates right away instead of after the throttle
+        self._wakeup.set()
+        await dispatcher
+
     async def _emit_event(self, event: ProgressEvent) -> None:
-        """Emit progress event to callback.
+        """Queue a phase boundary or terminal event for delivery.
 
         Args:
             event: Progress event to emit
         """
-        if self.callback:
-            try:
-                # Handle both sync and async callbacks
-                if asyncio.iscoroutinefunction(self.callback):
-                    await self.callback(event)
-                else:
-                    self.callback(event)
-            except Exception as e:
-                self.logger.warning(
-                    "Progress callback error",
-                    error=str(e),
-                    event_phase=event.phase.value,
-                )
+        self._enqueue(event, is_update=False)
+
+    def _enqueue(self, event: ProgressEvent, is_update: bool) -> None:
+        """Queue an event and make sure the dispatcher is running.
+
+        Args:
+            event: Progress event
+            is_update: Whether the event is a progress update that may be
+                coalesced with later updates of the same phase
+        """
+        if not self.callback:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to dispatch on; synchronous callbacks are
+            # called directly
+            if not asyncio.iscoroutinefunction(self.callback):
+                self._deliver_sync(event)
+            return
+
+        if self._dispatcher is None or self._dispatcher_loop is not loop:
+            self._queue = asyncio.Queue()
+            self._wakeup = asyncio.Event()
+            self._dispatcher_loop = loop
+            self._dispatcher = loop.create_task(self._dispatch_events())
+
+        self._queue.put_nowait((event, is_update))
+
+    async def _dispatch_events(self) -> None:
+        """Deliver queued events until the queue is empty."""
+        queue = self._queue
+        try:
+            while not queue.empty():
+                pending: List[Tuple[ProgressEvent, bool]] = []
+                while not queue.empty():
+                    pending.append(queue.get_nowait())
+
+                delivered_update = False
+                for index, (event, is_update) in enumerate(pending):
+                    if is_update and self._is_superseded(pending, index):
+                        self.events_coalesced += 1
+                        continue
+                    delivered_update = delivered_update or is_update
+                    await self._deliver(event)
+
+                # Updates queued during the pause are coalesced on the
+                # next pass
+                if delivered_update and self.min_event_interval:
+                    await self._pause(self.min_event_interval)
+        finally:
+            if self._queue is queue:
+                self._dispatcher = None
+                self._dispatcher_loop = None
+
+    @staticmethod
+    def _is_superseded(pending: List[Tuple[ProgressEvent, bool]], index: int) -> bool:
+        """Check if a later pending update of the same phase replaces an update."""
+        if index + 1 >= len(pending):
+            return False
+        event = pending[index][0]
+        next_event, next_is_update = pending[index + 1]
+        return next_is_update and next_event.phase == event.phase
+
+    async def _pause(self, seconds: float) -> None:
+        """Wait for the throttle interval or until a flush is requested."""
+        wakeup = self._wakeup
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _deliver(self, event: ProgressEvent) -> None:
+        """Deliver an event to the callback.
+
+        Args:
+            event: Progress event to deliver
+        """
+        try:
+            # Handle both sync and async callbacks
+            if asyncio.iscoroutinefunction(self.callback):
+                await self.callback(event)
+            else:
+                self.callback(event)
+            self.events_delivered += 1
+        except Exception as e:
+            self.logger.warning(
+                "Progress callback error",
+                error=str(e),
+                event_phase=event.phase.value,
+            )
+
+    def _deliver_sync(self, event: ProgressEvent) -> None:
+        """Deliver an event to a synchronous callback outside an event loop."""
+        try:
+            self.callback(event)
+            self.events_delivered += 1
+        except Exception as e:
+            self.logger.warning(
+                "Progress callback error",
+                error=str(e),
+                event_phase=event.phase.value,
+            )
 
     def _estimate_remaining_time(
         self, bytes_processed: int, total_bytes: int, start_time: float
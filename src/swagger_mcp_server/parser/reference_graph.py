@@ -0,0 +1,222 @@
+"""Schema reference graph with precomputed strongly connected components."""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class SchemaReferenceGraph:
+    """Directed graph of schema references, analyzed once in linear time.
+
+    Strongly connected components are computed with Tarjan's algorithm when
+    the graph is built. Cycle membership, a dependencies-first resolution
+    order and transitive dependency sets are then answered from the
+    precomputed components instead of searching the graph per query.
+    """
+
+    def __init__(self, edges: Dict[str, Iterable[str]]):
+        """Build the graph and compute its strongly connected components.
+
+        Args:
+            edges: Referenced schema names by schema name; references to
+                schemas that are not keys of ``edges`` are ignored
+        """
+        self.edges: Dict[str, List[str]] = {
+            node: [target for target in targets if target in edges]
+            for node, targets in edges.items()
+        }
+
+        # Components in reverse topological order: every component comes
+        # after all components it references
+        self.components: List[List[str]] = self._strongly_connected_components()
+        self.component_of: Dict[str, int] = {
+            node: index
+            for index, component in enumerate(self.components)
+            for node in component
+        }
+
+        self._transitive_cache: Dict[int, Set[str]] = {}
+
+    def is_circular(self, node: str) -> bool:
+        """Check if a schema is part of a reference cycle.
+
+        Args:
+            node: Schema name
+
+        Returns:
+            True if the schema can reach itself through references
+        """
+        index = self.component_of.get(node)
+        return index is not None and self._is_cyclic_component(index)
+
+    def in_same_cycle(self, source: str, target: str) -> bool:
+        """Check if two schemas reference each other (directly or not)."""
+        index = self.component_of.get(source)
+        return (
+            index is not None
+            and index == self.component_of.get(target)
+            and self._is_cyclic_component(index)
+        )
+
+    def resolution_order(self) -> List[str]:
+        """Get schemas ordered so that dependencies come first.
+
+        Schemas within one cycle have no valid order among themselves and
+        are kept together.
+
+        Returns:
+            Schema names in dependencies-first order
+        """
+        return [node for component in self.components for node in component]
+
+    def transitive_dependencies(self, node: str) -> Set[str]:
+        """Get all schemas reachable from a schema through references.
+
+        Args:
+            node: Schema name
+
+        Returns:
+            Reachable schema names (including the schema itself only if it
+            is part of a cycle)
+        """
+        index = self.component_of.get(node)
+        if index is None:
+            return set()
+
+        dependencies = set(self._component_closure(index))
+        if not self._is_cyclic_component(index):
+            dependencies.discard(node)
+        return dependencies
+
+    def cyclic_components(self) -> List[List[str]]:
+        """Get the components that contain reference cycles."""
+        return [
+            component
+            for index, component in enumerate(self.components)
+            if self._is_cyclic_component(index)
+        ]
+
+    def cycles(self) -> List[List[str]]:
+        """Get one representative cycle per cyclic component.
+
+        Returns:
+            Cycles as schema name paths that start and end at the same schema
+        """
+        return [self._find_cycle(component) for component in self.cyclic_components()]
+
+    def _is_cyclic_component(self, index: int) -> bool:
+        """Check if a component contains a cycle (size > 1 or self reference)."""
+        component = self.components[index]
+        return len(component) > 1 or component[0] in self.edges[component[0]]
+
+    def _component_closure(self, index: int) -> Set[str]:
+        """Get the members of a component and of all components it reaches."""
+        cached = self._transitive_cache.get(index)
+        if cached is not None:
+            return cached
+
+        # Components reach only components with lower indices, so resolving
+        # them bottom-up keeps the iteration free of recursion
+        pending = [index]
+        while pending:
+            current = pending[-1]
+            if current in self._transitive_cache:
+                pending.pop()
+                continue
+
+            successors = self._successor_components(current)
+            unresolved = [
+                successor
+                for successor in successors
+                if successor not in self._transitive_cache
+            ]
+            if unresolved:
+                pending.extend(unresolved)
+                continue
+
+            closure = set(self.components[current])
+            for successor in successors:
+                closure |= self._transitive_cache[successor]
+            self._transitive_cache[current] = closure
+            pending.pop()
+
+        return self._transitive_cache[index]
+
+    def _successor_components(self, index: int) -> Set[int]:
+        """Get the other components referenced from a component."""
+        return {
+            self.component_of[target]
+            for node in self.components[index]
+            for target in self.edges[node]
+            if self.component_of[target] != index
+        }
+
+    def _find_cycle(self, component: List[str]) -> List[str]:
+        """Find a cycle through the first schema of a cyclic component."""
+        start = component[0]
+        members = set(component)
+        parents: Dict[str, Optional[str]] = {start: None}
+        queue = [start]
+
+        # Breadth-first search within the component back to the start
+        for current in queue:
+            for target in self.edges[current]:
+                if target == start:
+                    path = [current]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    return list(reversed(path)) + [start]
+                if target in members and target not in parents:
+                    parents[target] = current
+                    queue.append(target)
+
+        return [start, start]
+
+    def _strongly_connected_components(self) -> List[List[str]]:
+        """Compute strongly connected components (iterative Tarjan)."""
+        index_of: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+        next_index = 0
+
+        for root in self.edges:
+            if root in index_of:
+                continue
+
+            # Each frame is (node, position of the next edge to visit)
+            work = [(root, 0)]
+            while work:
+                node, edge_position = work.pop()
+                if edge_position == 0:
+                    index_of[node] = lowlink[node] = next_index
+                    next_index += 1
+                    stack.append(node)
+                    on_stack.add(node)
+
+                targets = self.edges[node]
+                while edge_position < len(targets):
+                    target = targets[edge_position]
+                    edge_position += 1
+                    if target not in index_of:
+                        work.append((node, edge_position))
+                        work.append((target, 0))
+                        break
+                    if target in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[target])
+                else:
+                    # All edges visited: close the node
+                    if lowlink[node] == index_of[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+        return components
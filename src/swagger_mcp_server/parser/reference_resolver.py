@@ -0,0 +1,262 @@
+"""JSON pointer index and memoized ``$ref`` resolution for OpenAPI documents."""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import unquote
+
+import yaml
+
+from swagger_mcp_server.config.logging import get_logger
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+logger = get_logger(__name__)
+
+REMOTE_REF_PREFIXES = ("http://", "https://")
+
+
+@dataclass
+class ReferenceResolution:
+    """Result of reference resolution."""
+
+    resolved: bool
+    target: Optional[str] = None
+    error: Optional[str] = None
+    value: Any = None
+
+
+def unescape_pointer_token(token: str) -> str:
+    """Unescape a JSON pointer reference token (RFC 6901)."""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+class JsonPointerIndex:
+    """Index of the objects and arrays of a document by JSON pointer.
+
+    Containers are indexed the first time a pointer passes through them, so
+    each one is reached from the document root at most once; later lookups
+    start from the deepest indexed ancestor. Scalars are not indexed and are
+    looked up through their parent container.
+    """
+
+    def __init__(self, document: Any):
+        """Create the index of a document.
+
+        Args:
+            document: Parsed JSON/YAML document
+        """
+        self.nodes: Dict[str, Any] = {"": document}
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def get(self, pointer: str) -> Tuple[bool, Any]:
+        """Look up the node at a JSON pointer.
+
+        Args:
+            pointer: JSON pointer (e.g., "/components/schemas/User"), with
+                "" addressing the whole document
+
+        Returns:
+            Tuple of (found, node)
+        """
+        if pointer in self.nodes:
+            return True, self.nodes[pointer]
+
+        parent_pointer, _, token = pointer.rpartition("/")
+        found, parent = self.get(parent_pointer)
+        if not found:
+            return False, None
+
+        token = unescape_pointer_token(token)
+        if isinstance(parent, dict) and token in parent:
+            node = parent[token]
+        elif isinstance(parent, list) and token.isdigit() and int(token) < len(parent):
+            node = parent[int(token)]
+        else:
+            return False, None
+
+        if isinstance(node, (dict, list)):
+            self.nodes[pointer] = node
+        return True, node
+
+
+class ReferenceResolver:
+    """Resolves local and relative external-file ``$ref``s of a document.
+
+    Each document gets one JSON pointer index, and each distinct
+    reference is resolved once and memoized. External files (e.g.
+    ``common.yaml#/components/schemas/Error``) are loaded and indexed lazily
+    on first use and cached per file.
+    """
+
+    def __init__(
+        self,
+        document: Any,
+        base_path: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize reference resolver.
+
+        Args:
+            document: Root document
+            base_path: Location of the root document, used to find files of
+                relative external references
+        """
+        self.document = document
+        self.base_path = Path(base_path).resolve() if base_path else None
+
+        self._indexes: Dict[Optional[Path], JsonPointerIndex] = {}
+        self._load_errors: Dict[Path, str] = {}
+        self._memo: Dict[Tuple[Optional[Path], str], ReferenceResolution] = {}
+
+    def resolve(
+        self, ref_path: str, source: Optional[Path] = None
+    ) -> ReferenceResolution:
+        """Resolve a reference.
+
+        Args:
+            ref_path: Reference (e.g., "#/components/schemas/User" or
+                "common.yaml#/components/schemas/Error")
+            source: External file containing the reference, or None for the
+                root document
+
+        Returns:
+            Reference resolution result
+        """
+        key = (source, ref_path)
+        result = self._memo.get(key)
+        if result is None:
+            result = self._resolve(ref_path, source)
+            self._memo[key] = result
+        return result
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get resolution statistics.
+
+        Returns:
+            Dictionary with resolved reference and indexed document counts
+        """
+        return {
+            "references_resolved": len(self._memo),
+            "external_documents": sum(1 for path in self._indexes if path),
+            "indexed_nodes": sum(len(index) for index in self._indexes.values()),
+        }
+
+    def get_external_documents(self) -> List[Path]:
+        """Get the external files read so far, including unreadable ones.
+
+        Returns:
+            Sorted paths of the external documents
+        """
+        return sorted({path for path in self._indexes if path} | set(self._load_errors))
+
+    def _resolve(self, ref_path: str, source: Optional[Path]) -> ReferenceResolution:
+        """Resolve a reference without consulting the memo table."""
+        file_part, hash_sign, fragment = ref_path.partition("#")
+
+        if file_part.startswith(REMOTE_REF_PREFIXES):
+            return ReferenceResolution(
+                resolved=False,
+                error=f"Remote references not supported: {ref_path}",
+            )
+
+        document_path = source
+        if file_part:
+            base_path = source or self.base_path
+            if base_path is None:
+                return ReferenceResolution(
+                    resolved=False,
+                    error=(
+                        f"External reference requires the document location: "
+                        f"{ref_path}"
+                    ),
+                )
+            document_path = (base_path.parent / unquote(file_part)).resolve()
+
+        pointer = unquote(fragment)
+        if not hash_sign:
+            pointer = ""
+        if pointer and not pointer.startswith("/"):
+            return ReferenceResolution(
+                resolved=False, error=f"Invalid JSON pointer: {ref_path}"
+            )
+
+        try:
+            index = self._get_index(document_path)
+        except Exception as e:
+            return ReferenceResolution(
+                resolved=False,
+                error=f"Failed to load referenced document {file_part}: {str(e)}",
+            )
+
+        found, value = index.get(pointer)
+        if not found:
+            return ReferenceResolution(
+                resolved=False, error=f"Reference not found: {ref_path}"
+            )
+
+        return ReferenceResolution(
+            resolved=True, target=self._target_name(document_path, pointer), value=value
+        )
+
+    def _target_name(self, document_path: Optional[Path], pointer: str) -> str:
+        """Get the target name of a resolved reference.
+
+        Targets in the root document are plain paths (e.g.,
+        "components/schemas/User"); targets in external files are prefixed
+        with the file location relative to the root document.
+        """
+        if document_path is None or document_path == self.base_path:
+            return pointer[1:]
+
+        if self.base_path:
+            location = os.path.relpath(document_path, self.base_path.parent)
+        else:
+            location = str(document_path)
+        return f"{Path(location).as_posix()}#{pointer}"
+
+    def _get_index(self, document_path: Optional[Path]) -> JsonPointerIndex:
+        """Get the pointer index of a document, loading it on first use.
+
+        Raises:
+            OSError, ValueError, yaml.YAMLError: If the document cannot be
+                loaded (the failure is cached)
+        """
+        if document_path == self.base_path:
+            document_path = None
+
+        index = self._indexes.get(document_path)
+        if index is not None:
+            return index
+
+        if document_path is None:
+            index = JsonPointerIndex(self.document)
+        else:
+            if document_path in self._load_errors:
+                raise ValueError(self._load_errors[document_path])
+            try:
+                index = JsonPointerIndex(self._load_document(document_path))
+            except Exception as e:
+                self._load_errors[document_path] = str(e)
+                raise
+
+            logger.debug(
+                "Loaded external reference document", file_path=str(document_path)
+            )
+
+        self._indexes[document_path] = index
+        return index
+
+    @staticmethod
+    def _load_document(document_path: Path) -> Any:
+        """Load a JSON or YAML document."""
+        with open(document_path, "r", encoding="utf-8") as f:
+            if document_path.suffix.lower() == ".json":
+                return json.load(f)
+            return yaml.load(f, Loader=YamlLoader)
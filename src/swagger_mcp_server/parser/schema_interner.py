@@ -0,0 +1,132 @@
+"""Hash-consing of JSON schema subtrees.
+
+Generated specifications (protobuf or Java code generators, for example)
+repeat the same inline object shapes across thousands of request and
+response bodies. ``SchemaInterner`` maps structurally identical subtrees to
+a single shared instance, so a normalized model holds each distinct shape
+once no matter how often the document repeats it.
+"""
+
+from typing import Any, Dict, Hashable, List, Tuple
+
+# Structural key of a subtree: ("#", shape_id) for interned containers,
+# the string itself for strings and (type, value) for other scalars
+Key = Tuple[Any, Hashable]
+
+SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+class SchemaInterner:
+    """Shares structurally identical dict/list subtrees.
+
+    Subtrees are hashed bottom-up: the key of a container is built from the
+    shape IDs of its children, so every node is hashed once and interning a
+    document is linear in its size. Interned containers are shared between
+    all users and must be treated as read-only; input containers are never
+    modified (a container is copied when one of its children is replaced).
+
+    Key order of mappings is significant, so documents serialize exactly as
+    written.
+    """
+
+    def __init__(self):
+        """Initialize interner."""
+        # Structural key -> (shape ID, canonical subtree)
+        self._shapes: Dict[Tuple[Any, ...], Tuple[int, Any]] = {}
+        self.nodes_seen = 0
+        self.unique_nodes = 0
+
+    def intern(self, node: Any) -> Any:
+        """Get the shared instance of a subtree.
+
+        Args:
+            node: JSON-like value; scalars are returned unchanged
+
+        Returns:
+            Canonical subtree equal to ``node``
+        """
+        if type(node) in (dict, list):
+            return self._intern(node)[0]
+        return node
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Fraction of the subtrees seen that were duplicates."""
+        if not self.nodes_seen:
+            return 0.0
+        return 1 - self.unique_nodes / self.nodes_seen
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get deduplication statistics.
+
+        Returns:
+            Dictionary with subtree counts and the dedup ratio
+        """
+        return {
+            "subtrees_seen": self.nodes_seen,
+            "unique_subtrees": self.unique_nodes,
+            "duplicate_subtrees": self.nodes_seen - self.unique_nodes,
+            "dedup_ratio": round(self.dedup_ratio, 4),
+        }
+
+    def release(self) -> None:
+        """Drop the shape table but keep the statistics.
+
+        Shared subtrees stay shared; later subtrees are no longer matched
+        against earlier ones.
+        """
+        self._shapes = {}
+
+    def reset(self) -> None:
+        """Drop the shape table and the statistics."""
+        self.release()
+        self.nodes_seen = 0
+        self.unique_nodes = 0
+
+    def _intern(self, node: Any) -> Tuple[Any, Key]:
+        """Intern a subtree, returning its canonical instance and key."""
+        node_type = type(node)
+        if node_type is str:
+            return node, node
+        if node_type in SCALAR_TYPES:
+            # The type keeps True, 1 and 1.0 apart
+            return node, (node_type, node)
+
+        if node_type is dict:
+            intern = self._intern
+            parts = []
+            changed = False
+            for name, value in node.items():
+                canonical, key = intern(value)
+                if canonical is not value:
+                    changed = True
+                parts.append((name, canonical, key))
+            structure = (dict, tuple([(name, key) for name, _, key in parts]))
+            if changed:
+                node = {name: canonical for name, canonical, _ in parts}
+            return self._canonical(structure, node)
+
+        if node_type is list:
+            pairs = [self._intern(value) for value in node]
+            structure = (list, tuple([key for _, key in pairs]))
+            values = [canonical for canonical, _ in pairs]
+            if any(canonical is not value for canonical, value in zip(values, node)):
+                node = values
+            return self._canonical(structure, node)
+
+        try:
+            hash(node)
+        except TypeError:
+            # Not JSON data; never shared
+            return node, ("id", id(node))
+        return node, (node_type, node)
+
+    def _canonical(self, structure: Tuple[Any, ...], node: Any) -> Tuple[Any, Key]:
+        """Look up or register a container by structure."""
+        self.nodes_seen += 1
+        shape = self._shapes.get(structure)
+        if shape is None:
+            self.unique_nodes += 1
+            shape = (self.unique_nodes, node)
+            self._shapes[structure] = shape
+        return shape[1], ("#", shape[0])
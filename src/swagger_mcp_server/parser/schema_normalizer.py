@@ -1,7 +1,18 @@
 """Main OpenAPI Schema Normalization Engine orchestrator."""
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from swagger_mcp_server.config.logging import get_logger
 from swagger_mcp_server.parser.consistency_validator import (
@@ -14,28 +25,53 @@ from swagger_mcp_server.parser.models import (
     NormalizedSchema,
     NormalizedSecurityScheme,
 )
+from swagger_mcp_server.parser.parallel_normalizer import ParallelNormalizer
+from swagger_mcp_server.parser.schema_interner import SchemaInterner
 from swagger_mcp_server.parser.schema_processor import SchemaProcessor
 from swagger_mcp_server.parser.search_optimizer import (
     SearchIndex,
     SearchOptimizer,
 )
 from swagger_mcp_server.parser.security_mapper import SecurityMapper
+from swagger_mcp_server.parser.spill_store import SpilledEndpoints, SpillStore
+from swagger_mcp_server.parser.stream_parser import StreamedDocument
 
 logger = get_logger(__name__)
 
+EndpointResult = Tuple[List[NormalizedEndpoint], List[str], List[str]]
+SchemaResult = Tuple[Dict[str, NormalizedSchema], List[str], List[str]]
+
 
 @dataclass
 class NormalizationResult:
-    """Result of the complete normalization process."""
+    """Result of the complete normalization process.
 
-    endpoints: List[NormalizedEndpoint]
-    schemas: Dict[str, NormalizedSchema]
+    In spill mode ``endpoints`` and ``schemas`` are read-only views of
+    ``spill_store`` that load objects from disk while they are iterated;
+    call ``close()`` once the result has been consumed.
+    """
+
+    endpoints: Union[List[NormalizedEndpoint], SpilledEndpoints]
+    schemas: Mapping[str, NormalizedSchema]
     security_schemes: Dict[str, NormalizedSecurityScheme]
     search_index: SearchIndex
     errors: List[str]
     warnings: List[str]
     statistics: Dict[str, Any]
     consistency_report: Dict[str, Any]
+    spill_store: Optional[SpillStore] = None
+    # External files read to resolve references
+    referenced_files: List[Path] = field(default_factory=list)
+
+    @property
+    def is_spilled(self) -> bool:
+        """Whether endpoints and schemas are held on disk."""
+        return self.spill_store is not None
+
+    def close(self) -> None:
+        """Delete the on-disk store of a spilled result."""
+        if self.spill_store is not None:
+            self.spill_store.close()
 
 
 @dataclass
@@ -48,6 +84,22 @@ class NormalizationConfig:
     performance_mode: bool = False  # Skip some validations for speed
     max_circular_refs: int = 10  # Maximum circular reference depth
     enable_search_optimization: bool = True
+    # Worker processes for endpoint/schema normalization (1 = serial,
+    # 0 = one per CPU); see ParserConfig.normalization_workers
+    max_workers: int = 1
+    parallel_min_items: int = 500  # Smaller documents are normalized serially
+    # Run full Pydantic validation for every endpoint/schema model; otherwise
+    # models are constructed from slotted records without validation
+    strict_validation: bool = False
+    # Write normalized endpoints and schemas to a temporary on-disk store as
+    # they are produced instead of keeping them in memory, for specifications
+    # whose normalized form does not fit in RAM
+    spill_to_disk: bool = False
+    spill_dir: Optional[str] = None  # Defaults to the system temp directory
+    # Share structurally identical schema subtrees of endpoints and schemas
+    # (hash-consing); not applied in worker processes or in spill mode, where
+    # objects are pickled one at a time
+    deduplicate_schemas: bool = True
 
 
 class SchemaNormalizer:
@@ -57,24 +109,41 @@ class SchemaNormalizer:
         self.config = config or NormalizationConfig()
         self.logger = get_logger(__name__)
 
+        self.interner: Optional[SchemaInterner] = None
+        if self.config.deduplicate_schemas and not self.config.spill_to_disk:
+            self.interner = SchemaInterner()
+
         # Initialize components
-        self.endpoint_normalizer = EndpointNormalizer()
-        self.schema_processor = SchemaProcessor()
+        self.endpoint_normalizer = EndpointNormalizer(
+            self.config.strict_validation, self.interner
+        )
+        self.schema_processor = SchemaProcessor(
+            self.config.strict_validation, self.interner
+        )
         self.security_mapper = SecurityMapper()
         self.extension_handler = ExtensionHandler()
         self.consistency_validator = ConsistencyValidator()
         self.search_optimizer = SearchOptimizer()
 
     def normalize_openapi_document(
-        self, openapi_data: Dict[str, Any]
+        self,
+        openapi_data: Dict[str, Any],
+        base_path: Optional[Union[str, Path]] = None,
     ) -> NormalizationResult:
         """Normalize a complete OpenAPI document.
 
+        With ``NormalizationConfig.spill_to_disk`` endpoints and schemas are
+        written to a ``SpillStore`` as they are produced and the remaining
+        steps read them back from disk.
+
         Args:
             openapi_data: Complete OpenAPI document
+            base_path: Location of the document, used to resolve relative
+                external-file references
 
         Returns:
-            NormalizationResult with all normalized components
+            NormalizationResult with all normalized components; a spilled
+            result must be closed once consumed
         """
         self.logger.info(
             "Starting OpenAPI document normalization",
@@ -83,105 +152,318 @@ class SchemaNormalizer:
 
         all_errors = []
         all_warnings = []
+        spill_store = None
+        self._reset_interner()
+        self.schema_processor.reference_resolver = None
+
+        try:
+            if self.config.spill_to_disk:
+                self.logger.info("Steps 1-2: Normalizing endpoints and schemas to disk")
+                paths_data = openapi_data.get("paths")
+                components_data = openapi_data.get("components")
+                schemas_data = (
+                    components_data.get("schemas")
+                    if isinstance(components_data, dict)
+                    else None
+                )
+                spill_store = self._spill(
+                    paths_data.items() if isinstance(paths_data, dict) else (),
+                    schemas_data.items() if isinstance(schemas_data, dict) else (),
+                    openapi_data.get("security", []),
+                    all_errors,
+                    all_warnings,
+                )
+                endpoints, schemas = spill_store.endpoints, spill_store.schemas
+            else:
+                endpoints, schemas = self._normalize_in_memory(
+                    openapi_data, base_path, all_errors, all_warnings
+                )
+
+            result = self._complete_normalization(
+                openapi_data, endpoints, schemas, all_errors, all_warnings, spill_store
+            )
+            if spill_store is None and self.schema_processor.reference_resolver:
+                result.referenced_files = (
+                    self.schema_processor.reference_resolver.get_external_documents()
+                )
+            return result
+
+        except Exception as e:
+            return self._failed_result(e, all_warnings, spill_store)
+
+    def normalize_streamed_document_to_disk(
+        self, document_stream: StreamedDocument
+    ) -> NormalizationResult:
+        """Normalize a streamed document into an on-disk store.
+
+        Combines ``normalize_streamed_document`` with the whole-document
+        steps of ``normalize_openapi_document``: endpoints and schemas are
+        written to a ``SpillStore`` as they are produced, then consistency
+        validation, search optimization and statistics read them back from
+        disk. Neither the document nor its normalized form is ever held in
+        memory as a whole.
+
+        Args:
+            document_stream: Streamed document from ``SwaggerStreamParser``
+
+        Returns:
+            Spilled NormalizationResult; call ``close()`` when done with it
+        """
+        self.logger.info(
+            "Starting streamed OpenAPI document normalization to disk",
+            file_path=str(document_stream.file_path),
+        )
+
+        all_errors: List[str] = []
+        all_warnings: List[str] = []
+        spill_store = None
+        skeleton = document_stream.skeleton
+        self._reset_interner()
 
         try:
+            spill_store = self._spill(
+                document_stream.iter_path_items(),
+                document_stream.iter_schemas(),
+                skeleton.get("security", []),
+                all_errors,
+                all_warnings,
+            )
+            return self._complete_normalization(
+                skeleton,
+                spill_store.endpoints,
+                spill_store.schemas,
+                all_errors,
+                all_warnings,
+                spill_store,
+            )
+
+        except Exception as e:
+            return self._failed_result(e, all_warnings, spill_store)
+
+    def _reset_interner(self) -> None:
+        """Start deduplicating a new document."""
+        if self.interner is not None:
+            self.interner.reset()
+
+    def _normalize_in_memory(
+        self,
+        openapi_data: Dict[str, Any],
+        base_path: Optional[Union[str, Path]],
+        all_errors: List[str],
+        all_warnings: List[str],
+    ) -> Tuple[List[NormalizedEndpoint], Dict[str, NormalizedSchema]]:
+        """Normalize endpoints and schemas, serially or in parallel (steps 1-2)."""
+        parallel_results = None
+        if self._should_normalize_in_parallel(openapi_data):
+            self.logger.info("Steps 1-2: Normalizing endpoints and schemas in parallel")
+            parallel_results = self._normalize_in_parallel(openapi_data, base_path)
+
+        if parallel_results:
+            endpoint_result, schema_result = parallel_results
+        else:
             # Step 1: Extract and normalize endpoints
             self.logger.info("Step 1: Normalizing endpoints")
-            (
-                endpoints,
-                endpoint_errors,
-                endpoint_warnings,
-            ) = self._normalize_endpoints(openapi_data)
-            all_errors.extend(endpoint_errors)
-            all_warnings.extend(endpoint_warnings)
+            endpoint_result = self._normalize_endpoints(openapi_data)
 
             # Step 2: Process schema definitions
             self.logger.info("Step 2: Processing schemas")
-            schemas, schema_errors, schema_warnings = self._process_schemas(
-                openapi_data
-            )
-            all_errors.extend(schema_errors)
-            all_warnings.extend(schema_warnings)
-
-            # Step 3: Map security schemes
-            self.logger.info("Step 3: Mapping security schemes")
-            (
-                security_schemes,
-                security_errors,
-                security_warnings,
-            ) = self._map_security_schemes(openapi_data)
-            all_errors.extend(security_errors)
-            all_warnings.extend(security_warnings)
-
-            # Step 4: Process extensions (optional)
-            if self.config.include_extensions:
-                self.logger.info("Step 4: Processing extensions")
-                extension_warnings = self._process_extensions(
-                    endpoints, schemas, security_schemes
-                )
-                all_warnings.extend(extension_warnings)
-
-            # Step 5: Validate consistency
-            consistency_report = {}
-            if self.config.validate_consistency and not self.config.performance_mode:
-                self.logger.info("Step 5: Validating consistency")
-                consistency_report = self._validate_consistency(
-                    endpoints, schemas, security_schemes
-                )
-                all_errors.extend(consistency_report.get("errors", []))
-                all_warnings.extend(consistency_report.get("warnings", []))
-
-            # Step 6: Optimize for search
-            search_index = None
-            if self.config.optimize_for_search:
-                self.logger.info("Step 6: Optimizing for search")
-                search_index = self._optimize_for_search(
-                    endpoints, schemas, security_schemes
-                )
+            schema_result = self._process_schemas(openapi_data, base_path)
 
-            # Step 7: Generate statistics
-            self.logger.info("Step 7: Generating statistics")
-            statistics = self._generate_statistics(
-                endpoints, schemas, security_schemes, search_index
-            )
+        endpoints, endpoint_errors, endpoint_warnings = endpoint_result
+        all_errors.extend(endpoint_errors)
+        all_warnings.extend(endpoint_warnings)
+
+        schemas, schema_errors, schema_warnings = schema_result
+        all_errors.extend(schema_errors)
+        all_warnings.extend(schema_warnings)
+
+        return endpoints, schemas
+
+    def _spill(
+        self,
+        path_items: Iterable[Tuple[str, Any]],
+        schema_items: Iterable[Tuple[str, Any]],
+        global_security: List[Dict[str, Any]],
+        errors: List[str],
+        warnings: List[str],
+    ) -> SpillStore:
+        """Normalize endpoints and schemas into a new spill store (steps 1-2).
+
+        Schemas are normalized one at a time as in
+        ``normalize_streamed_document``: dependencies come from their local
+        ``$ref``s and no cross-schema reference resolution is done, since
+        that needs every schema in memory.
+        """
+        spill_store = SpillStore(self.config.spill_dir)
+        try:
+            for endpoint in self.endpoint_normalizer.iter_normalized_endpoints(
+                path_items, global_security, errors, warnings
+            ):
+                spill_store.add_endpoint(endpoint)
+            for schema in self.schema_processor.iter_normalized_schemas(
+                schema_items, errors
+            ):
+                spill_store.add_schema(schema)
+            spill_store.flush()
+        except BaseException:
+            spill_store.close()
+            raise
 
-            # Create final result
-            result = NormalizationResult(
-                endpoints=endpoints,
-                schemas=schemas,
-                security_schemes=security_schemes,
-                search_index=search_index,
-                errors=all_errors,
-                warnings=all_warnings,
-                statistics=statistics,
-                consistency_report=consistency_report,
+        self.logger.info(
+            "Normalized objects spilled to disk",
+            path=str(spill_store.path),
+            endpoints=len(spill_store.endpoints),
+            schemas=len(spill_store.schemas),
+            bytes_written=spill_store.bytes_written,
+        )
+        return spill_store
+
+    def _complete_normalization(
+        self,
+        openapi_data: Dict[str, Any],
+        endpoints: Union[List[NormalizedEndpoint], SpilledEndpoints],
+        schemas: Mapping[str, NormalizedSchema],
+        all_errors: List[str],
+        all_warnings: List[str],
+        spill_store: Optional[SpillStore] = None,
+    ) -> NormalizationResult:
+        """Run steps 3-7 on normalized endpoints and schemas."""
+        if self.interner is not None:
+            # Shared subtrees stay shared; the lookup table is not needed
+            # any more
+            self.interner.release()
+
+        # Step 3: Map security schemes
+        self.logger.info("Step 3: Mapping security schemes")
+        (
+            security_schemes,
+            security_errors,
+            security_warnings,
+        ) = self._map_security_schemes(openapi_data)
+        all_errors.extend(security_errors)
+        all_warnings.extend(security_warnings)
+
+        # Step 4: Process extensions (optional)
+        if self.config.include_extensions:
+            self.logger.info("Step 4: Processing extensions")
+            extension_warnings = self._process_extensions(
+                endpoints, schemas, security_schemes
             )
+            all_warnings.extend(extension_warnings)
 
-            self.logger.info(
-                "OpenAPI document normalization completed",
-                endpoints=len(endpoints),
-                schemas=len(schemas),
-                security_schemes=len(security_schemes),
-                errors=len(all_errors),
-                warnings=len(all_warnings),
-                success=len(all_errors) == 0,
+        # Step 5: Validate consistency
+        consistency_report = {}
+        if self.config.validate_consistency and not self.config.performance_mode:
+            self.logger.info("Step 5: Validating consistency")
+            consistency_report = self._validate_consistency(
+                endpoints, schemas, security_schemes
+            )
+            all_errors.extend(consistency_report.get("errors", []))
+            all_warnings.extend(consistency_report.get("warnings", []))
+
+        # Step 6: Optimize for search
+        search_index = None
+        if self.config.optimize_for_search:
+            self.logger.info("Step 6: Optimizing for search")
+            search_index = self._optimize_for_search(
+                endpoints, schemas, security_schemes
             )
 
-            return result
+        # Step 7: Generate statistics
+        self.logger.info("Step 7: Generating statistics")
+        statistics = self._generate_statistics(
+            endpoints, schemas, security_schemes, search_index
+        )
 
-        except Exception as e:
-            self.logger.error("Critical error during normalization", error=str(e))
-            # Return partial result with error
-            return NormalizationResult(
-                endpoints=[],
-                schemas={},
-                security_schemes={},
-                search_index=None,
-                errors=[f"Critical normalization error: {str(e)}"],
-                warnings=all_warnings,
-                statistics={},
-                consistency_report={},
-            )
+        # Create final result
+        result = NormalizationResult(
+            endpoints=endpoints,
+            schemas=schemas,
+            security_schemes=security_schemes,
+            search_index=search_index,
+            errors=all_errors,
+            warnings=all_warnings,
+            statistics=statistics,
+            consistency_report=consistency_report,
+            spill_store=spill_store,
+        )
+
+        self.logger.info(
+            "OpenAPI document normalization completed",
+            endpoints=len(endpoints),
+            schemas=len(schemas),
+            security_schemes=len(security_schemes),
+            errors=len(all_errors),
+            warnings=len(all_warnings),
+            success=len(all_errors) == 0,
+            spilled=spill_store is not None,
+        )
+
+        return result
+
+    def _failed_result(
+        self,
+        error: Exception,
+        warnings: List[str],
+        spill_store: Optional[SpillStore] = None,
+    ) -> NormalizationResult:
+        """Build the partial result of a normalization that failed."""
+        self.logger.error("Critical error during normalization", error=str(error))
+        if spill_store is not None:
+            spill_store.close()
+
+        return NormalizationResult(
+            endpoints=[],
+            schemas={},
+            security_schemes={},
+            search_index=None,
+            errors=[f"Critical normalization error: {str(error)}"],
+            warnings=warnings,
+            statistics={},
+            consistency_report={},
+        )
+
+    def normalize_streamed_document(
+        self,
+        document_stream: StreamedDocument,
+        errors: Optional[List[str]] = None,
+        warnings: Optional[List[str]] = None,
+    ) -> Iterator[Union[NormalizedEndpoint, NormalizedSchema]]:
+        """Normalize a streamed document one endpoint or schema at a time.
+
+        Counterpart of ``normalize_openapi_document`` for specs parsed with
+        ``ParserConfig.streaming_mode``: endpoints are yielded first, then
+        schemas, and nothing is accumulated so consumers (storage, indexing)
+        can process arbitrarily large specs with bounded memory. Whole-document
+        steps (consistency validation, search optimization) are not run.
+
+        Args:
+            document_stream: Streamed document from ``SwaggerStreamParser``
+            errors: Optional list collecting error messages
+            warnings: Optional list collecting warning messages
+
+        Yields:
+            Normalized endpoints followed by normalized schemas
+        """
+        errors = errors if errors is not None else []
+        warnings = warnings if warnings is not None else []
+        global_security = document_stream.skeleton.get("security", [])
+        self._reset_interner()
+
+        self.logger.info(
+            "Starting streamed OpenAPI document normalization",
+            file_path=str(document_stream.file_path),
+        )
+
+        yield from self.endpoint_normalizer.iter_normalized_endpoints(
+            document_stream.iter_path_items(), global_security, errors, warnings
+        )
+        yield from self.schema_processor.iter_normalized_schemas(
+            document_stream.iter_schemas(), errors
+        )
+
+        if self.interner is not None:
+            self.interner.release()
 
     def _normalize_endpoints(
         self, openapi_data: Dict[str, Any]
@@ -197,7 +479,9 @@ class SchemaNormalizer:
         return self.endpoint_normalizer.normalize_endpoints(paths_data, global_security)
 
     def _process_schemas(
-        self, openapi_data: Dict[str, Any]
+        self,
+        openapi_data: Dict[str, Any],
+        base_path: Optional[Union[str, Path]] = None,
     ) -> Tuple[Dict[str, NormalizedSchema], List[str], List[str]]:
         """Process all schema definitions from OpenAPI document."""
         components_data = openapi_data.get("components", {})
@@ -206,7 +490,88 @@ class SchemaNormalizer:
             self.logger.info("No schema definitions found")
             return {}, [], ["No schema definitions found"]
 
-        return self.schema_processor.process_schemas(components_data, openapi_data)
+        return self.schema_processor.process_schemas(
+            components_data, openapi_data, base_path
+        )
+
+    def _should_normalize_in_parallel(self, openapi_data: Dict[str, Any]) -> bool:
+        """Check if the document is worth sharding across worker processes."""
+        if self.config.max_workers == 1:
+            return False
+
+        paths_data = openapi_data.get("paths")
+        components_data = openapi_data.get("components")
+        schemas_data = (
+            components_data.get("schemas")
+            if isinstance(components_data, dict)
+            else None
+        )
+
+        item_count = sum(
+            len(section)
+            for section in (paths_data, schemas_data)
+            if isinstance(section, dict)
+        )
+        return item_count >= self.config.parallel_min_items
+
+    def _normalize_in_parallel(
+        self,
+        openapi_data: Dict[str, Any],
+        base_path: Optional[Union[str, Path]] = None,
+    ) -> Optional[Tuple[EndpointResult, SchemaResult]]:
+        """Normalize endpoints and schemas across worker processes.
+
+        Paths and schema definitions are sharded and processed in a process
+        pool (map); schema shards are then merged and cross-shard ``$ref``
+        resolution and circular reference detection run over all schemas
+        (reduce). Empty or malformed sections use the serial code path so
+        messages match serial normalization.
+
+        Returns:
+            Endpoint and schema results, or None if the pool failed and the
+            caller should normalize serially
+        """
+        paths_data = openapi_data.get("paths")
+        components_data = openapi_data.get("components")
+        schemas_data = (
+            components_data.get("schemas")
+            if isinstance(components_data, dict)
+            else None
+        )
+        parallel_paths = paths_data if isinstance(paths_data, dict) else {}
+        parallel_schemas = schemas_data if isinstance(schemas_data, dict) else {}
+
+        try:
+            endpoint_result, schema_shards = ParallelNormalizer(
+                self.config.max_workers,
+                strict_validation=self.config.strict_validation,
+            ).normalize(
+                parallel_paths,
+                parallel_schemas,
+                openapi_data.get("security", []),
+            )
+        except Exception as e:
+            self.logger.warning(
+                "Parallel normalization failed, falling back to serial",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return None
+
+        if not parallel_paths:
+            endpoint_result = self._normalize_endpoints(openapi_data)
+
+        if parallel_schemas:
+            schema_result = self.schema_processor.merge_schema_shards(
+                [(schemas, references) for schemas, references, _ in schema_shards],
+                openapi_data,
+                errors=[error for _, _, errors in schema_shards for error in errors],
+                base_path=base_path,
+            )
+        else:
+            schema_result = self._process_schemas(openapi_data, base_path)
+
+        return endpoint_result, schema_result
 
     def _map_security_schemes(
         self, openapi_data: Dict[str, Any]
@@ -356,6 +721,10 @@ class SchemaNormalizer:
             endpoints, schemas, security_schemes
         )
 
+        # Shared schema subtrees
+        if self.interner is not None:
+            stats["deduplication"] = self.interner.get_statistics()
+
         return stats
 
     def _calculate_quality_metrics(
@@ -1,9 +1,19 @@
 """Schema definition processing and reference resolution for OpenAPI documents."""
 
 import json
-from collections import defaultdict, deque
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set, Tuple
+from collections import defaultdict
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 try:
     import jsonref
@@ -13,41 +23,59 @@ except ImportError:
     JSONREF_AVAILABLE = False
 
 from swagger_mcp_server.config.logging import get_logger
+from swagger_mcp_server.parser.fast_models import SchemaRecord
 from swagger_mcp_server.parser.models import NormalizedSchema
+from swagger_mcp_server.parser.reference_graph import SchemaReferenceGraph
+from swagger_mcp_server.parser.reference_resolver import ReferenceResolver
+from swagger_mcp_server.parser.schema_interner import SchemaInterner
 
 logger = get_logger(__name__)
 
+# Local reference prefixes pointing at schema definitions (OpenAPI 3 / Swagger 2)
+LOCAL_SCHEMA_REF_PREFIXES = ("#/components/schemas/", "#/definitions/")
 
-@dataclass
-class ReferenceResolution:
-    """Result of reference resolution."""
-
-    resolved: bool
-    target: Optional[str] = None
-    error: Optional[str] = None
-    circular: bool = False
+# Resolved reference targets of schema definitions (without the leading "#/")
+SCHEMA_TARGET_PREFIXES = ("components/schemas/", "definitions/")
 
 
 class SchemaProcessor:
     """Processes OpenAPI schema definitions with reference resolution and dependency tracking."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        strict_validation: bool = False,
+        interner: Optional[SchemaInterner] = None,
+    ):
+        """Initialize schema processor.
+
+        Args:
+            strict_validation: Whether to run full Pydantic validation when
+                creating schema models
+            interner: Shares identical subschemas between schemas (None
+                disables sharing)
+        """
         self.logger = get_logger(__name__)
+        self.strict_validation = strict_validation
+        self.interner = interner
         self.processed_schemas: Dict[str, NormalizedSchema] = {}
-        self.reference_cache: Dict[str, ReferenceResolution] = {}
+        self.reference_resolver: Optional[ReferenceResolver] = None
         self.circular_references: Set[str] = set()
         self.dependency_graph: Dict[str, Set[str]] = defaultdict(set)
+        self.reference_graph = SchemaReferenceGraph({})
 
     def process_schemas(
         self,
         components_data: Dict[str, Any],
         full_document: Optional[Dict[str, Any]] = None,
+        base_path: Optional[Union[str, Path]] = None,
     ) -> Tuple[Dict[str, NormalizedSchema], List[str], List[str]]:
         """Process all schema components with reference resolution.
 
         Args:
             components_data: OpenAPI components object
             full_document: Complete OpenAPI document for reference resolution
+            base_path: Location of the document, used to resolve relative
+                external-file references
 
         Returns:
             Tuple of (normalized_schemas, errors, warnings)
@@ -66,30 +94,104 @@ class SchemaProcessor:
             jsonref_available=JSONREF_AVAILABLE,
         )
 
-        # Clear previous state
-        self.processed_schemas.clear()
-        self.reference_cache.clear()
-        self.circular_references.clear()
-        self.dependency_graph.clear()
+        schemas, references, shard_errors = self.normalize_schema_shard(
+            schemas_data.items(), collect_references=full_document is not None
+        )
+        errors.extend(shard_errors)
+
+        return self.merge_schema_shards(
+            [(schemas, references)], full_document, errors, warnings, base_path
+        )
 
-        # First pass: Create basic schema objects
-        for schema_name, schema_def in schemas_data.items():
+    def normalize_schema_shard(
+        self,
+        schema_items: Iterable[Tuple[str, Any]],
+        collect_references: bool = True,
+    ) -> Tuple[Dict[str, NormalizedSchema], Dict[str, Set[str]], List[str]]:
+        """Create normalized schemas for a shard of definitions (map step).
+
+        Works on each definition in isolation, so shards can be processed in
+        separate worker processes. Cross-schema work happens in
+        ``merge_schema_shards``.
+
+        Args:
+            schema_items: Iterable of (schema_name, schema_definition) pairs
+            collect_references: Whether to collect each schema's ``$ref``s
+
+        Returns:
+            Tuple of (schemas, references by schema name, errors)
+        """
+        schemas: Dict[str, NormalizedSchema] = {}
+        references: Dict[str, Set[str]] = {}
+        errors = []
+
+        for schema_name, schema_def in schema_items:
             if not isinstance(schema_def, dict):
                 errors.append(f"Schema definition must be object: {schema_name}")
                 continue
 
             try:
-                normalized_schema = self._create_basic_schema(schema_name, schema_def)
-                self.processed_schemas[schema_name] = normalized_schema
+                schemas[schema_name] = self._create_basic_schema(
+                    schema_name, schema_def
+                )
             except Exception as e:
                 errors.append(f"Failed to create basic schema {schema_name}: {str(e)}")
+                continue
+
+            if collect_references:
+                references[schema_name] = self._find_all_references(schema_def)
+
+        return schemas, references, errors
+
+    def merge_schema_shards(
+        self,
+        shards: Iterable[Tuple[Dict[str, NormalizedSchema], Dict[str, Set[str]]]],
+        full_document: Optional[Dict[str, Any]] = None,
+        errors: Optional[List[str]] = None,
+        warnings: Optional[List[str]] = None,
+        base_path: Optional[Union[str, Path]] = None,
+    ) -> Tuple[Dict[str, NormalizedSchema], List[str], List[str]]:
+        """Merge schema shards and run cross-schema processing (reduce step).
+
+        Shards are merged in order, then references are resolved against
+        the full document, usage relationships are built, and circular
+        references and consistency are checked across all schemas.
 
-        # Second pass: Resolve references and build dependency graph
+        Args:
+            shards: (schemas, references) pairs from ``normalize_schema_shard``
+            full_document: Complete OpenAPI document for reference resolution
+            errors: Errors collected so far
+            warnings: Warnings collected so far
+            base_path: Location of the document, used to resolve relative
+                external-file references
+
+        Returns:
+            Tuple of (normalized_schemas, errors, warnings)
+        """
+        errors = errors if errors is not None else []
+        warnings = warnings if warnings is not None else []
+
+        # Clear previous state
+        self.processed_schemas.clear()
+        self.reference_resolver = (
+            ReferenceResolver(full_document, base_path) if full_document else None
+        )
+        self.circular_references.clear()
+        self.dependency_graph.clear()
+        self.reference_graph = SchemaReferenceGraph({})
+
+        all_references: Dict[str, Set[str]] = {}
+        for schemas, references in shards:
+            self.processed_schemas.update(schemas)
+            all_references.update(references)
+
+        # Resolve references and build dependency graph
         if full_document:
             for schema_name in list(self.processed_schemas.keys()):
                 try:
                     self._resolve_schema_references(
-                        schema_name, schemas_data[schema_name], full_document
+                        schema_name,
+                        all_references.get(schema_name, set()),
                     )
                 except Exception as e:
                     error_msg = f"Failed to resolve references for schema {schema_name}: {str(e)}"
@@ -100,9 +202,13 @@ class SchemaProcessor:
                         error=str(e),
                     )
 
-        # Third pass: Update usage relationships
+        # Update usage relationships
         self._update_usage_relationships()
 
+        # Analyze the reference graph once; cycle checks, resolution order
+        # and transitive dependencies are answered from its components
+        self.reference_graph = SchemaReferenceGraph(self.get_dependency_graph())
+
         # Detect and report circular references
         circular_refs = self._detect_circular_references()
         if circular_refs:
@@ -127,6 +233,44 @@ class SchemaProcessor:
 
         return self.processed_schemas.copy(), errors, warnings
 
+    def iter_normalized_schemas(
+        self,
+        schema_items: Iterable[Tuple[str, Any]],
+        errors: Optional[List[str]] = None,
+    ) -> Iterator[NormalizedSchema]:
+        """Create normalized schemas lazily from a stream of definitions.
+
+        Used with ``SwaggerStreamParser.iter_schemas``. Schemas are not
+        retained in ``processed_schemas``; dependencies are taken from the
+        local ``$ref``s of each definition since the full document is never
+        materialized.
+
+        Args:
+            schema_items: Iterable of (schema_name, schema_definition) pairs
+            errors: Optional list collecting error messages
+
+        Yields:
+            Normalized schemas in document order
+        """
+        errors = errors if errors is not None else []
+
+        for schema_name, schema_def in schema_items:
+            if not isinstance(schema_def, dict):
+                errors.append(f"Schema definition must be object: {schema_name}")
+                continue
+
+            try:
+                normalized_schema = self._create_basic_schema(schema_name, schema_def)
+            except Exception as e:
+                errors.append(f"Failed to create basic schema {schema_name}: {str(e)}")
+                continue
+
+            for ref_path in self._find_all_references(schema_def):
+                if ref_path.startswith(LOCAL_SCHEMA_REF_PREFIXES):
+                    normalized_schema.dependencies.add(ref_path.rsplit("/", 1)[-1])
+
+            yield normalized_schema
+
     def _create_basic_schema(
         self, name: str, schema_def: Dict[str, Any]
     ) -> NormalizedSchema:
@@ -139,6 +283,9 @@ class SchemaProcessor:
         Returns:
             Basic normalized schema
         """
+        # Subschemas are shared with identical ones of other schemas
+        share = self._share
+
         # Extract basic properties
         schema_type = schema_def.get("type")
         format_type = schema_def.get("format")
@@ -149,12 +296,12 @@ class SchemaProcessor:
         examples = schema_def.get("examples")
 
         # Object properties
-        properties = schema_def.get("properties", {})
+        properties = share(schema_def.get("properties", {}))
         required = schema_def.get("required", [])
-        additional_properties = schema_def.get("additionalProperties")
+        additional_properties = share(schema_def.get("additionalProperties"))
 
         # Array properties
-        items = schema_def.get("items")
+        items = share(schema_def.get("items"))
         min_items = schema_def.get("minItems")
         max_items = schema_def.get("maxItems")
         unique_items = schema_def.get("uniqueItems")
@@ -176,15 +323,15 @@ class SchemaProcessor:
         const = schema_def.get("const")
 
         # Composition
-        all_of = schema_def.get("allOf")
-        one_of = schema_def.get("oneOf")
-        any_of = schema_def.get("anyOf")
-        not_schema = schema_def.get("not")
+        all_of = share(schema_def.get("allOf"))
+        one_of = share(schema_def.get("oneOf"))
+        any_of = share(schema_def.get("anyOf"))
+        not_schema = share(schema_def.get("not"))
 
         # Conditional
-        if_schema = schema_def.get("if")
-        then_schema = schema_def.get("then")
-        else_schema = schema_def.get("else")
+        if_schema = share(schema_def.get("if"))
+        then_schema = share(schema_def.get("then"))
+        else_schema = share(schema_def.get("else"))
 
         # Metadata
         read_only = schema_def.get("readOnly")
@@ -199,7 +346,7 @@ class SchemaProcessor:
         # Extract extensions
         extensions = self._extract_extensions(schema_def)
 
-        return NormalizedSchema(
+        return SchemaRecord(
             name=name,
             type=schema_type,
             format=format_type,
@@ -240,45 +387,46 @@ class SchemaProcessor:
             external_docs=external_docs,
             extensions=extensions,
             dependencies=set(),
-        )
+        ).to_model(self.strict_validation)
+
+    def _share(self, value: Any) -> Any:
+        """Get the shared instance of a subschema."""
+        if self.interner is None:
+            return value
+        return self.interner.intern(value)
 
     def _resolve_schema_references(
         self,
         schema_name: str,
-        schema_def: Dict[str, Any],
-        full_document: Dict[str, Any],
+        references: Set[str],
     ) -> None:
         """Resolve references and build dependency graph for a schema.
 
+        Each distinct reference is resolved once by ``reference_resolver``
+        and shared by all schemas using it.
+
         Args:
             schema_name: Schema name
-            schema_def: Schema definition
-            full_document: Complete OpenAPI document
+            references: ``$ref`` paths found in the schema definition
         """
         if schema_name not in self.processed_schemas:
             return
 
         schema = self.processed_schemas[schema_name]
 
-        # Find all references in this schema
-        references = self._find_all_references(schema_def)
-
         # Resolve each reference and build dependency graph
         for ref_path in references:
-            resolution = self._resolve_reference(ref_path, full_document)
+            resolution = self.reference_resolver.resolve(ref_path)
 
             if resolution.resolved and resolution.target:
                 # Add to dependency graph
                 self.dependency_graph[schema_name].add(resolution.target)
 
                 # Add to schema dependencies
-                if resolution.target.startswith("schemas/"):
-                    target_schema = resolution.target.replace("schemas/", "")
+                target_schema = self._schema_name_from_target(resolution.target)
+                if target_schema:
                     schema.dependencies.add(target_schema)
 
-            elif resolution.circular:
-                self.circular_references.add(f"{schema_name} -> {resolution.target}")
-
             if resolution.error:
                 self.logger.warning(
                     "Reference resolution warning",
@@ -318,125 +466,21 @@ class SchemaProcessor:
 
         return references
 
-    def _resolve_reference(
-        self, ref_path: str, document: Dict[str, Any]
-    ) -> ReferenceResolution:
-        """Resolve a single JSON reference.
+    def _schema_name_from_target(self, target: str) -> Optional[str]:
+        """Get the schema name of a resolved reference target.
 
         Args:
-            ref_path: Reference path (e.g., "#/components/schemas/User")
-            document: Complete document for resolution
+            target: Resolved target (e.g., "components/schemas/User")
 
         Returns:
-            Reference resolution result
+            Schema name, or None if the target is not a schema definition
         """
-        # Check cache first
-        if ref_path in self.reference_cache:
-            return self.reference_cache[ref_path]
-
-        try:
-            # Handle local references only (starting with #/)
-            if not ref_path.startswith("#/"):
-                result = ReferenceResolution(
-                    resolved=False,
-                    error=f"External references not supported: {ref_path}",
-                )
-                self.reference_cache[ref_path] = result
-                return result
-
-            # Parse the reference path
-            path_parts = ref_path[2:].split("/")  # Remove '#/' prefix
-
-            # Navigate to the referenced object
-            current = document
-            target_path = []
-
-            for part in path_parts:
-                if not isinstance(current, dict) or part not in current:
-                    result = ReferenceResolution(
-                        resolved=False,
-                        error=f"Reference not found: {ref_path}",
-                    )
-                    self.reference_cache[ref_path] = result
-                    return result
-
-                current = current[part]
-                target_path.append(part)
-
-            # Determine target type
-            target = "/".join(target_path)
-
-            # Check for circular references if this is a schema reference
-            if "schemas" in path_parts:
-                schema_name = path_parts[-1]
-                if self._would_create_circular_reference(schema_name, target_path):
-                    result = ReferenceResolution(
-                        resolved=True, target=target, circular=True
-                    )
-                    self.reference_cache[ref_path] = result
-                    return result
-
-            result = ReferenceResolution(resolved=True, target=target)
-            self.reference_cache[ref_path] = result
-            return result
-
-        except Exception as e:
-            result = ReferenceResolution(
-                resolved=False, error=f"Reference resolution failed: {str(e)}"
-            )
-            self.reference_cache[ref_path] = result
-            return result
-
-    def _would_create_circular_reference(
-        self, schema_name: str, target_path: List[str]
-    ) -> bool:
-        """Check if adding a dependency would create a circular reference.
-
-        Args:
-            schema_name: Source schema name
-            target_path: Target path components
-
-        Returns:
-            True if circular reference would be created
-        """
-        if (
-            len(target_path) < 2
-            or target_path[0] != "components"
-            or target_path[1] != "schemas"
-        ):
-            return False
-
-        target_schema = target_path[2]
-
-        # Simple check: direct circular reference
-        if target_schema == schema_name:
-            return True
-
-        # Use breadth-first search to detect cycles in dependency graph
-        visited = set()
-        queue = deque([target_schema])
-
-        while queue:
-            current = queue.popleft()
-
-            if current in visited:
-                continue
-
-            visited.add(current)
-
-            # If we reach back to the original schema, it's circular
-            if current == schema_name:
-                return True
-
-            # Add dependencies to queue
-            if current in self.dependency_graph:
-                for dep in self.dependency_graph[current]:
-                    if dep.startswith("schemas/"):
-                        dep_schema = dep.replace("schemas/", "")
-                        if dep_schema not in visited:
-                            queue.append(dep_schema)
-
-        return False
+        for prefix in SCHEMA_TARGET_PREFIXES:
+            if target.startswith(prefix):
+                schema_name = target[len(prefix) :]
+                if "/" not in schema_name:
+                    return schema_name
+        return None
 
     def _update_usage_relationships(self) -> None:
         """Update used_by relationships in schemas based on dependency graph."""
@@ -447,50 +491,28 @@ class SchemaProcessor:
         # Build reverse relationships
         for schema_name, dependencies in self.dependency_graph.items():
             for dep in dependencies:
-                if dep.startswith("schemas/"):
-                    dep_schema = dep.replace("schemas/", "")
-                    if dep_schema in self.processed_schemas:
-                        self.processed_schemas[dep_schema].used_by.add(schema_name)
+                dep_schema = self._schema_name_from_target(dep)
+                if dep_schema in self.processed_schemas:
+                    self.processed_schemas[dep_schema].used_by.add(schema_name)
 
     def _detect_circular_references(self) -> List[List[str]]:
         """Detect circular reference cycles in the dependency graph.
 
+        Every strongly connected component of the reference graph that
+        contains a cycle is reported once, and all references between its
+        members are recorded in ``circular_references``.
+
         Returns:
             List of circular reference cycles
         """
-        cycles = []
-        visited = set()
-        rec_stack = set()
-
-        def dfs(node: str, path: List[str]) -> None:
-            if node in rec_stack:
-                # Found a cycle
-                cycle_start = path.index(node)
-                cycle = path[cycle_start:] + [node]
-                cycles.append(cycle)
-                return
-
-            if node in visited:
-                return
-
-            visited.add(node)
-            rec_stack.add(node)
-
-            # Follow schema dependencies only
-            for dep in self.dependency_graph.get(node, []):
-                if dep.startswith("schemas/"):
-                    dep_schema = dep.replace("schemas/", "")
-                    if dep_schema in self.processed_schemas:
-                        dfs(dep_schema, path + [node])
-
-            rec_stack.remove(node)
-
-        # Check all schemas
-        for schema_name in self.processed_schemas.keys():
-            if schema_name not in visited:
-                dfs(schema_name, [])
+        for component in self.reference_graph.cyclic_components():
+            members = set(component)
+            for schema_name in component:
+                for dep in self.reference_graph.edges[schema_name]:
+                    if dep in members:
+                        self.circular_references.add(f"{schema_name} -> {dep}")
 
-        return cycles
+        return self.reference_graph.cycles()
 
     def _validate_schema_consistency(self) -> List[str]:
         """Validate schema consistency and report issues.
@@ -663,9 +685,42 @@ class SchemaProcessor:
 
         for schema_name in self.processed_schemas.keys():
             dependencies = []
-            for dep in self.dependency_graph.get(schema_name, []):
-                if dep.startswith("schemas/"):
-                    dependencies.append(dep.replace("schemas/", ""))
+            for dep in sorted(self.dependency_graph.get(schema_name, [])):
+                dep_schema = self._schema_name_from_target(dep)
+                if dep_schema:
+                    dependencies.append(dep_schema)
             graph[schema_name] = dependencies
 
         return graph
+
+    def get_resolution_order(self) -> List[str]:
+        """Get schema names ordered so that dependencies come first.
+
+        Schemas of one reference cycle are adjacent in the order.
+
+        Returns:
+            Schema names in dependencies-first order
+        """
+        return self.reference_graph.resolution_order()
+
+    def get_transitive_dependencies(self, schema_name: str) -> Set[str]:
+        """Get all schemas a schema references directly or indirectly.
+
+        Args:
+            schema_name: Schema name
+
+        Returns:
+            Names of all reachable schemas
+        """
+        return self.reference_graph.transitive_dependencies(schema_name)
+
+    def is_circular_reference(self, schema_name: str) -> bool:
+        """Check if a schema is part of a reference cycle.
+
+        Args:
+            schema_name: Schema name
+
+        Returns:
+            True if the schema references itself directly or indirectly
+        """
+        return self.reference_graph.is_circular(schema_name)
@@ -1,9 +1,24 @@
 """Search optimization for normalized OpenAPI data structures."""
 
-import re
+import json
+import mmap
+import struct
+import sys
+from array import array
 from collections import Counter
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set, Tuple
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from swagger_mcp_server.config.logging import get_logger
 from swagger_mcp_server.parser.models import (
@@ -12,9 +27,18 @@ from swagger_mcp_server.parser.models import (
     NormalizedSecurityScheme,
     ParameterLocation,
 )
+from swagger_mcp_server.parser.tokenizer import Tokenizer
 
 logger = get_logger(__name__)
 
+# Unsigned 32-bit integers for term/document numbers and counts
+INDEX_TYPECODE = "I"
+
+INDEX_FILE_MAGIC = b"SIDX"
+INDEX_FILE_VERSION = 1
+# Magic, format version and length of the JSON header
+_INDEX_FILE_PREAMBLE = struct.Struct("<4sII")
+
 
 @dataclass
 class SearchableDocument:
@@ -31,14 +55,326 @@ class SearchableDocument:
 
 @dataclass
 class SearchIndex:
-    """Search index with optimized data structures."""
+    """Inverted index of searchable documents in typed arrays.
+
+    Terms are interned and numbered in order of first occurrence, and
+    documents are numbered by their position in ``documents``. Postings are
+    stored in compressed sparse row form: the postings of term number ``t``
+    are ``term_offsets[t]:term_offsets[t + 1]`` of ``posting_documents``
+    (ascending document numbers) and ``posting_frequencies``.
+
+    Arrays are ``array('I')`` when the index is built and zero-copy views of
+    the file when it is loaded with ``load``.
+
+    ``save`` and ``load`` are for callers of ``SchemaNormalizer`` that keep
+    the index; the conversion output does not include it, since generated
+    servers search the FTS5 tables of their database instead.
+    """
 
     documents: List[SearchableDocument]
-    term_frequencies: Dict[str, Dict[str, int]]  # term -> doc_id -> frequency
-    document_frequencies: Dict[str, int]  # term -> number of docs containing term
-    document_lengths: Dict[str, int]  # doc_id -> total terms
-    total_documents: int
-    vocabulary: Set[str]
+    terms: List[str]
+    term_offsets: Sequence[int]
+    posting_documents: Sequence[int]
+    posting_frequencies: Sequence[int]
+    term_counts: Sequence[int]  # Number of terms of each document
+    _term_ids: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _mmap: Optional[mmap.mmap] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_postings(
+        cls,
+        documents: List[SearchableDocument],
+        terms: List[str],
+        postings: Iterable[Tuple[Sequence[int], Sequence[int]]],
+        term_counts: Sequence[int],
+    ) -> "SearchIndex":
+        """Create an index from per-term postings.
+
+        Args:
+            documents: Indexed documents
+            terms: Terms by term number
+            postings: (document numbers, frequencies) of every term, in
+                term number order
+            term_counts: Number of terms of each document
+
+        Returns:
+            Search index
+        """
+        term_offsets = array(INDEX_TYPECODE, [0])
+        posting_documents = array(INDEX_TYPECODE)
+        posting_frequencies = array(INDEX_TYPECODE)
+
+        for document_numbers, frequencies in postings:
+            posting_documents.extend(document_numbers)
+            posting_frequencies.extend(frequencies)
+            term_offsets.append(len(posting_documents))
+
+        return cls(
+            documents=documents,
+            terms=terms,
+            term_offsets=term_offsets,
+            posting_documents=posting_documents,
+            posting_frequencies=posting_frequencies,
+            term_counts=array(INDEX_TYPECODE, term_counts),
+        )
+
+    @property
+    def total_documents(self) -> int:
+        """Number of indexed documents."""
+        return len(self.documents)
+
+    @property
+    def vocabulary(self) -> Set[str]:
+        """All indexed terms."""
+        return set(self.terms)
+
+    @property
+    def document_frequencies(self) -> Dict[str, int]:
+        """Number of documents containing each term."""
+        offsets = self.term_offsets
+        return {
+            term: offsets[term_id + 1] - offsets[term_id]
+            for term_id, term in enumerate(self.terms)
+        }
+
+    @property
+    def document_lengths(self) -> Dict[str, int]:
+        """Number of terms of each document by document ID."""
+        return {
+            document.id: count
+            for document, count in zip(self.documents, self.term_counts)
+        }
+
+    @property
+    def term_frequencies(self) -> Dict[str, Dict[str, int]]:
+        """Term frequencies by document ID and term.
+
+        Built from the postings on every access; prefer ``postings``.
+        """
+        frequencies: Dict[str, Dict[str, int]] = {
+            document.id: {} for document in self.documents
+        }
+        for term_id, term in enumerate(self.terms):
+            document_numbers, term_frequencies = self._postings(term_id)
+            for document_number, frequency in zip(document_numbers, term_frequencies):
+                frequencies[self.documents[document_number].id][term] = frequency
+        return frequencies
+
+    def term_id(self, term: str) -> Optional[int]:
+        """Get the number of a term, or None if it is not indexed."""
+        if self._term_ids is None:
+            self._term_ids = {term: term_id for term_id, term in enumerate(self.terms)}
+        return self._term_ids.get(term)
+
+    def postings(self, term: str) -> Tuple[Sequence[int], Sequence[int]]:
+        """Get the postings of a term.
+
+        Args:
+            term: Indexed term
+
+        Returns:
+            Tuple of (document numbers, frequencies); empty if the term is
+            not indexed
+        """
+        term_id = self.term_id(term)
+        if term_id is None:
+            return (), ()
+        return self._postings(term_id)
+
+    def document_frequency(self, term: str) -> int:
+        """Get the number of documents containing a term."""
+        term_id = self.term_id(term)
+        if term_id is None:
+            return 0
+        return self.term_offsets[term_id + 1] - self.term_offsets[term_id]
+
+    def without_terms(self, removed_terms: Set[str]) -> "SearchIndex":
+        """Create a copy of the index without some terms.
+
+        Document term counts are kept as they are.
+
+        Args:
+            removed_terms: Terms to leave out
+
+        Returns:
+            New search index
+        """
+        kept_term_ids = [
+            term_id
+            for term_id, term in enumerate(self.terms)
+            if term not in removed_terms
+        ]
+        return SearchIndex.from_postings(
+            self.documents,
+            [self.terms[term_id] for term_id in kept_term_ids],
+            (self._postings(term_id) for term_id in kept_term_ids),
+            self.term_counts,
+        )
+
+    def save(self, file_path: Union[str, Path]) -> None:
+        """Write the index to a file that ``load`` can memory-map.
+
+        The file holds a JSON header with the terms and documents followed
+        by the arrays in native byte order, aligned to their item size.
+
+        Args:
+            file_path: Index file path
+        """
+        arrays = [
+            array(INDEX_TYPECODE, values)
+            for values in (
+                self.term_offsets,
+                self.posting_documents,
+                self.posting_frequencies,
+                self.term_counts,
+            )
+        ]
+        itemsize = arrays[0].itemsize
+        header = json.dumps(
+            {
+                "byteorder": sys.byteorder,
+                "itemsize": itemsize,
+                "terms": self.terms,
+                "documents": [asdict(document) for document in self.documents],
+                "array_lengths": [len(values) for values in arrays],
+            },
+            default=str,
+        ).encode("utf-8")
+
+        # Pad the header so the arrays start aligned
+        data_offset = _INDEX_FILE_PREAMBLE.size + len(header)
+        header += b" " * (-data_offset % itemsize)
+
+        with open(file_path, "wb") as f:
+            f.write(
+                _INDEX_FILE_PREAMBLE.pack(
+                    INDEX_FILE_MAGIC, INDEX_FILE_VERSION, len(header)
+                )
+            )
+            f.write(header)
+            for values in arrays:
+                values.tofile(f)
+
+    @classmethod
+    def load(cls, file_path: Union[str, Path], use_mmap: bool = True) -> "SearchIndex":
+        """Load an index written by ``save``.
+
+        Args:
+            file_path: Index file path
+            use_mmap: Whether to memory-map the file and use the arrays in
+                place instead of reading them into memory
+
+        Returns:
+            Search index; call ``close`` to release a memory-mapped file
+
+        Raises:
+            ValueError: If the file is not a compatible index file
+        """
+        with open(file_path, "rb") as f:
+            if use_mmap:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buffer = f.read()
+
+        try:
+            index = cls._from_buffer(buffer)
+        except Exception:
+            if use_mmap:
+                buffer.close()
+            raise
+
+        if use_mmap and isinstance(index.term_offsets, memoryview):
+            index._mmap = buffer
+        elif use_mmap:
+            buffer.close()
+        return index
+
+    def close(self) -> None:
+        """Release the memory-mapped file of a loaded index.
+
+        The arrays of the index cannot be used afterwards.
+        """
+        if self._mmap is None:
+            return
+        for name in (
+            "term_offsets",
+            "posting_documents",
+            "posting_frequencies",
+            "term_counts",
+        ):
+            values = getattr(self, name)
+            if isinstance(values, memoryview):
+                values.release()
+        self._mmap.close()
+        self._mmap = None
+
+    @classmethod
+    def _from_buffer(cls, buffer: Any) -> "SearchIndex":
+        """Create an index from the contents of an index file.
+
+        Everything is validated before the array views are created, so a
+        memory-mapped buffer can be closed if this fails.
+        """
+        with memoryview(buffer) as view:
+            if len(view) < _INDEX_FILE_PREAMBLE.size:
+                raise ValueError("Not a search index file")
+
+            magic, version, header_length = _INDEX_FILE_PREAMBLE.unpack_from(view)
+            if magic != INDEX_FILE_MAGIC:
+                raise ValueError("Not a search index file")
+            if version != INDEX_FILE_VERSION:
+                raise ValueError(f"Unsupported search index file version: {version}")
+
+            offset = _INDEX_FILE_PREAMBLE.size
+            header = json.loads(bytes(view[offset : offset + header_length]))
+            offset += header_length
+
+            itemsize = array(INDEX_TYPECODE).itemsize
+            if header["itemsize"] != itemsize:
+                raise ValueError(
+                    f"Search index file has {header['itemsize']}-byte integers, "
+                    f"expected {itemsize}"
+                )
+            if offset + sum(header["array_lengths"]) * itemsize > len(view):
+                raise ValueError("Truncated search index file")
+
+            documents = [
+                SearchableDocument(**document) for document in header["documents"]
+            ]
+            terms = [sys.intern(term) for term in header["terms"]]
+
+            arrays: List[Sequence[int]] = []
+            for length in header["array_lengths"]:
+                end = offset + length * itemsize
+                values = view[offset:end].cast(INDEX_TYPECODE)
+                if header["byteorder"] != sys.byteorder:
+                    values = array(INDEX_TYPECODE, values)
+                    values.byteswap()
+                arrays.append(values)
+                offset = end
+
+        term_offsets, posting_documents, posting_frequencies, term_counts = arrays
+        return cls(
+            documents=documents,
+            terms=terms,
+            term_offsets=term_offsets,
+            posting_documents=posting_documents,
+            posting_frequencies=posting_frequencies,
+            term_counts=term_counts,
+        )
+
+    def _postings(self, term_id: int) -> Tuple[Sequence[int], Sequence[int]]:
+        """Get the postings of a term by number."""
+        start = self.term_offsets[term_id]
+        end = self.term_offsets[term_id + 1]
+        return (
+            self.posting_documents[start:end],
+            self.posting_frequencies[start:end],
+        )
 
 
 class SearchOptimizer:
@@ -136,6 +472,10 @@ class SearchOptimizer:
             "error",
         }
 
+        self.tokenizer = Tokenizer(
+            stop_words=self.stop_words, keep_terms=self.important_terms
+        )
+
     def optimize_for_search(
         self,
         endpoints: List[NormalizedEndpoint],
@@ -416,78 +756,35 @@ class SearchOptimizer:
 
     def _build_search_index(self, documents: List[SearchableDocument]) -> SearchIndex:
         """Build optimized search index from documents."""
-        term_frequencies = {}
-        document_frequencies = Counter()
-        document_lengths = {}
-        vocabulary = set()
+        term_ids: Dict[str, int] = {}
+        terms: List[str] = []
+        postings: List[Tuple[array, array]] = []
+        term_counts = array(INDEX_TYPECODE)
 
-        for doc in documents:
-            # Tokenize and process content
-            terms = self._tokenize_content(doc.content)
-            term_counts = Counter(terms)
+        # Tokenize and process content
+        document_tokens = self.tokenizer.tokenize_many(doc.content for doc in documents)
 
-            # Store document length
-            document_lengths[doc.id] = len(terms)
+        for document_number, tokens in enumerate(document_tokens):
+            term_counts.append(len(tokens))
 
-            # Store term frequencies for this document
-            term_frequencies[doc.id] = dict(term_counts)
+            for term, frequency in Counter(tokens).items():
+                term_id = term_ids.get(term)
+                if term_id is None:
+                    term_id = len(terms)
+                    term = sys.intern(term)
+                    term_ids[term] = term_id
+                    terms.append(term)
+                    postings.append((array(INDEX_TYPECODE), array(INDEX_TYPECODE)))
 
-            # Update document frequencies and vocabulary
-            for term in term_counts.keys():
-                document_frequencies[term] += 1
-                vocabulary.add(term)
+                document_numbers, frequencies = postings[term_id]
+                document_numbers.append(document_number)
+                frequencies.append(frequency)
 
-        return SearchIndex(
-            documents=documents,
-            term_frequencies=term_frequencies,
-            document_frequencies=dict(document_frequencies),
-            document_lengths=document_lengths,
-            total_documents=len(documents),
-            vocabulary=vocabulary,
-        )
+        return SearchIndex.from_postings(documents, terms, postings, term_counts)
 
     def _tokenize_content(self, content: str) -> List[str]:
         """Tokenize content for search indexing."""
-        if not content:
-            return []
-
-        # Convert to lowercase
-        content = content.lower()
-
-        # Replace common separators with spaces
-        content = re.sub(r"[/_\-\.]+", " ", content)
-
-        # Extract words (including numbers)
-        words = re.findall(r"\b[a-z0-9]+\b", content)
-
-        # Filter and process words
-        processed_words = []
-        for word in words:
-            # Skip very short words unless they're important
-            if len(word) < 2 and word not in self.important_terms:
-                continue
-
-            # Skip stop words unless they're important
-            if word in self.stop_words and word not in self.important_terms:
-                continue
-
-            # Skip very long words (likely UUIDs or encoded data)
-            if len(word) > 50:
-                continue
-
-            processed_words.append(word)
-
-            # Add word stems for compound words
-            if len(word) > 6 and "_" not in word and "-" not in word:
-                # Simple stemming for API-related words
-                if word.endswith("s") and len(word) > 4:
-                    processed_words.append(word[:-1])  # Remove plural 's'
-                elif word.endswith("ed") and len(word) > 5:
-                    processed_words.append(word[:-2])  # Remove 'ed'
-                elif word.endswith("ing") and len(word) > 6:
-                    processed_words.append(word[:-3])  # Remove 'ing'
-
-        return processed_words
+        return self.tokenizer.tokenize(content)
 
     def get_search_statistics(self, search_index: SearchIndex) -> Dict[str, Any]:
         """Generate statistics about the search index.
@@ -590,57 +887,52 @@ class SearchOptimizer:
         Returns:
             Optimized search index
         """
+        document_frequencies = search_index.document_frequencies
+
         # Remove very rare terms that appear in only 1 document
         # and are not in important terms
-        rare_terms = set()
-        for term, doc_count in search_index.document_frequencies.items():
+        removed_terms = set()
+        for term, doc_count in document_frequencies.items():
             if doc_count == 1 and term not in self.important_terms:
-                rare_terms.add(term)
-
-        if rare_terms:
-            self.logger.info(f"Removing {len(rare_terms)} rare terms from index")
-
-            # Filter rare terms from vocabulary
-            search_index.vocabulary -= rare_terms
+                removed_terms.add(term)
 
-            # Remove from document frequencies
-            for term in rare_terms:
-                del search_index.document_frequencies[term]
+        if removed_terms:
+            self.logger.info(f"Removing {len(removed_terms)} rare terms from index")
 
-            # Remove from term frequencies
-            for doc_id in search_index.term_frequencies:
-                for term in rare_terms:
-                    search_index.term_frequencies[doc_id].pop(term, None)
+        vocabulary_size = len(document_frequencies) - len(removed_terms)
 
         # Limit vocabulary size if it's too large
         max_vocabulary_size = 10000
-        if len(search_index.vocabulary) > max_vocabulary_size:
+        if vocabulary_size > max_vocabulary_size:
             # Keep most frequent terms
             sorted_terms = sorted(
-                search_index.document_frequencies.items(),
+                (
+                    (term, doc_count)
+                    for term, doc_count in document_frequencies.items()
+                    if term not in removed_terms
+                ),
                 key=lambda x: x[1],
                 reverse=True,
             )
 
             kept_terms = set(term for term, _ in sorted_terms[:max_vocabulary_size])
             # Always keep important terms
-            kept_terms.update(self.important_terms & search_index.vocabulary)
-
-            removed_terms = search_index.vocabulary - kept_terms
+            kept_terms.update(
+                term
+                for term, _ in sorted_terms[max_vocabulary_size:]
+                if term in self.important_terms
+            )
 
             self.logger.info(
-                f"Reducing vocabulary from {len(search_index.vocabulary)} "
+                f"Reducing vocabulary from {vocabulary_size} "
                 f"to {len(kept_terms)} terms"
             )
 
-            # Update index
-            search_index.vocabulary = kept_terms
-
-            for term in removed_terms:
-                search_index.document_frequencies.pop(term, None)
+            removed_terms.update(
+                term for term, _ in sorted_terms if term not in kept_terms
+            )
 
-            for doc_id in search_index.term_frequencies:
-                for term in removed_terms:
-                    search_index.term_frequencies[doc_id].pop(term, None)
+        if removed_terms:
+            search_index = search_index.without_terms(removed_terms)
 
         return search_index
@@ -0,0 +1,270 @@
+"""Disk-backed store of normalized endpoints and schemas.
+
+Used by ``SchemaNormalizer`` in spill mode
+(``NormalizationConfig.spill_to_disk``) so that specifications whose
+normalized form does not fit in memory can still be normalized, validated,
+indexed and stored. Objects are pickled into a temporary SQLite database as
+they are produced and read back one at a time by later phases.
+"""
+
+import os
+import pickle
+import sqlite3
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+from swagger_mcp_server.config.logging import get_logger
+from swagger_mcp_server.parser.models import (
+    NormalizedEndpoint,
+    NormalizedSchema,
+)
+
+logger = get_logger(__name__)
+
+SPILL_FILE_PREFIX = "normalized-"
+SPILL_FILE_SUFFIX = ".sqlite"
+
+# Rows fetched per round trip while iterating
+READ_BATCH_SIZE = 256
+
+
+class SpillStore:
+    """Append-only temporary store of normalized objects.
+
+    Writes are buffered and inserted in batches; reads flush the buffer
+    first, so objects are visible as soon as they are added. Endpoints keep
+    their insertion order; schemas are keyed by name and a schema added
+    twice replaces the earlier one, as in a dictionary.
+
+    The database file is deleted by ``close()``. Objects read back are new
+    copies: changes to them are not written to the store.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        batch_size: int = 500,
+    ):
+        """Initialize spill store.
+
+        Args:
+            directory: Directory of the temporary database, defaults to the
+                system temporary directory
+            batch_size: Objects buffered in memory before they are written
+        """
+        self.batch_size = batch_size
+        self.bytes_written = 0
+
+        if directory is not None:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+        fd, path = tempfile.mkstemp(
+            prefix=SPILL_FILE_PREFIX, suffix=SPILL_FILE_SUFFIX, dir=directory
+        )
+        os.close(fd)
+        self.path = Path(path)
+
+        # Written by the normalizer thread, read by storage on the event loop
+        # thread; access is sequential
+        self._connection: Optional[sqlite3.Connection] = sqlite3.connect(
+            path, check_same_thread=False
+        )
+        # The file is scratch space: no journal and no fsync
+        self._connection.execute("PRAGMA journal_mode = OFF")
+        self._connection.execute("PRAGMA synchronous = OFF")
+        self._connection.execute(
+            "CREATE TABLE endpoints (id INTEGER PRIMARY KEY, payload BLOB NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE TABLE schemas (name TEXT PRIMARY KEY, payload BLOB NOT NULL)"
+        )
+
+        self._pending_endpoints: List[Tuple[bytes]] = []
+        self._pending_schemas: List[Tuple[str, bytes]] = []
+
+        self.endpoints = SpilledEndpoints(self)
+        self.schemas = SpilledSchemas(self)
+
+        logger.debug("Spill store created", path=str(self.path))
+
+    @property
+    def closed(self) -> bool:
+        """Whether the store has been closed."""
+        return self._connection is None
+
+    def add_endpoint(self, endpoint: NormalizedEndpoint) -> None:
+        """Append a normalized endpoint.
+
+        Args:
+            endpoint: Endpoint to store
+        """
+        self._pending_endpoints.append((self._dump(endpoint),))
+        if len(self._pending_endpoints) >= self.batch_size:
+            self.flush()
+
+    def add_schema(self, schema: NormalizedSchema) -> None:
+        """Add a normalized schema under its name.
+
+        Args:
+            schema: Schema to store
+        """
+        self._pending_schemas.append((schema.name, self._dump(schema)))
+        if len(self._pending_schemas) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered objects to the database."""
+        connection = self._require_connection()
+        with connection:
+            if self._pending_endpoints:
+                connection.executemany(
+                    "INSERT INTO endpoints (payload) VALUES (?)",
+                    self._pending_endpoints,
+                )
+                self._pending_endpoints = []
+            if self._pending_schemas:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO schemas (name, payload) VALUES (?, ?)",
+                    self._pending_schemas,
+                )
+                self._pending_schemas = []
+
+    def count(self, table: str) -> int:
+        """Count the objects of a table ("endpoints" or "schemas")."""
+        self.flush()
+        return self._scalar(f"SELECT COUNT(*) FROM {table}")
+
+    def iter_rows(self, query: str, parameters: Tuple[Any, ...] = ()) -> Iterator:
+        """Iterate over the rows of a query in batches."""
+        self.flush()
+        cursor = self._require_connection().execute(query, parameters)
+        try:
+            while True:
+                rows = cursor.fetchmany(READ_BATCH_SIZE)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            cursor.close()
+
+    def load(self, payload: bytes) -> Any:
+        """Unpickle a stored object."""
+        return pickle.loads(payload)
+
+    def close(self) -> None:
+        """Close the database and delete its file."""
+        if self._connection is None:
+            return
+
+        self._connection.close()
+        self._connection = None
+        self._pending_endpoints = []
+        self._pending_schemas = []
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+        logger.debug(
+            "Spill store closed",
+            path=str(self.path),
+            bytes_written=self.bytes_written,
+        )
+
+    def _dump(self, obj: Any) -> bytes:
+        """Pickle an object for storage."""
+        self._require_connection()
+        payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        self.bytes_written += len(payload)
+        return payload
+
+    def _scalar(self, query: str, parameters: Tuple[Any, ...] = ()) -> Any:
+        """Get the single value of a query."""
+        return self._require_connection().execute(query, parameters).fetchone()[0]
+
+    def _require_connection(self) -> sqlite3.Connection:
+        """Get the connection, failing if the store has been closed."""
+        if self._connection is None:
+            raise ValueError("Spill store is closed")
+        return self._connection
+
+    def __enter__(self) -> "SpillStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __getstate__(self):
+        raise TypeError("Spilled normalization results cannot be pickled")
+
+
+class SpilledEndpoints:
+    """Sequence-like view of the endpoints of a ``SpillStore``.
+
+    Supports ``len()``, truth testing and repeated iteration, which is all
+    that the consistency, indexing, statistics and storage phases need.
+    """
+
+    def __init__(self, store: SpillStore):
+        self._store = store
+
+    def __iter__(self) -> Iterator[NormalizedEndpoint]:
+        load = self._store.load
+        for (payload,) in self._store.iter_rows(
+            "SELECT payload FROM endpoints ORDER BY id"
+        ):
+            yield load(payload)
+
+    def __len__(self) -> int:
+        return self._store.count("endpoints")
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+
+class SpilledSchemas(Mapping):
+    """Read-only mapping view of the schemas of a ``SpillStore``.
+
+    Iteration and ``items()``/``values()`` read schemas in one pass over
+    the database rather than one lookup per key.
+    """
+
+    def __init__(self, store: SpillStore):
+        self._store = store
+
+    def __getitem__(self, name: str) -> NormalizedSchema:
+        rows = list(
+            self._store.iter_rows("SELECT payload FROM schemas WHERE name = ?", (name,))
+        )
+        if not rows:
+            raise KeyError(name)
+        return self._store.load(rows[0][0])
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+        self._store.flush()
+        return bool(
+            self._store._scalar(
+                "SELECT EXISTS (SELECT 1 FROM schemas WHERE name = ?)", (name,)
+            )
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        for (name,) in self._store.iter_rows("SELECT name FROM schemas ORDER BY rowid"):
+            yield name
+
+    def __len__(self) -> int:
+        return self._store.count("schemas")
+
+    def items(self) -> Iterator[Tuple[str, NormalizedSchema]]:
+        load = self._store.load
+        for name, payload in self._store.iter_rows(
+            "SELECT name, payload FROM schemas ORDER BY rowid"
+        ):
+            yield name, load(payload)
+
+    def values(self) -> Iterator[NormalizedSchema]:
+        for _, schema in self.items():
+            yield schema
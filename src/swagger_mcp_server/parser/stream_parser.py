@@ -2,13 +2,11 @@
 
 import asyncio
 import json
-import os
+import mmap
 import time
-import tracemalloc
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
-
-import psutil
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
 
 try:
     import ijson
@@ -18,6 +16,11 @@ except ImportError:
         "Install with: pip install ijson"
     )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from swagger_mcp_server.config.logging import get_logger
 from swagger_mcp_server.parser.base import (
     BaseParser,
@@ -26,15 +29,74 @@ from swagger_mcp_server.parser.base import (
     ParseResult,
     ParserType,
     ParseStatus,
+    ParseStrategy,
     SwaggerParseError,
+    select_parse_strategy,
 )
+from swagger_mcp_server.parser.memory_telemetry import MemoryTelemetry
 
 logger = get_logger(__name__)
 
+# Backend names reported in ParseMetrics.parser_backend
+IN_MEMORY_BACKEND = f"{'orjson' if orjson is not None else 'json'}+mmap"
+STREAMING_BACKEND = f"ijson:{ijson.backend}"
+
+HTTP_METHODS = frozenset(
+    {"get", "post", "put", "delete", "patch", "head", "options", "trace"}
+)
+
+# ijson prefixes of the sections streamed item by item in streaming mode
+PATHS_PREFIX = "paths"
+SCHEMAS_PREFIX = "components.schemas"
+DEFINITIONS_PREFIX = "definitions"  # Swagger 2.0
+
+# (parent prefix, key) -> section name for subtrees left out of the skeleton
+STREAMED_SECTIONS = {
+    ("", "paths"): "paths",
+    ("components", "schemas"): "schemas",
+    ("", "definitions"): "schemas",
+}
+
+
+@dataclass
+class StreamedDocument:
+    """Lazily streamed view of a JSON OpenAPI document.
+
+    ``skeleton`` holds everything except ``paths`` and the schema
+    definitions. Those are re-read from disk on every iteration, so only a
+    single path item or schema is materialized at a time.
+    """
+
+    file_path: Path
+    skeleton: Dict[str, Any]
+    parser: "SwaggerStreamParser"
+
+    @property
+    def schemas_prefix(self) -> str:
+        """ijson prefix of the schema definitions for this document."""
+        if "swagger" in self.skeleton:
+            return DEFINITIONS_PREFIX
+        return SCHEMAS_PREFIX
+
+    def iter_path_items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield ``(path, path_item)`` pairs."""
+        return self.parser.iter_path_items(self.file_path)
+
+    def iter_operations(self) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """Yield ``(path, method, operation)`` triples."""
+        return self.parser.iter_operations(self.file_path)
+
+    def iter_schemas(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield ``(schema_name, schema_definition)`` pairs."""
+        return self.parser.iter_schemas(self.file_path, self.schemas_prefix)
+
 
 class SwaggerStreamParser(BaseParser):
     """Memory-efficient stream-based parser for JSON Swagger/OpenAPI files."""
 
+    # Reported in ParseMetrics.parser_backend for streamed documents
+    streaming_backend = STREAMING_BACKEND
+
     def __init__(self, config: Optional[ParserConfig] = None):
         """Initialize stream parser.
 
@@ -42,7 +104,6 @@ class SwaggerStreamParser(BaseParser):
             config: Parser configuration
         """
         super().__init__(config)
-        self._current_process = psutil.Process(os.getpid())
 
     def get_supported_extensions(self) -> list[str]:
         """Get supported file extensions.
@@ -71,13 +132,11 @@ class SwaggerStreamParser(BaseParser):
         """
         path = Path(file_path)
         metrics = ParseMetrics()
+        telemetry = self._create_memory_telemetry()
 
         try:
-            # Start memory tracking
-            if tracemalloc.is_tracing():
-                tracemalloc.stop()
-            tracemalloc.start()
-            start_memory = self._get_memory_usage_mb()
+            telemetry.start()
+            telemetry.start_phase("parsing")
 
             # Validate file constraints
             await self.validate_file_constraints(path)
@@ -98,15 +157,20 @@ class SwaggerStreamParser(BaseParser):
             )
 
             # Use ijson for memory-efficient parsing
-            parsed_data = await self._stream_parse_file(path, metrics)
+            if self.config.streaming_mode:
+                metrics.parser_backend = self.streaming_backend
+                parsed_data = await self._stream_skeleton(path, metrics, telemetry)
+                result.document_stream = StreamedDocument(
+                    file_path=path, skeleton=parsed_data, parser=self
+                )
+            else:
+                parsed_data = await self._parse_document(path, metrics, telemetry)
 
             # Update metrics
             end_time = time.time()
             metrics.parse_duration_ms = (end_time - start_time) * 1000
-            metrics.memory_peak_mb = max(
-                metrics.memory_peak_mb,
-                self._get_memory_usage_mb() - start_memory,
-            )
+            telemetry.end_phase()
+            telemetry.record(metrics)
 
             # Extract basic API info
             if parsed_data:
@@ -115,8 +179,9 @@ class SwaggerStreamParser(BaseParser):
                 result.api_title = self._extract_api_title(parsed_data)
                 result.api_version = self._extract_api_version(parsed_data)
 
-                # Update quality metrics
-                self._update_quality_metrics(parsed_data, metrics)
+                # Update quality metrics (counted during the pass in streaming mode)
+                if not self.config.streaming_mode:
+                    self._update_quality_metrics(parsed_data, metrics)
 
             result.status = ParseStatus.COMPLETED
             metrics.end_time = time.time()
@@ -124,7 +189,9 @@ class SwaggerStreamParser(BaseParser):
             self.logger.info(
                 "Stream parsing completed",
                 file_path=str(path),
+                parser_backend=metrics.parser_backend,
                 duration_ms=metrics.parse_duration_ms,
+                throughput_mb_per_sec=metrics.processing_speed_mb_per_sec,
                 memory_peak_mb=metrics.memory_peak_mb,
                 endpoints_found=metrics.endpoints_found,
                 schemas_found=metrics.schemas_found,
@@ -145,8 +212,13 @@ class SwaggerStreamParser(BaseParser):
 
             if isinstance(e, SwaggerParseError):
                 metrics.errors.append(e.to_parse_error())
-                # Treat JSON parsing errors as recoverable - return failed result instead of raising
-                if e.error_type == "InvalidJSON":
+                # Treat syntax and memory limit errors as recoverable -
+                # return failed result instead of raising
+                if e.error_type in (
+                    "InvalidJSON",
+                    "InvalidYAML",
+                    "MemoryLimitExceeded",
+                ):
                     return ParseResult(
                         status=ParseStatus.FAILED,
                         file_path=path,
@@ -167,17 +239,51 @@ class SwaggerStreamParser(BaseParser):
                 )
 
         finally:
-            if tracemalloc.is_tracing():
-                tracemalloc.stop()
+            telemetry.stop()
+            telemetry.record(metrics)
+
+    async def _parse_document(
+        self,
+        file_path: Path,
+        metrics: ParseMetrics,
+        telemetry: Optional[MemoryTelemetry] = None,
+    ) -> Dict[str, Any]:
+        """Parse the whole document with the strategy for its size.
+
+        Files that fit in memory are decoded in a single call; larger files
+        are rebuilt from ijson events.
+
+        Args:
+            file_path: Path to file to parse
+            metrics: Metrics object to update
+            telemetry: Memory telemetry sampled while parsing
+
+        Returns:
+            Parsed JSON data as dictionary
+
+        Raises:
+            SwaggerParseError: If parsing fails
+        """
+        strategy = select_parse_strategy(metrics.file_size_bytes, self.config)
+        if strategy == ParseStrategy.IN_MEMORY:
+            metrics.parser_backend = IN_MEMORY_BACKEND
+            return await self._decode_in_memory(file_path, metrics, telemetry)
+
+        metrics.parser_backend = self.streaming_backend
+        return await self._stream_parse_file(file_path, metrics, telemetry)
 
     async def _stream_parse_file(
-        self, file_path: Path, metrics: ParseMetrics
+        self,
+        file_path: Path,
+        metrics: ParseMetrics,
+        telemetry: Optional[MemoryTelemetry] = None,
     ) -> Dict[str, Any]:
         """Parse file using ijson streaming parser.
 
         Args:
             file_path: Path to file to parse
             metrics: Metrics object to update
+            telemetry: Memory telemetry sampled at progress intervals
 
         Returns:
             Parsed JSON data as dictionary
@@ -192,34 +298,110 @@ class SwaggerStreamParser(BaseParser):
                 parser = ijson.parse(file, buf_size=self.config.chunk_size_bytes)
 
                 # Build the JSON structure incrementally
-                result = await self._build_json_structure(parser, metrics)
+                result = await self._build_json_structure(parser, metrics, telemetry)
 
                 return result
 
         except json.JSONDecodeError as e:
+            raise self._invalid_json_error(e)
+        except IOError as e:
+            raise self._file_io_error(e)
+
+    async def _decode_in_memory(
+        self,
+        file_path: Path,
+        metrics: ParseMetrics,
+        telemetry: Optional[MemoryTelemetry] = None,
+    ) -> Dict[str, Any]:
+        """Decode a file in a single call from a memory map.
+
+        orjson decodes straight from the mapped pages when it is installed;
+        the standard library decoder gets a copy of the file content.
+
+        Args:
+            file_path: Path to file to parse
+            metrics: Metrics object to update
+            telemetry: Memory telemetry checked after decoding
+
+        Returns:
+            Parsed JSON data as dictionary
+
+        Raises:
+            SwaggerParseError: If the file cannot be read or is not a JSON
+                object
+        """
+        try:
+            with open(file_path, "rb") as file:
+                if metrics.file_size_bytes == 0:
+                    document = json.loads(b"")
+                else:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        if orjson is not None:
+                            with memoryview(data) as view:
+                                document = orjson.loads(view)
+                        else:
+                            document = json.loads(data[:])
+        except json.JSONDecodeError as e:
+            raise self._invalid_json_error(e)
+        except UnicodeDecodeError as e:
             raise SwaggerParseError(
-                f"Invalid JSON: {e.msg}",
+                f"Invalid JSON: {str(e)}",
                 "InvalidJSON",
-                line_number=getattr(e, "lineno", None),
-                column_number=getattr(e, "colno", None),
-                context=f"Position {e.pos}" if hasattr(e, "pos") else None,
-                suggestion="Validate JSON syntax using a JSON validator",
+                suggestion="Save the file as UTF-8",
             )
         except IOError as e:
+            raise self._file_io_error(e)
+
+        if not isinstance(document, dict):
             raise SwaggerParseError(
-                f"File I/O error: {str(e)}",
-                "FileIOError",
-                suggestion="Check file permissions and disk space",
+                "Invalid JSON: the document root must be an object",
+                "InvalidJSON",
+                suggestion="OpenAPI documents are JSON objects",
             )
 
+        metrics.bytes_processed = metrics.file_size_bytes
+        if self.config.progress_callback:
+            self.config.progress_callback(
+                metrics.bytes_processed, metrics.file_size_bytes
+            )
+        if telemetry is not None:
+            telemetry.check_limit()
+
+        return document
+
+    @staticmethod
+    def _invalid_json_error(error: json.JSONDecodeError) -> SwaggerParseError:
+        """Convert a JSON decoding error into a parse error."""
+        return SwaggerParseError(
+            f"Invalid JSON: {error.msg}",
+            "InvalidJSON",
+            line_number=getattr(error, "lineno", None),
+            column_number=getattr(error, "colno", None),
+            context=f"Position {error.pos}" if hasattr(error, "pos") else None,
+            suggestion="Validate JSON syntax using a JSON validator",
+        )
+
+    @staticmethod
+    def _file_io_error(error: OSError) -> SwaggerParseError:
+        """Convert a file I/O error into a parse error."""
+        return SwaggerParseError(
+            f"File I/O error: {str(error)}",
+            "FileIOError",
+            suggestion="Check file permissions and disk space",
+        )
+
     async def _build_json_structure(
-        self, parser, metrics: ParseMetrics
+        self,
+        parser,
+        metrics: ParseMetrics,
+        telemetry: Optional[MemoryTelemetry] = None,
     ) -> Dict[str, Any]:
         """Build JSON structure from ijson parser events.
 
         Args:
             parser: ijson parser instance
             metrics: Metrics to update during parsing
+            telemetry: Memory telemetry sampled at progress intervals
 
         Returns:
             Complete JSON structure
@@ -227,6 +409,7 @@ class SwaggerStreamParser(BaseParser):
         Raises:
             SwaggerParseError: If structure building fails
         """
+        telemetry = telemetry or self._create_memory_telemetry()
         stack = [{}]  # Stack of objects/arrays being built
         current_key = None
         bytes_processed = 0
@@ -236,27 +419,19 @@ class SwaggerStreamParser(BaseParser):
             for prefix, event_type, value in parser:
                 bytes_processed += len(str(value).encode("utf-8"))
 
-                # Report progress if configured
+                # Report progress and sample memory at progress intervals
                 if (
-                    self.config.progress_callback
-                    and bytes_processed - last_progress_report
+                    bytes_processed - last_progress_report
                     >= self.config.progress_interval_bytes
                 ):
-                    self.config.progress_callback(
-                        bytes_processed, metrics.file_size_bytes
-                    )
                     last_progress_report = bytes_processed
+                    if self.config.progress_callback:
+                        self.config.progress_callback(
+                            bytes_processed, metrics.file_size_bytes
+                        )
 
                     # Check memory usage
-                    current_memory = self._get_memory_usage_mb()
-                    metrics.memory_peak_mb = max(metrics.memory_peak_mb, current_memory)
-
-                    if current_memory > self.config.max_memory_mb:
-                        raise SwaggerParseError(
-                            f"Memory usage {current_memory:.1f}MB exceeds limit {self.config.max_memory_mb}MB",
-                            "MemoryLimitExceeded",
-                            suggestion="Increase memory limit or use a smaller file",
-                        )
+                    telemetry.check_limit()
 
                 # Allow other tasks to run
                 if bytes_processed % (self.config.chunk_size_bytes * 10) == 0:
@@ -329,22 +504,215 @@ class SwaggerStreamParser(BaseParser):
                     suggestion="File may be corrupted or contain invalid JSON structure",
                 )
 
-    def _get_memory_usage_mb(self) -> float:
-        """Get current memory usage in MB.
+    async def _stream_skeleton(
+        self,
+        file_path: Path,
+        metrics: ParseMetrics,
+        telemetry: Optional[MemoryTelemetry] = None,
+    ) -> Dict[str, Any]:
+        """Build the document without its ``paths`` and schema definitions.
+
+        The streamed sections are skipped event by event instead of being
+        materialized; endpoints, schemas and extensions are counted on the
+        way so quality metrics stay available.
+
+        Args:
+            file_path: Path to file to parse
+            metrics: Metrics to update during parsing
+            telemetry: Memory telemetry sampled at progress intervals
 
         Returns:
-            Memory usage in megabytes
+            Document skeleton
+
+        Raises:
+            SwaggerParseError: If parsing fails
+        """
+        telemetry = telemetry or self._create_memory_telemetry()
+        builder = ijson.ObjectBuilder()
+        section = None
+        pending_section = None
+        skip_depth = 0
+        last_progress_report = 0
+
+        try:
+            with open(file_path, "rb") as file:
+                events = ijson.parse(
+                    file, buf_size=self.config.chunk_size_bytes, use_float=True
+                )
+                for prefix, event_type, value in events:
+                    if (
+                        event_type == "map_key"
+                        and isinstance(value, str)
+                        and value.startswith("x-")
+                    ):
+                        metrics.extensions_found += 1
+
+                    if skip_depth:
+                        if event_type in ("start_map", "start_array"):
+                            skip_depth += 1
+                        elif event_type in ("end_map", "end_array"):
+                            skip_depth -= 1
+                        elif event_type == "map_key":
+                            if section == "paths" and skip_depth == 2:
+                                if value.lower() in HTTP_METHODS:
+                                    metrics.endpoints_found += 1
+                            elif section == "schemas" and skip_depth == 1:
+                                metrics.schemas_found += 1
+                    elif pending_section:
+                        section, pending_section = pending_section, None
+                        if event_type in ("start_map", "start_array"):
+                            skip_depth = 1
+                    elif (
+                        event_type == "map_key" and (prefix, value) in STREAMED_SECTIONS
+                    ):
+                        pending_section = STREAMED_SECTIONS[(prefix, value)]
+                    else:
+                        builder.event(event_type, value)
+
+                    position = file.tell()
+                    if (
+                        position - last_progress_report
+                        >= self.config.progress_interval_bytes
+                    ):
+                        last_progress_report = position
+                        if self.config.progress_callback:
+                            self.config.progress_callback(
+                                position, metrics.file_size_bytes
+                            )
+                        telemetry.check_limit()
+                        await asyncio.sleep(0)  # Yield control
+
+            metrics.bytes_processed = metrics.file_size_bytes
+            if self.config.progress_callback:
+                self.config.progress_callback(
+                    metrics.bytes_processed, metrics.file_size_bytes
+                )
+
+        except ijson.JSONError as e:
+            raise SwaggerParseError(
+                f"Invalid JSON format: {str(e)}",
+                "InvalidJSON",
+                suggestion="Check if file contains valid JSON syntax",
+            )
+        except IOError as e:
+            raise self._file_io_error(e)
+
+        skeleton = getattr(builder, "value", None)
+        if not isinstance(skeleton, dict):
+            return {}
+
+        components = skeleton.get("components", {})
+        if isinstance(components, dict):
+            security_schemes = components.get("securitySchemes", {})
+            if isinstance(security_schemes, dict):
+                metrics.security_schemes_found = len(security_schemes)
+
+        return skeleton
+
+    def iter_path_items(
+        self, file_path: Union[str, Path]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream ``paths`` entries one path item at a time.
+
+        Args:
+            file_path: Path to JSON file
+
+        Yields:
+            Tuples of (path, path_item)
+        """
+        yield from self._iter_section(Path(file_path), PATHS_PREFIX)
+
+    def iter_operations(
+        self, file_path: Union[str, Path]
+    ) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """Stream HTTP operations one at a time.
+
+        Args:
+            file_path: Path to JSON file
+
+        Yields:
+            Tuples of (path, lowercase method, operation)
+        """
+        for path_name, path_item in self.iter_path_items(file_path):
+            if not isinstance(path_item, dict):
+                continue
+            for method, operation in path_item.items():
+                if method.lower() in HTTP_METHODS and isinstance(operation, dict):
+                    yield path_name, method.lower(), operation
+
+    def iter_schemas(
+        self, file_path: Union[str, Path], prefix: str = SCHEMAS_PREFIX
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream schema definitions one at a time.
+
+        Args:
+            file_path: Path to JSON file
+            prefix: ijson prefix of the schema container
+
+        Yields:
+            Tuples of (schema_name, schema_definition)
+        """
+        yield from self._iter_section(Path(file_path), prefix)
+
+    def _iter_section(self, file_path: Path, prefix: str) -> Iterator[Tuple[str, Any]]:
+        """Yield key/value pairs of the object found at ``prefix``.
+
+        Args:
+            file_path: Path to JSON file
+            prefix: ijson prefix of the object to stream
+
+        Yields:
+            Key/value pairs of the object
+
+        Raises:
+            SwaggerParseError: If the file cannot be read or is not valid JSON
         """
+        total_bytes = file_path.stat().st_size
+        last_progress_report = 0
+        telemetry = self._create_memory_telemetry()
+        telemetry.start()
+
         try:
-            # Get memory info for current process
-            memory_info = self._current_process.memory_info()
-            return memory_info.rss / (1024 * 1024)  # Convert bytes to MB
-        except:
-            # Fallback to tracemalloc if psutil fails
-            if tracemalloc.is_tracing():
-                current, peak = tracemalloc.get_traced_memory()
-                return current / (1024 * 1024)
-            return 0.0
+            with open(file_path, "rb") as file:
+                items = ijson.kvitems(
+                    file,
+                    prefix,
+                    buf_size=self.config.chunk_size_bytes,
+                    use_float=True,
+                )
+                for key, value in items:
+                    yield key, value
+
+                    position = file.tell()
+                    if (
+                        position - last_progress_report
+                        >= self.config.progress_interval_bytes
+                    ):
+                        last_progress_report = position
+                        if self.config.progress_callback:
+                            self.config.progress_callback(position, total_bytes)
+                        telemetry.check_limit()
+
+        except ijson.JSONError as e:
+            raise SwaggerParseError(
+                f"Invalid JSON format: {str(e)}",
+                "InvalidJSON",
+                suggestion="Check if file contains valid JSON syntax",
+            )
+        except IOError as e:
+            raise self._file_io_error(e)
+        finally:
+            telemetry.stop()
+
+    def _create_memory_telemetry(self) -> MemoryTelemetry:
+        """Create memory telemetry for a single parsing operation.
+
+        Returns:
+            Telemetry configured from parser settings
+        """
+        return MemoryTelemetry(
+            self.config.memory_telemetry, max_memory_mb=self.config.max_memory_mb
+        )
 
     def _extract_openapi_version(self, data: Dict[str, Any]) -> Optional[str]:
         """Extract OpenAPI version from parsed data.
@@ -1,6 +1,5 @@
 """Main Swagger/OpenAPI parser with integrated components."""
 
-import asyncio
 import time
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional, Union
@@ -8,6 +7,7 @@ from typing import Any, Callable, Dict, Optional, Union
 from swagger_mcp_server.config.logging import get_logger, log_parsing_progress
 from swagger_mcp_server.parser.base import (
     BaseParser,
+    ParseError,
     ParseMetrics,
     ParserConfig,
     ParseResult,
@@ -15,7 +15,12 @@ from swagger_mcp_server.parser.base import (
     ParseStatus,
     SwaggerParseError,
 )
+from swagger_mcp_server.parser.bundle_loader import (
+    SpecBundle,
+    SpecBundleLoader,
+)
 from swagger_mcp_server.parser.error_handler import ErrorContext, ErrorHandler
+from swagger_mcp_server.parser.memory_telemetry import MemoryTelemetry
 from swagger_mcp_server.parser.progress_reporter import (
     ProgressPhase,
     ProgressReporter,
@@ -24,8 +29,12 @@ from swagger_mcp_server.parser.stream_parser import SwaggerStreamParser
 from swagger_mcp_server.parser.structure_validator import StructureValidator
 from swagger_mcp_server.parser.validation import (
     OpenAPIValidator,
+    SpecValidationCache,
     ValidationResult,
 )
+from swagger_mcp_server.parser.yaml_stream_parser import (
+    SwaggerYamlStreamParser,
+)
 
 logger = get_logger(__name__)
 
@@ -47,16 +56,32 @@ class SwaggerParser(BaseParser):
             max_errors=self.config.max_errors,
         )
         self.stream_parser = SwaggerStreamParser(config)
+        self.yaml_stream_parser = SwaggerYamlStreamParser(config)
         self.structure_validator = StructureValidator(
             self.error_handler, preserve_order=self.config.preserve_order
         )
-        self.openapi_validator = OpenAPIValidator(
-            self.error_handler, strict_mode=self.config.strict_mode
-        )
+        self.validation_cache: Optional[SpecValidationCache] = None
+        if self.config.validation_cache_dir:
+            self.validation_cache = SpecValidationCache(
+                self.config.validation_cache_dir
+            )
+        self.openapi_validator = self._create_openapi_validator()
         self.progress_reporter = ProgressReporter(
             callback=self.config.progress_callback,
             interval_bytes=self.config.progress_interval_bytes,
         )
+        # The file cache lives as long as the parser, so reparsing a bundle
+        # only decodes the files that changed
+        self.bundle_loader = SpecBundleLoader(self.config.bundle_workers)
+
+    def _create_openapi_validator(self) -> OpenAPIValidator:
+        """Create the OpenAPI validator for the configured validation tier."""
+        return OpenAPIValidator(
+            self.error_handler,
+            strict_mode=self.config.strict_mode,
+            tier=self.config.validation_tier,
+            cache=self.validation_cache,
+        )
 
     def get_supported_extensions(self) -> list[str]:
         """Get supported file extensions.
@@ -64,7 +89,7 @@ class SwaggerParser(BaseParser):
         Returns:
             List of supported extensions
         """
-        return [".json"]
+        return [".json", ".yaml", ".yml"]
 
     def get_parser_type(self) -> ParserType:
         """Get parser type.
@@ -85,10 +110,14 @@ class SwaggerParser(BaseParser):
         """
         path = Path(file_path)
         start_time = time.time()
+        metrics = ParseMetrics()
+        telemetry = MemoryTelemetry(
+            self.config.memory_telemetry, max_memory_mb=self.config.max_memory_mb
+        )
 
         try:
             # Initialize metrics and progress tracking
-            metrics = ParseMetrics()
+            telemetry.start()
             metrics.file_size_bytes = path.stat().st_size
 
             self.logger.info(
@@ -114,6 +143,17 @@ class SwaggerParser(BaseParser):
             if not parse_result.is_success:
                 return parse_result
 
+            # Stream parser reports its own "parsing" phase
+            metrics.memory_peak_mb = parse_result.metrics.memory_peak_mb
+            metrics.phase_memory_peak_mb.update(
+                parse_result.metrics.phase_memory_peak_mb
+            )
+
+            if self.config.bundle_references:
+                bundle = await self._bundle_references(path, parse_result.data, metrics)
+                parse_result.data = bundle.document
+                parse_result.referenced_files = bundle.files[1:]
+
             # Phase 2: Structure Validation and Preservation
             await self.progress_reporter.start_phase(
                 ProgressPhase.VALIDATION,
@@ -121,18 +161,24 @@ class SwaggerParser(BaseParser):
                 0,  # Structure validation is not byte-based
             )
 
+            telemetry.start_phase("structure_validation")
             validated_data = await self._validate_structure_with_progress(
                 parse_result.data, str(path), metrics
             )
+            telemetry.check_limit()
 
             # Phase 3: OpenAPI Compliance Validation
             await self.progress_reporter.start_phase(
                 ProgressPhase.VALIDATION, "Validating OpenAPI compliance", 0
             )
 
+            telemetry.start_phase("openapi_validation")
             validation_result = await self._validate_openapi_with_progress(
                 validated_data, str(path), metrics
             )
+            telemetry.check_limit()
+            telemetry.end_phase()
+            telemetry.record(metrics)
 
             # Phase 4: Completion and Metrics
             await self.progress_reporter.complete("Parsing completed successfully")
@@ -146,6 +192,8 @@ class SwaggerParser(BaseParser):
                 api_title=parse_result.api_title,
                 api_version=parse_result.api_version,
                 metrics=metrics,
+                deferred_validation=self.openapi_validator.deferred_validation,
+                referenced_files=parse_result.referenced_files,
             )
 
             # Merge validation metrics
@@ -174,6 +222,7 @@ class SwaggerParser(BaseParser):
                 errors=len(metrics.errors),
                 warnings=len(metrics.warnings),
                 success_rate=metrics.success_rate,
+                memory_peak_mb=metrics.memory_peak_mb,
             )
 
             return final_result
@@ -199,6 +248,9 @@ class SwaggerParser(BaseParser):
                 status=ParseStatus.FAILED, file_path=path, metrics=metrics
             )
 
+        finally:
+            telemetry.stop()
+
     async def _parse_with_progress(
         self, path: Path, metrics: ParseMetrics
     ) -> ParseResult:
@@ -215,10 +267,8 @@ class SwaggerParser(BaseParser):
         original_callback = self.config.progress_callback
 
         def progress_callback(bytes_processed: int, total_bytes: int):
-            # Report to progress reporter
-            asyncio.create_task(
-                self.progress_reporter.update_progress(bytes_processed, total_bytes)
-            )
+            # Report to progress reporter; delivery happens off the parse loop
+            self.progress_reporter.record_progress(bytes_processed, total_bytes)
 
             # Call original callback if exists
             if original_callback:
@@ -237,18 +287,67 @@ class SwaggerParser(BaseParser):
                 phase="stream_parsing",
             )
 
+        stream_parser = self._select_stream_parser(path)
+
         # Temporarily set progress callback
         self.config.progress_callback = progress_callback
-        self.stream_parser.config.progress_callback = progress_callback
+        stream_parser.config.progress_callback = progress_callback
 
         try:
-            result = await self.stream_parser.parse(path)
-            await self.progress_reporter.complete_phase("JSON parsing completed")
+            result = await stream_parser.parse(path)
+            await self.progress_reporter.complete_phase(
+                f"{'YAML' if stream_parser is self.yaml_stream_parser else 'JSON'} "
+                "parsing completed"
+            )
             return result
         finally:
             # Restore original callback
             self.config.progress_callback = original_callback
-            self.stream_parser.config.progress_callback = original_callback
+            stream_parser.config.progress_callback = original_callback
+
+    async def _bundle_references(
+        self, path: Path, data: Dict[str, Any], metrics: ParseMetrics
+    ) -> SpecBundle:
+        """Merge the files referenced by the document into it.
+
+        Args:
+            path: Root document location
+            data: Parsed root document
+            metrics: Metrics to update
+
+        Returns:
+            Bundle whose document has no external-file references
+        """
+        bundle = await self.bundle_loader.load(path, root_document=data)
+        metrics.bundled_files = len(bundle.files)
+
+        for error in bundle.errors:
+            self.error_handler.add_error(
+                ParseError(
+                    message=error,
+                    error_type="BundleReferenceError",
+                    recoverable=True,
+                    suggestion="Check the relative $ref paths of the specification",
+                )
+            )
+
+        if self.config.bundle_output_path:
+            bundle.write(self.config.bundle_output_path)
+
+        return bundle
+
+    def _select_stream_parser(self, path: Path) -> SwaggerStreamParser:
+        """Select the stream parser for a file based on its extension.
+
+        Args:
+            path: File path
+
+        Returns:
+            YAML stream parser for .yaml/.yml files, JSON stream parser otherwise
+        """
+        if self.yaml_stream_parser.can_parse(path):
+            return self.yaml_stream_parser
+        return self.stream_parser
 
     async def _validate_structure_with_progress(
         self, data: Dict[str, Any], file_path: str, metrics: ParseMetrics
@@ -340,6 +439,7 @@ class SwaggerParser(BaseParser):
             "validation_metrics": {
                 "structure_validation_enabled": True,
                 "openapi_validation_enabled": self.config.validate_openapi,
+                "validation_tier": self.config.validation_tier.value,
             },
             "progress_metrics": self.progress_reporter.get_metrics(),
         }
@@ -353,9 +453,7 @@ class SwaggerParser(BaseParser):
         self.structure_validator = StructureValidator(
             self.error_handler, preserve_order=self.config.preserve_order
         )
-        self.openapi_validator = OpenAPIValidator(
-            self.error_handler, strict_mode=self.config.strict_mode
-        )
+        self.openapi_validator = self._create_openapi_validator()
         self.progress_reporter.reset()
 
         self.logger.debug("Parser state reset for new operation")
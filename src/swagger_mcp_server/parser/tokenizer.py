@@ -0,0 +1,174 @@
+"""Shared tokenizer for search indexing, ranking and query processing.
+
+Splits text into lowercase terms, breaking up camelCase, snake_case,
+kebab-case and URL paths, then filters and stems them. Processing of a raw
+token is memoized, so each distinct token of a corpus is filtered and
+stemmed once.
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional, Tuple
+
+# Boundaries inside camelCase and PascalCase words ("getUserByID" ->
+# "get User By ID", "HTTPServer" -> "HTTP Server")
+CAMEL_CASE_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+# Runs of letters and digits; underscores, hyphens, slashes, dots and other
+# punctuation separate words
+WORD_PATTERN = re.compile(r"[^\W_]+")
+
+DEFAULT_STOP_WORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "has",
+        "in",
+        "is",
+        "it",
+        "its",
+        "of",
+        "on",
+        "that",
+        "the",
+        "this",
+        "to",
+        "was",
+        "were",
+        "will",
+        "with",
+    }
+)
+
+
+def suffix_stem(word: str) -> str:
+    """Strip common English suffixes from long words.
+
+    Args:
+        word: Lowercase word
+
+    Returns:
+        Stem of the word (e.g., "endpoints" -> "endpoint"), or the word
+        itself if it is 6 characters or shorter
+    """
+    if len(word) <= 6:
+        return word
+    if word.endswith("s"):
+        return word[:-1]
+    if word.endswith("ed"):
+        return word[:-2]
+    if word.endswith("ing"):
+        return word[:-3]
+    return word
+
+
+class Tokenizer:
+    """Tokenizer with precompiled patterns and a per-token cache."""
+
+    def __init__(
+        self,
+        stop_words: Iterable[str] = DEFAULT_STOP_WORDS,
+        keep_terms: Iterable[str] = (),
+        min_length: int = 2,
+        max_length: int = 50,
+        stemmer: Optional[Callable[[str], str]] = suffix_stem,
+        expand_stems: bool = True,
+        cache_size: int = 16384,
+    ):
+        """Initialize tokenizer.
+
+        Args:
+            stop_words: Words to drop
+            keep_terms: Words kept even if they are stop words or shorter
+                than min_length
+            min_length: Minimum term length
+            max_length: Maximum term length; longer words are usually IDs
+                or encoded data
+            stemmer: Stemming function, or None to disable stemming
+            expand_stems: Whether to emit stems in addition to the words
+                (for indexing) instead of in place of them
+            cache_size: Maximum number of raw tokens in the cache
+        """
+        self.stop_words = frozenset(stop_words)
+        self.keep_terms = frozenset(keep_terms)
+        self.min_length = min_length
+        self.max_length = max_length
+        self.stemmer = stemmer
+        self.expand_stems = expand_stems
+
+        # Keyed by raw token, before lowercasing
+        self._process_token = lru_cache(maxsize=cache_size)(self._terms_of_token)
+
+    def split(self, text: str) -> List[str]:
+        """Split text into lowercase words without filtering or stemming.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            Words in order of occurrence
+        """
+        if not text:
+            return []
+        return WORD_PATTERN.findall(CAMEL_CASE_BOUNDARY.sub(" ", text).lower())
+
+    def tokenize(self, text: str) -> List[str]:
+        """Tokenize text into search terms.
+
+        Args:
+            text: Text to tokenize
+
+        Returns:
+            Terms in order of occurrence
+        """
+        if not text:
+            return []
+
+        terms: List[str] = []
+        process_token = self._process_token
+        for token in WORD_PATTERN.findall(CAMEL_CASE_BOUNDARY.sub(" ", text)):
+            terms.extend(process_token(token))
+        return terms
+
+    def tokenize_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """Tokenize a batch of texts sharing the token cache.
+
+        Args:
+            texts: Texts to tokenize
+
+        Returns:
+            Terms of every text, in input order
+        """
+        return [self.tokenize(text) for text in texts]
+
+    def cache_info(self):
+        """Get hit/miss statistics of the token cache."""
+        return self._process_token.cache_info()
+
+    def _terms_of_token(self, token: str) -> Tuple[str, ...]:
+        """Get the terms of a raw token."""
+        word = token.lower()
+
+        if word not in self.keep_terms:
+            if len(word) < self.min_length or word in self.stop_words:
+                return ()
+        if len(word) > self.max_length:
+            return ()
+
+        if self.stemmer is None:
+            return (word,)
+
+        stem = self.stemmer(word)
+        if not self.expand_stems:
+            return (stem,)
+        if stem != word:
+            return (word, stem)
+        return (word,)
@@ -1,24 +1,52 @@
 """OpenAPI 3.x specification compliance validation."""
 
+import asyncio
+import dataclasses
+import hashlib
+import json
+import os
 import re
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as package_version
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import yaml
 
 try:
     from openapi_spec_validator import validate_spec
-    from openapi_spec_validator.exceptions import OpenAPIValidationError
+    from openapi_spec_validator.validation.exceptions import (
+        OpenAPIValidationError,
+    )
 
     VALIDATOR_AVAILABLE = True
 except ImportError:
     VALIDATOR_AVAILABLE = False
 
 from swagger_mcp_server.config.logging import get_logger
-from swagger_mcp_server.parser.base import ParseError, SwaggerParseError
+from swagger_mcp_server.parser.base import (
+    ParseError,
+    SwaggerParseError,
+    ValidationTier,
+)
 from swagger_mcp_server.parser.error_handler import ErrorContext, ErrorHandler
 
 logger = get_logger(__name__)
 
+try:
+    VALIDATOR_VERSION = package_version("openapi-spec-validator")
+except PackageNotFoundError:
+    VALIDATOR_VERSION = "unavailable"
+
+# Errors and warnings reported by openapi-spec-validator
+SpecValidatorIssues = Tuple[List[ParseError], List[ParseError]]
+
 
 class OpenAPIVersion(Enum):
     """Supported OpenAPI versions."""
@@ -44,20 +72,304 @@ class ValidationResult:
     validation_duration_ms: float = 0.0
 
 
+def specification_hash(data: Dict[str, Any]) -> str:
+    """Compute the SHA-256 of a parsed specification, independent of key order.
+
+    Args:
+        data: Parsed OpenAPI document
+
+    Returns:
+        Hex digest of the canonical JSON form of the document
+    """
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def run_spec_validator(data: Dict[str, Any]) -> SpecValidatorIssues:
+    """Validate a document with openapi-spec-validator.
+
+    Defined at module level so it can run in a worker process.
+
+    Args:
+        data: Parsed OpenAPI document
+
+    Returns:
+        Tuple of (errors, warnings)
+    """
+    try:
+        validate_spec(data)
+
+    except OpenAPIValidationError as e:
+        # Convert validator errors to our format
+        return [
+            ParseError(
+                message=f"OpenAPI specification validation failed: {str(e)}",
+                error_type="SpecificationValidationError",
+                recoverable=False,
+                suggestion="Fix OpenAPI specification according to official schema",
+            )
+        ], []
+
+    except Exception as e:
+        return [], [
+            ParseError(
+                message=f"Spec validator error: {str(e)}",
+                error_type="ValidatorError",
+                recoverable=True,
+                suggestion="Check if document structure is valid OpenAPI format",
+            )
+        ]
+
+    return [], []
+
+
+def validate_specification_file(file_path: str) -> SpecValidatorIssues:
+    """Load a JSON or YAML specification file and validate it.
+
+    Defined at module level so it can run in a worker process, which then
+    loads the document itself instead of receiving it.
+
+    Args:
+        file_path: Path of the specification file
+
+    Returns:
+        Tuple of (errors, warnings)
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            if Path(file_path).suffix.lower() in (".yaml", ".yml"):
+                data = yaml.safe_load(f)
+            else:
+                data = json.load(f)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        return [], [
+            ParseError(
+                message=f"Spec validator could not load document: {str(e)}",
+                error_type="ValidatorError",
+                recoverable=True,
+            )
+        ]
+
+    return run_spec_validator(data)
+
+
+class SpecValidationCache:
+    """Cache of openapi-spec-validator results keyed by specification hash.
+
+    Results are kept in memory, dropping the least recently used entries
+    past ``max_entries``. With a cache directory they are also stored as
+    small JSON files, so unchanged specifications are not revalidated by
+    later runs. Keys include the validator version.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_entries: int = 128,
+    ):
+        """Initialize validation cache.
+
+        Args:
+            cache_dir: Directory for persistent entries (None keeps results
+                in memory only)
+            max_entries: Maximum number of results kept in memory
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, SpecValidatorIssues]" = OrderedDict()
+
+    def cache_key(self, spec_hash: str) -> str:
+        """Get the cache key of a specification hash."""
+        key_material = f"{spec_hash}:{VALIDATOR_VERSION}"
+        return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+    def get(self, spec_hash: str) -> Optional[SpecValidatorIssues]:
+        """Look up the validation result of a specification.
+
+        Args:
+            spec_hash: Specification hash (see ``specification_hash``)
+
+        Returns:
+            Tuple of (errors, warnings), or None on a cache miss
+        """
+        key = self.cache_key(spec_hash)
+        issues = self._entries.get(key)
+        if issues is not None:
+            self._entries.move_to_end(key)
+            return issues
+
+        if self.cache_dir is None:
+            return None
+
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            issues = (
+                [ParseError(**error) for error in entry["errors"]],
+                [ParseError(**warning) for warning in entry["warnings"]],
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Discarding unreadable validation cache entry", error=str(e))
+            return None
+
+        self._remember(key, issues)
+        return issues
+
+    def put(
+        self, spec_hash: str, errors: List[ParseError], warnings: List[ParseError]
+    ) -> None:
+        """Store the validation result of a specification.
+
+        Args:
+            spec_hash: Specification hash (see ``specification_hash``)
+            errors: Validation errors
+            warnings: Validation warnings
+        """
+        key = self.cache_key(spec_hash)
+        self._remember(key, (list(errors), list(warnings)))
+
+        if self.cache_dir is None:
+            return
+
+        entry = {
+            "errors": [dataclasses.asdict(error) for error in errors],
+            "warnings": [dataclasses.asdict(warning) for warning in warnings],
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write atomically so concurrent readers never see partial entries
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.cache_dir, suffix=".tmp", prefix=key
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(temp_path, self._entry_path(key))
+            except BaseException:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.warning("Failed to write validation cache entry", error=str(e))
+
+    def _remember(self, key: str, issues: SpecValidatorIssues) -> None:
+        """Add an entry to the in-memory cache."""
+        self._entries[key] = issues
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path of a persistent entry."""
+        return self.cache_dir / f"{key}.json"
+
+
+# Shared by validators created without a cache of their own
+DEFAULT_VALIDATION_CACHE = SpecValidationCache()
+
+
+class DeferredValidation:
+    """Full specification validation running in a worker process.
+
+    The result is added to the validation cache as soon as the worker
+    finishes, whether or not anyone waits for it.
+    """
+
+    def __init__(
+        self,
+        future: "Future[SpecValidatorIssues]",
+        spec_hash: str,
+        version: OpenAPIVersion,
+        cache: SpecValidationCache,
+    ):
+        """Initialize deferred validation.
+
+        Args:
+            future: Future of the worker running ``run_spec_validator``
+            spec_hash: Hash of the validated specification
+            version: Detected OpenAPI version
+            cache: Cache receiving the result
+        """
+        self.future = future
+        self.spec_hash = spec_hash
+        self.version = version
+        self.cache = cache
+        self.start_time = time.time()
+
+        future.add_done_callback(self._store_result)
+
+    def done(self) -> bool:
+        """Check if the worker has finished."""
+        return self.future.done()
+
+    async def result(self) -> ValidationResult:
+        """Wait for the worker and get the validation result.
+
+        Returns:
+            Validation result with the spec validator's errors and warnings
+        """
+        try:
+            errors, warnings = await asyncio.wrap_future(self.future)
+        except Exception as e:
+            errors, warnings = [], [
+                ParseError(
+                    message=f"Deferred validation failed: {str(e)}",
+                    error_type="ValidatorError",
+                    recoverable=True,
+                )
+            ]
+
+        return ValidationResult(
+            is_valid=len(errors) == 0,
+            version=self.version,
+            errors=errors,
+            warnings=warnings,
+            validation_duration_ms=(time.time() - self.start_time) * 1000,
+        )
+
+    def _store_result(self, future: "Future[SpecValidatorIssues]") -> None:
+        """Cache the result of a successfully finished worker."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        self.cache.put(self.spec_hash, *future.result())
+
+
 class OpenAPIValidator:
     """Validates OpenAPI 3.x specification compliance."""
 
-    def __init__(self, error_handler: ErrorHandler, strict_mode: bool = False):
+    def __init__(
+        self,
+        error_handler: ErrorHandler,
+        strict_mode: bool = False,
+        tier: ValidationTier = ValidationTier.FULL,
+        cache: Optional[SpecValidationCache] = None,
+        executor_factory: Optional[Callable[[], Executor]] = None,
+    ):
         """Initialize OpenAPI validator.
 
         Args:
             error_handler: Error handler for recording issues
             strict_mode: If True, treat warnings as errors
+            tier: Validation depth; STRUCTURAL skips openapi-spec-validator
+                and DEFERRED runs it in a worker process
+            cache: Cache of openapi-spec-validator results, defaults to a
+                process-wide in-memory cache
+            executor_factory: Creates the executor for deferred validation,
+                defaults to a single-worker ``ProcessPoolExecutor``
         """
         self.error_handler = error_handler
         self.strict_mode = strict_mode
+        self.tier = tier
+        self.cache = cache or DEFAULT_VALIDATION_CACHE
+        self.executor_factory = executor_factory or (
+            lambda: ProcessPoolExecutor(max_workers=1)
+        )
         self.logger = get_logger(__name__)
 
+        # Set by the deferred tier while full validation is still running
+        self.deferred_validation: Optional[DeferredValidation] = None
+
         # Version detection patterns
         self.version_patterns = {
             OpenAPIVersion.SWAGGER_2_0: r"^2\.0$",
@@ -80,9 +392,8 @@ class OpenAPIValidator:
         Returns:
             Validation result with errors and warnings
         """
-        import time
-
         start_time = time.time()
+        self.deferred_validation = None
 
         try:
             # Detect OpenAPI version
@@ -93,6 +404,7 @@ class OpenAPIValidator:
                 file_path=file_path,
                 detected_version=version.value,
                 validator_available=VALIDATOR_AVAILABLE,
+                tier=self.tier.value,
             )
 
             # Initialize result
@@ -124,7 +436,10 @@ class OpenAPIValidator:
 
             # Use openapi-spec-validator if available
             if VALIDATOR_AVAILABLE and result.is_valid:
-                await self._validate_with_spec_validator(data, result)
+                if self.tier == ValidationTier.FULL:
+                    await self._validate_with_spec_validator(data, result)
+                elif self.tier == ValidationTier.DEFERRED:
+                    await self._start_deferred_validation(data, result)
 
             # Custom validation rules
             await self._apply_custom_validation_rules(data, file_path, result)
@@ -175,6 +490,81 @@ class OpenAPIValidator:
 
             return result
 
+    async def validate_specification_file(
+        self, file_path: str, skeleton: Dict[str, Any], spec_hash: str
+    ) -> ValidationResult:
+        """Validate a specification file without loading it in this process.
+
+        Meant for streamed documents: the version and info object are
+        checked on the parsed skeleton, and openapi-spec-validator loads the
+        file itself, inline for FULL or in a worker for DEFERRED.
+
+        Args:
+            file_path: Path of the specification file
+            skeleton: Document without paths and schemas
+            spec_hash: Hash the spec validator result is cached under,
+                e.g. the hash of the file contents
+
+        Returns:
+            Validation result with errors and warnings
+        """
+        start_time = time.time()
+        self.deferred_validation = None
+
+        version = self._detect_openapi_version(skeleton)
+        result = ValidationResult(
+            is_valid=True, version=version, errors=[], warnings=[]
+        )
+
+        if version == OpenAPIVersion.UNKNOWN:
+            result.errors.append(
+                ParseError(
+                    message=f"Unsupported OpenAPI version: {version.value}",
+                    error_type="UnsupportedVersion",
+                    recoverable=False,
+                    suggestion="Use supported versions: 2.0, 3.0.x, or 3.1.0",
+                )
+            )
+        else:
+            await self._validate_info_object(skeleton.get("info"), result)
+
+        spec_validated = self.tier in (ValidationTier.FULL, ValidationTier.DEFERRED)
+        if VALIDATOR_AVAILABLE and spec_validated and not result.errors:
+            issues = self.cache.get(spec_hash)
+            if issues is None and not (
+                self.tier == ValidationTier.DEFERRED
+                and self._defer(
+                    validate_specification_file, file_path, spec_hash, version
+                )
+            ):
+                issues = validate_specification_file(file_path)
+                self.cache.put(spec_hash, *issues)
+
+            if issues is not None:
+                errors, warnings = issues
+                result.errors.extend(errors)
+                result.warnings.extend(warnings)
+
+        result.is_valid = len(result.errors) == 0
+
+        for error in result.errors:
+            self.error_handler.add_error(error)
+        for warning in result.warnings:
+            self.error_handler.add_error(warning)
+
+        result.validation_duration_ms = (time.time() - start_time) * 1000
+
+        self.logger.info(
+            "OpenAPI file validation completed",
+            file_path=file_path,
+            tier=self.tier.value,
+            is_valid=result.is_valid,
+            deferred=self.deferred_validation is not None,
+            duration_ms=result.validation_duration_ms,
+        )
+
+        return result
+
     def _detect_openapi_version(self, data: Dict[str, Any]) -> OpenAPIVersion:
         """Detect OpenAPI specification version.
 
@@ -323,30 +713,79 @@ class OpenAPIValidator:
             )
             return
 
-        try:
-            # Use the spec validator
-            validate_spec(data)
-
-        except OpenAPIValidationError as e:
-            # Convert validator errors to our format
-            result.errors.append(
-                ParseError(
-                    message=f"OpenAPI specification validation failed: {str(e)}",
-                    error_type="SpecificationValidationError",
-                    recoverable=False,
-                    suggestion="Fix OpenAPI specification according to official schema",
-                )
+        spec_hash = specification_hash(data)
+        issues = self.cache.get(spec_hash)
+        if issues is None:
+            issues = run_spec_validator(data)
+            self.cache.put(spec_hash, *issues)
+        else:
+            self.logger.debug(
+                "Using cached spec validation result", spec_hash=spec_hash
             )
 
+        errors, warnings = issues
+        result.errors.extend(errors)
+        result.warnings.extend(warnings)
+
+    async def _start_deferred_validation(
+        self, data: Dict[str, Any], result: ValidationResult
+    ) -> None:
+        """Start openapi-spec-validator in a worker process.
+
+        Cached results are applied right away. If no worker can be started,
+        the document is validated inline instead.
+
+        Args:
+            data: Document data
+            result: Validation result to update
+        """
+        spec_hash = specification_hash(data)
+        issues = self.cache.get(spec_hash)
+        if issues is not None:
+            errors, warnings = issues
+            result.errors.extend(errors)
+            result.warnings.extend(warnings)
+            return
+
+        if not self._defer(run_spec_validator, data, spec_hash, result.version):
+            await self._validate_with_spec_validator(data, result)
+
+    def _defer(
+        self,
+        validate: Callable[[Any], SpecValidatorIssues],
+        argument: Any,
+        spec_hash: str,
+        version: OpenAPIVersion,
+    ) -> bool:
+        """Submit a validation function to a worker process.
+
+        Args:
+            validate: Module-level function returning (errors, warnings)
+            argument: Argument passed to the function
+            spec_hash: Hash the result is cached under
+            version: Detected OpenAPI version
+
+        Returns:
+            True if the worker was started
+        """
+        try:
+            executor = self.executor_factory()
+            future = executor.submit(validate, argument)
+            # Already submitted work still completes after shutdown
+            executor.shutdown(wait=False)
         except Exception as e:
-            result.warnings.append(
-                ParseError(
-                    message=f"Spec validator error: {str(e)}",
-                    error_type="ValidatorError",
-                    recoverable=True,
-                    suggestion="Check if document structure is valid OpenAPI format",
-                )
+            self.logger.warning(
+                "Deferred validation unavailable, validating inline",
+                error=str(e),
+                error_type=type(e).__name__,
             )
+            return False
+
+        self.deferred_validation = DeferredValidation(
+            future, spec_hash, version, self.cache
+        )
+        self.logger.info("Full validation deferred to worker process")
+        return True
 
     async def _validate_info_object(self, info: Any, result: ValidationResult) -> None:
         """Validate info object structure.
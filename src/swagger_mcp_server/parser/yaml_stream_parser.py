@@ -0,0 +1,603 @@
+"""Event-based YAML parser for large Swagger/OpenAPI files."""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import yaml
+    from yaml.events import (
+        AliasEvent,
+        MappingEndEvent,
+        MappingStartEvent,
+        ScalarEvent,
+        SequenceEndEvent,
+        SequenceStartEvent,
+    )
+    from yaml.nodes import ScalarNode
+except ImportError:
+    raise ImportError(
+        "PyYAML library is required for YAML parsing. "
+        "Install with: pip install pyyaml"
+    )
+
+from swagger_mcp_server.parser.base import (
+    ParseMetrics,
+    ParserType,
+    SwaggerParseError,
+)
+from swagger_mcp_server.parser.memory_telemetry import MemoryTelemetry
+from swagger_mcp_server.parser.stream_parser import (
+    HTTP_METHODS,
+    STREAMED_SECTIONS,
+    SwaggerStreamParser,
+)
+
+# libyaml emits events roughly 10x faster than the pure-Python scanner
+try:
+    from yaml import CSafeLoader as YamlLoader
+
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+    LIBYAML_AVAILABLE = False
+
+STR_TAG = "tag:yaml.org,2002:str"
+COLLECTION_TAGS = frozenset({"!", "tag:yaml.org,2002:map", "tag:yaml.org,2002:seq"})
+
+# Returned by YamlEventReader.read_key for "<<" merge keys
+MERGE_KEY = object()
+
+# Loader events between two progress/memory checks
+EVENTS_PER_PROGRESS_CHECK = 1000
+
+# Prefixes containing a streamed section (e.g. "components")
+STREAMED_PARENTS = frozenset(parent for parent, _ in STREAMED_SECTIONS if parent)
+
+
+def apply_merges(mapping: Dict[str, Any], merges: List[Any]) -> None:
+    """Apply ``<<`` merge values; explicit keys and earlier merges win."""
+    for merge in merges:
+        sources = merge if isinstance(merge, list) else [merge]
+        for source in sources:
+            if not isinstance(source, dict):
+                raise SwaggerParseError(
+                    "Merge key values must be mappings",
+                    "InvalidYAML",
+                    suggestion="Only merge mappings or lists of mappings",
+                )
+            for key, value in source.items():
+                mapping.setdefault(key, value)
+
+
+class YamlEventReader:
+    """Builds Python values directly from loader events.
+
+    Skips PyYAML's node graph entirely: scalars are resolved and converted
+    one at a time and collections are built as plain dicts and lists, which
+    is several times faster and lighter than ``yaml.load``. Values can also
+    be skipped without being built. Anchored values are always built and
+    remembered for the whole document, so aliases resolve even when the
+    anchor sits in a skipped section.
+
+    Mapping keys are always strings, as in JSON (e.g. response code
+    ``200`` becomes ``"200"``). Merge keys (``<<``) are supported.
+    """
+
+    def __init__(
+        self,
+        loader: Any,
+        on_progress: Optional[Callable[[], None]] = None,
+        metrics: Optional[ParseMetrics] = None,
+    ):
+        """Initialize event reader.
+
+        Args:
+            loader: PyYAML loader positioned at the start of a stream
+            on_progress: Called every ``EVENTS_PER_PROGRESS_CHECK`` events
+            metrics: Metrics whose ``extensions_found`` is updated on the way
+        """
+        self.loader = loader
+        self.on_progress = on_progress
+        self.metrics = metrics
+        self.anchors: Dict[str, Any] = {}
+        self._events_read = 0
+
+    def next_event(self) -> Any:
+        """Consume the next event."""
+        self._events_read += 1
+        if self.on_progress and self._events_read % EVENTS_PER_PROGRESS_CHECK == 0:
+            self.on_progress()
+        return self.loader.get_event()
+
+    def at(self, event_class: type) -> bool:
+        """Check if the next event is of the given class."""
+        return self.loader.check_event(event_class)
+
+    def start_document(self) -> bool:
+        """Consume stream and document start events.
+
+        Returns:
+            True if the stream contains a document
+        """
+        self.next_event()  # StreamStartEvent
+        if self.at(yaml.StreamEndEvent):
+            return False
+        self.next_event()  # DocumentStartEvent
+        return True
+
+    def enter_mapping(self) -> bool:
+        """Consume a mapping start event if it is next and not anchored.
+
+        Returns:
+            True if a mapping was entered
+        """
+        event = self.loader.peek_event()
+        if isinstance(event, MappingStartEvent) and not event.anchor:
+            self.next_event()
+            return True
+        return False
+
+    def exit_collection(self) -> None:
+        """Consume the end event of the current mapping or sequence."""
+        self.next_event()
+
+    def read_key(self) -> Any:
+        """Read a mapping key.
+
+        Returns:
+            Key as a string, or ``MERGE_KEY`` for a ``<<`` merge key
+
+        Raises:
+            SwaggerParseError: If the key is not a scalar
+        """
+        event = self.next_event()
+
+        if isinstance(event, ScalarEvent):
+            if event.value == "<<" and event.implicit[0] and event.tag is None:
+                return MERGE_KEY
+            key = event.value
+            if event.anchor:
+                self.anchors[event.anchor] = key
+        elif isinstance(event, AliasEvent):
+            key = self._resolve_alias(event)
+        else:
+            key = None
+
+        if not isinstance(key, str):
+            raise SwaggerParseError(
+                "Only scalar mapping keys are supported",
+                "InvalidYAML",
+                line_number=event.start_mark.line + 1,
+                suggestion="Use string keys, as in JSON",
+            )
+
+        if self.metrics is not None and key.startswith("x-"):
+            self.metrics.extensions_found += 1
+        return key
+
+    def read_value(self) -> Any:
+        """Build the next value and its children.
+
+        Returns:
+            Python value (dict, list or scalar)
+
+        Raises:
+            SwaggerParseError: If the value uses unsupported tags or aliases
+        """
+        event = self.next_event()
+        event_class = type(event)
+
+        if event_class is ScalarEvent:
+            value = self._construct_scalar(event)
+        elif event_class is MappingStartEvent:
+            self._check_collection_tag(event)
+            value = {}
+            if event.anchor:
+                self.anchors[event.anchor] = value
+            self.read_mapping_items(value)
+            return value
+        elif event_class is SequenceStartEvent:
+            self._check_collection_tag(event)
+            value = []
+            if event.anchor:
+                self.anchors[event.anchor] = value
+            while not self.at(SequenceEndEvent):
+                value.append(self.read_value())
+            self.exit_collection()
+            return value
+        elif event_class is AliasEvent:
+            return self._resolve_alias(event)
+        else:
+            raise SwaggerParseError(
+                f"Unexpected YAML event: {event_class.__name__}",
+                "InvalidYAML",
+                suggestion="Check if file contains a single valid YAML document",
+            )
+
+        if event.anchor:
+            self.anchors[event.anchor] = value
+        return value
+
+    def read_mapping_items(self, mapping: Dict[str, Any]) -> None:
+        """Read the items of an entered mapping, including its end event.
+
+        Args:
+            mapping: Dictionary to fill
+        """
+        merges = []
+        while not self.at(MappingEndEvent):
+            key = self.read_key()
+            if key is MERGE_KEY:
+                merges.append(self.read_value())
+            else:
+                mapping[key] = self.read_value()
+        self.exit_collection()
+
+        if merges:
+            apply_merges(mapping, merges)
+
+    def skip_value(self) -> None:
+        """Consume the next value without building it.
+
+        Anchored values are built instead, so later aliases still resolve.
+        """
+        event = self.loader.peek_event()
+        if getattr(event, "anchor", None) and not isinstance(event, AliasEvent):
+            self.read_value()
+            return
+
+        event = self.next_event()
+        if isinstance(event, MappingStartEvent):
+            while not self.at(MappingEndEvent):
+                self.read_key()
+                self.skip_value()
+            self.exit_collection()
+        elif isinstance(event, SequenceStartEvent):
+            while not self.at(SequenceEndEvent):
+                self.skip_value()
+            self.exit_collection()
+
+    def _construct_scalar(self, event: ScalarEvent) -> Any:
+        """Convert a scalar event using the loader's resolvers and constructors."""
+        tag = event.tag
+        if tag is None or tag == "!":
+            if not event.implicit[0]:
+                return event.value  # Quoted or block scalar
+            tag = self.loader.resolve(ScalarNode, event.value, event.implicit)
+        if tag == STR_TAG:
+            return event.value
+
+        constructor = self.loader.yaml_constructors.get(tag)
+        if constructor is None:
+            raise SwaggerParseError(
+                f"Unsupported YAML tag '{tag}'",
+                "InvalidYAML",
+                line_number=event.start_mark.line + 1,
+                suggestion="Remove custom tags; only standard YAML types are supported",
+            )
+        return constructor(self.loader, ScalarNode(tag, event.value, style=event.style))
+
+    def _check_collection_tag(self, event: Any) -> None:
+        """Reject collections with custom or non-JSON tags (e.g. ``!!set``)."""
+        if event.tag is not None and event.tag not in COLLECTION_TAGS:
+            raise SwaggerParseError(
+                f"Unsupported YAML tag '{event.tag}'",
+                "InvalidYAML",
+                line_number=event.start_mark.line + 1,
+                suggestion="Remove custom tags; only standard YAML types are supported",
+            )
+
+    def _resolve_alias(self, event: AliasEvent) -> Any:
+        """Return the value of a previously seen anchor."""
+        if event.anchor not in self.anchors:
+            raise SwaggerParseError(
+                f"Found undefined alias '{event.anchor}'",
+                "InvalidYAML",
+                line_number=event.start_mark.line + 1,
+                suggestion="Define the anchor before it is referenced",
+            )
+        return self.anchors[event.anchor]
+
+
+class SwaggerYamlStreamParser(SwaggerStreamParser):
+    """Memory-efficient event-based parser for YAML Swagger/OpenAPI files.
+
+    Mirrors :class:`SwaggerStreamParser`: values are built straight from
+    libyaml events (``CSafeLoader``, with a pure-Python fallback), and in
+    streaming mode ``paths`` and schema definitions are emitted one item
+    at a time.
+    """
+
+    streaming_backend = f"pyyaml:{YamlLoader.__name__}"
+
+    def get_supported_extensions(self) -> list[str]:
+        """Get supported file extensions.
+
+        Returns:
+            List of supported extensions
+        """
+        return [".yaml", ".yml"]
+
+    def get_parser_type(self) -> ParserType:
+        """Get parser type.
+
+        Returns:
+            Parser type enum
+        """
+        return ParserType.OPENAPI_YAML
+
+    async def _parse_document(
+        self,
+        file_path: Path,
+        metrics: ParseMetrics,
+        telemetry: Optional[MemoryTelemetry] = None,
+    ) -> Dict[str, Any]:
+        """Parse the whole YAML document; YAML is always read from events.
+
+        Args:
+            file_path: Path to file to parse
+            metrics: Metrics object to update
+            telemetry: Memory telemetry sampled at progress intervals
+
+        Returns:
+            Parsed YAML data as dictionary
+        """
+        metrics.parser_backend = self.streaming_backend
+        return await self._stream_parse_file(file_path, metrics, telemetry)
+
+    async def _stream_parse_file(
+        self,
+        file_path: Path,
+        metrics: ParseMetrics,
+        telemetry: Optional[MemoryTelemetry] = None,
+    ) -> Dict[str, Any]:
+        """Parse the whole YAML document from loader events.
+
+        Args:
+            file_path: Path to file to parse
+            metrics: Metrics object to update
+            telemetry: Memory telemetry sampled at progress intervals
+
+        Returns:
+            Parsed YAML data as dictionary
+
+        Raises:
+            SwaggerParseError: If parsing fails
+        """
+        telemetry = telemetry or self._create_memory_telemetry()
+
+        with self._open_reader(file_path, metrics.file_size_bytes, telemetry) as reader:
+            data = reader.read_value() if reader.start_document() else {}
+
+        self._report_complete(metrics)
+        return data if isinstance(data, dict) else {}
+
+    async def _stream_skeleton(
+        self,
+        file_path: Path,
+        metrics: ParseMetrics,
+        telemetry: Optional[MemoryTelemetry] = None,
+    ) -> Dict[str, Any]:
+        """Build the document without its ``paths`` and schema definitions.
+
+        Args:
+            file_path: Path to file to parse
+            metrics: Metrics to update during parsing
+            telemetry: Memory telemetry sampled at progress intervals
+
+        Returns:
+            Document skeleton
+
+        Raises:
+            SwaggerParseError: If parsing fails
+        """
+        telemetry = telemetry or self._create_memory_telemetry()
+        skeleton: Dict[str, Any] = {}
+
+        with self._open_reader(
+            file_path, metrics.file_size_bytes, telemetry, metrics=metrics
+        ) as reader:
+            if reader.start_document() and reader.enter_mapping():
+                self._read_skeleton(reader, "", skeleton, metrics)
+
+        self._report_complete(metrics)
+
+        components = skeleton.get("components", {})
+        if isinstance(components, dict):
+            security_schemes = components.get("securitySchemes", {})
+            if isinstance(security_schemes, dict):
+                metrics.security_schemes_found = len(security_schemes)
+
+        return skeleton
+
+    def _read_skeleton(
+        self,
+        reader: YamlEventReader,
+        prefix: str,
+        mapping: Dict[str, Any],
+        metrics: ParseMetrics,
+    ) -> None:
+        """Read an entered mapping, skipping streamed sections.
+
+        Args:
+            reader: Event reader positioned inside the mapping
+            prefix: Dotted prefix of the mapping ("" for the root)
+            mapping: Dictionary to fill
+            metrics: Metrics updated with endpoint and schema counts
+        """
+        merges = []
+        while not reader.at(MappingEndEvent):
+            key = reader.read_key()
+            if key is MERGE_KEY:
+                merges.append(reader.read_value())
+                continue
+
+            child_prefix = f"{prefix}.{key}" if prefix else key
+            if (prefix, key) in STREAMED_SECTIONS:
+                self._skip_section(reader, STREAMED_SECTIONS[(prefix, key)], metrics)
+            elif child_prefix in STREAMED_PARENTS and reader.enter_mapping():
+                mapping[key] = {}
+                self._read_skeleton(reader, child_prefix, mapping[key], metrics)
+            else:
+                mapping[key] = reader.read_value()
+        reader.exit_collection()
+
+        if merges:
+            apply_merges(mapping, merges)
+
+    def _skip_section(
+        self, reader: YamlEventReader, section: str, metrics: ParseMetrics
+    ) -> None:
+        """Skip a streamed section, counting its endpoints or schemas.
+
+        Args:
+            reader: Event reader positioned at the section value
+            section: Section name ("paths" or "schemas")
+            metrics: Metrics to update
+        """
+        if not reader.enter_mapping():
+            reader.skip_value()
+            return
+
+        while not reader.at(MappingEndEvent):
+            reader.read_key()
+            if section == "schemas":
+                metrics.schemas_found += 1
+                reader.skip_value()
+            elif reader.enter_mapping():
+                while not reader.at(MappingEndEvent):
+                    method = reader.read_key()
+                    if isinstance(method, str) and method.lower() in HTTP_METHODS:
+                        metrics.endpoints_found += 1
+                    reader.skip_value()
+                reader.exit_collection()
+            else:
+                reader.skip_value()
+
+        reader.exit_collection()
+
+    def _iter_section(self, file_path: Path, prefix: str) -> Iterator[Tuple[str, Any]]:
+        """Yield key/value pairs of the mapping found at ``prefix``.
+
+        Args:
+            file_path: Path to YAML file
+            prefix: Dotted prefix of the mapping to stream
+
+        Yields:
+            Key/value pairs of the mapping
+
+        Raises:
+            SwaggerParseError: If the file cannot be read or is not valid YAML
+        """
+        telemetry = self._create_memory_telemetry()
+        telemetry.start()
+
+        try:
+            with self._open_reader(
+                file_path, file_path.stat().st_size, telemetry
+            ) as reader:
+                if (
+                    reader.start_document()
+                    and reader.enter_mapping()
+                    and self._seek_mapping(reader, prefix.split("."))
+                ):
+                    while not reader.at(MappingEndEvent):
+                        key = reader.read_key()
+                        value = reader.read_value()
+                        if key is not MERGE_KEY:
+                            yield key, value
+        finally:
+            telemetry.stop()
+
+    def _seek_mapping(self, reader: YamlEventReader, keys: List[str]) -> bool:
+        """Advance into the mapping at ``keys`` below the current mapping.
+
+        Args:
+            reader: Event reader positioned inside a mapping
+            keys: Remaining key path
+
+        Returns:
+            True if the reader is now inside the target mapping
+        """
+        while not reader.at(MappingEndEvent):
+            key = reader.read_key()
+            if key == keys[0] and reader.enter_mapping():
+                if len(keys) == 1:
+                    return True
+                return self._seek_mapping(reader, keys[1:])
+            reader.skip_value()
+        return False
+
+    @contextmanager
+    def _open_reader(
+        self,
+        file_path: Path,
+        total_bytes: int,
+        telemetry: MemoryTelemetry,
+        metrics: Optional[ParseMetrics] = None,
+    ) -> Iterator[YamlEventReader]:
+        """Open a file for event reading with progress and memory checks.
+
+        Args:
+            file_path: Path to YAML file
+            total_bytes: File size in bytes
+            telemetry: Memory telemetry checked at progress intervals
+            metrics: Metrics passed to the reader
+
+        Yields:
+            Event reader over the file
+
+        Raises:
+            SwaggerParseError: If the file cannot be read or is not valid YAML
+        """
+        last_progress_report = 0
+
+        try:
+            with open(file_path, "rb") as file:
+
+                def report_progress() -> None:
+                    nonlocal last_progress_report
+                    position = file.tell()
+                    if (
+                        position - last_progress_report
+                        < self.config.progress_interval_bytes
+                    ):
+                        return
+                    last_progress_report = position
+                    if self.config.progress_callback:
+                        self.config.progress_callback(position, total_bytes)
+                    telemetry.check_limit()
+
+                loader = YamlLoader(file)
+                try:
+                    yield YamlEventReader(
+                        loader, on_progress=report_progress, metrics=metrics
+                    )
+                finally:
+                    loader.dispose()
+
+        except yaml.YAMLError as e:
+            mark = getattr(e, "problem_mark", None)
+            raise SwaggerParseError(
+                f"Invalid YAML format: {str(e)}",
+                "InvalidYAML",
+                line_number=mark.line + 1 if mark else None,
+                column_number=mark.column + 1 if mark else None,
+                suggestion="Check if file contains valid YAML syntax",
+            )
+        except IOError as e:
+            raise SwaggerParseError(
+                f"File I/O error: {str(e)}",
+                "FileIOError",
+                suggestion="Check file permissions and disk space",
+            )
+
+    def _report_complete(self, metrics: ParseMetrics) -> None:
+        """Record the whole file as processed and report final progress."""
+        metrics.bytes_processed = metrics.file_size_bytes
+        if self.config.progress_callback:
+            self.config.progress_callback(
+                metrics.bytes_processed, metrics.file_size_bytes
+            )
@@ -20,7 +20,9 @@ from swagger_mcp_server.parser.base import (
     ParseResult,
     SwaggerParseError,
 )
+from swagger_mcp_server.parser.normalization_cache import NormalizationCache
 from swagger_mcp_server.parser.schema_normalizer import (
+    NormalizationConfig,
     NormalizationResult,
     SchemaNormalizer,
 )
@@ -56,6 +58,7 @@ class ProcessingMetrics:
     memory_peak_mb: float = 0.0
     errors_count: int = 0
     warnings_count: int = 0
+    normalization_cache_hit: bool = False
 
     def calculate_total_duration(self) -> float:
         """Calculate and set total processing duration."""
@@ -193,9 +196,9 @@ class ParsingStage(ProcessingStage):
 class NormalizationStage(ProcessingStage):
     """Stage for normalizing parsed OpenAPI data."""
 
-    def __init__(self):
+    def __init__(self, config: Optional[NormalizationConfig] = None):
         super().__init__("normalization")
-        self.normalizer = SchemaNormalizer()
+        self.normalizer = SchemaNormalizer(config)
 
     async def execute(
         self, input_data: Dict[str, Any], context: PipelineContext
@@ -206,9 +209,23 @@ class NormalizationStage(ProcessingStage):
         try:
             # Normalize the parsed data (run in thread pool for CPU-intensive work)
             loop = asyncio.get_event_loop()
-            normalization_result = await loop.run_in_executor(
-                None, self.normalizer.normalize_openapi_document, input_data
+            document_stream = getattr(
+                context.stage_results.get("parsing"), "document_stream", None
             )
+            if self.normalizer.config.spill_to_disk and document_stream is not None:
+                # Streamed and spilled: the document is never fully in memory
+                normalization_result = await loop.run_in_executor(
+                    None,
+                    self.normalizer.normalize_streamed_document_to_disk,
+                    document_stream,
+                )
+            else:
+                normalization_result = await loop.run_in_executor(
+                    None,
+                    self.normalizer.normalize_openapi_document,
+                    input_data,
+                    context.file_path or None,
+                )
 
             # Update metrics
             context.metrics.normalization_duration = time.time() - stage_start
@@ -368,10 +385,23 @@ class SwaggerProcessingPipeline:
         self.db_config = db_config or DatabaseConfig()
         self.db_manager = get_db_manager(self.db_config)
 
+        self.normalization_config = NormalizationConfig(
+            max_workers=self.parser_config.normalization_workers,
+            strict_validation=self.parser_config.strict_mode,
+            spill_to_disk=self.parser_config.normalization_spill,
+            spill_dir=self.parser_config.normalization_spill_dir,
+        )
+        self.normalization_cache: Optional[NormalizationCache] = None
+        if self.parser_config.normalization_cache_dir:
+            self.normalization_cache = NormalizationCache(
+                self.parser_config.normalization_cache_dir,
+                max_size_mb=self.parser_config.normalization_cache_max_mb,
+            )
+
         # Initialize stages
         self.stages: List[ProcessingStage] = [
             ParsingStage(self.parser_config),
-            NormalizationStage(),
+            NormalizationStage(self.normalization_config),
             StorageStage(self.db_manager),
         ]
 
@@ -395,10 +425,21 @@ class SwaggerProcessingPipeline:
 
         executed_stages = []
         current_data = file_path
+        stages = self.stages
 
         try:
+            cached_result = self._load_cached_normalization(context)
+            if cached_result is not None:
+                # Unchanged specification: skip parsing and normalization
+                current_data = cached_result
+                stages = [
+                    stage
+                    for stage in self.stages
+                    if stage.name not in ("parsing", "normalization")
+                ]
+
             # Execute each stage in sequence
-            for stage in self.stages:
+            for stage in stages:
                 self.logger.debug(f"Executing stage: {stage.name}")
 
                 stage_result = await stage.execute(current_data, context)
@@ -416,11 +457,24 @@ class SwaggerProcessingPipeline:
                         errors=stage_result.errors,
                     )
 
+                if (
+                    stage.name == "normalization"
+                    and self.normalization_cache
+                    and not stage_result.data.is_spilled
+                ):
+                    self.normalization_cache.put(
+                        context.file_hash,
+                        stage_result.data,
+                        self.normalization_config,
+                        dependencies=self._referenced_files(context, stage_result.data),
+                    )
+
                 # Update metrics and pass data to next stage
                 context.metrics.warnings_count += len(stage_result.warnings)
                 current_data = stage_result.data
 
             # All stages completed successfully
+            deferred_warnings = await self._collect_deferred_validation(context)
             context.metrics.calculate_total_duration()
 
             self.logger.info(
@@ -433,6 +487,7 @@ class SwaggerProcessingPipeline:
                 api_id=context.api_id,
                 file_path=file_path,
                 metrics=context.metrics,
+                warnings=deferred_warnings,
             )
 
         except Exception as e:
@@ -452,6 +507,77 @@ class SwaggerProcessingPipeline:
                 errors=[f"Pipeline failed: {str(e)}"],
             )
 
+        finally:
+            normalization_result = context.stage_results.get("normalization")
+            if isinstance(normalization_result, NormalizationResult):
+                # Deletes the on-disk store of a spilled result
+                normalization_result.close()
+
+    @staticmethod
+    def _referenced_files(
+        context: PipelineContext, normalization_result: NormalizationResult
+    ) -> List[Path]:
+        """Get the files besides the specification a result was built from."""
+        referenced_files = list(
+            getattr(context.stage_results.get("parsing"), "referenced_files", [])
+        )
+        referenced_files.extend(normalization_result.referenced_files)
+        return referenced_files
+
+    def _load_cached_normalization(
+        self, context: PipelineContext
+    ) -> Optional[NormalizationResult]:
+        """Load the cached normalization result for the context's file."""
+        if not self.normalization_cache:
+            return None
+
+        cached_result = self.normalization_cache.get(
+            context.file_hash, self.normalization_config
+        )
+        if cached_result is None:
+            return None
+
+        context.stage_results["normalization"] = cached_result
+        context.metrics.normalization_cache_hit = True
+        context.metrics.file_size_bytes = Path(context.file_path).stat().st_size
+        context.metrics.endpoints_processed = len(cached_result.endpoints)
+        context.metrics.schemas_processed = len(cached_result.schemas)
+        context.metrics.security_schemes_processed = len(cached_result.security_schemes)
+        context.metrics.warnings_count += len(cached_result.warnings)
+
+        self.logger.info(f"Using cached normalization result for {context.file_path}")
+        return cached_result
+
+    async def _collect_deferred_validation(self, context: PipelineContext) -> List[str]:
+        """Wait for deferred full validation of the processed specification.
+
+        The data is already stored, so validation problems found after the
+        fact are reported as warnings.
+        """
+        parse_result = context.stage_results.get("parsing")
+        if not isinstance(parse_result, ParseResult):
+            return []
+        if parse_result.deferred_validation is None:
+            return []
+
+        validation_result = await parse_result.deferred_validation.result()
+        context.metrics.validation_duration = (
+            validation_result.validation_duration_ms / 1000
+        )
+        context.metrics.warnings_count += len(validation_result.errors) + len(
+            validation_result.warnings
+        )
+
+        self.logger.info(
+            f"Deferred validation completed for {context.file_path} "
+            f"({'valid' if validation_result.is_valid else 'invalid'})"
+        )
+
+        return [
+            f"Deferred validation: {issue.message}"
+            for issue in validation_result.errors + validation_result.warnings
+        ]
+
     async def _rollback_stages(
         self, stages: List[ProcessingStage], context: PipelineContext
     ) -> None:
@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set
 from urllib.parse import urlparse
 
+from ..parser.tokenizer import Tokenizer
+
 
 @dataclass
 class EndpointSearchDocument:
@@ -107,6 +109,9 @@ class EndpointDocumentProcessor:
         "with",
     }
 
+    # Keywords are whole words of three or more characters
+    KEYWORD_TOKENIZER = Tokenizer(stop_words=STOP_WORDS, min_length=3, stemmer=None)
+
     def __init__(self):
         """Initialize the endpoint document processor."""
         pass
@@ -550,9 +555,8 @@ class EndpointDocumentProcessor:
         """
         keywords = set()
 
-        # Extract from text using simple tokenization
-        words = re.findall(r"\b[a-zA-Z]{3,}\b", searchable_text.lower())
-        keywords.update(word for word in words if word not in self.STOP_WORDS)
+        # Extract from text
+        keywords.update(self.KEYWORD_TOKENIZER.tokenize(searchable_text))
 
         # Add path segments if path exists
         path = endpoint_data.get("path")
@@ -575,9 +579,7 @@ class EndpointDocumentProcessor:
         )
         if operation_id:
             # Split camelCase and snake_case
-            words = re.sub(r"([a-z])([A-Z])", r"\1 \2", operation_id)
-            words = words.replace("_", " ").replace("-", " ")
-            keywords.update(word.lower() for word in words.split() if len(word) > 2)
+            keywords.update(self.KEYWORD_TOKENIZER.tokenize(operation_id))
 
         return sorted(list(keywords))
 
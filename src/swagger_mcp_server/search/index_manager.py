@@ -193,6 +193,44 @@ class SearchIndexManager:
         """
         return await self._remove_document(endpoint_id)
 
+    async def apply_endpoint_changes(
+        self,
+        updated_endpoints: List[Dict[str, Any]],
+        removed_endpoint_ids: List[str],
+    ) -> Tuple[int, int]:
+        """Apply incremental endpoint changes in a single index write.
+
+        Args:
+            updated_endpoints: Endpoint data of added or changed endpoints
+            removed_endpoint_ids: IDs of endpoints deleted from the database
+
+        Returns:
+            Tuple[int, int]: (documents_updated, documents_removed)
+
+        Raises:
+            RuntimeError: If the index update fails
+        """
+        documents = []
+        for endpoint_data in updated_endpoints:
+            document = await self._create_search_document(endpoint_data)
+            if validate_schema_fields(document):
+                documents.append(document)
+
+        try:
+            removed_count = 0
+            with self.index.writer() as writer:
+                for endpoint_id in removed_endpoint_ids:
+                    removed_count += writer.delete_by_term(
+                        "endpoint_id", str(endpoint_id)
+                    )
+                for document in documents:
+                    writer.update_document(**document)
+
+            return len(documents), removed_count
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to apply endpoint changes: {e}") from e
+
     async def get_index_stats(self) -> Dict[str, Any]:
         """Get statistics about the current search index.
 
@@ -21,8 +21,6 @@ from typing import Dict, List, Optional, Set, Tuple, Union
 try:
     import nltk
     from nltk.corpus import stopwords
-    from nltk.stem import PorterStemmer
-    from nltk.tokenize import word_tokenize
 
     NLTK_AVAILABLE = True
 except ImportError:
@@ -35,6 +33,7 @@ from whoosh.qparser import MultifieldParser, QueryParser
 from whoosh.query import And, FuzzyTerm, Not, Or, Query, Term, Wildcard
 
 from ..config.settings import SearchConfig
+from ..parser.tokenizer import Tokenizer
 
 
 @dataclass
@@ -77,16 +76,22 @@ class QueryProcessor:
         # Initialize NLP components if available
         if NLTK_AVAILABLE:
             try:
-                self.stemmer = PorterStemmer()
                 self.stop_words = set(stopwords.words("english"))
             except Exception as e:
                 self.logger.warning(f"Failed to initialize NLTK components: {e}")
-                self.stemmer = None
                 self.stop_words = set()
         else:
-            self.stemmer = None
             self.stop_words = set()
 
+        # Query terms are stemmed with the tokenizer's default stemmer, as
+        # the indexed documents are, but replaced by their stems rather
+        # than expanded; a stem always occurs among the document terms
+        self.tokenizer = Tokenizer(
+            stop_words=self.stop_words,
+            min_length=1,
+            expand_stems=False,
+        )
+
         # Load API-specific terminology and synonyms
         self.api_terms = self._load_api_terminology()
         self.synonym_map = self._load_synonym_map()
@@ -351,33 +356,8 @@ class QueryProcessor:
         if not query:
             return []
 
-        # Tokenize
-        if NLTK_AVAILABLE and hasattr(self, "stemmer"):
-            try:
-                tokens = word_tokenize(query.lower())
-            except:
-                tokens = query.lower().split()
-        else:
-            tokens = query.lower().split()
-
-        # Remove stopwords and apply stemming
-        normalized = []
-        for token in tokens:
-            # Skip stopwords
-            if token in self.stop_words:
-                continue
-
-            # Apply stemming if available
-            if self.stemmer:
-                try:
-                    stemmed = self.stemmer.stem(token)
-                    normalized.append(stemmed)
-                except:
-                    normalized.append(token)
-            else:
-                normalized.append(token)
-
-        return normalized
+        # Tokenize, remove stopwords and apply stemming
+        return self.tokenizer.tokenize(query)
 
     def _determine_query_type(
         self,
@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from rank_bm25 import BM25L, BM25Okapi, BM25Plus
 
 from ..config.settings import SearchConfig
+from ..parser.tokenizer import Tokenizer
 
 
 @dataclass
@@ -35,6 +36,7 @@ class RelevanceRanker:
         """
         self.config = config
         self.bm25_instances: Dict[str, Any] = {}
+        self.tokenizer = Tokenizer()
 
     def train_bm25_models(self, corpus: Dict[str, List[str]]) -> None:
         """Train BM25 models for different document fields.
@@ -45,7 +47,7 @@ class RelevanceRanker:
         for field_name, documents in corpus.items():
             if documents:
                 # Tokenize documents for BM25
-                tokenized_docs = [doc.lower().split() for doc in documents]
+                tokenized_docs = self.tokenizer.tokenize_many(documents)
 
                 # Use BM25Plus for better handling of long documents
                 self.bm25_instances[field_name] = BM25Plus(
@@ -75,6 +77,11 @@ class RelevanceRanker:
         boost_factors = {}
         total_score = 0.0
 
+        # Query terms go through the same tokenizer as the documents
+        query_tokens = [
+            token for term in query_terms for token in self.tokenizer.tokenize(term)
+        ]
+
         # Base field weights from configuration
         field_weights = {
             "endpoint_path": 1.5,
@@ -88,17 +95,18 @@ class RelevanceRanker:
         # Calculate BM25 scores for each field
         for field_name, weight in field_weights.items():
             if field_name in document and document[field_name]:
-                field_content = str(document[field_name]).lower()
-                field_tokens = field_content.split()
+                field_tokens = self.tokenizer.tokenize(str(document[field_name]))
 
                 # Use trained BM25 model if available
                 if field_name in self.bm25_instances:
                     bm25_score = self._calculate_bm25_score(
-                        query_terms, field_tokens, field_name
+                        query_tokens, field_tokens, field_name
                     )
                 else:
                     # Fallback to simple TF-IDF-like scoring
-                    bm25_score = self._calculate_simple_score(query_terms, field_tokens)
+                    bm25_score = self._calculate_simple_score(
+                        query_tokens, field_tokens
+                    )
 
                 field_scores[field_name] = bm25_score
                 total_score += bm25_score * weight
@@ -1,6 +1,7 @@
 """Storage layer for OpenAPI data persistence and retrieval."""
 
 from swagger_mcp_server.storage.backup import BackupManager
+from swagger_mcp_server.storage.bulk_loader import BulkLoader, BulkLoadStats
 from swagger_mcp_server.storage.database import (
     DatabaseConfig,
     DatabaseManager,
@@ -27,6 +28,8 @@ __all__ = [
     "DatabaseManager",
     "DatabaseConfig",
     "get_db_manager",
+    "BulkLoader",
+    "BulkLoadStats",
     # Models
     "APIMetadata",
     "Endpoint",
@@ -0,0 +1,400 @@
+"""Bulk loading of conversion results into the database.
+
+Creating one ORM object per row and flushing it through a repository costs a
+round trip, an identity-map entry and a refresh for every endpoint and
+schema. ``BulkLoader`` instead buffers plain row dictionaries and writes them
+with Core ``executemany`` inserts, all inside a single transaction, while
+SQLite runs with load-optimized pragmas. Full-text indexes and the tag index
+are not updated row by row: their triggers are suspended and every row is
+indexed in one statement at the end of the load.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from swagger_mcp_server.config.logging import get_logger
+from swagger_mcp_server.storage.database import DatabaseManager
+from swagger_mcp_server.storage.models import (
+    ENDPOINT_TAGS_REINDEX_SQL,
+    ENDPOINT_TAGS_TRIGGERS,
+    ENDPOINTS_FTS_REINDEX_SQL,
+    ENDPOINTS_FTS_TRIGGERS,
+    FTS_TRIGGER_NAMES,
+    SCHEMAS_FTS_REINDEX_SQL,
+    SCHEMAS_FTS_TRIGGERS,
+)
+
+logger = get_logger(__name__)
+
+# Rows buffered per table before they are written in one executemany call
+DEFAULT_BATCH_SIZE = 1000
+
+# Page cache during the load, in KiB (negative cache_size values are sizes
+# rather than page counts)
+DEFAULT_CACHE_SIZE_KIB = 64 * 1024
+
+# Pragmas saved before and restored after the load, in restore order
+RESTORED_PRAGMAS = ("journal_mode", "synchronous", "cache_size")
+
+# FTS5 table -> (statement indexing all rows, triggers keeping it in sync)
+FTS_INDEXES = {
+    "endpoints_fts": (ENDPOINTS_FTS_REINDEX_SQL, ENDPOINTS_FTS_TRIGGERS),
+    "schemas_fts": (SCHEMAS_FTS_REINDEX_SQL, SCHEMAS_FTS_TRIGGERS),
+}
+
+ENDPOINT_TAGS_TRIGGER_NAMES = (
+    "endpoint_tags_insert",
+    "endpoint_tags_delete",
+    "endpoint_tags_update",
+)
+
+
+@dataclass
+class BulkLoadStats:
+    """Rows written by a bulk load and its throughput."""
+
+    rows_by_table: Dict[str, int] = field(default_factory=dict)
+    batches: int = 0
+    duration_seconds: float = 0.0
+    fts_reindex_seconds: float = 0.0
+    tag_reindex_seconds: float = 0.0
+
+    @property
+    def rows_inserted(self) -> int:
+        """Total number of rows written."""
+        return sum(self.rows_by_table.values())
+
+    @property
+    def rows_per_second(self) -> float:
+        """Load throughput."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.rows_inserted / self.duration_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert statistics to dictionary."""
+        return {
+            "rows_inserted": self.rows_inserted,
+            "rows_by_table": dict(self.rows_by_table),
+            "batches": self.batches,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "fts_reindex_seconds": round(self.fts_reindex_seconds, 3),
+            "tag_reindex_seconds": round(self.tag_reindex_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+class BulkLoader:
+    """Loads rows in large batches inside a single transaction.
+
+    Used as an async context manager. On entry the loader switches the
+    connection to ``synchronous=OFF``, ``journal_mode=MEMORY`` and a larger
+    page cache; on exit it commits (or rolls back if the block raised) and
+    restores the previous pragmas. The in-memory journal keeps rollback
+    working, but a crash during the load can leave the database corrupt, so
+    the loader is meant for building a new database that can be rebuilt
+    from its specification.
+
+    With ``defer_fts`` the FTS5 sync triggers are dropped for the load.
+    Before committing, the loader clears the full-text indexes, indexes
+    all rows with one ``INSERT ... SELECT`` per table and merges the
+    resulting segments with the ``'optimize'`` command and reinstalls the
+    triggers in the same transaction, so the rows are never committed
+    without the triggers that keep their indexes in sync. After a rollback
+    the triggers are reinstalled as well. Building each index in
+    one pass is faster than one trigger call per row and leaves a single,
+    unfragmented segment. ``defer_tags`` does the same for the endpoint_tags
+    table, which is rebuilt from the tags of all endpoints.
+
+    Rows are dictionaries of column values. Python-side column defaults
+    (timestamps, for example) are applied as for ORM objects.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        cache_size_kib: int = DEFAULT_CACHE_SIZE_KIB,
+        defer_fts: bool = True,
+        defer_tags: bool = True,
+    ):
+        """Initialize bulk loader.
+
+        Args:
+            db_manager: Initialized database manager to load into
+            batch_size: Rows buffered per table before they are written
+            cache_size_kib: SQLite page cache size during the load
+            defer_fts: Index full-text search once at the end of the load
+                instead of through per-row triggers
+            defer_tags: Rebuild endpoint_tags once at the end of the load
+                instead of through per-row triggers
+        """
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.cache_size_kib = cache_size_kib
+        self.defer_fts = defer_fts
+        self.defer_tags = defer_tags
+        self.stats = BulkLoadStats()
+
+        self._connection: Optional[AsyncConnection] = None
+        self._saved_pragmas: Dict[str, Any] = {}
+        # FTS5 tables whose triggers are suspended
+        self._deferred_fts: List[str] = []
+        self._deferred_tags = False
+        # (model, ignore_conflicts) -> buffered rows
+        self._pending: Dict[Tuple[Type[Any], bool], List[Dict[str, Any]]] = {}
+        self._started_at = 0.0
+
+    async def __aenter__(self) -> "BulkLoader":
+        self._connection = await self.db_manager.connect()
+        try:
+            await self._configure_for_load()
+            if self.defer_fts:
+                await self._suspend_fts_triggers()
+            if self.defer_tags:
+                await self._suspend_tag_triggers()
+        except Exception:
+            await self._restore_triggers()
+            await self._restore_pragmas()
+            await self._connection.close()
+            self._connection = None
+            raise
+
+        self._started_at = time.perf_counter()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        connection = self._require_connection()
+        try:
+            if exc_type is None:
+                await self.flush()
+                await self._reindex_fts()
+                await self._reindex_tags()
+                await self._install_triggers()
+                await connection.commit()
+                self._deferred_fts = []
+                self._deferred_tags = False
+            else:
+                await connection.rollback()
+                logger.warning("Bulk load rolled back", error=str(exc_val))
+        finally:
+            self.stats.duration_seconds = time.perf_counter() - self._started_at
+            self._pending = {}
+            try:
+                await self._restore_triggers()
+                await self._restore_pragmas()
+            finally:
+                await connection.close()
+                self._connection = None
+
+        if exc_type is None:
+            logger.info("Bulk load completed", **self.stats.to_dict())
+
+    async def insert_one(self, model: Type[Any], row: Dict[str, Any]) -> int:
+        """Insert a single row immediately.
+
+        Used for parent rows whose generated key the following rows need.
+
+        Args:
+            model: Mapped model class of the table
+            row: Column values
+
+        Returns:
+            Primary key of the new row
+        """
+        result = await self._require_connection().execute(insert(model), row)
+        self._count(model, 1)
+        return result.inserted_primary_key[0]
+
+    async def add(
+        self, model: Type[Any], row: Dict[str, Any], ignore_conflicts: bool = False
+    ) -> None:
+        """Buffer a row for insertion.
+
+        All rows of a table must have the same columns.
+
+        Args:
+            model: Mapped model class of the table
+            row: Column values
+            ignore_conflicts: Skip rows violating a uniqueness constraint
+                (``INSERT OR IGNORE``) instead of failing the load
+        """
+        key = (model, ignore_conflicts)
+        rows = self._pending.setdefault(key, [])
+        rows.append(row)
+        if len(rows) >= self.batch_size:
+            await self._write(key)
+
+    async def update(self, model: Type[Any], row_id: int, values: Dict[str, Any]):
+        """Update columns of an already inserted row.
+
+        Args:
+            model: Mapped model class of the table
+            row_id: Primary key of the row
+            values: Column values to set
+        """
+        await self.flush()
+        await self._require_connection().execute(
+            update(model).where(model.id == row_id).values(**values)
+        )
+
+    async def execute(self, statement: Any) -> Any:
+        """Execute a statement in the load transaction after pending rows.
+
+        Args:
+            statement: SQLAlchemy statement
+
+        Returns:
+            Statement result
+        """
+        await self.flush()
+        return await self._require_connection().execute(statement)
+
+    async def flush(self) -> None:
+        """Write all buffered rows."""
+        for key in list(self._pending):
+            await self._write(key)
+
+    async def _write(self, key: Tuple[Type[Any], bool]) -> None:
+        """Write the buffered rows of one table in a single executemany call."""
+        rows = self._pending.pop(key, None)
+        if not rows:
+            return
+
+        model, ignore_conflicts = key
+        statement = insert(model)
+        if ignore_conflicts:
+            statement = statement.prefix_with("OR IGNORE")
+
+        result = await self._require_connection().execute(statement, rows)
+        self.stats.batches += 1
+        self._count(model, result.rowcount if ignore_conflicts else len(rows))
+
+    def _count(self, model: Type[Any], rows: int) -> None:
+        """Record rows written to a table."""
+        table = model.__tablename__
+        self.stats.rows_by_table[table] = self.stats.rows_by_table.get(table, 0) + rows
+
+    async def _configure_for_load(self) -> None:
+        """Save the current pragmas and switch to load-optimized ones."""
+        connection = self._require_connection()
+        for pragma in RESTORED_PRAGMAS:
+            result = await connection.exec_driver_sql(f"PRAGMA {pragma}")
+            self._saved_pragmas[pragma] = result.scalar()
+
+        # journal_mode can only change outside a transaction, so it is set
+        # before the first insert; MEMORY rather than OFF keeps ROLLBACK
+        await connection.exec_driver_sql("PRAGMA journal_mode=MEMORY")
+        await connection.exec_driver_sql("PRAGMA synchronous=OFF")
+        await connection.exec_driver_sql(
+            f"PRAGMA cache_size=-{int(self.cache_size_kib)}"
+        )
+        await connection.commit()
+
+    async def _suspend_fts_triggers(self) -> None:
+        """Drop the sync triggers of the existing FTS5 tables."""
+        connection = self._require_connection()
+        for table in FTS_INDEXES:
+            result = await connection.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (table,),
+            )
+            if result.scalar() is None:
+                # Full-text search disabled or unavailable
+                continue
+
+            for trigger_name in FTS_TRIGGER_NAMES:
+                if trigger_name.startswith(f"{table}_"):
+                    await connection.exec_driver_sql(
+                        f"DROP TRIGGER IF EXISTS {trigger_name}"
+                    )
+            self._deferred_fts.append(table)
+
+    async def _reindex_fts(self) -> None:
+        """Index all rows of the deferred FTS5 tables and merge segments."""
+        if not self._deferred_fts:
+            return
+
+        started_at = time.perf_counter()
+        connection = self._require_connection()
+        for table in self._deferred_fts:
+            reindex_sql, _ = FTS_INDEXES[table]
+            await connection.exec_driver_sql(
+                f"INSERT INTO {table}({table}) VALUES ('delete-all')"
+            )
+            await connection.exec_driver_sql(reindex_sql)
+            await connection.exec_driver_sql(
+                f"INSERT INTO {table}({table}) VALUES ('optimize')"
+            )
+        self.stats.fts_reindex_seconds = time.perf_counter() - started_at
+
+    async def _suspend_tag_triggers(self) -> None:
+        """Drop the triggers maintaining endpoint_tags."""
+        connection = self._require_connection()
+        for trigger_name in ENDPOINT_TAGS_TRIGGER_NAMES:
+            await connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger_name}")
+        self._deferred_tags = True
+
+    async def _reindex_tags(self) -> None:
+        """Rebuild endpoint_tags from the tags of all endpoints."""
+        if not self._deferred_tags:
+            return
+
+        started_at = time.perf_counter()
+        connection = self._require_connection()
+        await connection.exec_driver_sql("DELETE FROM endpoint_tags")
+        await connection.exec_driver_sql(ENDPOINT_TAGS_REINDEX_SQL)
+        self.stats.tag_reindex_seconds = time.perf_counter() - started_at
+
+    async def _install_triggers(self) -> None:
+        """Recreate the suspended triggers in the current transaction."""
+        connection = self._require_connection()
+        for table in self._deferred_fts:
+            _, triggers = FTS_INDEXES[table]
+            for trigger_sql in triggers:
+                await connection.exec_driver_sql(trigger_sql)
+        if self._deferred_tags:
+            for trigger_sql in ENDPOINT_TAGS_TRIGGERS:
+                await connection.exec_driver_sql(trigger_sql)
+
+    async def _restore_triggers(self) -> None:
+        """Reinstall triggers still suspended after a failed load."""
+        if not self._deferred_fts and not self._deferred_tags:
+            return
+
+        connection = self._require_connection()
+        try:
+            await self._install_triggers()
+            await connection.commit()
+        except Exception as e:
+            logger.error(
+                "Failed to reinstall index triggers",
+                fts_tables=self._deferred_fts,
+                endpoint_tags=self._deferred_tags,
+                error=str(e),
+            )
+            raise
+        self._deferred_fts = []
+        self._deferred_tags = False
+
+    async def _restore_pragmas(self) -> None:
+        """Restore the pragmas saved before the load."""
+        connection = self._require_connection()
+        try:
+            for pragma in RESTORED_PRAGMAS:
+                value = self._saved_pragmas.get(pragma)
+                if value is not None:
+                    await connection.exec_driver_sql(f"PRAGMA {pragma}={value}")
+            await connection.commit()
+        except Exception as e:
+            logger.warning("Failed to restore SQLite pragmas", error=str(e))
+
+    def _require_connection(self) -> AsyncConnection:
+        """Get the load connection, failing outside the context manager."""
+        if self._connection is None:
+            raise RuntimeError("Bulk loader is not active")
+        return self._connection
@@ -11,6 +11,7 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 import aiosqlite
 from sqlalchemy import create_engine, event, select
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -19,8 +20,11 @@ from sqlalchemy.pool import StaticPool
 
 from swagger_mcp_server.config.logging import get_logger
 from swagger_mcp_server.storage.models import (
+    ENDPOINT_TAGS_REINDEX_SQL,
+    ENDPOINT_TAGS_TRIGGERS,
     ENDPOINTS_FTS_SQL,
     ENDPOINTS_FTS_TRIGGERS,
+    REPLACED_FTS_TRIGGERS,
     SCHEMAS_FTS_SQL,
     SCHEMAS_FTS_TRIGGERS,
     Base,
@@ -121,6 +125,8 @@ class DatabaseManager:
                 async with self._engine.begin() as conn:
                     await conn.run_sync(Base.metadata.create_all)
 
+                await self._setup_tag_index()
+
                 # Setup FTS5 tables if enabled
                 if self.config.enable_fts:
                     await self._setup_fts()
@@ -165,6 +171,27 @@ class DatabaseManager:
 
             await conn.commit()
 
+    async def _setup_tag_index(self) -> None:
+        """Setup the triggers maintaining the endpoint_tags table.
+
+        Databases created before the table existed are indexed once, when
+        the triggers are first installed.
+        """
+        async with aiosqlite.connect(self.config.database_path) as conn:
+            cursor = await conn.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'trigger' AND name = 'endpoint_tags_insert'"
+            )
+            installed = await cursor.fetchone() is not None
+
+            for trigger_sql in ENDPOINT_TAGS_TRIGGERS:
+                await conn.execute(trigger_sql)
+
+            if not installed:
+                await conn.execute(ENDPOINT_TAGS_REINDEX_SQL)
+
+            await conn.commit()
+
     async def _setup_fts(self) -> None:
         """Setup FTS5 virtual tables and triggers."""
         async with aiosqlite.connect(self.config.database_path) as conn:
@@ -173,6 +200,11 @@ class DatabaseManager:
                 await conn.execute(ENDPOINTS_FTS_SQL)
                 await conn.execute(SCHEMAS_FTS_SQL)
 
+                # Replace delete/update triggers created by older versions,
+                # which wrote to the external-content FTS tables directly
+                for trigger_name in REPLACED_FTS_TRIGGERS:
+                    await conn.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+
                 # Create triggers to keep FTS in sync
                 for trigger_sql in ENDPOINTS_FTS_TRIGGERS:
                     await conn.execute(trigger_sql)
@@ -240,6 +272,16 @@ class DatabaseManager:
             finally:
                 await session.close()
 
+    async def connect(self) -> AsyncConnection:
+        """Open a Core connection on the database engine.
+
+        The caller owns the connection and must close it.
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        return await self._engine.connect()
+
     async def execute_raw_sql(self, sql: str, params: Optional[tuple] = None) -> Any:
         """Execute raw SQL query."""
         async with aiosqlite.connect(self.config.database_path) as conn:
@@ -151,6 +151,20 @@ class MigrationManager:
                 up_sql=self._get_epic6_categories_upgrade_sql(),
                 down_sql=self._get_epic6_categories_downgrade_sql(),
             ),
+            Migration(
+                version="005",
+                name="endpoint_category_links",
+                description="Add join table linking endpoints to categories",
+                up_sql=self._get_category_links_upgrade_sql(),
+                down_sql=self._get_category_links_downgrade_sql(),
+            ),
+            Migration(
+                version="006",
+                name="endpoint_tags",
+                description="Add indexed table of endpoint tags",
+                up_sql=self._get_endpoint_tags_upgrade_sql(),
+                down_sql=self._get_endpoint_tags_downgrade_sql(),
+            ),
         ]
         return migrations
 
@@ -938,3 +952,71 @@ class MigrationManager:
             WHERE rowid = new.id;
         END;
         """
+
+    def _get_category_links_upgrade_sql(self) -> str:
+        """Get SQL adding the endpoint_category_links join table.
+
+        Existing endpoints are linked to the category of their first tag,
+        normalized like the categorization engine does
+        ("Search-Promo" -> "search_promo").
+        """
+        return """
+        CREATE TABLE IF NOT EXISTS endpoint_category_links (
+            category_id INTEGER NOT NULL REFERENCES endpoint_categories(id) ON DELETE CASCADE,
+            endpoint_id INTEGER NOT NULL REFERENCES endpoints(id) ON DELETE CASCADE,
+            PRIMARY KEY (category_id, endpoint_id)
+        ) WITHOUT ROWID;
+
+        CREATE INDEX IF NOT EXISTS ix_category_links_endpoint
+            ON endpoint_category_links(endpoint_id, category_id);
+
+        -- Tags may be stored as a JSON array or as a JSON-encoded string of one
+        INSERT OR IGNORE INTO endpoint_category_links (category_id, endpoint_id)
+        SELECT ec.id, e.id
+        FROM endpoints e
+        JOIN endpoint_categories ec
+          ON ec.api_id = e.api_id
+         AND ec.category_name = LOWER(REPLACE(REPLACE(
+                 json_extract(json_extract(e.tags, '$'), '$[0]'), '-', '_'), ' ', '_'));
+        """
+
+    def _get_category_links_downgrade_sql(self) -> str:
+        """Get SQL dropping the endpoint_category_links join table."""
+        return """
+        DROP INDEX IF EXISTS ix_category_links_endpoint;
+        DROP TABLE IF EXISTS endpoint_category_links;
+        """
+
+    def _get_endpoint_tags_upgrade_sql(self) -> str:
+        """Get SQL adding the endpoint_tags table, its triggers and rows."""
+        from swagger_mcp_server.storage.models import (
+            ENDPOINT_TAGS_REINDEX_SQL,
+            ENDPOINT_TAGS_TRIGGERS,
+        )
+
+        sql_parts = [
+            """
+        CREATE TABLE IF NOT EXISTS endpoint_tags (
+            endpoint_id INTEGER NOT NULL REFERENCES endpoints(id) ON DELETE CASCADE,
+            tag VARCHAR(255) COLLATE NOCASE NOT NULL,
+            PRIMARY KEY (endpoint_id, tag)
+        ) WITHOUT ROWID;
+
+        CREATE INDEX IF NOT EXISTS ix_endpoint_tags_tag
+            ON endpoint_tags(tag, endpoint_id);
+        """,
+            *ENDPOINT_TAGS_TRIGGERS,
+            ENDPOINT_TAGS_REINDEX_SQL,
+        ]
+
+        return "\n\n".join(sql_parts)
+
+    def _get_endpoint_tags_downgrade_sql(self) -> str:
+        """Get SQL dropping the endpoint_tags table and its triggers."""
+        return """
+        DROP TRIGGER IF EXISTS endpoint_tags_insert;
+        DROP TRIGGER IF EXISTS endpoint_tags_delete;
+        DROP TRIGGER IF EXISTS endpoint_tags_update;
+        DROP INDEX IF EXISTS ix_endpoint_tags_tag;
+        DROP TABLE IF EXISTS endpoint_tags;
+        """
@@ -490,6 +490,67 @@ class EndpointCategory(Base, TimestampMixin):
         }
 
 
+class EndpointCategoryLink(Base):
+    """Links endpoints to the categories of the catalog.
+
+    Populated at conversion time from the categorization phase, so that
+    category and category group filters are indexed joins. The composite
+    primary key (a clustered WITHOUT ROWID table) covers lookups by
+    category; ix_category_links_endpoint covers lookups by endpoint.
+    """
+
+    __tablename__ = "endpoint_category_links"
+
+    category_id = Column(
+        Integer,
+        ForeignKey("endpoint_categories.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    endpoint_id = Column(
+        Integer,
+        ForeignKey("endpoints.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # Constraints and indexes
+    __table_args__ = (
+        Index("ix_category_links_endpoint", "endpoint_id", "category_id"),
+        {"sqlite_with_rowid": False},
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert model to dictionary."""
+        return {"category_id": self.category_id, "endpoint_id": self.endpoint_id}
+
+
+class EndpointTag(Base):
+    """Indexes the tags of each endpoint.
+
+    Maintained from endpoints.tags by the ENDPOINT_TAGS_TRIGGERS, so that tag
+    filters are index lookups instead of pattern matches on the JSON column.
+    Tags compare case-insensitively, like the LIKE patterns they replace.
+    """
+
+    __tablename__ = "endpoint_tags"
+
+    endpoint_id = Column(
+        Integer,
+        ForeignKey("endpoints.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    tag = Column(String(255, collation="NOCASE"), primary_key=True)
+
+    # Constraints and indexes
+    __table_args__ = (
+        Index("ix_endpoint_tags_tag", "tag", "endpoint_id"),
+        {"sqlite_with_rowid": False},
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert model to dictionary."""
+        return {"endpoint_id": self.endpoint_id, "tag": self.tag}
+
+
 # FTS5 Virtual Table SQL (to be created separately)
 ENDPOINTS_FTS_SQL = """
 CREATE VIRTUAL TABLE IF NOT EXISTS endpoints_fts USING fts5(
@@ -520,7 +581,9 @@ CREATE VIRTUAL TABLE IF NOT EXISTS schemas_fts USING fts5(
 );
 """
 
-# Triggers to keep FTS5 tables in sync
+# Triggers to keep FTS5 tables in sync. The FTS tables use external content,
+# so stale rows must be removed with the 'delete' command and the old values
+# (a plain DELETE/UPDATE on the FTS table corrupts the index).
 ENDPOINTS_FTS_TRIGGERS = [
     """
     CREATE TRIGGER IF NOT EXISTS endpoints_fts_insert AFTER INSERT ON endpoints
@@ -533,22 +596,20 @@ ENDPOINTS_FTS_TRIGGERS = [
     """
     CREATE TRIGGER IF NOT EXISTS endpoints_fts_delete AFTER DELETE ON endpoints
     BEGIN
-        DELETE FROM endpoints_fts WHERE rowid = old.id;
+        INSERT INTO endpoints_fts(endpoints_fts, rowid, path, method, operation_id, summary, description, tags, searchable_text, category)
+        VALUES ('delete', old.id, old.path, old.method, old.operation_id, old.summary, old.description,
+                json_extract(old.tags, '$'), old.searchable_text, old.category);
     END;
     """,
     """
     CREATE TRIGGER IF NOT EXISTS endpoints_fts_update AFTER UPDATE ON endpoints
     BEGIN
-        UPDATE endpoints_fts SET
-            path = new.path,
-            method = new.method,
-            operation_id = new.operation_id,
-            summary = new.summary,
-            description = new.description,
-            tags = json_extract(new.tags, '$'),
-            searchable_text = new.searchable_text,
-            category = new.category
-        WHERE rowid = new.id;
+        INSERT INTO endpoints_fts(endpoints_fts, rowid, path, method, operation_id, summary, description, tags, searchable_text, category)
+        VALUES ('delete', old.id, old.path, old.method, old.operation_id, old.summary, old.description,
+                json_extract(old.tags, '$'), old.searchable_text, old.category);
+        INSERT INTO endpoints_fts(rowid, path, method, operation_id, summary, description, tags, searchable_text, category)
+        VALUES (new.id, new.path, new.method, new.operation_id, new.summary, new.description,
+                json_extract(new.tags, '$'), new.searchable_text, new.category);
     END;
     """,
 ]
@@ -565,19 +626,97 @@ SCHEMAS_FTS_TRIGGERS = [
     """
     CREATE TRIGGER IF NOT EXISTS schemas_fts_delete AFTER DELETE ON schemas
     BEGIN
-        DELETE FROM schemas_fts WHERE rowid = old.id;
+        INSERT INTO schemas_fts(schemas_fts, rowid, name, title, description, searchable_text, property_names)
+        VALUES ('delete', old.id, old.name, old.title, old.description, old.searchable_text,
+                json_extract(old.property_names, '$'));
     END;
     """,
     """
     CREATE TRIGGER IF NOT EXISTS schemas_fts_update AFTER UPDATE ON schemas
     BEGIN
-        UPDATE schemas_fts SET
-            name = new.name,
-            title = new.title,
-            description = new.description,
-            searchable_text = new.searchable_text,
-            property_names = json_extract(new.property_names, '$')
-        WHERE rowid = new.id;
+        INSERT INTO schemas_fts(schemas_fts, rowid, name, title, description, searchable_text, property_names)
+        VALUES ('delete', old.id, old.name, old.title, old.description, old.searchable_text,
+                json_extract(old.property_names, '$'));
+        INSERT INTO schemas_fts(rowid, name, title, description, searchable_text, property_names)
+        VALUES (new.id, new.name, new.title, new.description, new.searchable_text,
+                json_extract(new.property_names, '$'));
     END;
     """,
 ]
+
+# Names of all FTS triggers, suspended while bulk loading
+FTS_TRIGGER_NAMES = [
+    "endpoints_fts_insert",
+    "endpoints_fts_delete",
+    "endpoints_fts_update",
+    "schemas_fts_insert",
+    "schemas_fts_delete",
+    "schemas_fts_update",
+]
+
+# Set-based equivalents of the insert triggers, used to index all rows at once
+# after a bulk load. The expressions must match the triggers: the 'delete'
+# command only removes an entry when given the values that were indexed, so
+# the built-in 'rebuild' command (which reads raw JSON columns) cannot be used.
+ENDPOINTS_FTS_REINDEX_SQL = """
+INSERT INTO endpoints_fts(rowid, path, method, operation_id, summary, description, tags, searchable_text, category)
+SELECT id, path, method, operation_id, summary, description,
+       json_extract(tags, '$'), searchable_text, category
+FROM endpoints ORDER BY id;
+"""
+
+SCHEMAS_FTS_REINDEX_SQL = """
+INSERT INTO schemas_fts(rowid, name, title, description, searchable_text, property_names)
+SELECT id, name, title, description, searchable_text,
+       json_extract(property_names, '$')
+FROM schemas ORDER BY id;
+"""
+
+# Tags of an endpoint as json_each() rows. Tags may be stored as a JSON array
+# or as a JSON-encoded string holding the array; anything else has no tags.
+_TAG_VALUES_SQL = """json_each(CASE WHEN json_valid(json_extract({tags}, '$'))
+                          THEN json_extract({tags}, '$') END) AS tag_values"""
+
+# Triggers keeping endpoint_tags in sync with endpoints.tags
+ENDPOINT_TAGS_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS endpoint_tags_insert AFTER INSERT ON endpoints
+    BEGIN
+        INSERT OR IGNORE INTO endpoint_tags(endpoint_id, tag)
+        SELECT new.id, tag_values.value FROM {_TAG_VALUES_SQL.format(tags="new.tags")}
+        WHERE tag_values.type = 'text';
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS endpoint_tags_delete AFTER DELETE ON endpoints
+    BEGIN
+        DELETE FROM endpoint_tags WHERE endpoint_id = old.id;
+    END;
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS endpoint_tags_update AFTER UPDATE OF tags ON endpoints
+    BEGIN
+        DELETE FROM endpoint_tags WHERE endpoint_id = old.id;
+        INSERT OR IGNORE INTO endpoint_tags(endpoint_id, tag)
+        SELECT new.id, tag_values.value FROM {_TAG_VALUES_SQL.format(tags="new.tags")}
+        WHERE tag_values.type = 'text';
+    END;
+    """,
+]
+
+# Set-based equivalent of endpoint_tags_insert, used to index existing rows
+ENDPOINT_TAGS_REINDEX_SQL = f"""
+INSERT OR IGNORE INTO endpoint_tags(endpoint_id, tag)
+SELECT endpoints.id, tag_values.value
+FROM endpoints, {_TAG_VALUES_SQL.format(tags="endpoints.tags")}
+WHERE tag_values.type = 'text';
+"""
+
+# Triggers whose definitions were fixed; dropped on initialization so that
+# databases created by older versions get the current definitions
+REPLACED_FTS_TRIGGERS = [
+    "endpoints_fts_delete",
+    "endpoints_fts_update",
+    "schemas_fts_delete",
+    "schemas_fts_update",
+]
@@ -2,11 +2,17 @@
 
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, func, or_, select, text
+from sqlalchemy import and_, column, func, or_, select, table, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from swagger_mcp_server.config.logging import get_logger
-from swagger_mcp_server.storage.models import APIMetadata, Endpoint
+from swagger_mcp_server.storage.models import (
+    APIMetadata,
+    Endpoint,
+    EndpointCategory,
+    EndpointCategoryLink,
+    EndpointTag,
+)
 from swagger_mcp_server.storage.repositories.base import (
     BaseRepository,
     RepositoryError,
@@ -14,6 +20,54 @@ from swagger_mcp_server.storage.repositories.base import (
 
 logger = get_logger(__name__)
 
+# Endpoints carrying any of the given tags (formatted with one placeholder per
+# tag); endpoint_tags compares tags case-insensitively through its index
+TAG_MEMBERS_SQL = """
+    endpoints.id IN (
+        SELECT endpoint_tags.endpoint_id
+        FROM endpoint_tags
+        WHERE endpoint_tags.tag IN ({placeholders})
+    )
+"""
+
+# Endpoints linked to a category (column "category_name") or a category group
+# (column "category_group"); the parameter is compared case-insensitively.
+# Matching categories are looked up first so that links are read by primary
+# key range instead of scanning all links.
+CATEGORY_MEMBERS_SQL = """
+    endpoints.id IN (
+        SELECT links.endpoint_id
+        FROM endpoint_category_links links
+        WHERE links.category_id IN (
+            SELECT ec.id FROM endpoint_categories ec
+            WHERE LOWER(ec.{column}) = LOWER(?)
+        )
+    )
+"""
+
+# FTS5 table of endpoints; rank orders matches by relevance (bm25)
+ENDPOINTS_FTS = table("endpoints_fts", column("rowid"), column("rank"))
+
+# Endpoint columns read by search result cards
+RESULT_COLUMNS = (
+    Endpoint.id,
+    Endpoint.path,
+    Endpoint.method,
+    Endpoint.operation_id,
+    Endpoint.summary,
+    Endpoint.description,
+    Endpoint.tags,
+    Endpoint.parameters,
+    Endpoint.security,
+    Endpoint.deprecated,
+)
+
+# Number of endpoints linked to the category "ec"
+CATEGORY_ENDPOINT_COUNT_SQL = """(
+    SELECT COUNT(*) FROM endpoint_category_links links
+    WHERE links.category_id = ec.id
+)"""
+
 
 class EndpointRepository(BaseRepository[Endpoint]):
     """Repository for endpoint data access operations."""
@@ -73,47 +127,27 @@ class EndpointRepository(BaseRepository[Endpoint]):
                 params.extend(methods)
 
             if tags:
-                # Search in tags JSON array
-                tag_conditions = []
-                for tag in tags:
-                    tag_conditions.append("JSON_EXTRACT(endpoints.tags, '$') LIKE ?")
-                    params.append(f'%"{tag}"%')
-                if tag_conditions:
-                    conditions.append(f"({' OR '.join(tag_conditions)})")
+                # Endpoints with any of the tags, through the endpoint_tags index
+                tag_placeholders = ",".join(["?" for _ in tags])
+                conditions.append(
+                    TAG_MEMBERS_SQL.format(placeholders=tag_placeholders)
+                )
+                params.extend(tags)
 
             if deprecated is not None:
                 conditions.append("endpoints.deprecated = ?")
                 params.append(deprecated)
 
-            # Epic 6: Category filtering using JOIN with endpoint_categories table
-            # Match category by finding tag in endpoints that matches category_name
-            # Tags are stored as JSON strings like ["Campaign"] or ["Ad", "Edit"]
-            # Categories are normalized (lowercase, underscores): "campaign", "ad", "search_promo"
-            # Tags use Title-Case: "Campaign", "Ad", "Search-Promo"
+            # Epic 6: Category filtering through the endpoint_category_links
+            # join table (indexed, no per-row tag matching)
             if category:
-                conditions.append("""
-                    EXISTS (
-                        SELECT 1 FROM endpoint_categories ec
-                        WHERE ec.api_id = endpoints.api_id
-                          AND LOWER(ec.category_name) = LOWER(?)
-                          AND (
-                              endpoints.tags LIKE '%' || UPPER(SUBSTR(ec.category_name, 1, 1)) || SUBSTR(REPLACE(ec.category_name, '_', '-'), 2) || '%'
-                          )
-                    )
-                """)
+                conditions.append(CATEGORY_MEMBERS_SQL.format(column="category_name"))
                 params.append(category)
 
             if category_group:
-                conditions.append("""
-                    EXISTS (
-                        SELECT 1 FROM endpoint_categories ec
-                        WHERE ec.api_id = endpoints.api_id
-                          AND LOWER(ec.category_group) = LOWER(?)
-                          AND (
-                              endpoints.tags LIKE '%' || UPPER(SUBSTR(ec.category_name, 1, 1)) || SUBSTR(REPLACE(ec.category_name, '_', '-'), 2) || '%'
-                          )
-                    )
-                """)
+                conditions.append(
+                    CATEGORY_MEMBERS_SQL.format(column="category_group")
+                )
                 params.append(category_group)
 
             if conditions:
@@ -129,9 +163,9 @@ class EndpointRepository(BaseRepository[Endpoint]):
             endpoints = []
             for row in rows:
                 endpoint = Endpoint()
-                for i, column in enumerate(result.keys()):
-                    if hasattr(endpoint, column):
-                        setattr(endpoint, column, row[i])
+                for i, key in enumerate(result.keys()):
+                    if hasattr(endpoint, key):
+                        setattr(endpoint, key, row[i])
                 endpoints.append(endpoint)
 
             self.logger.debug(
@@ -153,7 +187,7 @@ class EndpointRepository(BaseRepository[Endpoint]):
                 query, api_id, methods, tags, deprecated, category, category_group, limit, offset
             )
 
-    async def _like_search_endpoints(
+    async def search_endpoints_paginated(
         self,
         query: str,
         api_id: Optional[int] = None,
@@ -162,17 +196,165 @@ class EndpointRepository(BaseRepository[Endpoint]):
         deprecated: Optional[bool] = None,
         category: Optional[str] = None,
         category_group: Optional[str] = None,
-        limit: int = 50,
+        limit: int = 20,
         offset: int = 0,
-    ) -> List[Endpoint]:
-        """Fallback search using LIKE operations. Epic 6: Enhanced with category filtering."""
-        stmt = select(Endpoint)
+    ) -> Dict[str, Any]:
+        """Search one page of endpoints together with the total match count.
 
-        # Text search conditions
-        search_terms = query.split()
+        The page and the exact total come from a single query: every row
+        carries ``COUNT(*) OVER ()``, evaluated over all matches before
+        LIMIT/OFFSET apply. Only a page past the last match needs a separate
+        count. Rows are projected to RESULT_COLUMNS, so the returned
+        endpoints are detached and leave the other attributes unset.
+
+        Args:
+            query: Full-text query; empty to filter only
+            api_id: Restrict to one API
+            methods: HTTP methods to include
+            tags: Tags of which endpoints must carry at least one
+            deprecated: Filter by deprecation status
+            category: Category name (case-insensitive)
+            category_group: Category group name (case-insensitive)
+            limit: Page size
+            offset: Number of matches to skip
+
+        Returns:
+            Dictionary with the page's "endpoints" and the "total_count" of
+            matches
+        """
+        try:
+            conditions = self._search_conditions(
+                api_id, methods, tags, deprecated, category, category_group
+            )
+
+            if not query.strip():
+                stmt = self._result_select(conditions).order_by(
+                    Endpoint.path, Endpoint.method, Endpoint.id
+                )
+                return await self._fetch_page(stmt, limit, offset)
+
+            try:
+                stmt = (
+                    self._result_select(conditions)
+                    .join(ENDPOINTS_FTS, ENDPOINTS_FTS.c.rowid == Endpoint.id)
+                    .where(text("endpoints_fts MATCH :query").bindparams(query=query))
+                    .order_by(ENDPOINTS_FTS.c.rank, Endpoint.id)
+                )
+                return await self._fetch_page(stmt, limit, offset)
+            except Exception as e:
+                # Invalid FTS5 syntax or full-text search unavailable
+                self.logger.warning(
+                    "FTS search failed, falling back to LIKE search",
+                    query=query,
+                    error=str(e),
+                )
+
+            stmt = (
+                self._result_select(conditions)
+                .where(and_(*self._text_conditions(query)))
+                .order_by(Endpoint.path, Endpoint.method, Endpoint.id)
+            )
+            return await self._fetch_page(stmt, limit, offset)
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to search endpoints",
+                query=query,
+                limit=limit,
+                offset=offset,
+                error=str(e),
+            )
+            raise RepositoryError(f"Failed to search endpoints: {str(e)}")
+
+    @staticmethod
+    def _result_select(conditions: List[Any]) -> Any:
+        """Select result columns and the total match count of each row."""
+        return select(
+            *RESULT_COLUMNS, func.count().over().label("total_count")
+        ).where(*conditions)
+
+    async def _fetch_page(self, stmt: Any, limit: int, offset: int) -> Dict[str, Any]:
+        """Execute a result select for one page.
+
+        Args:
+            stmt: Statement from _result_select, ordered
+            limit: Page size
+            offset: Number of matches to skip
+
+        Returns:
+            Dictionary with "endpoints" and "total_count"
+        """
+        result = await self.session.execute(stmt.limit(limit).offset(offset))
+        rows = result.all()
+
+        if rows:
+            total_count = rows[0].total_count
+        elif offset > 0:
+            # Past the last match no row carries the window count
+            count_stmt = select(func.count()).select_from(
+                stmt.with_only_columns(Endpoint.id).order_by(None).subquery()
+            )
+            total_count = (await self.session.execute(count_stmt)).scalar_one()
+        else:
+            total_count = 0
+
+        endpoints = []
+        for row in rows:
+            values = dict(row._mapping)
+            values.pop("total_count")
+            endpoints.append(Endpoint(**values))
+
+        self.logger.debug(
+            "Endpoint page searched",
+            found=len(endpoints),
+            total_count=total_count,
+            offset=offset,
+        )
+
+        return {"endpoints": endpoints, "total_count": total_count}
+
+    def _search_conditions(
+        self,
+        api_id: Optional[int] = None,
+        methods: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        deprecated: Optional[bool] = None,
+        category: Optional[str] = None,
+        category_group: Optional[str] = None,
+    ) -> List[Any]:
+        """Build the filter conditions shared by the search paths."""
+        conditions = []
+
+        if api_id:
+            conditions.append(Endpoint.api_id == api_id)
+
+        if methods:
+            conditions.append(Endpoint.method.in_(methods))
+
+        if tags:
+            conditions.append(self._tag_members(tags))
+
+        if deprecated is not None:
+            conditions.append(Endpoint.deprecated == deprecated)
+
+        if category:
+            conditions.append(
+                self._category_members(EndpointCategory.category_name, category)
+            )
+
+        if category_group:
+            conditions.append(
+                self._category_members(EndpointCategory.category_group, category_group)
+            )
+
+        return conditions
+
+    @staticmethod
+    def _text_conditions(query: str) -> List[Any]:
+        """Conditions matching every term of a query with LIKE patterns."""
         text_conditions = []
 
-        for term in search_terms:
+        for term in query.split():
             term_pattern = f"%{term}%"
             term_conditions = or_(
                 Endpoint.path.ilike(term_pattern),
@@ -183,6 +365,26 @@ class EndpointRepository(BaseRepository[Endpoint]):
             )
             text_conditions.append(term_conditions)
 
+        return text_conditions
+
+    async def _like_search_endpoints(
+        self,
+        query: str,
+        api_id: Optional[int] = None,
+        methods: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        deprecated: Optional[bool] = None,
+        category: Optional[str] = None,
+        category_group: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Endpoint]:
+        """Fallback search using LIKE operations. Epic 6: Enhanced with category filtering."""
+        stmt = select(Endpoint)
+
+        # Text search conditions
+        text_conditions = self._text_conditions(query)
+
         if text_conditions:
             stmt = stmt.where(and_(*text_conditions))
 
@@ -194,42 +396,22 @@ class EndpointRepository(BaseRepository[Endpoint]):
             stmt = stmt.where(Endpoint.method.in_(methods))
 
         if tags:
-            # JSON array search for tags
-            tag_conditions = []
-            for tag in tags:
-                tag_conditions.append(Endpoint.tags.like(f'%"{tag}"%'))
-            if tag_conditions:
-                stmt = stmt.where(or_(*tag_conditions))
+            stmt = stmt.where(self._tag_members(tags))
 
         if deprecated is not None:
             stmt = stmt.where(Endpoint.deprecated == deprecated)
 
-        # Epic 6: Category filtering using subquery with endpoint_categories table
-        # Tags are stored as JSON strings like ["Campaign"] with Title-Case
-        # Categories use lowercase with underscores: "campaign", "search_promo"
+        # Epic 6: Category filtering through the endpoint_category_links
+        # join table (indexed, no per-row tag matching)
         if category:
-            # Use raw SQL for EXISTS subquery with tag matching
-            category_filter = text("""
-                EXISTS (
-                    SELECT 1 FROM endpoint_categories ec
-                    WHERE ec.api_id = endpoints.api_id
-                      AND LOWER(ec.category_name) = LOWER(:category_param)
-                      AND endpoints.tags LIKE '%' || UPPER(SUBSTR(ec.category_name, 1, 1)) || SUBSTR(REPLACE(ec.category_name, '_', '-'), 2) || '%'
-                )
-            """)
-            stmt = stmt.where(category_filter.bindparams(category_param=category))
+            stmt = stmt.where(
+                self._category_members(EndpointCategory.category_name, category)
+            )
 
         if category_group:
-            # Use raw SQL for EXISTS subquery with tag matching
-            group_filter = text("""
-                EXISTS (
-                    SELECT 1 FROM endpoint_categories ec
-                    WHERE ec.api_id = endpoints.api_id
-                      AND LOWER(ec.category_group) = LOWER(:group_param)
-                      AND endpoints.tags LIKE '%' || UPPER(SUBSTR(ec.category_name, 1, 1)) || SUBSTR(REPLACE(ec.category_name, '_', '-'), 2) || '%'
-                )
-            """)
-            stmt = stmt.where(group_filter.bindparams(group_param=category_group))
+            stmt = stmt.where(
+                self._category_members(EndpointCategory.category_group, category_group)
+            )
 
         stmt = stmt.limit(limit).offset(offset)
 
@@ -270,38 +452,19 @@ class EndpointRepository(BaseRepository[Endpoint]):
             stmt = stmt.where(Endpoint.method.in_(methods))
 
         if tags:
-            tag_conditions = []
-            for tag in tags:
-                tag_conditions.append(Endpoint.tags.like(f'%"{tag}"%'))
-            if tag_conditions:
-                stmt = stmt.where(or_(*tag_conditions))
-
-        # Epic 6: Category filtering using subquery with endpoint_categories table
-        # Tags are stored as JSON strings like ["Campaign"] with Title-Case
-        # Categories use lowercase with underscores: "campaign", "search_promo"
+            stmt = stmt.where(self._tag_members(tags))
+
+        # Epic 6: Category filtering through the endpoint_category_links
+        # join table (indexed, no per-row tag matching)
         if category:
-            # Use raw SQL for EXISTS subquery with tag matching
-            category_filter = text("""
-                EXISTS (
-                    SELECT 1 FROM endpoint_categories ec
-                    WHERE ec.api_id = endpoints.api_id
-                      AND LOWER(ec.category_name) = LOWER(:category_param)
-                      AND endpoints.tags LIKE '%' || UPPER(SUBSTR(ec.category_name, 1, 1)) || SUBSTR(REPLACE(ec.category_name, '_', '-'), 2) || '%'
-                )
-            """)
-            stmt = stmt.where(category_filter.bindparams(category_param=category))
+            stmt = stmt.where(
+                self._category_members(EndpointCategory.category_name, category)
+            )
 
         if category_group:
-            # Use raw SQL for EXISTS subquery with tag matching
-            group_filter = text("""
-                EXISTS (
-                    SELECT 1 FROM endpoint_categories ec
-                    WHERE ec.api_id = endpoints.api_id
-                      AND LOWER(ec.category_group) = LOWER(:group_param)
-                      AND endpoints.tags LIKE '%' || UPPER(SUBSTR(ec.category_name, 1, 1)) || SUBSTR(REPLACE(ec.category_name, '_', '-'), 2) || '%'
-                )
-            """)
-            stmt = stmt.where(group_filter.bindparams(group_param=category_group))
+            stmt = stmt.where(
+                self._category_members(EndpointCategory.category_group, category_group)
+            )
 
         stmt = stmt.limit(limit).offset(offset)
 
@@ -310,6 +473,40 @@ class EndpointRepository(BaseRepository[Endpoint]):
 
         return list(endpoints)
 
+    @staticmethod
+    def _tag_members(tags: List[str]) -> Any:
+        """Condition matching endpoints carrying any of the tags.
+
+        Args:
+            tags: Tags compared case-insensitively
+
+        Returns:
+            Filter condition on Endpoint.id
+        """
+        return Endpoint.id.in_(
+            select(EndpointTag.endpoint_id).where(EndpointTag.tag.in_(tags))
+        )
+
+    @staticmethod
+    def _category_members(column: Any, value: str) -> Any:
+        """Condition matching endpoints linked to a category or group.
+
+        Args:
+            column: EndpointCategory column compared case-insensitively
+            value: Category name or group name
+
+        Returns:
+            Filter condition on Endpoint.id
+        """
+        category_ids = select(EndpointCategory.id).where(
+            func.lower(column) == func.lower(value)
+        )
+        return Endpoint.id.in_(
+            select(EndpointCategoryLink.endpoint_id).where(
+                EndpointCategoryLink.category_id.in_(category_ids)
+            )
+        )
+
     async def get_by_path_method(
         self, path: str, method: str, api_id: Optional[int] = None
     ) -> Optional[Endpoint]:
@@ -374,16 +571,13 @@ class EndpointRepository(BaseRepository[Endpoint]):
             if api_id:
                 stmt = stmt.where(Endpoint.api_id == api_id)
 
-            # Build tag conditions
-            tag_conditions = []
-            for tag in tags:
-                tag_conditions.append(Endpoint.tags.like(f'%"{tag}"%'))
-
-            if tag_conditions:
+            if tags:
                 if match_all:
-                    stmt = stmt.where(and_(*tag_conditions))
+                    stmt = stmt.where(
+                        and_(*[self._tag_members([tag]) for tag in tags])
+                    )
                 else:
-                    stmt = stmt.where(or_(*tag_conditions))
+                    stmt = stmt.where(self._tag_members(tags))
 
             result = await self.session.execute(stmt)
             endpoints = result.scalars().all()
@@ -451,17 +645,19 @@ class EndpointRepository(BaseRepository[Endpoint]):
     async def get_all_tags(self, api_id: Optional[int] = None) -> List[str]:
         """Get all unique tags from endpoints."""
         try:
-            # Raw SQL to extract tags from JSON arrays
+            # Tags are indexed case-insensitively; distinct spellings are kept
             query = """
-            SELECT DISTINCT json_each.value as tag
-            FROM endpoints, json_each(endpoints.tags)
-            WHERE json_each.value IS NOT NULL
+            SELECT DISTINCT endpoint_tags.tag COLLATE BINARY AS tag
+            FROM endpoint_tags
             """
 
-            params = []
+            params = {}
             if api_id:
-                query += " AND endpoints.api_id = ?"
-                params.append(api_id)
+                query += """
+                JOIN endpoints ON endpoints.id = endpoint_tags.endpoint_id
+                WHERE endpoints.api_id = :api_id
+                """
+                params["api_id"] = api_id
 
             query += " ORDER BY tag"
 
@@ -623,20 +819,23 @@ class EndpointRepository(BaseRepository[Endpoint]):
             RepositoryError: If query fails
         """
         try:
-            # Build SQL query
-            query = """
-            SELECT
-                category_name,
-                display_name,
-                description,
-                category_group,
-                endpoint_count,
-                http_methods,
-                api_id
-            FROM endpoint_categories
-            WHERE (? IS NULL OR api_id = ?)
-              AND (? IS NULL OR category_group = ?)
-              AND (? = 1 OR endpoint_count > 0)
+            # Build SQL query; endpoint counts come from the category links
+            # (a range scan of the links primary key per category)
+            query = f"""
+            SELECT * FROM (
+                SELECT
+                    ec.category_name,
+                    ec.display_name,
+                    ec.description,
+                    ec.category_group,
+                    {CATEGORY_ENDPOINT_COUNT_SQL} AS endpoint_count,
+                    ec.http_methods,
+                    ec.api_id
+                FROM endpoint_categories ec
+                WHERE (:api_id IS NULL OR ec.api_id = :api_id)
+                  AND (:category_group IS NULL OR ec.category_group = :category_group)
+            )
+            WHERE (:include_empty = 1 OR endpoint_count > 0)
             """
 
             # Add sorting
@@ -652,13 +851,11 @@ class EndpointRepository(BaseRepository[Endpoint]):
             # Execute query
             result = await self.session.execute(
                 text(query),
-                [
-                    api_id,
-                    api_id,
-                    category_group,
-                    category_group,
-                    1 if include_empty else 0,
-                ],
+                {
+                    "api_id": api_id,
+                    "category_group": category_group,
+                    "include_empty": 1 if include_empty else 0,
+                },
             )
 
             rows = result.fetchall()
@@ -715,20 +912,20 @@ class EndpointRepository(BaseRepository[Endpoint]):
             RepositoryError: If query fails
         """
         try:
-            query = """
+            query = f"""
             SELECT
-                category_group,
-                COUNT(DISTINCT category_name) as category_count,
-                SUM(endpoint_count) as total_endpoints,
-                GROUP_CONCAT(category_name, ',') as categories
-            FROM endpoint_categories
-            WHERE category_group IS NOT NULL
-              AND (? IS NULL OR api_id = ?)
-            GROUP BY category_group
-            ORDER BY category_group ASC
+                ec.category_group,
+                COUNT(DISTINCT ec.category_name) as category_count,
+                SUM({CATEGORY_ENDPOINT_COUNT_SQL}) as total_endpoints,
+                GROUP_CONCAT(ec.category_name, ',') as categories
+            FROM endpoint_categories ec
+            WHERE ec.category_group IS NOT NULL
+              AND (:api_id IS NULL OR ec.api_id = :api_id)
+            GROUP BY ec.category_group
+            ORDER BY ec.category_group ASC
             """
 
-            result = await self.session.execute(text(query), [api_id, api_id])
+            result = await self.session.execute(text(query), {"api_id": api_id})
             rows = result.fetchall()
 
             groups = []
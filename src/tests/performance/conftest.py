@@ -0,0 +1,368 @@
+"""Shared fixtures for performance tests.
+
+Provides a deterministic generator of synthetic OpenAPI 2.0/3.0/3.1
+specifications whose size and shape (operation and schema counts, ``$ref``
+chain depth, reference cycles, ``allOf`` fan-out, description sizes) are
+controlled by ``SyntheticSpecConfig``.
+"""
+
+import json
+import math
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+import yaml
+
+OPENAPI_VERSIONS = ("2.0", "3.0.3", "3.1.0")
+
+# Operations per resource: list/create on the collection path and
+# get/update/delete on the item path
+RESOURCE_OPERATIONS = (
+    ("collection", "get", "list"),
+    ("collection", "post", "create"),
+    ("item", "get", "get"),
+    ("item", "put", "update"),
+    ("item", "delete", "delete"),
+)
+
+WORDS = (
+    "account",
+    "address",
+    "amount",
+    "archive",
+    "balance",
+    "batch",
+    "catalog",
+    "category",
+    "channel",
+    "customer",
+    "delivery",
+    "discount",
+    "document",
+    "inventory",
+    "invoice",
+    "item",
+    "merchant",
+    "message",
+    "order",
+    "payment",
+    "price",
+    "product",
+    "profile",
+    "refund",
+    "report",
+    "return",
+    "review",
+    "session",
+    "shipment",
+    "status",
+    "stock",
+    "subscription",
+    "supplier",
+    "token",
+    "transaction",
+    "user",
+    "warehouse",
+    "webhook",
+)
+
+DESCRIPTION_POOL_SIZE = 256
+TAG_COUNT = 25
+
+
+@dataclass
+class SyntheticSpecConfig:
+    """Shape of a generated specification."""
+
+    openapi_version: str = "3.0.3"  # One of OPENAPI_VERSIONS
+    operations: int = 1000
+    schemas: int = 100
+    # Schemas form chains in which each schema references the next one;
+    # the length of a chain is ref_depth + 1 schemas
+    ref_depth: int = 3
+    # Number of chains whose last schema references back to the first
+    cycles: int = 0
+    # allOf members of composed schemas (0 disables composition)
+    all_of_fan_out: int = 0
+    composed_every: int = 10  # Every n-th schema is composed
+    description_size: int = 200  # Characters per description
+    seed: int = 42
+
+
+class SyntheticSpecGenerator:
+    """Builds a specification dictionary for a ``SyntheticSpecConfig``.
+
+    Output depends only on the config (including the seed), so benchmark
+    runs on different machines or commits compare like with like.
+    """
+
+    def __init__(self, config: SyntheticSpecConfig):
+        if config.openapi_version not in OPENAPI_VERSIONS:
+            raise ValueError(f"Unsupported OpenAPI version: {config.openapi_version}")
+
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.swagger_2 = config.openapi_version == "2.0"
+        self.ref_prefix = (
+            "#/definitions/" if self.swagger_2 else "#/components/schemas/"
+        )
+        self.schema_names = [f"Model{index}" for index in range(config.schemas)]
+        self.descriptions = [
+            self._make_description() for _ in range(DESCRIPTION_POOL_SIZE)
+        ]
+
+    def generate(self) -> Dict[str, Any]:
+        """Generate the specification."""
+        info = {
+            "title": "Synthetic API",
+            "version": "1.0.0",
+            "description": self._description(),
+        }
+        paths = self._paths()
+        schemas = {
+            name: self._schema(index) for index, name in enumerate(self.schema_names)
+        }
+
+        if self.swagger_2:
+            return {
+                "swagger": "2.0",
+                "info": info,
+                "host": "api.example.com",
+                "basePath": "/v1",
+                "schemes": ["https"],
+                "produces": ["application/json"],
+                "securityDefinitions": {
+                    "apiKey": {"type": "apiKey", "name": "X-API-Key", "in": "header"}
+                },
+                "security": [{"apiKey": []}],
+                "paths": paths,
+                "definitions": schemas,
+            }
+
+        return {
+            "openapi": self.config.openapi_version,
+            "info": info,
+            "servers": [{"url": "https://api.example.com/v1"}],
+            "security": [{"bearerAuth": []}],
+            "paths": paths,
+            "components": {
+                "schemas": schemas,
+                "securitySchemes": {"bearerAuth": {"type": "http", "scheme": "bearer"}},
+            },
+        }
+
+    def _paths(self) -> Dict[str, Any]:
+        """Generate paths with exactly ``operations`` operations."""
+        paths: Dict[str, Any] = {}
+        resources = math.ceil(self.config.operations / len(RESOURCE_OPERATIONS))
+        remaining = self.config.operations
+
+        for resource in range(resources):
+            collection_path = f"/resource{resource}"
+            item_path = f"{collection_path}/{{id}}"
+            for kind, method, verb in RESOURCE_OPERATIONS:
+                if remaining == 0:
+                    break
+                remaining -= 1
+
+                path = collection_path if kind == "collection" else item_path
+                paths.setdefault(path, {})[method] = self._operation(
+                    resource, kind, method, verb
+                )
+
+        return paths
+
+    def _operation(
+        self, resource: int, kind: str, method: str, verb: str
+    ) -> Dict[str, Any]:
+        """Generate one operation."""
+        schema_ref = self._resource_schema(resource)
+        parameters: List[Dict[str, Any]] = []
+
+        if kind == "item":
+            parameters.append(self._parameter("id", "path", "string", required=True))
+        elif method == "get":
+            parameters.append(self._parameter("limit", "query", "integer"))
+            parameters.append(self._parameter("offset", "query", "integer"))
+
+        if method == "delete":
+            success_code, body = "204", None
+        elif method == "post":
+            success_code, body = "201", schema_ref
+        elif kind == "collection":
+            success_code, body = "200", {"type": "array", "items": schema_ref}
+        else:
+            success_code, body = "200", schema_ref
+
+        operation: Dict[str, Any] = {
+            "operationId": f"{verb}Resource{resource}",
+            "summary": f"{verb.capitalize()} resource {resource}",
+            "description": self._description(),
+            "tags": [f"tag{resource % TAG_COUNT}"],
+            "parameters": parameters,
+            "responses": {
+                success_code: self._response("Success", body),
+                "404": self._response("Not found", None),
+            },
+        }
+
+        if method in ("post", "put"):
+            if self.swagger_2:
+                parameters.append(
+                    {
+                        "name": "body",
+                        "in": "body",
+                        "required": True,
+                        "schema": schema_ref,
+                    }
+                )
+            else:
+                operation["requestBody"] = {
+                    "required": True,
+                    "content": {"application/json": {"schema": schema_ref}},
+                }
+
+        return operation
+
+    def _parameter(
+        self, name: str, location: str, schema_type: str, required: bool = False
+    ) -> Dict[str, Any]:
+        """Generate a non-body parameter."""
+        parameter = {"name": name, "in": location, "required": required}
+        if self.swagger_2:
+            parameter["type"] = schema_type
+        else:
+            parameter["schema"] = {"type": schema_type}
+        return parameter
+
+    def _response(self, description: str, schema: Any) -> Dict[str, Any]:
+        """Generate a response, with a JSON body if a schema is given."""
+        response: Dict[str, Any] = {"description": description}
+        if schema is not None:
+            if self.swagger_2:
+                response["schema"] = schema
+            else:
+                response["content"] = {"application/json": {"schema": schema}}
+        return response
+
+    def _resource_schema(self, resource: int) -> Dict[str, Any]:
+        """Get the schema of a resource (inline if there are no schemas)."""
+        if not self.schema_names:
+            return {"type": "object", "properties": {"id": {"type": "string"}}}
+        return self._ref(resource % len(self.schema_names))
+
+    def _schema(self, index: int) -> Dict[str, Any]:
+        """Generate the schema with the given index."""
+        config = self.config
+        properties: Dict[str, Any] = {
+            "id": {"type": "integer", "format": "int64"},
+            "name": {"type": "string", "maxLength": 128},
+            "note": self._nullable_string(),
+            "created_at": {"type": "string", "format": "date-time"},
+            "status": {"type": "string", "enum": ["active", "inactive", "deleted"]},
+        }
+
+        chain_length = config.ref_depth + 1
+        position = index % chain_length
+        chain_start = index - position
+        is_last = position == config.ref_depth or index == len(self.schema_names) - 1
+
+        if not is_last:
+            properties["child"] = self._ref(index + 1)
+        elif chain_start // chain_length < config.cycles:
+            properties["parent"] = self._ref(chain_start)
+
+        schema: Dict[str, Any] = {
+            "type": "object",
+            "description": self._description(),
+            "required": ["id", "name"],
+            "properties": properties,
+        }
+
+        if config.all_of_fan_out and index % config.composed_every == 0:
+            members = [
+                self._ref(member)
+                for member in self._all_of_members(index, config.all_of_fan_out)
+            ]
+            schema = {"allOf": members + [schema]}
+
+        return schema
+
+    def _all_of_members(self, index: int, fan_out: int) -> List[int]:
+        """Pick the schemas a composed schema is built from."""
+        count = len(self.schema_names)
+        return [
+            (index + offset) % count for offset in range(1, min(fan_out, count - 1) + 1)
+        ]
+
+    def _nullable_string(self) -> Dict[str, Any]:
+        """Generate a nullable string schema in the version's syntax."""
+        if self.swagger_2:
+            return {"type": "string", "x-nullable": True}
+        if self.config.openapi_version.startswith("3.1"):
+            return {"type": ["string", "null"]}
+        return {"type": "string", "nullable": True}
+
+    def _ref(self, index: int) -> Dict[str, str]:
+        """Reference the schema with the given index."""
+        return {"$ref": f"{self.ref_prefix}{self.schema_names[index]}"}
+
+    def _description(self) -> str:
+        """Pick a description from the pool."""
+        return self.random.choice(self.descriptions)
+
+    def _make_description(self) -> str:
+        """Generate a description of ``description_size`` characters."""
+        size = self.config.description_size
+        words: List[str] = []
+        length = 0
+        while length < size:
+            word = self.random.choice(WORDS)
+            words.append(word)
+            length += len(word) + 1
+        return " ".join(words)[:size].capitalize()
+
+
+def generate_spec(config: SyntheticSpecConfig) -> Dict[str, Any]:
+    """Generate a synthetic specification."""
+    return SyntheticSpecGenerator(config).generate()
+
+
+@pytest.fixture
+def synthetic_spec() -> Callable[..., Dict[str, Any]]:
+    """Factory of synthetic specifications.
+
+    Keyword arguments are ``SyntheticSpecConfig`` fields.
+    """
+
+    def factory(**options: Any) -> Dict[str, Any]:
+        return generate_spec(SyntheticSpecConfig(**options))
+
+    return factory
+
+
+@pytest.fixture
+def synthetic_spec_file(tmp_path) -> Callable[..., Path]:
+    """Factory writing synthetic specifications to files.
+
+    Keyword arguments are ``SyntheticSpecConfig`` fields plus
+    ``file_format`` ("json" or "yaml").
+    """
+
+    def factory(file_format: str = "json", **options: Any) -> Path:
+        config = SyntheticSpecConfig(**options)
+        spec = generate_spec(config)
+        file_path = tmp_path / (
+            f"synthetic-{config.openapi_version}-{config.operations}.{file_format}"
+        )
+        with open(file_path, "w", encoding="utf-8") as f:
+            if file_format == "yaml":
+                yaml.safe_dump(spec, f, sort_keys=False)
+            else:
+                json.dump(spec, f)
+        return file_path
+
+    return factory
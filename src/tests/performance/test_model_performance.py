@@ -0,0 +1,115 @@
+"""Performance comparison of slotted records and Pydantic models.
+
+Measures construction throughput (objects/sec) and retained memory (bytes
+per object) of the hot-path records against validated Pydantic models and
+records them in ``benchmark.extra_info``.
+"""
+
+import gc
+import time
+import tracemalloc
+
+import pytest
+
+from swagger_mcp_server.parser.fast_models import EndpointRecord, SchemaRecord
+from swagger_mcp_server.parser.models import (
+    HttpMethod,
+    NormalizedEndpoint,
+    NormalizedParameter,
+    NormalizedSchema,
+    ParameterLocation,
+)
+
+OBJECT_COUNT = 2000
+
+PARAMETERS = [
+    NormalizedParameter(name="id", location=ParameterLocation.PATH, required=True),
+    NormalizedParameter(name="limit", location=ParameterLocation.QUERY),
+]
+PROPERTIES = {"id": {"type": "integer"}, "name": {"type": "string"}}
+
+
+def endpoint_values(index):
+    """Field values of a representative endpoint."""
+    return {
+        "path": f"/pets/{index}",
+        "method": HttpMethod.GET,
+        "operation_id": f"getPet{index}",
+        "summary": "Get a pet",
+        "description": "Returns a single pet",
+        "tags": ["pets"],
+        "parameters": PARAMETERS,
+        "schema_dependencies": {"Pet"},
+    }
+
+
+def schema_values(index):
+    """Field values of a representative schema."""
+    return {
+        "name": f"Pet{index}",
+        "type": "object",
+        "description": "A pet",
+        "properties": PROPERTIES,
+        "required": ["id"],
+    }
+
+
+def measure(factory, values):
+    """Measure objects/sec and retained bytes per object of a factory."""
+    start = time.perf_counter()
+    for item in values:
+        factory(**item)
+    objects_per_sec = len(values) / (time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    retained = [factory(**item) for item in values]
+    bytes_per_object = (tracemalloc.get_traced_memory()[0] - baseline) / len(retained)
+    tracemalloc.stop()
+
+    return objects_per_sec, bytes_per_object
+
+
+@pytest.mark.performance
+class TestModelPerformance:
+    """Compare slotted records with validated Pydantic models."""
+
+    @pytest.mark.parametrize(
+        "record_class, model_class, make_values",
+        [
+            (EndpointRecord, NormalizedEndpoint, endpoint_values),
+            (SchemaRecord, NormalizedSchema, schema_values),
+        ],
+        ids=["endpoint", "schema"],
+    )
+    def test_record_construction(
+        self, benchmark, record_class, model_class, make_values
+    ):
+        """Records retain less memory than models; rates go to extra_info."""
+        # Values are created up front so only the objects themselves count
+        values = [make_values(index) for index in range(OBJECT_COUNT)]
+
+        benchmark.pedantic(
+            lambda: [record_class(**item) for item in values], rounds=1, iterations=1
+        )
+
+        record_rate, record_bytes = measure(record_class, values)
+        model_rate, model_bytes = measure(model_class, values)
+        construct_rate, _ = measure(
+            lambda **item: record_class(**item).to_model(), values
+        )
+
+        benchmark.extra_info.update(
+            {
+                "objects": OBJECT_COUNT,
+                "record_objects_per_sec": round(record_rate),
+                "record_bytes_per_object": round(record_bytes),
+                "model_objects_per_sec": round(model_rate),
+                "model_bytes_per_object": round(model_bytes),
+                "record_to_model_objects_per_sec": round(construct_rate),
+            }
+        )
+
+        # Wall-clock rates vary with machine load, retained memory does not
+        assert record_bytes < model_bytes
@@ -0,0 +1,249 @@
+"""Throughput benchmarks of the conversion pipeline on synthetic specifications.
+
+Each benchmark generates a specification with the ``synthetic_spec_file``
+fixture and runs the parse, validate, normalize, store and index phases on
+it, recording in ``benchmark.extra_info``:
+
+- ``mb_per_sec``: parse throughput of the specification file
+- ``phase_seconds``: wall time of every phase
+- ``phase_rss_mb``: resident set size after every phase
+- ``peak_rss_mb``: peak resident set size of the process
+
+The default size keeps the suite fast; larger specifications (up to 100k
+operations) are only benchmarked with ``SWAGGER_MCP_LARGE_BENCHMARKS=1``.
+Save results for comparison between commits with
+``pytest -m performance --benchmark-autosave``.
+"""
+
+import asyncio
+import json
+import os
+import resource
+import sys
+import time
+from pathlib import Path
+
+import psutil
+import pytest
+
+from swagger_mcp_server.conversion.pipeline import ConversionPipeline
+from swagger_mcp_server.parser.base import ParserConfig, ValidationTier
+from swagger_mcp_server.parser.error_handler import ErrorHandler
+from swagger_mcp_server.parser.schema_normalizer import (
+    NormalizationConfig,
+    SchemaNormalizer,
+)
+from swagger_mcp_server.parser.search_optimizer import SearchOptimizer
+from swagger_mcp_server.parser.stream_parser import SwaggerStreamParser
+from swagger_mcp_server.parser.validation import (
+    OpenAPIValidator,
+    SpecValidationCache,
+)
+
+MB = 1024 * 1024
+
+large_specs = [
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        not os.environ.get("SWAGGER_MCP_LARGE_BENCHMARKS"),
+        reason="set SWAGGER_MCP_LARGE_BENCHMARKS=1 to benchmark large specs",
+    ),
+]
+
+SIZES = [
+    pytest.param(1000, 100, id="1k"),
+    pytest.param(10000, 1000, id="10k", marks=large_specs),
+    pytest.param(100000, 5000, id="100k", marks=large_specs),
+]
+
+
+def peak_rss_mb() -> float:
+    """Get the peak resident set size of the process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return peak / MB if sys.platform == "darwin" else peak / 1024
+
+
+class PipelineBenchmark:
+    """Runs the pipeline phases on a specification file and times them."""
+
+    def __init__(self, spec_file: Path, output_dir: Path):
+        self.spec_file = spec_file
+        self.output_dir = output_dir
+        self.process = psutil.Process()
+        self.phase_seconds = {}
+        self.phase_rss_mb = {}
+
+    def run(self) -> None:
+        """Run all phases.
+
+        A private event loop is used so the loop of the test session is
+        left alone.
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self._run_phases())
+        finally:
+            loop.close()
+
+    async def _run_phases(self) -> None:
+        parse_result = await self._phase("parse", self._parse())
+        assert parse_result.is_success, parse_result.metrics.errors
+
+        # Later phases take the complete document; streaming parse results
+        # only materialize its skeleton
+        with open(self.spec_file, "r", encoding="utf-8") as f:
+            document = json.load(f)
+
+        validation = await self._phase("validate", self._validate(document))
+        assert validation.is_valid, validation.errors
+
+        normalized = await self._phase("normalize", self._normalize(document))
+        assert normalized.endpoints
+
+        assert await self._phase("store", self._store())
+
+        search_index = await self._phase("index", self._index(normalized))
+        assert search_index.documents
+
+    async def _phase(self, name, phase):
+        """Run and measure one phase."""
+        start = time.perf_counter()
+        result = await phase
+        self.phase_seconds[name] = time.perf_counter() - start
+        self.phase_rss_mb[name] = self.process.memory_info().rss / MB
+        return result
+
+    async def _parse(self):
+        config = ParserConfig(max_file_size_mb=1024, validate_openapi=False)
+        return await SwaggerStreamParser(config).parse(self.spec_file)
+
+    async def _validate(self, document):
+        # A fresh cache so every round runs the spec validator
+        validator = OpenAPIValidator(
+            ErrorHandler(), tier=ValidationTier.FULL, cache=SpecValidationCache()
+        )
+        return await validator.validate_specification(document, str(self.spec_file))
+
+    async def _normalize(self, document):
+        normalizer = SchemaNormalizer(NormalizationConfig(optimize_for_search=False))
+        return normalizer.normalize_openapi_document(document, self.spec_file)
+
+    async def _store(self) -> bool:
+        (self.output_dir / "data").mkdir(parents=True, exist_ok=True)
+        pipeline = ConversionPipeline(str(self.spec_file), str(self.output_dir))
+        await pipeline._populate_database({})
+        return pipeline.conversion_stats.get("database_populated", False)
+
+    async def _index(self, normalized):
+        return SearchOptimizer().optimize_for_search(
+            normalized.endpoints, normalized.schemas, normalized.security_schemes
+        )
+
+
+@pytest.mark.performance
+class TestSyntheticSpecGenerator:
+    """Test the synthetic specification generator."""
+
+    def test_generation_is_deterministic(self, synthetic_spec):
+        """The same configuration always yields the same document."""
+        options = {"operations": 120, "schemas": 30, "cycles": 2, "all_of_fan_out": 3}
+
+        assert json.dumps(synthetic_spec(**options)) == json.dumps(
+            synthetic_spec(**options)
+        )
+        assert synthetic_spec(**options) != synthetic_spec(seed=7, **options)
+
+    @pytest.mark.parametrize("openapi_version", ["2.0", "3.0.3", "3.1.0"])
+    def test_generated_shape(self, synthetic_spec, openapi_version):
+        """Operation and schema counts, cycles and allOf follow the config."""
+        spec = synthetic_spec(
+            openapi_version=openapi_version,
+            operations=103,
+            schemas=40,
+            ref_depth=3,
+            cycles=2,
+            all_of_fan_out=3,
+        )
+
+        if openapi_version == "2.0":
+            schemas = spec["definitions"]
+        else:
+            assert spec["openapi"] == openapi_version
+            schemas = spec["components"]["schemas"]
+
+        assert sum(len(operations) for operations in spec["paths"].values()) == 103
+        assert len(schemas) == 40
+
+        # Chains of four schemas; the first two close into cycles
+        assert schemas["Model3"]["properties"]["parent"]["$ref"].endswith("/Model0")
+        assert schemas["Model7"]["properties"]["parent"]["$ref"].endswith("/Model4")
+        assert "parent" not in schemas["Model11"]["properties"]
+        assert schemas["Model1"]["properties"]["child"]["$ref"].endswith("/Model2")
+
+        # Every tenth schema is composed of three others
+        assert len(schemas["Model10"]["allOf"]) == 4
+        assert "allOf" not in schemas["Model11"]
+
+
+@pytest.mark.performance
+class TestPipelineBenchmark:
+    """Benchmark the pipeline phases on synthetic specifications."""
+
+    @pytest.mark.parametrize("openapi_version", ["2.0", "3.0.3", "3.1.0"])
+    @pytest.mark.parametrize("operations, schemas", SIZES)
+    def test_pipeline_throughput(
+        self,
+        benchmark,
+        synthetic_spec_file,
+        tmp_path,
+        openapi_version,
+        operations,
+        schemas,
+    ):
+        """Record throughput, memory and per-phase times of all phases."""
+        spec_file = synthetic_spec_file(
+            openapi_version=openapi_version,
+            operations=operations,
+            schemas=schemas,
+            ref_depth=4,
+            cycles=schemas // 50,
+            all_of_fan_out=3,
+        )
+        spec_size_mb = spec_file.stat().st_size / MB
+
+        runs = []
+
+        def run_pipeline():
+            run = PipelineBenchmark(spec_file, tmp_path / f"server-{len(runs)}")
+            run.run()
+            runs.append(run)
+
+        benchmark.pedantic(run_pipeline, rounds=1, iterations=1)
+
+        run = runs[-1]
+        benchmark.extra_info.update(
+            {
+                "openapi_version": openapi_version,
+                "operations": operations,
+                "schemas": schemas,
+                "spec_size_mb": round(spec_size_mb, 3),
+                "mb_per_sec": round(spec_size_mb / run.phase_seconds["parse"], 3),
+                "phase_seconds": {
+                    phase: round(seconds, 4)
+                    for phase, seconds in run.phase_seconds.items()
+                },
+                "phase_rss_mb": {
+                    phase: round(rss, 1) for phase, rss in run.phase_rss_mb.items()
+                },
+                "peak_rss_mb": round(peak_rss_mb(), 1),
+            }
+        )
+
+        assert list(run.phase_seconds) == [
+            "parse",
+            "validate",
+            "normalize",
+            "store",
+            "index",
+        ]
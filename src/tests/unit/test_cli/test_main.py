@@ -50,6 +50,7 @@ class TestCLI:
         assert "SWAGGER_FILE" in result.output
         assert "--output" in result.output
         assert "--port" in result.output
+        assert "--validation-tier" in result.output
 
     def test_convert_command_basic(self):
         """Test convert command with basic parameters."""
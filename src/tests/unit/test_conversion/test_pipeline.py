@@ -3,6 +3,7 @@
 import json
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -105,16 +106,15 @@ class TestConversionPipeline:
         assert "not found" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_validate_input_file_too_large(self):
-        """Test input file validation with oversized file."""
+    async def test_validate_input_file_large(self):
+        """Large files are accepted, they are streamed."""
         # Create a large file (mock)
         with patch("os.path.getsize", return_value=200 * 1024 * 1024):  # 200MB
             pipeline = ConversionPipeline(self.swagger_file)
 
-            with pytest.raises(ConversionError) as exc_info:
-                await pipeline._validate_input_file()
+            await pipeline._validate_input_file()
 
-            assert "too large" in str(exc_info.value)
+        assert pipeline.conversion_stats["input_file_size"] == 200 * 1024 * 1024
 
     @pytest.mark.asyncio
     async def test_prepare_output_directory(self):
@@ -351,6 +351,41 @@ class TestConversionPipelineIntegration:
         assert os.path.exists(os.path.join(output_dir, "README.md"))
         assert os.path.exists(os.path.join(output_dir, "requirements.txt"))
 
+    @pytest.mark.asyncio
+    async def test_full_conversion_yaml(self):
+        """YAML specifications are streamed into the generated database."""
+        import sqlite3
+
+        import yaml
+
+        yaml_file = os.path.join(self.temp_dir, "integration_api.yaml")
+        with open(yaml_file, "w") as f:
+            yaml.safe_dump(self.swagger_data, f)
+        output_dir = os.path.join(self.temp_dir, "yaml_output")
+
+        result = await ConversionPipeline(
+            yaml_file, output_dir, {"skip_validation": True}
+        ).execute_conversion()
+
+        stats = result["conversion_stats"]
+        assert stats["endpoints_found"] == 3
+        assert stats["schemas_found"] == 2
+        assert stats["endpoints_inserted"] == 3
+        assert stats["schemas_inserted"] == 2
+        assert stats["category_links_inserted"] == 3
+
+        db_path = os.path.join(output_dir, "data", "mcp_server.db")
+        with sqlite3.connect(db_path) as conn:
+            endpoints = conn.execute(
+                "SELECT method, path FROM endpoints ORDER BY path, method"
+            ).fetchall()
+
+        assert endpoints == [
+            ("GET", "/users"),
+            ("POST", "/users"),
+            ("GET", "/users/{id}"),
+        ]
+
     @pytest.mark.asyncio
     async def test_conversion_with_custom_options(self):
         """Test conversion with custom options."""
@@ -387,6 +422,234 @@ class TestConversionPipelineIntegration:
         assert error.details is not None
         assert "troubleshooting" in error.details
 
+    @pytest.mark.asyncio
+    async def test_parsing_phase_streams_specification(self):
+        """The parsing phase never loads the whole specification."""
+        pipeline = ConversionPipeline(
+            self.swagger_file, os.path.join(self.temp_dir, "output")
+        )
+
+        with (
+            patch("json.load", side_effect=AssertionError("loaded whole")),
+            patch(
+                "swagger_mcp_server.parser.stream_parser.StreamedDocument.iter_schemas",
+                side_effect=AssertionError("schemas streamed"),
+            ),
+        ):
+            parsed_data = await pipeline._execute_parsing_phase()
+
+        assert parsed_data["info"] == self.swagger_data["info"]
+        assert parsed_data["endpoints"] == [
+            {
+                "path": "/users",
+                "method": "GET",
+                "operation_id": "listUsers",
+                "tags": ["users"],
+            },
+            {
+                "path": "/users",
+                "method": "POST",
+                "operation_id": "createUser",
+                "tags": ["users"],
+            },
+            {
+                "path": "/users/{id}",
+                "method": "GET",
+                "operation_id": "getUser",
+                "tags": ["users"],
+            },
+        ]
+        assert parsed_data["schema_count"] == 2
+        assert pipeline.conversion_stats["schemas_found"] == 2
+
+    @pytest.mark.asyncio
+    async def test_spec_validation_phase_uses_persistent_cache(self):
+        """Unchanged specifications are not revalidated by later runs."""
+        options = {"validation_cache_dir": os.path.join(self.temp_dir, "cache")}
+
+        for run in range(2):
+            pipeline = ConversionPipeline(
+                self.swagger_file, os.path.join(self.temp_dir, "output"), options
+            )
+            parsed_data = await pipeline._execute_parsing_phase()
+            with patch(
+                "swagger_mcp_server.parser.validation.validate_spec"
+            ) as validate:
+                await pipeline._execute_spec_validation_phase(parsed_data)
+            assert validate.call_count == (1 if run == 0 else 0)
+
+        assert pipeline.conversion_stats["spec_validation"]["tier"] == "full"
+        assert pipeline.conversion_stats["spec_validation"]["is_valid"]
+        assert pipeline.deferred_validation is None
+
+    @pytest.mark.asyncio
+    async def test_spec_validation_tiers(self):
+        """Structural validation skips the spec validator, deferred starts it."""
+        options = {
+            "validation_tier": "structural",
+            "validation_cache_dir": os.path.join(self.temp_dir, "cache"),
+        }
+        pipeline = ConversionPipeline(
+            self.swagger_file, os.path.join(self.temp_dir, "output"), options
+        )
+        parsed_data = await pipeline._execute_parsing_phase()
+
+        with patch("swagger_mcp_server.parser.validation.validate_spec") as validate:
+            await pipeline._execute_spec_validation_phase(parsed_data)
+        validate.assert_not_called()
+
+        pipeline.options["validation_tier"] = "deferred"
+        with patch(
+            "swagger_mcp_server.parser.validation.ProcessPoolExecutor",
+            side_effect=lambda max_workers: ThreadPoolExecutor(max_workers),
+        ):
+            await pipeline._execute_spec_validation_phase(parsed_data)
+        assert pipeline.conversion_stats["spec_validation"]["deferred"]
+        assert (await pipeline.deferred_validation.result()).is_valid
+
+        pipeline.options["validation_tier"] = "thorough"
+        with pytest.raises(ConversionError, match="Unknown validation tier"):
+            await pipeline._execute_spec_validation_phase(parsed_data)
+
+    @pytest.mark.asyncio
+    async def test_incremental_conversion_applies_diff(self):
+        """Incremental mode only touches changed endpoints and schemas."""
+        import sqlite3
+
+        output_dir = os.path.join(self.temp_dir, "output")
+        await ConversionPipeline(
+            self.swagger_file, output_dir, {"skip_validation": True}
+        ).execute_conversion()
+
+        paths = self.swagger_data["paths"]
+        paths["/users"]["get"]["summary"] = "List active users"
+        del paths["/users"]["post"]
+        paths["/teams"] = {"get": {"summary": "List teams", "operationId": "teams"}}
+        del self.swagger_data["components"]["schemas"]["UserProfile"]
+        with open(self.swagger_file, "w") as f:
+            json.dump(self.swagger_data, f)
+
+        pipeline = ConversionPipeline(
+            self.swagger_file,
+            output_dir,
+            {"skip_validation": True, "incremental": True},
+        )
+        # Only the streamed operations are categorized
+        with patch.object(
+            pipeline, "_execute_parsing_phase", side_effect=AssertionError
+        ):
+            result = await pipeline.execute_conversion()
+
+        assert result["incremental"] is True
+        assert result["changes"]["endpoints"] == {
+            "added": 1,
+            "changed": 1,
+            "removed": 1,
+            "unchanged": 1,
+        }
+        assert result["changes"]["schemas"]["removed"] == 1
+        assert result["changes"]["schemas"]["unchanged"] == 1
+
+        db_path = os.path.join(output_dir, "data", "mcp_server.db")
+        with sqlite3.connect(db_path) as conn:
+            endpoints = conn.execute(
+                "SELECT method, path, summary FROM endpoints ORDER BY path, method"
+            ).fetchall()
+            fts_matches = conn.execute(
+                "SELECT rowid FROM endpoints_fts WHERE endpoints_fts MATCH 'active'"
+            ).fetchall()
+            schemas = conn.execute("SELECT name FROM schemas").fetchall()
+            category_links = conn.execute(
+                "SELECT ec.category_name, e.path, e.method "
+                "FROM endpoint_category_links links "
+                "JOIN endpoint_categories ec ON ec.id = links.category_id "
+                "JOIN endpoints e ON e.id = links.endpoint_id "
+                "ORDER BY e.path, e.method"
+            ).fetchall()
+            categories = conn.execute(
+                "SELECT category_name, endpoint_count, http_methods "
+                "FROM endpoint_categories ORDER BY category_name"
+            ).fetchall()
+
+        assert endpoints == [
+            ("GET", "/teams", "List teams"),
+            ("GET", "/users", "List active users"),
+            ("GET", "/users/{id}", "Get user"),
+        ]
+        assert len(fts_matches) == 1
+        assert schemas == [("User",)]
+        assert category_links == [
+            ("teams", "/teams", "GET"),
+            ("users", "/users", "GET"),
+            ("users", "/users/{id}", "GET"),
+        ]
+        assert categories == [
+            ("teams", 1, '["GET"]'),
+            ("users", 2, '["GET"]'),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_incremental_conversion_follows_tag_metadata(self):
+        """Changed tag definitions and groups recategorize all endpoints."""
+        import sqlite3
+
+        self.swagger_data["tags"] = [{"name": "users", "description": "Users"}]
+        self.swagger_data["x-tagGroups"] = [{"name": "Accounts", "tags": ["users"]}]
+        with open(self.swagger_file, "w") as f:
+            json.dump(self.swagger_data, f)
+
+        output_dir = os.path.join(self.temp_dir, "output")
+        await ConversionPipeline(
+            self.swagger_file, output_dir, {"skip_validation": True}
+        ).execute_conversion()
+
+        self.swagger_data["tags"][0]["description"] = "People using the API"
+        self.swagger_data["x-tagGroups"][0]["name"] = "People"
+        with open(self.swagger_file, "w") as f:
+            json.dump(self.swagger_data, f)
+
+        result = await ConversionPipeline(
+            self.swagger_file,
+            output_dir,
+            {"skip_validation": True, "incremental": True},
+        ).execute_conversion()
+
+        assert result["changes"]["tags"] == {
+            "added": 0,
+            "changed": 2,
+            "removed": 0,
+            "unchanged": 0,
+        }
+        assert not any(result["changes"]["endpoints"][k] for k in ("added", "changed"))
+
+        db_path = os.path.join(output_dir, "data", "mcp_server.db")
+        with sqlite3.connect(db_path) as conn:
+            categories = conn.execute(
+                "SELECT category_name, description, category_group, "
+                "endpoint_count FROM endpoint_categories"
+            ).fetchall()
+            link_count = conn.execute(
+                "SELECT COUNT(*) FROM endpoint_category_links"
+            ).fetchone()[0]
+
+        assert categories == [("users", "People using the API", "People", 3)]
+        assert link_count == 3
+
+    @pytest.mark.asyncio
+    async def test_incremental_conversion_without_previous_run(self):
+        """Incremental mode falls back to a full conversion."""
+        output_dir = os.path.join(self.temp_dir, "output")
+        pipeline = ConversionPipeline(
+            self.swagger_file,
+            output_dir,
+            {"skip_validation": True, "incremental": True},
+        )
+
+        result = await pipeline.execute_conversion()
+
+        assert "incremental" not in result
+        assert result["conversion_stats"]["endpoints_inserted"] == 3
+
 
 @pytest.mark.performance
 class TestConversionPerformance:
@@ -0,0 +1,86 @@
+"""Tests for the structural specification diff."""
+
+from swagger_mcp_server.conversion.spec_diff import (
+    ENDPOINTS_SECTION,
+    NODE_ADDED,
+    NODE_CHANGED,
+    SCHEMAS_SECTION,
+    TAGS_SECTION,
+    SpecDiffer,
+    endpoint_key,
+    hash_node,
+)
+
+
+class TestSpecDiff:
+    """Test node hashing and diffing."""
+
+    def test_hash_ignores_key_order(self):
+        """Node hashes do not depend on key order."""
+        assert hash_node({"a": 1, "b": [1, 2]}) == hash_node({"b": [1, 2], "a": 1})
+        assert hash_node({"a": 1}) != hash_node({"a": 2})
+
+    def test_first_revision_is_all_added(self):
+        """Without stored hashes every node is added."""
+        differ = SpecDiffer()
+
+        assert differ.classify(ENDPOINTS_SECTION, "GET /a", {}) == NODE_ADDED
+        assert differ.classify(SCHEMAS_SECTION, "A", {}) == NODE_ADDED
+        diff = differ.finish()
+
+        assert diff.endpoints.added == ["GET /a"]
+        assert diff.schemas.added == ["A"]
+        assert set(differ.node_hashes[ENDPOINTS_SECTION]) == {"GET /a"}
+
+    def test_classifies_changes(self):
+        """Nodes are classified against the previous revision."""
+        previous = SpecDiffer()
+        previous.classify(ENDPOINTS_SECTION, "GET /same", {"summary": "x"})
+        previous.classify(ENDPOINTS_SECTION, "GET /edited", {"summary": "old"})
+        previous.classify(ENDPOINTS_SECTION, "GET /gone", {})
+        previous.classify(SCHEMAS_SECTION, "Pet", {"type": "object"})
+
+        differ = SpecDiffer(previous.node_hashes)
+        assert differ.classify(ENDPOINTS_SECTION, "GET /same", {"summary": "x"}) is None
+        assert (
+            differ.classify(ENDPOINTS_SECTION, "GET /edited", {"summary": "new"})
+            == NODE_CHANGED
+        )
+        assert differ.classify(ENDPOINTS_SECTION, "POST /new", {}) == NODE_ADDED
+        assert differ.classify(SCHEMAS_SECTION, "Pet", {"type": "object"}) is None
+        diff = differ.finish()
+
+        assert diff.has_changes
+        assert diff.endpoints.summary() == {
+            "added": 1,
+            "changed": 1,
+            "removed": 1,
+            "unchanged": 1,
+        }
+        assert diff.endpoints.removed == ["GET /gone"]
+        assert not diff.schemas.has_changes
+
+    def test_tag_metadata(self):
+        """Root tag definitions and groups are diffed as a third section."""
+        root = {"tags": [{"name": "users"}], "x-tagGroups": []}
+        previous = SpecDiffer()
+        assert previous.classify_tag_metadata(root)
+
+        unchanged = SpecDiffer(previous.node_hashes)
+        assert not unchanged.classify_tag_metadata(dict(root))
+        assert not unchanged.finish().has_changes
+
+        regrouped = SpecDiffer(previous.node_hashes)
+        assert regrouped.classify_tag_metadata(
+            {**root, "x-tagGroups": [{"name": "People", "tags": ["users"]}]}
+        )
+        assert regrouped.finish().tags.changed == ["x-tagGroups"]
+
+        # Revisions stored without tag metadata hashes
+        legacy = {ENDPOINTS_SECTION: {}, SCHEMAS_SECTION: {}}
+        assert SpecDiffer(legacy).classify_tag_metadata(root)
+        assert set(previous.node_hashes[TAGS_SECTION]) == {"tags", "x-tagGroups"}
+
+    def test_endpoint_key(self):
+        """Endpoint keys combine method and path."""
+        assert endpoint_key("/pets", "get") == "GET /pets"
@@ -15,6 +15,7 @@ from swagger_mcp_server.parser.base import (
     ParserFactory,
     ParserType,
     ParseStatus,
+    ParseStrategy,
     SwaggerParseError,
 )
 
@@ -355,6 +356,18 @@ class TestParserFactory:
         assert isinstance(parser, MockParser)
         assert parser.config.strict_mode is True
 
+    def test_create_parser_selects_strategy(self, factory, temp_json_file):
+        """Test that the parser gets the decoding strategy for the file size."""
+        factory.register_parser(ParserType.OPENAPI_JSON, MockParser)
+
+        parser = factory.create_parser(temp_json_file)
+        assert parser.config.parse_strategy == ParseStrategy.IN_MEMORY
+
+        config = ParserConfig(in_memory_max_mb=0)
+        parser = factory.create_parser(temp_json_file, config)
+        assert parser.config.parse_strategy == ParseStrategy.STREAMING
+        assert config.parse_strategy == ParseStrategy.AUTO
+
     def test_detect_parser_type_json(self, factory):
         """Test detecting parser type for JSON file."""
         parser_type = factory._detect_parser_type(Path("test.json"))
@@ -0,0 +1,271 @@
+"""Tests for concurrent loading of multi-file specification bundles."""
+
+import json
+import os
+
+import pytest
+import yaml
+
+from swagger_mcp_server.parser.base import ParserConfig, SwaggerParseError
+from swagger_mcp_server.parser.bundle_loader import (
+    BundleFileCache,
+    SpecBundleLoader,
+)
+from swagger_mcp_server.parser.schema_normalizer import SchemaNormalizer
+from swagger_mcp_server.parser.swagger_parser import SwaggerParser
+
+ROOT = {
+    "openapi": "3.0.3",
+    "info": {"title": "Pets", "version": "1.0.0"},
+    "paths": {
+        "/pets": {
+            "get": {
+                "parameters": [{"$ref": "common.yaml#/components/parameters/Limit"}],
+                "responses": {
+                    "200": {
+                        "description": "Pets",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "array",
+                                    "items": {"$ref": "schemas/pet.yaml"},
+                                }
+                            }
+                        },
+                    },
+                    "default": {"$ref": "common.yaml#/components/responses/Problem"},
+                },
+            }
+        },
+        "/owners": {"$ref": "paths/owners.yaml"},
+    },
+    "components": {
+        "schemas": {
+            "Error": {"$ref": "common.yaml#/components/schemas/Error"},
+            "Tag": {"type": "string"},
+        }
+    },
+}
+
+COMMON = {
+    "components": {
+        "parameters": {
+            "Limit": {"name": "limit", "in": "query", "schema": {"type": "integer"}}
+        },
+        "responses": {
+            "Problem": {
+                "description": "Error",
+                "content": {
+                    "application/json": {
+                        "schema": {"$ref": "#/components/schemas/Error"}
+                    }
+                },
+            }
+        },
+        "schemas": {
+            "Error": {
+                "type": "object",
+                "properties": {"message": {"type": "string"}},
+            }
+        },
+    }
+}
+
+PET = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "owner": {"$ref": "owner.json"},
+        "tag": {"$ref": "../openapi.yaml#/components/schemas/Tag"},
+    },
+}
+
+OWNER = {
+    "type": "object",
+    "properties": {"pets": {"type": "array", "items": {"$ref": "pet.yaml"}}},
+}
+
+OWNERS_PATH = {
+    "get": {
+        "responses": {
+            "200": {
+                "description": "Owners",
+                "content": {
+                    "application/json": {"schema": {"$ref": "../schemas/owner.json"}}
+                },
+            }
+        }
+    }
+}
+
+
+@pytest.fixture
+def bundle_dir(tmp_path):
+    """Write a specification split across five files."""
+    (tmp_path / "schemas").mkdir()
+    (tmp_path / "paths").mkdir()
+    files = {
+        "openapi.yaml": ROOT,
+        "common.yaml": COMMON,
+        "schemas/pet.yaml": PET,
+        "schemas/owner.json": OWNER,
+        "paths/owners.yaml": OWNERS_PATH,
+    }
+    for name, content in files.items():
+        with open(tmp_path / name, "w", encoding="utf-8") as f:
+            if name.endswith(".json"):
+                json.dump(content, f)
+            else:
+                yaml.safe_dump(content, f)
+    return tmp_path
+
+
+def external_refs(node):
+    """Collect references that point outside the document."""
+    refs = []
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and not ref.startswith("#"):
+            refs.append(ref)
+        for value in node.values():
+            refs.extend(external_refs(value))
+    elif isinstance(node, list):
+        for item in node:
+            refs.extend(external_refs(item))
+    return refs
+
+
+class TestSpecBundleLoader:
+    """Test SpecBundleLoader functionality."""
+
+    async def test_bundle_is_self_contained(self, bundle_dir):
+        """External targets are moved into components and references rewritten."""
+        bundle = await SpecBundleLoader().load(bundle_dir / "openapi.yaml")
+        document = bundle.document
+        components = document["components"]
+
+        assert bundle.errors == []
+        assert len(bundle.files) == 5
+        assert bundle.files[0] == (bundle_dir / "openapi.yaml").resolve()
+        assert external_refs(document) == []
+
+        # Root entries that only reference a file are replaced by the target
+        assert (
+            components["schemas"]["Error"] == COMMON["components"]["schemas"]["Error"]
+        )
+        assert components["responses"]["Problem"]["content"]["application/json"][
+            "schema"
+        ] == {"$ref": "#/components/schemas/Error"}
+        assert components["parameters"]["Limit"]["name"] == "limit"
+
+        # Cyclic schemas across files
+        pet = components["schemas"]["pet"]
+        assert pet["properties"]["owner"] == {"$ref": "#/components/schemas/owner"}
+        assert pet["properties"]["tag"] == {"$ref": "#/components/schemas/Tag"}
+        owner = components["schemas"]["owner"]
+        assert owner["properties"]["pets"]["items"] == {
+            "$ref": "#/components/schemas/pet"
+        }
+
+        # Path items have no component section and are inlined
+        assert "get" in document["paths"]["/owners"]
+
+        # The normalizer sees the merged schemas
+        result = SchemaNormalizer().normalize_openapi_document(document)
+        assert {"pet", "owner", "Error"} <= set(result.schemas)
+
+    async def test_file_cache(self, bundle_dir):
+        """Unchanged files are not decoded again."""
+        cache = BundleFileCache()
+        loader = SpecBundleLoader(max_workers=2, cache=cache)
+
+        await loader.load(bundle_dir / "openapi.yaml")
+        assert cache.decodes == 5
+
+        await loader.load(bundle_dir / "openapi.yaml")
+        assert cache.decodes == 5
+        assert cache.hits == 5
+
+        # Touched but unchanged files are hashed, not decoded
+        pet_file = bundle_dir / "schemas" / "pet.yaml"
+        stat = pet_file.stat()
+        os.utime(pet_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        await loader.load(bundle_dir / "openapi.yaml")
+        assert cache.decodes == 5
+
+        pet_file.write_text(yaml.safe_dump({**PET, "description": "A pet"}))
+        bundle = await loader.load(bundle_dir / "openapi.yaml")
+        assert cache.decodes == 6
+        assert bundle.document["components"]["schemas"]["pet"]["description"] == (
+            "A pet"
+        )
+
+    async def test_missing_files_and_targets(self, bundle_dir):
+        """Unresolvable references are reported and kept."""
+        (bundle_dir / "paths" / "owners.yaml").unlink()
+        common = json.loads(json.dumps(COMMON))
+        del common["components"]["parameters"]
+        (bundle_dir / "common.yaml").write_text(yaml.safe_dump(common))
+
+        bundle = await SpecBundleLoader().load(bundle_dir / "openapi.yaml")
+
+        assert len(bundle.errors) == 2
+        assert bundle.document["paths"]["/owners"] == {"$ref": "paths/owners.yaml"}
+        assert bundle.document["paths"]["/pets"]["get"]["parameters"] == [
+            {"$ref": "common.yaml#/components/parameters/Limit"}
+        ]
+
+        with pytest.raises(SwaggerParseError):
+            await SpecBundleLoader().load(bundle_dir / "missing.yaml")
+
+    async def test_swagger_2_and_artifact(self, tmp_path):
+        """Swagger 2.0 targets go to definitions; the bundle can be written."""
+        root = {
+            "swagger": "2.0",
+            "info": {"title": "Pets", "version": "1.0.0"},
+            "paths": {
+                "/pets": {
+                    "get": {
+                        "responses": {
+                            "200": {
+                                "description": "OK",
+                                "schema": {"$ref": "models.json#/definitions/Pet"},
+                            }
+                        }
+                    }
+                }
+            },
+            "definitions": {"Pet": {"type": "string"}},
+        }
+        models = {"definitions": {"Pet": {"type": "object"}}}
+        (tmp_path / "api.json").write_text(json.dumps(root))
+        (tmp_path / "models.json").write_text(json.dumps(models))
+
+        bundle = await SpecBundleLoader().load(tmp_path / "api.json")
+
+        assert bundle.document["definitions"] == {
+            "Pet": {"type": "string"},
+            "Pet_2": {"type": "object"},
+        }
+        output = bundle.write(tmp_path / "out" / "bundled.yaml")
+        assert yaml.safe_load(output.read_text()) == bundle.document
+
+    async def test_swagger_parser_bundle_mode(self, bundle_dir, tmp_path):
+        """The parser merges bundles and writes the artifact when configured."""
+        output_path = tmp_path / "bundled.json"
+        parser = SwaggerParser(
+            ParserConfig(
+                bundle_references=True,
+                bundle_output_path=str(output_path),
+                validate_openapi=False,
+            )
+        )
+
+        result = await parser.parse(bundle_dir / "openapi.yaml")
+
+        assert result.is_success
+        assert result.metrics.bundled_files == 5
+        assert len(result.referenced_files) == 4
+        assert (bundle_dir / "openapi.yaml").resolve() not in result.referenced_files
+        assert external_refs(result.data) == []
+        assert json.loads(output_path.read_text())["components"]["schemas"]["pet"]
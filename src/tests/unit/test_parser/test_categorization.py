@@ -314,6 +314,49 @@ class TestCategorizationEngine:
         # Should fallback to path extraction
         assert result.category == "test"
 
+    def test_first_tag_group_wins(self, engine):
+        """Test a tag listed in several groups resolves to the first one."""
+        engine.set_tag_groups(
+            [
+                {"name": "First", "tags": ["Campaign"]},
+                {"name": "Second", "tags": ["Campaign", "Ad"]},
+            ]
+        )
+
+        assert engine.resolve_category_hierarchy(["Campaign"]) == (
+            "campaign",
+            "First",
+        )
+        assert engine.resolve_category_hierarchy(["Ad"]) == ("ad", "Second")
+
+    def test_categorize_endpoints_matches_single(self, engine_with_ozon_tags):
+        """Test batch categorization gives the per-endpoint results."""
+        endpoints = [
+            ("/api/client/campaign", "GET", {"tags": ["Campaign", "Ad"]}),
+            ("/api/client/campaign/{id}", "PUT", {"tags": ["Campaign"]}),
+            ("/api/v1/statistics/daily", "GET", {}),
+            ("/api/v1/statistics/report", "POST", {"tags": "not a list"}),
+            ("/", "GET", {"tags": []}),
+            ("/api/test", "GET", None),
+            (None, "GET", {"tags": ["Ad"]}),
+        ]
+        catalog = CategoryCatalog()
+
+        results = engine_with_ozon_tags.categorize_endpoints(endpoints, catalog)
+
+        assert results == [
+            engine_with_ozon_tags.categorize_endpoint(operation, path)
+            for path, _, operation in endpoints
+        ]
+        assert results[0].metadata["all_tags"] == ["Campaign", "Ad"]
+        assert results[1].metadata["all_tags"] == ["Campaign"]
+
+        categories = {item["category_name"]: item for item in catalog.get_categories()}
+        assert categories["campaign"]["endpoint_count"] == 2
+        assert categories["campaign"]["http_methods"] == ["GET", "PUT"]
+        assert categories["statistics"]["endpoint_count"] == 2
+        assert categories["Uncategorized"]["endpoint_count"] == 3
+
 
 class TestCategoryCatalog:
     """Test CategoryCatalog functionality."""
@@ -0,0 +1,145 @@
+"""Tests for the persistent normalization result cache."""
+
+import json
+import os
+
+import pytest
+
+from swagger_mcp_server.parser.normalization_cache import NormalizationCache
+from swagger_mcp_server.parser.schema_normalizer import (
+    NormalizationConfig,
+    NormalizationResult,
+    SchemaNormalizer,
+)
+
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Pet Store", "version": "1.0"},
+    "paths": {
+        "/pets": {
+            "get": {
+                "operationId": "listPets",
+                "tags": ["pets"],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/Pet"}
+                            }
+                        },
+                    }
+                },
+            }
+        }
+    },
+    "components": {
+        "schemas": {
+            "Pet": {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}},
+            }
+        }
+    },
+}
+
+
+class TestNormalizationCache:
+    """Test NormalizationCache functionality."""
+
+    @pytest.fixture(scope="class")
+    def result(self):
+        """Normalize the sample specification."""
+        return SchemaNormalizer().normalize_openapi_document(SPEC)
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create cache in a temporary directory."""
+        return NormalizationCache(tmp_path / "cache")
+
+    def test_roundtrip(self, cache, result):
+        """Cached results are equal to the stored result."""
+        assert cache.get("abc") is None
+        assert cache.put("abc", result)
+
+        cached = cache.get("abc")
+
+        assert isinstance(cached, NormalizationResult)
+        assert cached.endpoints == result.endpoints
+        assert cached.schemas == result.schemas
+        assert cached.search_index == result.search_index
+        assert cached.statistics == result.statistics
+
+    def test_key_includes_version_and_config(self, tmp_path, result):
+        """A parser version or result-affecting config change misses."""
+        cache = NormalizationCache(tmp_path, parser_version="1.0.0")
+        cache.put("abc", result)
+
+        upgraded = NormalizationCache(tmp_path, parser_version="1.1.0")
+        assert upgraded.get("abc") is None
+        assert cache.get("abc", NormalizationConfig(validate_consistency=False)) is None
+        # Worker settings do not change the result
+        assert cache.get("abc", NormalizationConfig(max_workers=4)) is not None
+
+    def test_lru_eviction(self, tmp_path, result):
+        """Least recently used entries are evicted past the size limit."""
+        cache = NormalizationCache(tmp_path)
+        cache.put("first", result)
+        entry_size = cache.get_size_bytes()
+        cache.max_size_bytes = entry_size * 2
+
+        cache.put("second", result)
+        first_path = cache._entry_path(cache.cache_key("first"))
+        second_path = cache._entry_path(cache.cache_key("second"))
+        os.utime(first_path, (1, 1))
+        os.utime(second_path, (2, 2))
+        # Reading "first" makes "second" the least recently used entry
+        assert cache.get("first") is not None
+        cache.put("third", result)
+
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+        assert cache.get("third") is not None
+        assert cache.get_size_bytes() <= cache.max_size_bytes
+
+    def test_corrupt_entry_discarded(self, cache, result):
+        """Unreadable entries are treated as misses and removed."""
+        cache.put("abc", result)
+        entry_path = cache._entry_path(cache.cache_key("abc"))
+        entry_path.write_bytes(b"not a cache entry")
+
+        assert cache.get("abc") is None
+        assert not entry_path.exists()
+
+    def test_changed_referenced_file_misses(self, cache, tmp_path):
+        """Entries are stale once a file referenced by the spec changes."""
+        spec_path = tmp_path / "api.json"
+        common_path = tmp_path / "common.json"
+        document = json.loads(json.dumps(SPEC))
+        document["components"]["schemas"]["Pet"]["properties"]["error"] = {
+            "$ref": "common.json#/Error"
+        }
+        spec_path.write_text(json.dumps(document))
+        common_path.write_text(json.dumps({"Error": {"type": "object"}}))
+
+        result = SchemaNormalizer().normalize_openapi_document(document, spec_path)
+        assert result.referenced_files == [common_path.resolve()]
+
+        cache.put("abc", result, dependencies=result.referenced_files)
+        assert cache.get("abc") is not None
+
+        common_path.write_text(json.dumps({"Error": {"type": "string"}}))
+        assert cache.get("abc") is None
+
+        common_path.unlink()
+        cache.put("abc", result, dependencies=result.referenced_files)
+        assert cache.get("abc") is not None
+        common_path.write_text("{}")
+        assert cache.get("abc") is None
+
+    def test_oversized_result_not_cached(self, cache, result):
+        """Results larger than the cache are not written."""
+        cache.max_size_bytes = 10
+
+        assert not cache.put("abc", result)
+        assert cache.get_size_bytes() == 0
@@ -6,7 +6,10 @@ from unittest.mock import Mock, patch
 import pytest
 
 from swagger_mcp_server.parser.consistency_validator import (
+    DEFAULT_RULES,
+    ConsistencyRule,
     ConsistencyValidator,
+    NodeType,
 )
 from swagger_mcp_server.parser.endpoint_normalizer import EndpointNormalizer
 from swagger_mcp_server.parser.extension_handler import ExtensionHandler
@@ -21,6 +24,7 @@ from swagger_mcp_server.parser.models import (
 from swagger_mcp_server.parser.schema_processor import SchemaProcessor
 from swagger_mcp_server.parser.search_optimizer import (
     SearchableDocument,
+    SearchIndex,
     SearchOptimizer,
 )
 from swagger_mcp_server.parser.security_mapper import SecurityMapper
@@ -135,6 +139,28 @@ class TestEndpointNormalizer:
         assert endpoint.request_body.required is True
         assert "application/json" in endpoint.request_body.content
 
+    def test_strict_and_fast_models_agree(self):
+        """Validated and unvalidated endpoints hold the same field values."""
+        paths_data = {
+            "/users": {
+                "get": {
+                    "operationId": "getUsers",
+                    "tags": ["users"],
+                    "responses": {"200": {"description": "OK"}},
+                }
+            }
+        }
+
+        (fast,), _, _ = self.normalizer.normalize_endpoints(paths_data)
+        (strict,), _, _ = EndpointNormalizer(
+            strict_validation=True
+        ).normalize_endpoints(paths_data)
+
+        assert type(fast.method) is type(strict.method)
+        assert fast.method == strict.method == "get"
+        assert fast.searchable_text == strict.searchable_text
+        assert fast.model_dump() == strict.model_dump()
+
     def test_validate_path_parameters(self):
         """Test path parameter validation."""
         # Valid case
@@ -251,14 +277,17 @@ class TestSchemaProcessor:
             }
         }
 
-        schemas, errors, warnings = self.processor.process_schemas(components_data)
+        schemas, errors, warnings = self.processor.process_schemas(
+            components_data, {"components": components_data}
+        )
 
         assert len(schemas) == 2
         assert len(errors) == 0
 
         user_schema = schemas["User"]
-        # TODO: Dependency analysis not yet implemented
-        # assert "Address" in user_schema.dependencies
+        assert "Address" in user_schema.dependencies
+        assert "User" in schemas["Address"].used_by
+        assert not self.processor.is_circular_reference("User")
 
     def test_detect_circular_dependencies(self):
         """Test detection of circular schema dependencies."""
@@ -277,14 +306,71 @@ class TestSchemaProcessor:
             }
         }
 
-        schemas, errors, warnings = self.processor.process_schemas(components_data)
+        schemas, errors, warnings = self.processor.process_schemas(
+            components_data, {"components": components_data}
+        )
 
         # Should handle self-reference without error
         assert len(schemas) == 1
         assert "Node" in schemas
         node_schema = schemas["Node"]
-        # TODO: Circular dependency analysis not yet implemented
-        # assert "Node" in node_schema.dependencies
+        assert "Node" in node_schema.dependencies
+        assert self.processor.is_circular_reference("Node")
+        assert warnings == ["Circular reference detected: Node -> Node"]
+
+    def test_reference_graph_analysis(self):
+        """Test cycles, resolution order and transitive dependencies."""
+        components_data = {
+            "schemas": {
+                "Order": {
+                    "type": "object",
+                    "properties": {
+                        "customer": {"$ref": "#/components/schemas/Customer"},
+                        "items": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/Item"},
+                        },
+                    },
+                },
+                "Customer": {
+                    "type": "object",
+                    "properties": {
+                        "orders": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/Order"},
+                        },
+                        "address": {"$ref": "#/components/schemas/Address"},
+                    },
+                },
+                "Item": {"type": "object"},
+                "Address": {"type": "object"},
+            }
+        }
+
+        schemas, errors, warnings = self.processor.process_schemas(
+            components_data, {"components": components_data}
+        )
+
+        assert len(errors) == 0
+        assert len(warnings) == 1
+        assert self.processor.is_circular_reference("Order")
+        assert self.processor.is_circular_reference("Customer")
+        assert not self.processor.is_circular_reference("Item")
+        assert self.processor.circular_references == {
+            "Order -> Customer",
+            "Customer -> Order",
+        }
+
+        order = self.processor.get_resolution_order()
+        assert order.index("Item") < order.index("Order")
+        assert order.index("Address") < order.index("Customer")
+        assert self.processor.get_transitive_dependencies("Order") == {
+            "Order",
+            "Customer",
+            "Item",
+            "Address",
+        }
+        assert self.processor.get_transitive_dependencies("Item") == set()
 
     def test_resolve_all_references(self):
         """Test comprehensive reference resolution."""
@@ -541,6 +627,47 @@ class TestConsistencyValidator:
         assert "statistics" in report
         assert "recommendations" in report
         assert report["summary"]["endpoints_analyzed"] == 1
+        assert set(report["statistics"]["rule_timings_ms"]) == {
+            rule.name for rule in DEFAULT_RULES
+        }
+
+    def test_rules_visit_registered_nodes_once(self):
+        """Rules see each registered node once, in a single traversal."""
+        visits = []
+
+        class RecordingRule(ConsistencyRule):
+            name = "recording"
+            node_types = frozenset({NodeType.PARAMETER, NodeType.SCHEMA})
+
+            def visit_endpoint(self, endpoint):
+                visits.append(("endpoint", endpoint.path))
+
+            def visit_parameter(self, endpoint, param):
+                visits.append(("parameter", param.name))
+
+            def visit_schema(self, schema_name, schema):
+                visits.append(("schema", schema_name))
+
+            def finish(self):
+                self.warnings.append(f"{len(visits)} nodes visited")
+
+        endpoints = [
+            Mock(path=f"/users/{index}", parameters=[Mock(), Mock()])
+            for index in range(300)
+        ]
+        for endpoint in endpoints:
+            endpoint.parameters[0].name = "id"
+            endpoint.parameters[1].name = "limit"
+        schemas = {"User": Mock(), "Order": Mock()}
+
+        validator = ConsistencyValidator(rules=[RecordingRule])
+        errors, warnings = validator.validate_full_consistency(endpoints, schemas, {})
+
+        assert errors == []
+        assert warnings == ["602 nodes visited"]
+        assert visits[:2] == [("parameter", "id"), ("parameter", "limit")]
+        assert visits[-2:] == [("schema", "User"), ("schema", "Order")]
+        assert list(validator.rule_timings_ms) == ["recording"]
 
 
 class TestSearchOptimizer:
@@ -713,6 +840,64 @@ class TestSearchOptimizer:
         assert stats["document_types"]["endpoint"] == 1
         assert stats["document_types"]["schema"] == 1
 
+    def _build_index(self):
+        documents = [
+            SearchableDocument(
+                "1", "endpoint", "GET /users", "list users users", [], {}, 1.0
+            ),
+            SearchableDocument(
+                "2", "schema", "User", "user schema users", [], {"type": "object"}, 1.0
+            ),
+        ]
+        return self.optimizer._build_search_index(documents)
+
+    def test_search_index_postings(self):
+        """Test the search index stores postings by term."""
+        search_index = self._build_index()
+
+        document_numbers, frequencies = search_index.postings("users")
+        assert list(document_numbers) == [0, 1]
+        assert list(frequencies) == [2, 1]
+        assert search_index.postings("missing") == ((), ())
+        assert search_index.document_frequency("users") == 2
+        assert search_index.document_lengths == {"1": 3, "2": 3}
+        assert search_index.term_frequencies["1"] == {"list": 1, "users": 2}
+        assert search_index.vocabulary == {"list", "users", "user", "schema"}
+
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_search_index_save_and_load(self, tmp_path, use_mmap):
+        """Test the search index round-trips through an index file."""
+        search_index = self._build_index()
+        index_file = tmp_path / "search.idx"
+        search_index.save(index_file)
+
+        loaded = SearchIndex.load(index_file, use_mmap=use_mmap)
+        try:
+            assert loaded.documents == search_index.documents
+            assert loaded.terms == search_index.terms
+            assert list(loaded.postings("users")[0]) == [0, 1]
+            assert loaded.term_frequencies == search_index.term_frequencies
+            assert loaded.document_lengths == search_index.document_lengths
+        finally:
+            loaded.close()
+
+    def test_search_index_load_rejects_other_files(self, tmp_path):
+        """Test loading a file that is not an index file fails."""
+        index_file = tmp_path / "search.idx"
+        index_file.write_bytes(b"not an index file")
+
+        with pytest.raises(ValueError):
+            SearchIndex.load(index_file)
+
+    def test_optimize_search_performance_removes_rare_terms(self):
+        """Test terms found in a single document are removed."""
+        search_index = self.optimizer.optimize_search_performance(self._build_index())
+
+        # "list" is an important term and is kept
+        assert search_index.vocabulary == {"users", "list"}
+        assert list(search_index.postings("users")[0]) == [0, 1]
+        assert list(search_index.postings("list")[0]) == [0]
+
 
 class TestIntegrationTests:
     """Integration tests for the complete normalization pipeline."""
@@ -916,3 +1101,123 @@ class TestIntegrationTests:
 
         assert search_index.total_documents == 100
         assert optimization_time < 2.0  # Should take less than 2 seconds
+
+
+class TestParallelNormalization:
+    """Tests for process-pool sharded normalization."""
+
+    @staticmethod
+    def _build_document(count: int) -> Dict[str, Any]:
+        paths = {}
+        schemas = {}
+        for i in range(count):
+            paths[f"/items{i}/{{id}}"] = {
+                "get": {
+                    "operationId": f"getItem{i}",
+                    "parameters": [
+                        {
+                            "name": "id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        }
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": f"#/components/schemas/Item{i}"}
+                                }
+                            },
+                        }
+                    },
+                }
+            }
+            # Each schema references one in a different shard
+            schemas[f"Item{i}"] = {
+                "type": "object",
+                "properties": {
+                    "next": {"$ref": f"#/components/schemas/Item{(i + 1) % count}"}
+                },
+            }
+        return {
+            "openapi": "3.0.0",
+            "info": {"title": "Items", "version": "1.0"},
+            "paths": paths,
+            "components": {"schemas": schemas},
+        }
+
+    def test_shard_items_preserves_order(self):
+        """Shards are contiguous, balanced and cover every item once."""
+        from swagger_mcp_server.parser.parallel_normalizer import shard_items
+
+        items = {f"k{i}": i for i in range(10)}
+
+        shards = shard_items(items, 3)
+
+        assert [len(shard) for shard in shards] == [4, 3, 3]
+        assert [key for shard in shards for key in shard] == list(items)
+        assert shard_items({"a": 1}, 8) == [{"a": 1}]
+
+    def test_parallel_matches_serial(self):
+        """Sharded normalization produces the same result as serial."""
+        from swagger_mcp_server.parser.schema_normalizer import (
+            NormalizationConfig,
+            SchemaNormalizer,
+        )
+
+        document = self._build_document(40)
+        serial = SchemaNormalizer(
+            NormalizationConfig(optimize_for_search=False)
+        ).normalize_openapi_document(document)
+        parallel = SchemaNormalizer(
+            NormalizationConfig(
+                optimize_for_search=False, max_workers=3, parallel_min_items=1
+            )
+        ).normalize_openapi_document(document)
+
+        assert [e.operation_id for e in parallel.endpoints] == [
+            e.operation_id for e in serial.endpoints
+        ]
+        assert list(parallel.schemas) == list(serial.schemas)
+        assert parallel.schemas == serial.schemas
+        assert parallel.errors == serial.errors
+        assert parallel.warnings == serial.warnings
+
+    def test_parallel_failure_falls_back_to_serial(self):
+        """A broken process pool falls back to serial normalization."""
+        from swagger_mcp_server.parser.schema_normalizer import (
+            NormalizationConfig,
+            SchemaNormalizer,
+        )
+
+        normalizer = SchemaNormalizer(
+            NormalizationConfig(max_workers=2, parallel_min_items=1)
+        )
+
+        with patch(
+            "swagger_mcp_server.parser.schema_normalizer.ParallelNormalizer.normalize",
+            side_effect=OSError("no semaphores"),
+        ):
+            result = normalizer.normalize_openapi_document(self._build_document(5))
+
+        assert len(result.endpoints) == 5
+        assert len(result.schemas) == 5
+
+    def test_small_documents_stay_serial(self):
+        """Documents below the item threshold never start a pool."""
+        from swagger_mcp_server.parser.schema_normalizer import (
+            NormalizationConfig,
+            SchemaNormalizer,
+        )
+
+        normalizer = SchemaNormalizer(NormalizationConfig(max_workers=4))
+
+        with patch(
+            "swagger_mcp_server.parser.schema_normalizer.ParallelNormalizer"
+        ) as parallel_normalizer:
+            result = normalizer.normalize_openapi_document(self._build_document(5))
+
+        parallel_normalizer.assert_not_called()
+        assert len(result.endpoints) == 5
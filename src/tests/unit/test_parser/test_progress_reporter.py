@@ -0,0 +1,88 @@
+"""Tests for queued, coalescing progress reporting."""
+
+import asyncio
+import threading
+
+from swagger_mcp_server.parser.progress_reporter import (
+    ProgressPhase,
+    ProgressReporter,
+)
+
+
+class TestProgressReporter:
+    """Test ProgressReporter event delivery."""
+
+    async def test_updates_are_coalesced(self):
+        """Updates queued while the dispatcher waits collapse to the latest."""
+        events = []
+        reporter = ProgressReporter(
+            callback=events.append, interval_bytes=1, max_events_per_second=5
+        )
+
+        await reporter.start_operation(1000)
+        await reporter.start_phase(ProgressPhase.PARSING, "Parsing")
+        for processed in range(100, 1001, 100):
+            reporter.record_progress(processed, 1000)
+        await reporter.complete()
+
+        phases = [event.phase for event in events]
+        assert phases[0] == ProgressPhase.INITIALIZATION
+        assert phases[-1] == ProgressPhase.COMPLETION
+
+        updates = [event for event in events if event.message.endswith("progress")]
+        assert [event.bytes_processed for event in updates] == [1000]
+        assert reporter.events_coalesced == 9
+        assert reporter.get_metrics()["events_delivered"] == len(events)
+
+    async def test_update_rate_is_throttled(self):
+        """Updates are delivered at most max_events_per_second."""
+        events = []
+        reporter = ProgressReporter(
+            callback=events.append, interval_bytes=1, max_events_per_second=20
+        )
+
+        await reporter.start_phase(ProgressPhase.PARSING, "Parsing")
+        for processed in range(1, 101):
+            reporter.record_progress(processed, 100)
+            await asyncio.sleep(0.001)
+        await reporter.complete()
+
+        updates = [event for event in events if event.message.endswith("progress")]
+        assert 1 <= len(updates) < 50
+        assert updates[-1].bytes_processed == 100
+
+    async def test_async_callback_and_errors(self):
+        """Async callbacks are awaited and callback errors are contained."""
+        events = []
+
+        async def callback(event):
+            events.append(event)
+            if event.message == "Parsing":
+                raise ValueError("broken callback")
+
+        reporter = ProgressReporter(callback=callback)
+
+        await reporter.start_phase(ProgressPhase.PARSING, "Parsing")
+        await reporter.fail("boom")
+
+        assert [event.message for event in events] == ["Parsing", "Failed: boom"]
+        assert reporter.events_delivered == 1
+
+    def test_without_event_loop(self):
+        """Synchronous callbacks are called directly outside an event loop."""
+        events = []
+        reporter = ProgressReporter(callback=events.append)
+        reporter.current_phase = ProgressPhase.PARSING
+
+        def report():
+            asyncio.run(reporter.start_phase(ProgressPhase.PARSING, "Parsing"))
+            reporter.record_progress(10, 10)
+
+        # asyncio.run() clears the current event loop of its thread when it
+        # finishes; a separate thread keeps the main thread's loop intact
+        # for the async tests that run later in the session
+        thread = threading.Thread(target=report)
+        thread.start()
+        thread.join()
+
+        assert [event.progress_percent for event in events] == [0.0, 100.0]
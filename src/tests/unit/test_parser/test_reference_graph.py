@@ -0,0 +1,48 @@
+"""Tests for the schema reference graph."""
+
+from swagger_mcp_server.parser.reference_graph import SchemaReferenceGraph
+
+
+class TestSchemaReferenceGraph:
+    """Test SchemaReferenceGraph functionality."""
+
+    def test_components_in_dependency_order(self):
+        """Components are listed after the components they reference."""
+        graph = SchemaReferenceGraph(
+            {"A": ["B"], "B": ["C"], "C": ["B", "D"], "D": [], "E": ["Missing"]}
+        )
+
+        assert sorted(map(sorted, graph.cyclic_components())) == [["B", "C"]]
+        order = graph.resolution_order()
+        assert order.index("D") < order.index("B") < order.index("A")
+        assert not graph.is_circular("E")
+        assert graph.in_same_cycle("B", "C")
+        assert not graph.in_same_cycle("A", "B")
+        assert graph.transitive_dependencies("A") == {"B", "C", "D"}
+        assert graph.transitive_dependencies("B") == {"B", "C", "D"}
+
+    def test_cycles(self):
+        """One cycle path is reported per cyclic component."""
+        graph = SchemaReferenceGraph(
+            {"Node": ["Node"], "A": ["B"], "B": ["C"], "C": ["A"]}
+        )
+
+        cycles = sorted(graph.cycles())
+
+        assert ["Node", "Node"] in cycles
+        abc_cycle = next(cycle for cycle in cycles if "A" in cycle)
+        assert abc_cycle[0] == abc_cycle[-1]
+        assert sorted(abc_cycle[:-1]) == ["A", "B", "C"]
+
+    def test_deep_chain_without_recursion(self):
+        """Long reference chains do not hit the recursion limit."""
+        size = 5000
+        edges = {f"S{i}": [f"S{i + 1}"] for i in range(size)}
+        edges[f"S{size}"] = ["S0"]
+
+        graph = SchemaReferenceGraph(edges)
+
+        assert len(graph.components) == 1
+        assert graph.is_circular("S0")
+        assert len(graph.cycles()[0]) == size + 2
+        assert len(graph.transitive_dependencies("S10")) == size + 1
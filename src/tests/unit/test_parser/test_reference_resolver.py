@@ -0,0 +1,149 @@
+"""Tests for JSON pointer indexing and $ref resolution."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from swagger_mcp_server.parser.reference_resolver import (
+    JsonPointerIndex,
+    ReferenceResolver,
+)
+from swagger_mcp_server.parser.schema_processor import SchemaProcessor
+
+DOCUMENT = {
+    "openapi": "3.0.0",
+    "paths": {"/pets/{id}": {"get": {"responses": {"200": {"description": "OK"}}}}},
+    "components": {
+        "schemas": {
+            "Pet": {
+                "type": "object",
+                "properties": {
+                    "owner": {"$ref": "#/components/schemas/Owner"},
+                    "error": {"$ref": "common.yaml#/components/schemas/Error"},
+                },
+            },
+            "Owner": {"type": "object"},
+        }
+    },
+}
+
+COMMON_YAML = """
+components:
+  schemas:
+    Error:
+      type: object
+      properties:
+        code:
+          $ref: 'codes.json#/Code'
+"""
+
+
+class TestJsonPointerIndex:
+    """Test JsonPointerIndex functionality."""
+
+    def test_lookup(self):
+        """Containers, scalars and escaped keys are addressable."""
+        index = JsonPointerIndex(DOCUMENT)
+
+        assert index.get("") == (True, DOCUMENT)
+        assert index.get("/components/schemas/Owner") == (True, {"type": "object"})
+        assert index.get("/paths/~1pets~1{id}/get/responses/200/description") == (
+            True,
+            "OK",
+        )
+        assert index.get("/openapi") == (True, "3.0.0")
+        assert index.get("/components/schemas/Missing") == (False, None)
+
+
+class TestReferenceResolver:
+    """Test ReferenceResolver functionality."""
+
+    @pytest.fixture
+    def spec_path(self, tmp_path):
+        """Write the root document and its external files."""
+        spec_path = tmp_path / "api.json"
+        spec_path.write_text(json.dumps(DOCUMENT))
+        (tmp_path / "common.yaml").write_text(COMMON_YAML)
+        (tmp_path / "codes.json").write_text(json.dumps({"Code": {"type": "int"}}))
+        return spec_path
+
+    def test_local_references_memoized(self):
+        """Each distinct reference is resolved once."""
+        resolver = ReferenceResolver(DOCUMENT)
+
+        with patch.object(resolver, "_resolve", wraps=resolver._resolve) as resolve:
+            first = resolver.resolve("#/components/schemas/Owner")
+            second = resolver.resolve("#/components/schemas/Owner")
+
+        assert resolve.call_count == 1
+        assert first is second
+        assert first.resolved
+        assert first.target == "components/schemas/Owner"
+        assert first.value == {"type": "object"}
+
+        missing = resolver.resolve("#/components/schemas/Missing")
+        assert not missing.resolved
+        assert "Reference not found" in missing.error
+
+    def test_external_references(self, spec_path):
+        """Relative file references are loaded lazily and cached per file."""
+        resolver = ReferenceResolver(DOCUMENT, spec_path)
+        assert resolver.get_statistics()["external_documents"] == 0
+
+        with patch.object(
+            resolver, "_load_document", wraps=resolver._load_document
+        ) as load:
+            error = resolver.resolve("common.yaml#/components/schemas/Error")
+            document = resolver.resolve("common.yaml")
+            nested = resolver.resolve(
+                error.value["properties"]["code"]["$ref"],
+                source=spec_path.parent / "common.yaml",
+            )
+
+        assert load.call_count == 2
+        assert error.resolved
+        assert error.target == "common.yaml#/components/schemas/Error"
+        assert document.value["components"]["schemas"]["Error"] == error.value
+        assert nested.target == "codes.json#/Code"
+        assert nested.value == {"type": "int"}
+        assert resolver.get_statistics()["external_documents"] == 2
+        assert resolver.get_external_documents() == [
+            spec_path.parent.resolve() / "codes.json",
+            spec_path.parent.resolve() / "common.yaml",
+        ]
+
+    def test_unresolvable_external_references(self, spec_path):
+        """Missing files, remote and location-less references fail cleanly."""
+        resolver = ReferenceResolver(DOCUMENT, spec_path)
+
+        missing = resolver.resolve("missing.yaml#/Thing")
+        assert not missing.resolved
+        assert "Failed to load referenced document" in missing.error
+        # A file created later changes the resolution
+        assert resolver.get_external_documents() == [
+            spec_path.parent.resolve() / "missing.yaml"
+        ]
+
+        remote = resolver.resolve("https://example.com/api.yaml#/Thing")
+        assert "Remote references not supported" in remote.error
+
+        without_location = ReferenceResolver(DOCUMENT).resolve("common.yaml#/x")
+        assert "requires the document location" in without_location.error
+
+    def test_schema_processor_external_reference(self, spec_path):
+        """Schemas referencing external files resolve without warnings."""
+        processor = SchemaProcessor()
+
+        with patch.object(processor.logger, "warning") as warning:
+            schemas, errors, _ = processor.process_schemas(
+                DOCUMENT["components"], DOCUMENT, spec_path
+            )
+
+        assert errors == []
+        warning.assert_not_called()
+        assert schemas["Pet"].dependencies == {"Owner"}
+        assert processor.dependency_graph["Pet"] == {
+            "components/schemas/Owner",
+            "common.yaml#/components/schemas/Error",
+        }
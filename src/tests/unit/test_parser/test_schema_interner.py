@@ -0,0 +1,185 @@
+"""Tests for hash-consing of schema subtrees."""
+
+import copy
+
+import pytest
+
+from swagger_mcp_server.parser.schema_interner import SchemaInterner
+from swagger_mcp_server.parser.schema_normalizer import (
+    NormalizationConfig,
+    SchemaNormalizer,
+)
+
+ERROR_SHAPE = {
+    "type": "object",
+    "properties": {
+        "code": {"type": "integer", "format": "int32"},
+        "message": {"type": "string"},
+    },
+}
+
+
+class TestSchemaInterner:
+    """Test structural sharing of subtrees."""
+
+    def test_identical_subtrees_are_shared(self):
+        """Equal subtrees map to one instance, at every depth."""
+        interner = SchemaInterner()
+        first = interner.intern(copy.deepcopy(ERROR_SHAPE))
+        second = interner.intern(copy.deepcopy(ERROR_SHAPE))
+
+        assert first == ERROR_SHAPE
+        assert second is first
+        assert interner.nodes_seen == 8
+        assert interner.unique_nodes == 4
+        assert interner.dedup_ratio == pytest.approx(0.5)
+
+    def test_shared_children_inside_different_parents(self):
+        """Parents differing elsewhere still share their identical children."""
+        interner = SchemaInterner()
+        first = interner.intern({"a": copy.deepcopy(ERROR_SHAPE), "b": 1})
+        second = interner.intern({"a": copy.deepcopy(ERROR_SHAPE), "b": 2})
+
+        assert first is not second
+        assert first["a"] is second["a"]
+
+    @pytest.mark.parametrize(
+        "left, right",
+        [
+            ({"x": 1}, {"x": True}),
+            ({"x": 1}, {"x": 1.0}),
+            ({"x": "1"}, {"x": 1}),
+            ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+            ([1, 2], [2, 1]),
+            ({"x": []}, {"x": {}}),
+        ],
+    )
+    def test_distinct_subtrees_are_not_shared(self, left, right):
+        """Types, key order and element order are part of the structure."""
+        interner = SchemaInterner()
+
+        assert interner.intern(left) is not interner.intern(right)
+        assert interner.dedup_ratio == 0.0
+
+    def test_input_is_not_modified(self):
+        """Containers with replaced children are copied, not changed."""
+        interner = SchemaInterner()
+        shared = interner.intern(copy.deepcopy(ERROR_SHAPE))
+        original = {"items": [copy.deepcopy(ERROR_SHAPE)]}
+        items = original["items"]
+
+        result = interner.intern(original)
+
+        assert result["items"][0] is shared
+        assert original["items"] is items
+        assert original["items"][0] is not shared
+
+    def test_scalars_pass_through(self):
+        """Scalars and None are returned unchanged and not counted."""
+        interner = SchemaInterner()
+
+        assert interner.intern("text") == "text"
+        assert interner.intern(None) is None
+        assert interner.nodes_seen == 0
+
+    def test_release_keeps_statistics(self):
+        """Releasing drops the table; reset also clears the counters."""
+        interner = SchemaInterner()
+        first = interner.intern(copy.deepcopy(ERROR_SHAPE))
+        interner.intern(copy.deepcopy(ERROR_SHAPE))
+
+        interner.release()
+        assert interner.get_statistics()["duplicate_subtrees"] == 4
+        assert interner.intern(copy.deepcopy(ERROR_SHAPE)) is not first
+
+        interner.reset()
+        assert interner.get_statistics() == {
+            "subtrees_seen": 0,
+            "unique_subtrees": 0,
+            "duplicate_subtrees": 0,
+            "dedup_ratio": 0.0,
+        }
+
+
+class TestNormalizationDeduplication:
+    """Test deduplication during document normalization."""
+
+    @pytest.fixture
+    def openapi_data(self):
+        """Document repeating an inline error shape in every operation."""
+        return {
+            "openapi": "3.0.0",
+            "info": {"title": "Generated API", "version": "1.0.0"},
+            "paths": {
+                f"/things{index}": {
+                    "post": {
+                        "operationId": f"createThing{index}",
+                        "requestBody": {
+                            "content": {
+                                "application/json": {
+                                    "schema": copy.deepcopy(ERROR_SHAPE)
+                                }
+                            }
+                        },
+                        "responses": {
+                            "500": {
+                                "description": "Error",
+                                "content": {
+                                    "application/json": {
+                                        "schema": copy.deepcopy(ERROR_SHAPE)
+                                    }
+                                },
+                            }
+                        },
+                    }
+                }
+                for index in range(10)
+            },
+            "components": {
+                "schemas": {
+                    "Error": copy.deepcopy(ERROR_SHAPE),
+                    "Thing": {"type": "object", "properties": {"error": ERROR_SHAPE}},
+                }
+            },
+        }
+
+    def test_repeated_shapes_are_shared(self, openapi_data):
+        """Endpoints and schemas share one instance of the repeated shape."""
+        result = SchemaNormalizer().normalize_openapi_document(openapi_data)
+
+        bodies = [
+            endpoint.request_body.content["application/json"]["schema"]
+            for endpoint in result.endpoints
+        ] + [
+            endpoint.responses["500"].content["application/json"]["schema"]
+            for endpoint in result.endpoints
+        ]
+        shared = bodies[0]
+        assert all(body is shared for body in bodies)
+        assert result.schemas["Thing"].properties["error"] is shared
+        assert result.schemas["Error"].properties is shared["properties"]
+
+        statistics = result.statistics["deduplication"]
+        assert statistics["duplicate_subtrees"] > 0
+        assert 0.0 < statistics["dedup_ratio"] < 1.0
+
+    def test_statistics_are_per_document(self, openapi_data):
+        """Normalizing a document again reports the same ratio."""
+        normalizer = SchemaNormalizer()
+        first = normalizer.normalize_openapi_document(openapi_data)
+        second = normalizer.normalize_openapi_document(openapi_data)
+
+        assert first.statistics["deduplication"] == second.statistics["deduplication"]
+
+    def test_deduplication_can_be_disabled(self, openapi_data):
+        """Without deduplication no subtree is shared."""
+        result = SchemaNormalizer(
+            NormalizationConfig(deduplicate_schemas=False)
+        ).normalize_openapi_document(openapi_data)
+
+        first, second = result.endpoints[:2]
+        assert (
+            first.request_body.content["application/json"]["schema"]
+            is not second.request_body.content["application/json"]["schema"]
+        )
+        assert "deduplication" not in result.statistics
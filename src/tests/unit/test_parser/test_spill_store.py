@@ -0,0 +1,222 @@
+"""Tests for disk-spilling normalization."""
+
+import json
+import pickle
+
+import pytest
+
+from swagger_mcp_server.parser.base import ParserConfig
+from swagger_mcp_server.parser.consistency_validator import (
+    DEFAULT_RULES,
+    ConsistencyVisitor,
+)
+from swagger_mcp_server.parser.models import HttpMethod, NormalizedEndpoint
+from swagger_mcp_server.parser.schema_normalizer import (
+    NormalizationConfig,
+    SchemaNormalizer,
+)
+from swagger_mcp_server.parser.schema_processor import SchemaProcessor
+from swagger_mcp_server.parser.spill_store import SpillStore
+from swagger_mcp_server.parser.stream_parser import SwaggerStreamParser
+
+
+def make_endpoint(path: str) -> NormalizedEndpoint:
+    return NormalizedEndpoint(path=path, method=HttpMethod.GET, operation_id=path)
+
+
+def make_schema(name: str, **schema_def):
+    schema_def.setdefault("type", "object")
+    return SchemaProcessor()._create_basic_schema(name, schema_def)
+
+
+@pytest.fixture
+def openapi_data():
+    """OpenAPI document with an undefined schema reference."""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Spilled API", "version": "1.0.0"},
+        "security": [{"apiKey": []}],
+        "paths": {
+            f"/items{index}": {
+                "get": {
+                    "operationId": f"getItems{index}",
+                    "summary": f"List items {index}",
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/Item"}
+                                }
+                            },
+                        }
+                    },
+                },
+                "delete": {
+                    "operationId": f"deleteItems{index}",
+                    "responses": {
+                        "404": {
+                            "description": "Not found",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/Missing"}
+                                }
+                            },
+                        }
+                    },
+                },
+            }
+            for index in range(30)
+        },
+        "components": {
+            "schemas": {
+                "Item": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "string"},
+                        "owner": {"$ref": "#/components/schemas/Owner"},
+                    },
+                },
+                "Owner": {"type": "object", "properties": {"name": {"type": "string"}}},
+            },
+            "securitySchemes": {
+                "apiKey": {"type": "apiKey", "in": "header", "name": "X-Key"}
+            },
+        },
+    }
+
+
+class TestSpillStore:
+    """Test the on-disk store of normalized objects."""
+
+    def test_endpoints_round_trip_in_order(self, tmp_path):
+        """Endpoints are read back in insertion order, across batches."""
+        with SpillStore(tmp_path, batch_size=3) as store:
+            for index in range(10):
+                store.add_endpoint(make_endpoint(f"/e{index}"))
+
+            assert len(store.endpoints) == 10
+            assert [e.path for e in store.endpoints] == [f"/e{i}" for i in range(10)]
+            # Views can be iterated again
+            assert [e.path for e in store.endpoints][0] == "/e0"
+            assert store.bytes_written > 0
+
+    def test_schemas_behave_like_a_mapping(self, tmp_path):
+        """Schemas are keyed by name and a later schema replaces an earlier one."""
+        with SpillStore(tmp_path) as store:
+            store.add_schema(make_schema("User"))
+            store.add_schema(make_schema("Address"))
+            store.add_schema(make_schema("User", description="Replaced"))
+
+            schemas = store.schemas
+            assert len(schemas) == 2
+            assert "User" in schemas
+            assert "Missing" not in schemas
+            assert schemas["User"].description == "Replaced"
+            assert set(schemas) == {"User", "Address"}
+            assert dict(schemas.items())["Address"].name == "Address"
+            assert [s.name for s in schemas.values()] == ["Address", "User"]
+            with pytest.raises(KeyError):
+                schemas["Missing"]
+
+    def test_empty_store(self, tmp_path):
+        """An empty store has empty, falsy views."""
+        with SpillStore(tmp_path) as store:
+            assert not store.endpoints
+            assert not store.schemas
+            assert list(store.endpoints) == []
+
+    def test_close_deletes_database(self, tmp_path):
+        """Closing removes the temporary file and rejects further use."""
+        store = SpillStore(tmp_path)
+        store.add_endpoint(make_endpoint("/a"))
+        assert store.path.exists()
+
+        store.close()
+        store.close()
+
+        assert store.closed
+        assert not store.path.exists()
+        with pytest.raises(ValueError):
+            store.add_endpoint(make_endpoint("/b"))
+
+    def test_store_cannot_be_pickled(self, tmp_path):
+        """Spilled results are never written to the normalization cache."""
+        with SpillStore(tmp_path) as store:
+            with pytest.raises(TypeError):
+                pickle.dumps(store)
+
+
+class TestSpilledNormalization:
+    """Test normalization in spill mode."""
+
+    def test_spilled_result_matches_in_memory(self, openapi_data, tmp_path):
+        """Later phases see the same data whether or not it was spilled."""
+        in_memory = SchemaNormalizer().normalize_openapi_document(openapi_data)
+        spilled = SchemaNormalizer(
+            NormalizationConfig(spill_to_disk=True, spill_dir=str(tmp_path))
+        ).normalize_openapi_document(openapi_data)
+
+        try:
+            assert spilled.is_spilled
+            assert not in_memory.is_spilled
+            assert len(spilled.endpoints) == len(in_memory.endpoints) == 60
+            assert [e.operation_id for e in spilled.endpoints] == [
+                e.operation_id for e in in_memory.endpoints
+            ]
+            assert list(spilled.schemas) == list(in_memory.schemas)
+            assert spilled.schemas["Item"].dependencies == {"Owner"}
+
+            assert spilled.consistency_report["errors"]
+            assert (
+                spilled.consistency_report["errors"]
+                == in_memory.consistency_report["errors"]
+            )
+            assert len(spilled.search_index.documents) == len(
+                in_memory.search_index.documents
+            )
+            assert (
+                spilled.statistics["quality_metrics"]
+                == in_memory.statistics["quality_metrics"]
+            )
+            assert list(spilled.security_schemes) == ["apiKey"]
+        finally:
+            spilled.close()
+
+        assert not spilled.spill_store.path.exists()
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_streamed_document_to_disk(self, openapi_data, tmp_path):
+        """Streamed documents are normalized without materializing them."""
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text(json.dumps(openapi_data))
+        parse_result = await SwaggerStreamParser(
+            ParserConfig(streaming_mode=True)
+        ).parse(spec_file)
+
+        normalizer = SchemaNormalizer(
+            NormalizationConfig(spill_to_disk=True, spill_dir=str(tmp_path / "spill"))
+        )
+        result = normalizer.normalize_streamed_document_to_disk(
+            parse_result.document_stream
+        )
+
+        try:
+            assert len(result.endpoints) == 60
+            assert list(result.schemas) == ["Item", "Owner"]
+            assert list(result.security_schemes) == ["apiKey"]
+            assert result.consistency_report["summary"]["endpoints_analyzed"] == 60
+        finally:
+            result.close()
+
+    def test_consistency_visitor_accepts_iterables(self):
+        """Consistency rules only need a single pass over the nodes."""
+        endpoints = [make_endpoint(f"/e{index}") for index in range(5)]
+        endpoints.append(make_endpoint("/e0"))
+        schemas = {"Owner": make_schema("Owner")}
+
+        def run(nodes):
+            rules = [rule(schemas, {}) for rule in DEFAULT_RULES]
+            return ConsistencyVisitor(rules, chunk_size=2).run(nodes, schemas)
+
+        assert run(iter(endpoints)) == run(endpoints)
@@ -7,11 +7,19 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from swagger_mcp_server.parser.base import (
+    MemoryTelemetryMode,
     ParserConfig,
     ParseStatus,
+    ParseStrategy,
     SwaggerParseError,
+    select_parse_strategy,
+)
+from swagger_mcp_server.parser.memory_telemetry import MemoryTelemetry
+from swagger_mcp_server.parser.stream_parser import (
+    IN_MEMORY_BACKEND,
+    STREAMING_BACKEND,
+    SwaggerStreamParser,
 )
-from swagger_mcp_server.parser.stream_parser import SwaggerStreamParser
 
 
 class TestSwaggerStreamParser:
@@ -443,3 +451,310 @@ class TestSwaggerStreamParser:
         for result in results:
             assert result.is_success is True
             assert result.data is not None
+
+
+class TestStreamingMode:
+    """Test incremental path/schema streaming."""
+
+    @pytest.fixture
+    def streaming_parser(self):
+        """Create stream parser in streaming mode."""
+        return SwaggerStreamParser(ParserConfig(streaming_mode=True))
+
+    @pytest.fixture
+    def spec_file(self, tmp_path):
+        """Create OpenAPI file with paths, schemas and extensions."""
+        data = {
+            "openapi": "3.0.0",
+            "info": {"title": "Streamed API", "version": "2.0.0"},
+            "security": [{"apiKey": []}],
+            "x-root": True,
+            "paths": {
+                "/users": {
+                    "parameters": [{"name": "trace", "in": "header"}],
+                    "get": {
+                        "operationId": "listUsers",
+                        "x-internal": False,
+                        "responses": {
+                            "200": {
+                                "description": "OK",
+                                "content": {
+                                    "application/json": {
+                                        "schema": {"$ref": "#/components/schemas/User"}
+                                    }
+                                },
+                            }
+                        },
+                    },
+                    "post": {"responses": {"201": {"description": "Created"}}},
+                },
+                "/v1.0/health": {"get": {"responses": {}}},
+            },
+            "components": {
+                "schemas": {
+                    "User": {
+                        "type": "object",
+                        "properties": {
+                            "address": {"$ref": "#/components/schemas/Address"},
+                            "score": {"type": "number", "example": 0.5},
+                        },
+                    },
+                    "Address": {"type": "object"},
+                },
+                "securitySchemes": {
+                    "apiKey": {"type": "apiKey", "in": "header", "name": "X-Key"}
+                },
+            },
+        }
+
+        json_file = tmp_path / "streamed.json"
+        json_file.write_text(json.dumps(data))
+        return json_file
+
+    async def test_parse_returns_skeleton_only(self, streaming_parser, spec_file):
+        """Paths and schemas are not materialized in streaming mode."""
+        result = await streaming_parser.parse(spec_file)
+
+        assert result.is_success is True
+        assert "paths" not in result.data
+        assert "schemas" not in result.data["components"]
+        assert "securitySchemes" in result.data["components"]
+        assert result.api_title == "Streamed API"
+        assert result.document_stream is not None
+
+    async def test_streaming_metrics_counted_during_pass(
+        self, streaming_parser, spec_file
+    ):
+        """Quality metrics match the full parse without building the document."""
+        streamed = await streaming_parser.parse(spec_file)
+        full = await SwaggerStreamParser().parse(spec_file)
+
+        assert streamed.metrics.endpoints_found == full.metrics.endpoints_found == 3
+        assert streamed.metrics.schemas_found == full.metrics.schemas_found == 2
+        assert streamed.metrics.security_schemes_found == 1
+        assert streamed.metrics.extensions_found == full.metrics.extensions_found
+
+    async def test_iter_operations_and_schemas(self, streaming_parser, spec_file):
+        """Operations and schemas are yielded one at a time."""
+        result = await streaming_parser.parse(spec_file)
+        stream = result.document_stream
+
+        operations = list(stream.iter_operations())
+        assert [(path, method) for path, method, _ in operations] == [
+            ("/users", "get"),
+            ("/users", "post"),
+            ("/v1.0/health", "get"),
+        ]
+        assert operations[0][2]["operationId"] == "listUsers"
+
+        schemas = dict(stream.iter_schemas())
+        assert list(schemas) == ["User", "Address"]
+        assert isinstance(schemas["User"]["properties"]["score"]["example"], float)
+
+    async def test_swagger2_definitions_streamed(self, streaming_parser, tmp_path):
+        """Swagger 2.0 definitions are streamed as schemas."""
+        data = {
+            "swagger": "2.0",
+            "info": {"title": "Legacy", "version": "1"},
+            "paths": {},
+            "definitions": {"Pet": {"type": "object"}},
+        }
+        json_file = tmp_path / "swagger2.json"
+        json_file.write_text(json.dumps(data))
+
+        result = await streaming_parser.parse(json_file)
+
+        assert "definitions" not in result.data
+        assert result.metrics.schemas_found == 1
+        assert [name for name, _ in result.document_stream.iter_schemas()] == ["Pet"]
+
+    async def test_streamed_normalization(self, streaming_parser, spec_file):
+        """Streamed documents normalize into endpoints then schemas."""
+        from swagger_mcp_server.parser.models import (
+            NormalizedEndpoint,
+            NormalizedSchema,
+        )
+        from swagger_mcp_server.parser.schema_normalizer import (
+            SchemaNormalizer,
+        )
+
+        result = await streaming_parser.parse(spec_file)
+        errors = []
+        items = list(
+            SchemaNormalizer().normalize_streamed_document(
+                result.document_stream, errors=errors
+            )
+        )
+
+        endpoints = [i for i in items if isinstance(i, NormalizedEndpoint)]
+        schemas = [i for i in items if isinstance(i, NormalizedSchema)]
+
+        assert errors == []
+        assert len(endpoints) == 3
+        assert endpoints[0].schema_dependencies == {"User"}
+        assert endpoints[0].parameter_names == ["trace"]
+        assert [s.name for s in schemas] == ["User", "Address"]
+        assert schemas[0].dependencies == {"Address"}
+
+    async def test_streaming_malformed_json(self, streaming_parser, tmp_path):
+        """Malformed JSON fails gracefully in streaming mode."""
+        json_file = tmp_path / "malformed.json"
+        json_file.write_text('{"openapi": "3.0.0", "paths": {"/a": {"get": }}}')
+
+        result = await streaming_parser.parse(json_file)
+
+        assert result.status == ParseStatus.FAILED
+        assert result.metrics.errors[0].error_type == "InvalidJSON"
+
+
+class TestMemoryTelemetry:
+    """Test memory telemetry modes."""
+
+    @pytest.fixture
+    def spec_file(self, tmp_path):
+        """Create a small OpenAPI JSON file."""
+        data = {
+            "openapi": "3.0.0",
+            "info": {"title": "Telemetry API", "version": "1.0.0"},
+            "paths": {"/items": {"get": {"responses": {"200": {}}}}},
+        }
+        json_file = tmp_path / "telemetry.json"
+        json_file.write_text(json.dumps(data))
+        return json_file
+
+    async def test_sampled_mode_is_default(self, spec_file):
+        """Sampled RSS telemetry reports a parsing phase without tracemalloc."""
+        import tracemalloc
+
+        result = await SwaggerStreamParser().parse(spec_file)
+
+        assert result.is_success
+        assert result.metrics.memory_telemetry_mode == "sampled"
+        assert "parsing" in result.metrics.phase_memory_peak_mb
+        assert not tracemalloc.is_tracing()
+
+    async def test_off_mode_records_nothing(self, spec_file):
+        """Off mode skips measurement and the memory guard."""
+        config = ParserConfig(
+            memory_telemetry=MemoryTelemetryMode.OFF,
+            max_memory_mb=1,
+            progress_interval_bytes=1,
+        )
+
+        result = await SwaggerStreamParser(config).parse(spec_file)
+
+        assert result.is_success
+        assert result.metrics.memory_telemetry_mode == "off"
+        assert result.metrics.memory_peak_mb == 0.0
+
+    async def test_tracemalloc_mode_is_opt_in(self, spec_file):
+        """Tracemalloc mode traces only for the duration of the parse."""
+        import tracemalloc
+
+        config = ParserConfig(memory_telemetry=MemoryTelemetryMode.TRACEMALLOC)
+
+        result = await SwaggerStreamParser(config).parse(spec_file)
+
+        assert result.is_success
+        assert result.metrics.memory_telemetry_mode == "tracemalloc"
+        assert result.metrics.phase_memory_peak_mb["parsing"] > 0
+        assert not tracemalloc.is_tracing()
+
+    @pytest.mark.parametrize("streaming_mode", [False, True])
+    async def test_sampled_guard_enforces_limit(self, spec_file, streaming_mode):
+        """The max_memory_mb guard fires in sampled mode."""
+        config = ParserConfig(
+            max_memory_mb=1,
+            progress_interval_bytes=1,
+            streaming_mode=streaming_mode,
+        )
+
+        result = await SwaggerStreamParser(config).parse(spec_file)
+
+        assert result.status == ParseStatus.FAILED
+        assert result.metrics.errors[0].error_type == "MemoryLimitExceeded"
+
+    def test_phase_peaks(self):
+        """Peaks are attributed to the phase that was active."""
+        telemetry = MemoryTelemetry(MemoryTelemetryMode.TRACEMALLOC)
+        telemetry.start()
+        try:
+            telemetry.start_phase("small")
+            telemetry.start_phase("large")
+            buffer = bytearray(8 * 1024 * 1024)
+            telemetry.end_phase()
+            del buffer
+        finally:
+            telemetry.stop()
+
+        assert telemetry.phase_peaks_mb["large"] >= 8
+        assert telemetry.phase_peaks_mb["small"] < 1
+        assert telemetry.peak_mb >= 8
+
+
+class TestParseStrategy:
+    """Test size-adaptive selection of the JSON decoder."""
+
+    @pytest.fixture
+    def spec_file(self, tmp_path):
+        """Create a small OpenAPI JSON file."""
+        data = {
+            "openapi": "3.0.0",
+            "info": {"title": "Strategy API", "version": "1.0.0"},
+            "paths": {"/items": {"get": {"responses": {"200": {}}}}},
+            "components": {"schemas": {"Item": {"type": "object"}}},
+        }
+        json_file = tmp_path / "strategy.json"
+        json_file.write_text(json.dumps(data))
+        return json_file
+
+    def test_select_parse_strategy(self):
+        """Files that fit in memory are decoded in one call."""
+        config = ParserConfig(in_memory_max_mb=1, in_memory_factor=10)
+        gigabyte = 1024**3
+
+        assert select_parse_strategy(1024, config, gigabyte) == ParseStrategy.IN_MEMORY
+        assert (
+            select_parse_strategy(2 * 1024 * 1024, config, gigabyte)
+            == ParseStrategy.STREAMING
+        )
+        assert select_parse_strategy(1024, config, 5000) == ParseStrategy.STREAMING
+
+        forced = ParserConfig(parse_strategy=ParseStrategy.STREAMING)
+        assert select_parse_strategy(1024, forced, gigabyte) == ParseStrategy.STREAMING
+
+    @pytest.mark.parametrize(
+        "strategy, backend",
+        [
+            (ParseStrategy.IN_MEMORY, IN_MEMORY_BACKEND),
+            (ParseStrategy.STREAMING, STREAMING_BACKEND),
+        ],
+    )
+    async def test_backends_agree(self, spec_file, strategy, backend):
+        """Both decoders produce the same document and report themselves."""
+        result = await SwaggerStreamParser(ParserConfig(parse_strategy=strategy)).parse(
+            spec_file
+        )
+
+        assert result.is_success
+        assert result.data == json.loads(spec_file.read_text())
+        assert result.metrics.parser_backend == backend
+        assert result.metrics.endpoints_found == 1
+
+    def test_backend_names(self):
+        """Backend names include the decoder library."""
+        assert IN_MEMORY_BACKEND in ("orjson+mmap", "json+mmap")
+        assert STREAMING_BACKEND.startswith("ijson:")
+
+    @pytest.mark.parametrize("content", ["", "{invalid", "[1, 2]"])
+    async def test_in_memory_invalid_json(self, tmp_path, content):
+        """Decoding errors and non-object roots fail the parse."""
+        json_file = tmp_path / "invalid.json"
+        json_file.write_text(content)
+
+        result = await SwaggerStreamParser(
+            ParserConfig(parse_strategy=ParseStrategy.IN_MEMORY)
+        ).parse(json_file)
+
+        assert result.status == ParseStatus.FAILED
+        assert result.metrics.errors[0].error_type == "InvalidJSON"
@@ -0,0 +1,72 @@
+"""Tests for the shared search tokenizer."""
+
+from swagger_mcp_server.config.settings import SearchConfig
+from swagger_mcp_server.parser.tokenizer import Tokenizer, suffix_stem
+from swagger_mcp_server.search.query_processor import QueryProcessor
+
+
+class TestTokenizer:
+    """Test Tokenizer functionality."""
+
+    def test_split_identifiers_and_paths(self):
+        """camelCase, snake_case, kebab-case and paths are split into words."""
+        tokenizer = Tokenizer()
+
+        assert tokenizer.split("getUserByID") == ["get", "user", "by", "id"]
+        assert tokenizer.split("HTTPServer user_id") == ["http", "server", "user", "id"]
+        assert tokenizer.split("/api/v1/user-profiles/{id}") == [
+            "api",
+            "v1",
+            "user",
+            "profiles",
+            "id",
+        ]
+        assert tokenizer.split("") == []
+
+    def test_filtering(self):
+        """Stop words and short or very long words are dropped."""
+        tokenizer = Tokenizer(keep_terms={"x"})
+
+        assert tokenizer.tokenize("the x of a user " + "a" * 60) == ["x", "user"]
+
+    def test_stem_expansion(self):
+        """Stems are added after words or replace them."""
+        assert Tokenizer().tokenize("List endpoints") == [
+            "list",
+            "endpoints",
+            "endpoint",
+        ]
+        assert Tokenizer(expand_stems=False).tokenize("List endpoints") == [
+            "list",
+            "endpoint",
+        ]
+        assert Tokenizer(stemmer=None).tokenize("List endpoints") == [
+            "list",
+            "endpoints",
+        ]
+        assert suffix_stem("users") == "users"
+        assert suffix_stem("deleting") == "delet"
+
+    def test_query_terms_are_indexed_terms(self):
+        """Query terms are stemmed like the documents they are matched against."""
+        query_tokenizer = QueryProcessor(SearchConfig()).tokenizer
+        text = "List categories, deleted endpoints"
+
+        query_terms = query_tokenizer.tokenize(text)
+        assert query_terms == ["list", "categorie", "delet", "endpoint"]
+        assert set(query_terms) <= set(Tokenizer().tokenize(text))
+
+    def test_tokenize_many_shares_cache(self):
+        """Each distinct raw token is processed once."""
+        tokenizer = Tokenizer()
+
+        assert tokenizer.tokenize_many(["Get users", "get Users"]) == [
+            ["get", "users"],
+            ["get", "users"],
+        ]
+        info = tokenizer.cache_info()
+        assert info.misses == 4
+        assert info.hits == 0
+
+        tokenizer.tokenize("users get")
+        assert tokenizer.cache_info().hits == 2
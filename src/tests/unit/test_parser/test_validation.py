@@ -0,0 +1,222 @@
+"""Tests for tiered OpenAPI validation and cached spec validator results."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from swagger_mcp_server.parser.base import ValidationTier
+from swagger_mcp_server.parser.error_handler import ErrorHandler
+from swagger_mcp_server.parser.validation import (
+    OpenAPIValidator,
+    SpecValidationCache,
+    specification_hash,
+    validate_specification_file,
+)
+
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Pets", "version": "1.0.0", "description": "Pet store"},
+    "servers": [{"url": "https://example.com"}],
+    "paths": {"/pets": {"get": {"responses": {"200": {"description": "OK"}}}}},
+}
+
+# Structurally fine, but the operation has no responses
+INVALID_SPEC = {
+    **SPEC,
+    "paths": {"/pets": {"get": {"summary": "List pets"}}},
+}
+
+
+def make_validator(tier, cache, **kwargs):
+    """Create a validator with its own error handler."""
+    return OpenAPIValidator(ErrorHandler(), tier=tier, cache=cache, **kwargs)
+
+
+def spec_validator_errors(result):
+    """Get the errors reported by openapi-spec-validator."""
+    return [
+        error
+        for error in result.errors
+        if error.error_type == "SpecificationValidationError"
+    ]
+
+
+class TestSpecValidationCache:
+    """Test SpecValidationCache functionality."""
+
+    def test_specification_hash_ignores_key_order(self):
+        """Equal documents hash equally regardless of key order."""
+        reordered = dict(reversed(list(SPEC.items())))
+        assert specification_hash(reordered) == specification_hash(SPEC)
+        assert specification_hash(INVALID_SPEC) != specification_hash(SPEC)
+
+    async def test_persistent_entries(self, tmp_path):
+        """Results written to the cache directory are reused by new caches."""
+        validator = make_validator(ValidationTier.FULL, SpecValidationCache(tmp_path))
+        first = await validator.validate_specification(INVALID_SPEC, "api.json")
+
+        with patch("swagger_mcp_server.parser.validation.validate_spec") as validate:
+            validator = make_validator(
+                ValidationTier.FULL, SpecValidationCache(tmp_path)
+            )
+            second = await validator.validate_specification(INVALID_SPEC, "api.json")
+
+        validate.assert_not_called()
+        assert len(spec_validator_errors(first)) == 1
+        assert spec_validator_errors(second) == spec_validator_errors(first)
+        assert not second.is_valid
+
+
+class TestValidationTiers:
+    """Test validation tiers of OpenAPIValidator."""
+
+    async def test_structural_tier_skips_spec_validator(self):
+        """The structural tier only runs the built-in checks."""
+        validator = make_validator(ValidationTier.STRUCTURAL, SpecValidationCache())
+
+        with patch("swagger_mcp_server.parser.validation.validate_spec") as validate:
+            result = await validator.validate_specification(INVALID_SPEC, "api.json")
+
+        validate.assert_not_called()
+        assert result.is_valid
+        assert validator.deferred_validation is None
+
+    async def test_full_tier_caches_by_hash(self):
+        """Unchanged specifications are validated once."""
+        cache = SpecValidationCache()
+
+        with patch("swagger_mcp_server.parser.validation.validate_spec") as validate:
+            for _ in range(2):
+                validator = make_validator(ValidationTier.FULL, cache)
+                result = await validator.validate_specification(SPEC, "api.json")
+
+        assert validate.call_count == 1
+        assert result.is_valid
+
+    async def test_deferred_tier(self):
+        """Deferred validation reports its result later and caches it."""
+        cache = SpecValidationCache()
+        validator = make_validator(
+            ValidationTier.DEFERRED,
+            cache,
+            executor_factory=lambda: ThreadPoolExecutor(max_workers=1),
+        )
+
+        result = await validator.validate_specification(INVALID_SPEC, "api.json")
+        assert result.is_valid
+        assert validator.deferred_validation is not None
+
+        deferred_result = await validator.deferred_validation.result()
+        assert not deferred_result.is_valid
+        assert len(spec_validator_errors(deferred_result)) == 1
+        assert cache.get(specification_hash(INVALID_SPEC)) is not None
+
+        # Known results are applied right away
+        result = await validator.validate_specification(INVALID_SPEC, "api.json")
+        assert not result.is_valid
+        assert validator.deferred_validation is None
+
+    async def test_deferred_tier_falls_back_to_inline(self):
+        """Without a worker the document is validated inline."""
+
+        def broken_executor():
+            raise OSError("no semaphores")
+
+        validator = make_validator(
+            ValidationTier.DEFERRED,
+            SpecValidationCache(),
+            executor_factory=broken_executor,
+        )
+
+        result = await validator.validate_specification(INVALID_SPEC, "api.json")
+
+        assert validator.deferred_validation is None
+        assert len(spec_validator_errors(result)) == 1
+
+
+class TestFileValidation:
+    """Test validating streamed specifications from their file."""
+
+    @pytest.fixture
+    def spec_file(self, tmp_path):
+        """Specification file failing openapi-spec-validator."""
+        path = tmp_path / "api.json"
+        path.write_text(json.dumps(INVALID_SPEC))
+        return str(path)
+
+    def skeleton(self):
+        """Skeleton of the specification, as streamed."""
+        return {key: value for key, value in INVALID_SPEC.items() if key != "paths"}
+
+    def test_validate_specification_file(self, spec_file, tmp_path):
+        """The document is loaded by the validation function itself."""
+        errors, _ = validate_specification_file(spec_file)
+        assert [error.error_type for error in errors] == [
+            "SpecificationValidationError"
+        ]
+
+        yaml_file = tmp_path / "api.yaml"
+        yaml_file.write_text("openapi: 3.0.0\n")
+        assert validate_specification_file(str(yaml_file))[0]
+
+        errors, warnings = validate_specification_file(str(tmp_path / "missing.json"))
+        assert errors == []
+        assert warnings[0].error_type == "ValidatorError"
+
+    async def test_structural_tier_checks_skeleton(self, spec_file):
+        """The structural tier never loads the file."""
+        validator = make_validator(ValidationTier.STRUCTURAL, SpecValidationCache())
+
+        with patch("json.load", side_effect=AssertionError("loaded whole")):
+            result = await validator.validate_specification_file(
+                spec_file, self.skeleton(), "file-hash"
+            )
+            broken = await validator.validate_specification_file(
+                spec_file, {"openapi": "3.0.0", "info": {}}, "file-hash"
+            )
+
+        assert result.is_valid
+        assert [error.error_type for error in broken.errors] == [
+            "MissingRequiredField",
+            "MissingRequiredField",
+        ]
+
+    async def test_full_tier_caches_by_file_hash(self, spec_file, tmp_path):
+        """Persistent results are reused without loading the file."""
+        cache_dir = tmp_path / "cache"
+        validator = make_validator(ValidationTier.FULL, SpecValidationCache(cache_dir))
+        first = await validator.validate_specification_file(
+            spec_file, self.skeleton(), "file-hash"
+        )
+
+        validator = make_validator(ValidationTier.FULL, SpecValidationCache(cache_dir))
+        with patch(
+            "swagger_mcp_server.parser.validation.validate_specification_file"
+        ) as validate_file:
+            second = await validator.validate_specification_file(
+                spec_file, self.skeleton(), "file-hash"
+            )
+
+        validate_file.assert_not_called()
+        assert len(spec_validator_errors(first)) == 1
+        assert spec_validator_errors(second) == spec_validator_errors(first)
+
+    async def test_deferred_tier_validates_file_in_worker(self, spec_file):
+        """Deferred validation loads and validates the file in the worker."""
+        cache = SpecValidationCache()
+        validator = make_validator(
+            ValidationTier.DEFERRED,
+            cache,
+            executor_factory=lambda: ThreadPoolExecutor(max_workers=1),
+        )
+
+        result = await validator.validate_specification_file(
+            spec_file, self.skeleton(), "file-hash"
+        )
+        assert result.is_valid
+
+        deferred_result = await validator.deferred_validation.result()
+        assert len(spec_validator_errors(deferred_result)) == 1
+        assert cache.get("file-hash") is not None
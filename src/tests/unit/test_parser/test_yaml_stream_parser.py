@@ -0,0 +1,155 @@
+"""Tests for event-based YAML parser."""
+
+import pytest
+
+from swagger_mcp_server.parser.base import (
+    ParserConfig,
+    ParserType,
+    ParseStatus,
+)
+from swagger_mcp_server.parser.swagger_parser import SwaggerParser
+from swagger_mcp_server.parser.yaml_stream_parser import (
+    SwaggerYamlStreamParser,
+)
+
+SPEC_YAML = """\
+openapi: 3.0.0
+info:
+  title: Pet Store
+  version: "1.0"
+x-errors: &errors
+  "500":
+    description: Server error
+paths:
+  /pets:
+    get:
+      responses:
+        200:
+          description: OK
+        <<: *errors
+    post:
+      requestBody:
+        content:
+          application/json:
+            schema:
+              $ref: '#/components/schemas/Pet'
+      responses: *errors
+  /pets/{id}:
+    parameters: []
+    delete:
+      responses:
+        204: {description: Deleted}
+components:
+  securitySchemes:
+    apiKey: {type: apiKey, in: header, name: X-API-Key}
+  schemas:
+    Pet:
+      type: object
+      x-internal: true
+    PetId: {type: integer}
+"""
+
+
+class TestSwaggerYamlStreamParser:
+    """Test SwaggerYamlStreamParser functionality."""
+
+    @pytest.fixture
+    def spec_file(self, tmp_path):
+        """Create OpenAPI YAML file."""
+        yaml_file = tmp_path / "openapi.yaml"
+        yaml_file.write_text(SPEC_YAML)
+        return yaml_file
+
+    @pytest.fixture
+    def streaming_parser(self):
+        """Create YAML parser in streaming mode."""
+        return SwaggerYamlStreamParser(ParserConfig(streaming_mode=True))
+
+    def test_parser_type_and_extensions(self):
+        """Test YAML parser metadata."""
+        parser = SwaggerYamlStreamParser()
+
+        assert parser.get_parser_type() == ParserType.OPENAPI_YAML
+        assert parser.get_supported_extensions() == [".yaml", ".yml"]
+
+    async def test_parse_full_document(self, spec_file):
+        """Full parse resolves aliases, merge keys and JSON-style keys."""
+        result = await SwaggerYamlStreamParser().parse(spec_file)
+
+        assert result.is_success
+        assert result.api_title == "Pet Store"
+        responses = result.data["paths"]["/pets"]["get"]["responses"]
+        assert responses == {
+            "200": {"description": "OK"},
+            "500": {"description": "Server error"},
+        }
+        assert result.metrics.endpoints_found == 3
+        assert result.metrics.schemas_found == 2
+        assert result.metrics.processing_speed_mb_per_sec > 0
+
+    async def test_streaming_skeleton(self, streaming_parser, spec_file):
+        """Streaming mode leaves paths and schemas out of the skeleton."""
+        result = await streaming_parser.parse(spec_file)
+
+        assert result.is_success
+        assert "paths" not in result.data
+        assert "schemas" not in result.data["components"]
+        assert result.metrics.endpoints_found == 3
+        assert result.metrics.schemas_found == 2
+        assert result.metrics.security_schemes_found == 1
+        assert result.metrics.extensions_found == 2
+
+    async def test_streaming_matches_full_parse(self, streaming_parser, spec_file):
+        """Streamed items equal their fully parsed counterparts."""
+        full = (await SwaggerYamlStreamParser().parse(spec_file)).data
+        document = (await streaming_parser.parse(spec_file)).document_stream
+
+        operations = list(document.iter_operations())
+        schemas = dict(document.iter_schemas())
+
+        assert [(path, method) for path, method, _ in operations] == [
+            ("/pets", "get"),
+            ("/pets", "post"),
+            ("/pets/{id}", "delete"),
+        ]
+        for path, method, operation in operations:
+            assert operation == full["paths"][path][method]
+        assert schemas == full["components"]["schemas"]
+
+    async def test_swagger2_definitions_streamed(self, streaming_parser, tmp_path):
+        """Swagger 2.0 definitions are streamed as schemas."""
+        yaml_file = tmp_path / "swagger.yml"
+        yaml_file.write_text(
+            "swagger: '2.0'\n"
+            "info: {title: Legacy, version: '1'}\n"
+            "paths: {}\n"
+            "definitions:\n"
+            "  Pet: {type: object}\n"
+        )
+
+        result = await streaming_parser.parse(yaml_file)
+
+        assert result.metrics.schemas_found == 1
+        assert [name for name, _ in result.document_stream.iter_schemas()] == ["Pet"]
+
+    @pytest.mark.parametrize("streaming_mode", [False, True])
+    async def test_malformed_yaml(self, tmp_path, streaming_mode):
+        """Malformed YAML fails gracefully with the problem location."""
+        yaml_file = tmp_path / "broken.yaml"
+        yaml_file.write_text("openapi: 3.0.0\npaths:\n  /a: [unclosed\n")
+        parser = SwaggerYamlStreamParser(ParserConfig(streaming_mode=streaming_mode))
+
+        result = await parser.parse(yaml_file)
+
+        assert result.status == ParseStatus.FAILED
+        assert result.metrics.errors[0].error_type == "InvalidYAML"
+        assert result.metrics.errors[0].line_number is not None
+
+    async def test_swagger_parser_selects_yaml_parser(self, spec_file):
+        """The main parser routes YAML files to the YAML stream parser."""
+        result = await SwaggerParser(ParserConfig(validate_openapi=False)).parse(
+            spec_file
+        )
+
+        assert result.is_success
+        assert result.api_title == "Pet Store"
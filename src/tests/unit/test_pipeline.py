@@ -7,6 +7,8 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from swagger_mcp_server.parser.base import ParserConfig
+from swagger_mcp_server.parser.schema_normalizer import SchemaNormalizer
 from swagger_mcp_server.pipeline import (
     BatchProcessingResult,
     PipelineContext,
@@ -171,6 +173,66 @@ class TestPipelineComponents:
             assert result.success is False
             assert "stage2 failed" in result.errors
 
+    @pytest.mark.asyncio
+    async def test_normalization_cache_skips_parsing(self, tmp_path):
+        """A cached normalization result skips parsing and normalization."""
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text("{}")
+        normalized = SchemaNormalizer().normalize_openapi_document(
+            {"openapi": "3.0.0", "info": {"title": "API", "version": "1"}, "paths": {}}
+        )
+        config = ParserConfig(normalization_cache_dir=str(tmp_path / "cache"))
+
+        with patch("swagger_mcp_server.pipeline.get_db_manager"):
+            pipeline = SwaggerProcessingPipeline(config)
+            runs = []
+            for _ in range(2):
+                stages = [
+                    MockStage("parsing"),
+                    MockStage("normalization", result_data=normalized),
+                    MockStage("storage", result_data=1),
+                ]
+                pipeline.stages = stages
+                result = await pipeline.process_file(str(spec_file))
+                runs.append((stages, result))
+
+        (first_stages, first), (second_stages, second) = runs
+        assert all(stage.execute_called for stage in first_stages)
+        assert not first.metrics.normalization_cache_hit
+        assert not second_stages[0].execute_called
+        assert not second_stages[1].execute_called
+        assert second_stages[2].execute_called
+        assert second.success is True
+        assert second.metrics.normalization_cache_hit
+
+    @pytest.mark.asyncio
+    async def test_normalization_cache_checks_referenced_files(self, tmp_path):
+        """A change to a referenced file invalidates the cached result."""
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text("{}")
+        common_file = tmp_path / "common.json"
+        common_file.write_text("{}")
+        normalized = SchemaNormalizer().normalize_openapi_document(
+            {"openapi": "3.0.0", "info": {"title": "API", "version": "1"}, "paths": {}}
+        )
+        normalized.referenced_files = [common_file]
+        config = ParserConfig(normalization_cache_dir=str(tmp_path / "cache"))
+
+        with patch("swagger_mcp_server.pipeline.get_db_manager"):
+            pipeline = SwaggerProcessingPipeline(config)
+            hits = []
+            for content in ("{}", "{}", '{"Error": {}}'):
+                common_file.write_text(content)
+                pipeline.stages = [
+                    MockStage("parsing"),
+                    MockStage("normalization", result_data=normalized),
+                    MockStage("storage", result_data=1),
+                ]
+                result = await pipeline.process_file(str(spec_file))
+                hits.append(result.metrics.normalization_cache_hit)
+
+        assert hits == [False, True, False]
+
     @pytest.mark.asyncio
     async def test_batch_processing_success(self):
         """Test successful batch processing."""
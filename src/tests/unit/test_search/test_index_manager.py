@@ -287,6 +287,25 @@ class TestSearchIndexManager:
 
         assert isinstance(result, bool)
 
+    @pytest.mark.asyncio
+    async def test_apply_endpoint_changes(self, index_manager):
+        """Test applying incremental endpoint changes in one write."""
+        index_manager.endpoint_repo.count_all = AsyncMock(return_value=0)
+        index_manager.endpoint_repo.get_all = AsyncMock(return_value=[])
+        await index_manager.create_index_from_database()
+
+        endpoints = [
+            {"id": "1", "path": "/api/one", "method": "GET", "summary": "One"},
+            {"id": "2", "path": "/api/two", "method": "GET", "summary": "Two"},
+        ]
+        assert await index_manager.apply_endpoint_changes(endpoints, []) == (2, 0)
+
+        updated = [{"id": "1", "path": "/api/one", "method": "PUT"}]
+        result = await index_manager.apply_endpoint_changes(updated, ["2"])
+
+        assert result == (1, 1)
+        assert index_manager.index.doc_count() == 1
+
     @pytest.mark.asyncio
     async def test_get_index_stats(self, index_manager):
         """Test getting index statistics."""
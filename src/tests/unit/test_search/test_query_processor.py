@@ -18,6 +18,7 @@ from swagger_mcp_server.config.settings import (
     SearchConfig,
     SearchPerformanceConfig,
 )
+from swagger_mcp_server.parser.tokenizer import Tokenizer, suffix_stem
 from swagger_mcp_server.search.query_processor import (
     ProcessedQuery,
     QueryProcessor,
@@ -90,12 +91,11 @@ class TestQueryPreprocessing:
         query = "users authentication endpoints"
         processed = await query_processor.process_query(query)
 
-        # Check that stemming is applied (assuming NLTK is available)
+        # Terms are stemmed like indexed documents
         normalized = processed.normalized_terms
-        assert len(normalized) > 0
-        # Should handle plural forms
-        if hasattr(query_processor, "stemmer") and query_processor.stemmer:
-            assert any("user" in term for term in normalized)
+        assert normalized == ["users", "authentication", "endpoint"]
+        indexed_terms = set(Tokenizer().tokenize(query))
+        assert set(normalized) <= indexed_terms
 
     @pytest.mark.asyncio
     async def test_empty_query_handling(self, query_processor):
@@ -541,7 +541,7 @@ class TestNLTKIntegration:
         """Test handling when NLTK is not available."""
         with patch("swagger_mcp_server.search.query_processor.NLTK_AVAILABLE", False):
             processor = QueryProcessor(search_config)
-            assert processor.stemmer is None
+            assert processor.tokenizer.stemmer is suffix_stem
             assert processor.stop_words == set()
 
     @pytest.mark.asyncio
@@ -554,24 +554,7 @@ class TestNLTKIntegration:
 
             assert processed.original_query == query
             assert len(processed.normalized_terms) > 0
-            # Should still work without stemming
-
-    @pytest.mark.asyncio
-    async def test_nltk_error_handling(self, query_processor):
-        """Test handling of NLTK processing errors."""
-        # Mock NLTK components to raise errors
-        if hasattr(query_processor, "stemmer") and query_processor.stemmer:
-            with patch.object(
-                query_processor.stemmer,
-                "stem",
-                side_effect=Exception("NLTK error"),
-            ):
-                query = "users authentication"
-                processed = await query_processor.process_query(query)
-
-                # Should handle errors gracefully
-                assert processed.original_query == query
-                assert len(processed.normalized_terms) > 0
+            # Stemming does not depend on NLTK
 
 
 @pytest.mark.integration
@@ -0,0 +1,260 @@
+"""Tests for batched bulk loading."""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from swagger_mcp_server.storage.bulk_loader import BulkLoader, BulkLoadStats
+from swagger_mcp_server.storage.database import DatabaseConfig, DatabaseManager
+from swagger_mcp_server.storage.models import (
+    FTS_TRIGGER_NAMES,
+    APIMetadata,
+    Endpoint,
+    EndpointCategory,
+    Schema,
+)
+
+API_ROW = {"title": "Bulk API", "version": "1.0.0", "openapi_version": "3.0.0"}
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    """Initialized database in WAL mode."""
+    manager = DatabaseManager(
+        DatabaseConfig(database_path=str(tmp_path / "bulk.db"), vacuum_on_startup=False)
+    )
+    await manager.initialize()
+    yield manager
+    await manager.close()
+
+
+async def pragmas(db_manager):
+    async with db_manager._engine.connect() as connection:
+        return {
+            name: (await connection.exec_driver_sql(f"PRAGMA {name}")).scalar()
+            for name in ("journal_mode", "synchronous", "cache_size")
+        }
+
+
+async def count(db_manager, model):
+    async with db_manager.get_session() as session:
+        return (await session.execute(select(func.count(model.id)))).scalar()
+
+
+async def fts_triggers(db_manager):
+    rows = await db_manager.execute_raw_sql(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%fts%'"
+    )
+    return sorted(name for (name,) in rows)
+
+
+def endpoint_row(api_id, index):
+    return {
+        "api_id": api_id,
+        "path": f"/items/{index}",
+        "method": "GET",
+        "summary": f"Get item {index}",
+    }
+
+
+class TestBulkLoader:
+    """Test loading rows in batches."""
+
+    async def test_rows_are_written_in_batches(self, db_manager):
+        """Rows reach the database in executemany batches of the batch size."""
+        async with BulkLoader(db_manager, batch_size=10) as loader:
+            api_id = await loader.insert_one(APIMetadata, API_ROW)
+            for index in range(25):
+                await loader.add(Endpoint, endpoint_row(api_id, index))
+            await loader.add(Schema, {"api_id": api_id, "name": "Item"})
+
+        assert loader.stats.rows_by_table == {
+            "api_metadata": 1,
+            "endpoints": 25,
+            "schemas": 1,
+        }
+        # Two full endpoint batches, then the rest of both tables on exit
+        assert loader.stats.batches == 4
+        assert loader.stats.rows_per_second > 0
+        assert await count(db_manager, Endpoint) == 25
+
+        async with db_manager.get_session() as session:
+            endpoint = (await session.execute(select(Endpoint).limit(1))).scalar()
+            assert endpoint.created_at is not None
+            assert endpoint.deprecated is False
+
+    async def test_full_text_index_is_maintained(self, db_manager):
+        """FTS triggers fire for bulk inserted rows."""
+        async with BulkLoader(db_manager) as loader:
+            api_id = await loader.insert_one(APIMetadata, API_ROW)
+            await loader.add(Endpoint, endpoint_row(api_id, 1))
+
+        rows = await db_manager.execute_raw_sql(
+            "SELECT path FROM endpoints_fts WHERE endpoints_fts MATCH 'item'"
+        )
+        assert rows == [("/items/1",)]
+
+    async def test_pragmas_are_restored(self, db_manager):
+        """Load-optimized pragmas only apply during the load."""
+        before = await pragmas(db_manager)
+
+        async with BulkLoader(db_manager, cache_size_kib=4096) as loader:
+            during = await pragmas(db_manager)
+            await loader.insert_one(APIMetadata, API_ROW)
+
+        assert during == {
+            "journal_mode": "memory",
+            "synchronous": 0,
+            "cache_size": -4096,
+        }
+        assert before["journal_mode"] == "wal"
+        assert await pragmas(db_manager) == before
+
+    async def test_failed_load_is_rolled_back(self, db_manager):
+        """Nothing is written when the load raises."""
+        before = await pragmas(db_manager)
+
+        with pytest.raises(RuntimeError):
+            async with BulkLoader(db_manager, batch_size=2) as loader:
+                api_id = await loader.insert_one(APIMetadata, API_ROW)
+                for index in range(5):
+                    await loader.add(Endpoint, endpoint_row(api_id, index))
+                raise RuntimeError("parse failed")
+
+        assert await count(db_manager, APIMetadata) == 0
+        assert await count(db_manager, Endpoint) == 0
+        assert await pragmas(db_manager) == before
+
+    async def test_ignored_conflicts_are_not_counted(self, db_manager):
+        """Duplicate rows are skipped with INSERT OR IGNORE."""
+        async with BulkLoader(db_manager) as loader:
+            api_id = await loader.insert_one(APIMetadata, API_ROW)
+            for name in ("users", "orders", "users"):
+                await loader.add(
+                    EndpointCategory,
+                    {"api_id": api_id, "category_name": name},
+                    ignore_conflicts=True,
+                )
+
+        assert loader.stats.rows_by_table["endpoint_categories"] == 2
+        assert await count(db_manager, EndpointCategory) == 2
+
+    async def test_update_sees_buffered_rows(self, db_manager):
+        """Updates run after the rows buffered before them."""
+        async with BulkLoader(db_manager) as loader:
+            api_id = await loader.insert_one(APIMetadata, API_ROW)
+            await loader.update(APIMetadata, api_id, {"parse_metadata": {"a": 1}})
+
+        async with db_manager.get_session() as session:
+            api = await session.get(APIMetadata, api_id)
+            assert api.parse_metadata == {"a": 1}
+
+    async def test_fts_triggers_are_suspended_during_load(self, db_manager):
+        """Rows are indexed once, when the load completes."""
+        async with BulkLoader(db_manager, batch_size=2) as loader:
+            api_id = await loader.insert_one(APIMetadata, API_ROW)
+            for index in range(5):
+                await loader.add(Endpoint, endpoint_row(api_id, index))
+            await loader.add(Schema, {"api_id": api_id, "name": "ItemSchema"})
+            await loader.flush()
+
+            assert await fts_triggers(db_manager) == []
+            assert await db_manager.execute_raw_sql(
+                "SELECT COUNT(*) FROM endpoints_fts WHERE endpoints_fts MATCH 'item'"
+            ) == [(0,)]
+
+        assert await fts_triggers(db_manager) == sorted(FTS_TRIGGER_NAMES)
+        assert await db_manager.execute_raw_sql(
+            "SELECT COUNT(*) FROM endpoints_fts WHERE endpoints_fts MATCH 'item'"
+        ) == [(5,)]
+        assert await db_manager.execute_raw_sql(
+            "SELECT name FROM schemas_fts WHERE schemas_fts MATCH 'itemschema'"
+        ) == [("ItemSchema",)]
+        assert loader.stats.fts_reindex_seconds > 0
+
+    async def test_reindexed_rows_stay_in_sync(self, db_manager):
+        """Triggers can update and delete entries of reindexed rows."""
+        async with BulkLoader(db_manager) as loader:
+            api_id = await loader.insert_one(APIMetadata, API_ROW)
+            for index in range(3):
+                row = endpoint_row(api_id, index)
+                await loader.add(Endpoint, {**row, "tags": ["billing"]})
+
+        await db_manager.execute_raw_sql("DELETE FROM endpoints WHERE id = 1")
+        await db_manager.execute_raw_sql(
+            "UPDATE endpoints SET summary = 'Renamed' WHERE id = 2"
+        )
+
+        assert await db_manager.execute_raw_sql(
+            "SELECT rowid FROM endpoints_fts WHERE endpoints_fts MATCH 'billing'"
+        ) == [(2,), (3,)]
+        assert await db_manager.execute_raw_sql(
+            "SELECT rowid FROM endpoints_fts WHERE endpoints_fts MATCH 'renamed'"
+        ) == [(2,)]
+        await db_manager.execute_raw_sql(
+            "INSERT INTO endpoints_fts(endpoints_fts) VALUES ('integrity-check')"
+        )
+
+    async def test_failed_load_restores_fts_triggers(self, db_manager):
+        """Triggers are reinstalled when the load is rolled back."""
+        with pytest.raises(RuntimeError):
+            async with BulkLoader(db_manager):
+                raise RuntimeError("parse failed")
+
+        assert await fts_triggers(db_manager) == sorted(FTS_TRIGGER_NAMES)
+
+    async def test_triggers_are_committed_with_the_rows(self, db_manager, monkeypatch):
+        """The load never commits while the sync triggers are dropped."""
+        committed_triggers = []
+        commit = AsyncConnection.commit
+
+        async def checked_commit(connection):
+            result = await connection.exec_driver_sql(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' "
+                "AND (name LIKE '%fts%' OR name LIKE 'endpoint_tags_%')"
+            )
+            committed_triggers.append(result.scalar())
+            await commit(connection)
+
+        async with BulkLoader(db_manager) as loader:
+            monkeypatch.setattr(AsyncConnection, "commit", checked_commit)
+            api_id = await loader.insert_one(APIMetadata, API_ROW)
+            await loader.add(Endpoint, endpoint_row(api_id, 1))
+
+        assert committed_triggers
+        assert set(committed_triggers) == {len(FTS_TRIGGER_NAMES) + 3}
+
+    async def test_fts_can_be_maintained_per_row(self, db_manager):
+        """Without deferral the triggers stay active during the load."""
+        async with BulkLoader(db_manager, defer_fts=False) as loader:
+            assert await fts_triggers(db_manager) == sorted(FTS_TRIGGER_NAMES)
+            await loader.insert_one(APIMetadata, API_ROW)
+
+        assert loader.stats.fts_reindex_seconds == 0.0
+
+    async def test_tag_triggers_are_suspended_during_load(self, db_manager):
+        """endpoint_tags is rebuilt once the load completes."""
+        async with BulkLoader(db_manager) as loader:
+            api_id = await loader.insert_one(APIMetadata, API_ROW)
+            row = endpoint_row(api_id, 1)
+            await loader.add(Endpoint, {**row, "tags": ["billing"]})
+            await loader.flush()
+
+            assert await db_manager.execute_raw_sql(
+                "SELECT COUNT(*) FROM endpoint_tags"
+            ) == [(0,)]
+
+        assert await db_manager.execute_raw_sql(
+            "SELECT endpoint_id, tag FROM endpoint_tags"
+        ) == [(1, "billing")]
+        assert await db_manager.execute_raw_sql(
+            "SELECT COUNT(*) FROM sqlite_master "
+            "WHERE type = 'trigger' AND name LIKE 'endpoint_tags_%'"
+        ) == [(3,)]
+
+    def test_stats_without_duration(self):
+        """Throughput of an empty load is zero."""
+        stats = BulkLoadStats()
+
+        assert stats.rows_per_second == 0.0
+        assert stats.to_dict()["rows_inserted"] == 0
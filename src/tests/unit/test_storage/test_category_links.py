@@ -0,0 +1,168 @@
+"""Tests for category filtering through the endpoint_category_links table."""
+
+import sqlite3
+
+import pytest
+
+from swagger_mcp_server.storage.bulk_loader import BulkLoader
+from swagger_mcp_server.storage.database import DatabaseConfig, DatabaseManager
+from swagger_mcp_server.storage.migrations import MigrationManager
+from swagger_mcp_server.storage.models import (
+    APIMetadata,
+    Endpoint,
+    EndpointCategory,
+    EndpointCategoryLink,
+)
+from swagger_mcp_server.storage.repositories import EndpointRepository
+from swagger_mcp_server.storage.repositories.endpoint_repository import (
+    CATEGORY_MEMBERS_SQL,
+)
+
+# path -> (tags, category assigned by categorization)
+ENDPOINTS = {
+    "/campaigns": (["Campaign"], "campaign"),
+    "/campaigns/ads": (["Campaign", "Ad"], "campaign"),
+    "/ads": (["Ad"], "ad"),
+    "/ad-groups": (["AdGroup"], "adgroup"),
+    "/promos": (["Search-Promo"], "search_promo"),
+}
+
+# category -> group
+CATEGORIES = {
+    "campaign": "Advertising",
+    "ad": "Advertising",
+    "adgroup": "Advertising",
+    "search_promo": None,
+    "statistics": None,
+}
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    """Database with categorized endpoints."""
+    manager = DatabaseManager(
+        DatabaseConfig(
+            database_path=str(tmp_path / "links.db"), vacuum_on_startup=False
+        )
+    )
+    await manager.initialize()
+
+    async with BulkLoader(manager) as loader:
+        api_id = await loader.insert_one(
+            APIMetadata,
+            {"title": "Ads API", "version": "1.0.0", "openapi_version": "3.0.0"},
+        )
+        category_ids = {}
+        for name, group in CATEGORIES.items():
+            category_ids[name] = await loader.insert_one(
+                EndpointCategory,
+                {"api_id": api_id, "category_name": name, "category_group": group},
+            )
+        for path, (tags, category) in ENDPOINTS.items():
+            endpoint_id = await loader.insert_one(
+                Endpoint,
+                {
+                    "api_id": api_id,
+                    "path": path,
+                    "method": "GET",
+                    "summary": f"List {path}",
+                    "tags": tags,
+                },
+            )
+            await loader.add(
+                EndpointCategoryLink,
+                {"category_id": category_ids[category], "endpoint_id": endpoint_id},
+            )
+
+    yield manager
+    await manager.close()
+
+
+def paths(endpoints):
+    return sorted(endpoint.path for endpoint in endpoints)
+
+
+class TestCategoryLinks:
+    """Test category filters and counts backed by the join table."""
+
+    @pytest.mark.parametrize("query", ["", "list"])
+    @pytest.mark.parametrize(
+        "category, expected",
+        [
+            ("campaign", ["/campaigns", "/campaigns/ads"]),
+            # Only the category assigned to the endpoint, not every tag that
+            # contains the name
+            ("AD", ["/ads"]),
+            ("search_promo", ["/promos"]),
+            ("statistics", []),
+        ],
+    )
+    async def test_category_filter(self, db_manager, query, category, expected):
+        """Endpoints are filtered by their linked category."""
+        async with db_manager.get_session() as session:
+            endpoints = await EndpointRepository(session).search_endpoints(
+                query, category=category
+            )
+
+        assert paths(endpoints) == expected
+
+    async def test_category_group_filter(self, db_manager):
+        """Group filters match endpoints of every category in the group."""
+        async with db_manager.get_session() as session:
+            repo = EndpointRepository(session)
+            grouped = await repo.search_endpoints("", category_group="advertising")
+            combined = await repo.search_endpoints(
+                "", category="ad", category_group="Advertising"
+            )
+
+        assert paths(grouped) == ["/ad-groups", "/ads", "/campaigns", "/campaigns/ads"]
+        assert paths(combined) == ["/ads"]
+
+    async def test_category_counts_come_from_links(self, db_manager):
+        """Category and group endpoint counts are counted from the links."""
+        async with db_manager.get_session() as session:
+            repo = EndpointRepository(session)
+            categories = await repo.get_categories(sort_by="endpointCount")
+            with_empty = await repo.get_categories(include_empty=True)
+            groups = await repo.get_category_groups()
+
+        assert [(c["name"], c["endpointCount"]) for c in categories] == [
+            ("campaign", 2),
+            ("ad", 1),
+            ("adgroup", 1),
+            ("search_promo", 1),
+        ]
+        assert len(with_empty) == len(CATEGORIES)
+        assert groups[0]["name"] == "Advertising"
+        assert groups[0]["totalEndpoints"] == 4
+
+    async def test_filter_reads_links_by_primary_key(self, db_manager):
+        """The category filter is an index lookup rather than a scan."""
+        plan = await db_manager.execute_raw_sql(
+            "EXPLAIN QUERY PLAN SELECT id FROM endpoints WHERE "
+            + CATEGORY_MEMBERS_SQL.format(column="category_name"),
+            ("campaign",),
+        )
+        details = " | ".join(row[-1] for row in plan)
+
+        assert "SEARCH links USING PRIMARY KEY (category_id=?)" in details
+        assert "SCAN links" not in details
+
+    async def test_migration_backfills_links(self, db_manager):
+        """Existing databases are linked by the first tag of each endpoint."""
+        connection = sqlite3.connect(db_manager.config.database_path)
+        try:
+            linked = connection.execute(
+                "SELECT category_id, endpoint_id FROM endpoint_category_links"
+            ).fetchall()
+            connection.execute("DROP TABLE endpoint_category_links")
+            connection.executescript(
+                MigrationManager(db_manager)._get_category_links_upgrade_sql()
+            )
+            backfilled = connection.execute(
+                "SELECT category_id, endpoint_id FROM endpoint_category_links"
+            ).fetchall()
+        finally:
+            connection.close()
+
+        assert sorted(backfilled) == sorted(linked)
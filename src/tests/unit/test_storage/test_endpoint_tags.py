@@ -0,0 +1,184 @@
+"""Tests for tag filtering through the endpoint_tags table."""
+
+import json
+import sqlite3
+
+import pytest
+
+from swagger_mcp_server.storage.bulk_loader import BulkLoader
+from swagger_mcp_server.storage.database import DatabaseConfig, DatabaseManager
+from swagger_mcp_server.storage.migrations import MigrationManager
+from swagger_mcp_server.storage.models import APIMetadata, Endpoint
+from swagger_mcp_server.storage.repositories import EndpointRepository
+
+# path -> tags column; the pipeline stores tags as a JSON-encoded string
+ENDPOINTS = {
+    "/users": ["Users"],
+    "/users/{id}/orders": ["users", "Orders"],
+    "/orders": json.dumps(["Orders"]),
+    "/user-groups": ["UserGroups"],
+    "/health": None,
+}
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    """Database with tagged endpoints."""
+    manager = DatabaseManager(
+        DatabaseConfig(database_path=str(tmp_path / "tags.db"), vacuum_on_startup=False)
+    )
+    await manager.initialize()
+
+    async with BulkLoader(manager) as loader:
+        api_id = await loader.insert_one(
+            APIMetadata,
+            {"title": "Shop API", "version": "1.0.0", "openapi_version": "3.0.0"},
+        )
+        for path, tags in ENDPOINTS.items():
+            await loader.add(
+                Endpoint,
+                {
+                    "api_id": api_id,
+                    "path": path,
+                    "method": "GET",
+                    "summary": f"List {path}",
+                    "tags": tags,
+                },
+            )
+
+    yield manager
+    await manager.close()
+
+
+async def tag_rows(db_manager):
+    rows = await db_manager.execute_raw_sql(
+        "SELECT endpoints.path, endpoint_tags.tag FROM endpoint_tags "
+        "JOIN endpoints ON endpoints.id = endpoint_tags.endpoint_id"
+    )
+    return sorted(rows)
+
+
+def paths(endpoints):
+    return sorted(endpoint.path for endpoint in endpoints)
+
+
+class TestEndpointTags:
+    """Test tag filters backed by the endpoint_tags table."""
+
+    async def test_bulk_load_indexes_tags(self, db_manager):
+        """Array and JSON-encoded tags are indexed once the load completes."""
+        assert await tag_rows(db_manager) == [
+            ("/orders", "Orders"),
+            ("/user-groups", "UserGroups"),
+            ("/users", "Users"),
+            ("/users/{id}/orders", "Orders"),
+            ("/users/{id}/orders", "users"),
+        ]
+
+    async def test_triggers_keep_tags_in_sync(self, db_manager):
+        """Inserted, updated and deleted endpoints update the index."""
+        async with db_manager.get_session() as session:
+            session.add(Endpoint(api_id=1, path="/carts", method="GET", tags=["Carts"]))
+            await session.commit()
+
+        await db_manager.execute_raw_sql(
+            "UPDATE endpoints SET tags = '[\"Admin\"]' WHERE path = '/health'"
+        )
+        await db_manager.execute_raw_sql("DELETE FROM endpoints WHERE path = '/users'")
+
+        rows = await tag_rows(db_manager)
+        assert ("/carts", "Carts") in rows
+        assert ("/health", "Admin") in rows
+        assert ("/users", "Users") not in rows
+
+    @pytest.mark.parametrize("query", ["", "list"])
+    @pytest.mark.parametrize(
+        "tags, expected",
+        [
+            (["users"], ["/users", "/users/{id}/orders"]),
+            (["ORDERS"], ["/orders", "/users/{id}/orders"]),
+            (["Users", "UserGroups"], ["/user-groups", "/users", "/users/{id}/orders"]),
+            (["user"], []),
+        ],
+    )
+    async def test_tag_filter(self, db_manager, query, tags, expected):
+        """Search filters match whole tags, case-insensitively."""
+        async with db_manager.get_session() as session:
+            endpoints = await EndpointRepository(session).search_endpoints(
+                query, tags=tags
+            )
+
+        assert paths(endpoints) == expected
+
+    async def test_get_by_tags(self, db_manager):
+        """Endpoints can match any or all of the tags."""
+        async with db_manager.get_session() as session:
+            repo = EndpointRepository(session)
+            any_tag = await repo.get_by_tags(["users", "orders"])
+            all_tags = await repo.get_by_tags(["users", "orders"], match_all=True)
+            other_api = await repo.get_by_tags(["users"], api_id=2)
+
+        assert paths(any_tag) == ["/orders", "/users", "/users/{id}/orders"]
+        assert paths(all_tags) == ["/users/{id}/orders"]
+        assert other_api == []
+
+    async def test_get_all_tags(self, db_manager):
+        """Distinct spellings of the tags are listed in order."""
+        async with db_manager.get_session() as session:
+            repo = EndpointRepository(session)
+            all_tags = await repo.get_all_tags()
+            api_tags = await repo.get_all_tags(api_id=1)
+            other_api = await repo.get_all_tags(api_id=2)
+
+        assert all_tags == ["Orders", "UserGroups", "Users", "users"]
+        assert api_tags == all_tags
+        assert other_api == []
+
+    async def test_tag_filter_uses_index(self, db_manager):
+        """Tag lookups read the covering tag index."""
+        plan = await db_manager.execute_raw_sql(
+            "EXPLAIN QUERY PLAN "
+            "SELECT endpoint_id FROM endpoint_tags WHERE tag IN (?, ?)",
+            ("users", "orders"),
+        )
+        details = " | ".join(row[-1] for row in plan)
+
+        assert "USING COVERING INDEX ix_endpoint_tags_tag (tag=?)" in details
+
+    async def test_existing_database_is_indexed(self, tmp_path):
+        """Initialization indexes endpoints stored before the table existed."""
+        path = tmp_path / "old.db"
+        manager = DatabaseManager(
+            DatabaseConfig(database_path=str(path), vacuum_on_startup=False)
+        )
+        await manager.initialize()
+        async with BulkLoader(manager) as loader:
+            api_id = await loader.insert_one(
+                APIMetadata,
+                {"title": "Old API", "version": "1.0.0", "openapi_version": "3.0.0"},
+            )
+            await loader.add(
+                Endpoint,
+                {
+                    "api_id": api_id,
+                    "path": "/users",
+                    "method": "GET",
+                    "tags": ["Users"],
+                },
+            )
+        await manager.close()
+
+        connection = sqlite3.connect(path)
+        connection.executescript(
+            MigrationManager(manager)._get_endpoint_tags_downgrade_sql()
+        )
+        connection.close()
+
+        manager = DatabaseManager(
+            DatabaseConfig(database_path=str(path), vacuum_on_startup=False)
+        )
+        await manager.initialize()
+        try:
+            assert await tag_rows(manager) == [("/users", "Users")]
+        finally:
+            await manager.close()
@@ -0,0 +1,129 @@
+"""Tests for paginated endpoint search with exact totals."""
+
+import pytest
+
+from swagger_mcp_server.storage.bulk_loader import BulkLoader
+from swagger_mcp_server.storage.database import DatabaseConfig, DatabaseManager
+from swagger_mcp_server.storage.models import APIMetadata, Endpoint
+from swagger_mcp_server.storage.repositories import EndpointRepository
+
+ORDER_COUNT = 23
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    """Database with order endpoints and a few others."""
+    manager = DatabaseManager(
+        DatabaseConfig(
+            database_path=str(tmp_path / "pages.db"), vacuum_on_startup=False
+        )
+    )
+    await manager.initialize()
+
+    async with BulkLoader(manager) as loader:
+        api_id = await loader.insert_one(
+            APIMetadata,
+            {"title": "Shop API", "version": "1.0.0", "openapi_version": "3.0.0"},
+        )
+        for index in range(ORDER_COUNT):
+            await loader.add(
+                Endpoint,
+                {
+                    "api_id": api_id,
+                    "path": f"/orders/{index:02d}",
+                    "method": "POST" if index % 2 else "GET",
+                    "operation_id": f"order{index}",
+                    "summary": f"Order operation {index}",
+                    "tags": ["orders"],
+                    "parameters": [{"name": "id", "in": "path", "required": True}],
+                    "security": [{"oauth": []}],
+                    "searchable_text": "order",
+                },
+            )
+        for path in ("/users", "/health"):
+            await loader.add(
+                Endpoint,
+                {
+                    "api_id": api_id,
+                    "path": path,
+                    "method": "GET",
+                    "operation_id": path.strip("/"),
+                    "summary": f"Read {path}",
+                    "tags": ["misc"],
+                    "parameters": [],
+                    "security": [],
+                    "searchable_text": path.strip("/"),
+                },
+            )
+
+    yield manager
+    await manager.close()
+
+
+async def search(db_manager, query, **kwargs):
+    async with db_manager.get_session() as session:
+        return await EndpointRepository(session).search_endpoints_paginated(
+            query, **kwargs
+        )
+
+
+class TestSearchEndpointsPaginated:
+    """Test one-query pagination of endpoint search."""
+
+    @pytest.mark.parametrize("query", ["order", ""])
+    async def test_pages_carry_exact_total(self, db_manager, query):
+        """Every page reports the total number of matches."""
+        kwargs = {"tags": ["orders"]} if not query else {}
+        pages = [
+            await search(db_manager, query, limit=10, offset=offset, **kwargs)
+            for offset in (0, 10, 20)
+        ]
+
+        assert [page["total_count"] for page in pages] == [ORDER_COUNT] * 3
+        assert [len(page["endpoints"]) for page in pages] == [10, 10, 3]
+
+        paths = [e.path for page in pages for e in page["endpoints"]]
+        assert sorted(paths) == [f"/orders/{i:02d}" for i in range(ORDER_COUNT)]
+
+    async def test_filters_apply_to_total(self, db_manager):
+        """The total counts only matches passing the filters."""
+        page = await search(db_manager, "order", methods=["POST"], limit=5)
+
+        assert page["total_count"] == ORDER_COUNT // 2
+        assert {endpoint.method for endpoint in page["endpoints"]} == {"POST"}
+
+    async def test_page_past_last_match(self, db_manager):
+        """A page beyond the matches is empty but still reports the total."""
+        page = await search(db_manager, "order", limit=10, offset=100)
+
+        assert page == {"endpoints": [], "total_count": ORDER_COUNT}
+
+    async def test_no_matches(self, db_manager):
+        """Queries without matches report a zero total."""
+        page = await search(db_manager, "invoice")
+
+        assert page == {"endpoints": [], "total_count": 0}
+
+    async def test_invalid_fts_query_falls_back_to_like(self, db_manager):
+        """Queries that are not valid FTS5 syntax are matched with LIKE."""
+        page = await search(db_manager, "/orders/1", limit=5)
+
+        assert page["total_count"] == 10
+        assert [e.path for e in page["endpoints"]] == [
+            "/orders/10",
+            "/orders/11",
+            "/orders/12",
+            "/orders/13",
+            "/orders/14",
+        ]
+
+    async def test_rows_hold_result_columns(self, db_manager):
+        """Returned endpoints carry the columns used by result cards."""
+        page = await search(db_manager, "users")
+        (endpoint,) = page["endpoints"]
+
+        assert endpoint.path == "/users"
+        assert endpoint.operation_id == "users"
+        assert endpoint.parameters == []
+        assert endpoint.deprecated is False
+        assert endpoint.searchable_text is None